@@ -0,0 +1,123 @@
+"""Benchmarks the isAnyOf strategies against an in-memory SQLite database.
+
+Each strategy filters a table of rows by lists of increasing length, timing the
+request end to end: building the filter, compiling and executing the count and page
+queries, through a plan cache as the data grid's requests are. Lists which exceed
+SQLite's limit on the number of bind parameters are reported as errors.
+
+Each request filters by a new list, unless `--reuse` is passed, in which case every
+request filters by the same list, as when paging through a pasted selection, which
+only loads its temporary table once.
+
+Usage:
+    python benchmarks/is_any_of.py [--rows 200000] [--repeat 5] [--reuse]
+"""
+
+from argparse import ArgumentParser
+from random import Random
+from statistics import median
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from mui.v6.grid import GridFilterItem, GridFilterModel, GridPaginationModel
+from mui.v6.integrations.sqlalchemy import DataGridQuery, PlanCache
+from mui.v6.integrations.sqlalchemy.filter import (
+    IsAnyOfStrategy,
+    IsAnyOfThresholds,
+    register_scalable_is_any_of_operator,
+)
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, declarative_base
+
+Base = declarative_base()
+
+SIZES = (10, 100, 1_000, 10_000, 50_000)
+STRATEGY_THRESHOLDS: Dict[IsAnyOfStrategy, IsAnyOfThresholds] = {
+    IsAnyOfStrategy.EXPANDING: IsAnyOfThresholds(json=None, temporary_table=None),
+    IsAnyOfStrategy.JSON: IsAnyOfThresholds(json=1, temporary_table=None),
+    IsAnyOfStrategy.TEMPORARY_TABLE: IsAnyOfThresholds(json=None, temporary_table=1),
+}
+
+
+class Order(Base):  # type: ignore[valid-type,misc]
+    __tablename__ = "benchmark_order"
+
+    id = Column(Integer, primary_key=True)
+    reference = Column(String, nullable=False)
+
+
+def _time_request(session: Session, values: List[int], plan_cache: PlanCache) -> float:
+    start = perf_counter()
+    dg_query = DataGridQuery(
+        query=session.query(Order),
+        column_resolver=lambda field: getattr(Order, field),
+        filter_model=GridFilterModel(
+            items=[GridFilterItem(field="id", operator="isAnyOf", value=values)]
+        ),
+        pagination_model=GridPaginationModel(page=0, page_size=100),
+        plan_cache=plan_cache,
+    )
+    dg_query.total()
+    dg_query.items()
+    return perf_counter() - start
+
+
+def _benchmark(  # noqa: PLR0917
+    session: Session,
+    strategy: IsAnyOfStrategy,
+    size: int,
+    rows: int,
+    repeat: int,
+    reuse: bool,
+) -> Optional[float]:
+    register_scalable_is_any_of_operator(
+        STRATEGY_THRESHOLDS[strategy], sessions=session
+    )
+    random = Random(size)
+    plan_cache = PlanCache()
+    timings = []
+    values = random.sample(range(1, rows + 1), size)
+    # the first request builds the plan and compiles the statements
+    for _ in range(repeat + 1):
+        if not reuse:
+            values = random.sample(range(1, rows + 1), size)
+        try:
+            timings.append(_time_request(session, values, plan_cache))
+        except DBAPIError:
+            session.rollback()
+            return None
+    return median(timings[1:])
+
+
+def main() -> None:
+    """Runs the benchmarks, printing the median time of each strategy and size."""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--reuse", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(bind=engine)
+    with Session(bind=engine, future=True) as session:
+        session.execute(
+            Order.__table__.insert(),
+            [{"reference": f"ORD-{i:08d}"} for i in range(args.rows)],
+        )
+        session.commit()
+        print(f"{'values':>8}" + "".join(f"{s.value:>18}" for s in IsAnyOfStrategy))
+        for size in SIZES:
+            cells = []
+            for strategy in IsAnyOfStrategy:
+                elapsed = _benchmark(
+                    session, strategy, size, args.rows, args.repeat, args.reuse
+                )
+                cells.append(
+                    f"{elapsed * 1000:>15.2f} ms" if elapsed is not None else "error"
+                )
+            print(f"{size:>8}" + "".join(f"{cell:>18}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,9 @@ from mui.v6.grid import (
     CamelCaseGridFilterModelDict,
     FilterField,
     GridBaseModel,
+    GridColumnFields,
+    GridColumnVisibilityModel,
+    GridCursorCodec,
     GridFilterItem,
     GridFilterItemDict,
     GridFilterModel,
@@ -13,6 +16,7 @@ from mui.v6.grid import (
     GridSortItem,
     GridSortModel,
     Id,
+    InvalidCursorError,
     Items,
     ItemsLiterals,
     LogicOperator,
@@ -36,6 +40,9 @@ __all__ = [
     "CamelCaseGridFilterModelDict",
     "FilterField",
     "GridBaseModel",
+    "GridColumnFields",
+    "GridColumnVisibilityModel",
+    "GridCursorCodec",
     "GridFilterItem",
     "GridFilterItemDict",
     "GridFilterModel",
@@ -47,6 +54,7 @@ __all__ = [
     "GridSortItem",
     "GridSortModel",
     "Id",
+    "InvalidCursorError",
     "Items",
     "ItemsLiterals",
     "LogicOperator",
@@ -0,0 +1,25 @@
+"""The export module serializes the data grid's rows for download.
+
+This module only depends on the standard library, the rows are produced by an
+integration, such as `mui.v6.integrations.sqlalchemy.export`.
+"""
+
+from mui.v6.export.format import (
+    EXPORT_FILE_EXTENSIONS,
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    ExportFormatLiterals,
+)
+from mui.v6.export.writers import iter_buffered, iter_csv, iter_export, iter_ndjson
+
+# isort: unique-list
+__all__ = [
+    "EXPORT_FILE_EXTENSIONS",
+    "EXPORT_MEDIA_TYPES",
+    "ExportFormat",
+    "ExportFormatLiterals",
+    "iter_buffered",
+    "iter_csv",
+    "iter_export",
+    "iter_ndjson",
+]
@@ -0,0 +1,34 @@
+"""The format module contains the formats the data grid's rows can be exported in."""
+
+from typing import Dict
+
+from typing_extensions import Literal
+
+from mui.compat import StrEnum
+
+ExportFormatLiterals = Literal["csv", "ndjson"]
+
+
+class ExportFormat(StrEnum):
+    """The formats the data grid's rows can be exported in.
+
+    Attributes:
+        CSV: Comma separated values, with a header row.
+        NDJSON: Newline delimited JSON, one JSON object per row.
+    """
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+"""The media type of each export format, for use in a response's Content-Type."""
+EXPORT_MEDIA_TYPES: Dict[str, str] = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+"""The file extension of each export format, for use in a download's filename."""
+EXPORT_FILE_EXTENSIONS: Dict[str, str] = {
+    ExportFormat.CSV: ".csv",
+    ExportFormat.NDJSON: ".ndjson",
+}
@@ -0,0 +1,122 @@
+"""The writers module serializes rows into export formats, one row at a time.
+
+Each writer is a generator, so the rows are serialized as they are produced and the
+export's memory use does not depend on the number of rows being exported.
+"""
+
+import csv
+import json
+from io import StringIO
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from mui.v6.export.format import ExportFormat, ExportFormatLiterals
+
+
+def iter_csv(
+    rows: Iterable[Mapping[str, Any]], fields: Optional[Sequence[str]] = None
+) -> Iterator[str]:
+    """Serializes rows as comma separated values, beginning with a header row.
+
+    Args:
+        rows (Iterable[Mapping[str, Any]]): The rows being exported.
+        fields (Optional[Sequence[str]], optional): The fields to export, in order.
+            Keys which aren't exported are ignored, and missing keys are left empty.
+            Defaults to None, exporting the keys of the first row.
+
+    Returns:
+        Iterator[str]: The lines of the CSV document.
+    """
+    buffer = StringIO()
+    writer: Optional["csv.DictWriter[str]"] = None
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(
+                buffer, fieldnames=list(fields or row), extrasaction="ignore"
+            )
+            writer.writeheader()
+        writer.writerow(row)
+        # the buffer is reused, so only a single row is held in memory
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if writer is None and fields:
+        csv.writer(buffer).writerow(fields)
+        yield buffer.getvalue()
+
+
+def iter_ndjson(
+    rows: Iterable[Mapping[str, Any]], fields: Optional[Sequence[str]] = None
+) -> Iterator[str]:
+    """Serializes rows as newline delimited JSON.
+
+    Values which JSON does not natively support, such as datetimes, are converted
+    using `str`.
+
+    Args:
+        rows (Iterable[Mapping[str, Any]]): The rows being exported.
+        fields (Optional[Sequence[str]], optional): The fields to export. Defaults to
+            None, exporting every key of each row.
+
+    Returns:
+        Iterator[str]: The lines of the NDJSON document.
+    """
+    for row in rows:
+        exported = {field: row.get(field) for field in fields} if fields else row
+        yield (
+            json.dumps(exported, default=str, separators=(",", ":"), ensure_ascii=False)
+            + "\n"
+        )
+
+
+def iter_buffered(lines: Iterable[str], size: int = 65536) -> Iterator[str]:
+    """Joins lines into chunks of at least `size` characters.
+
+    Streaming responses write each chunk separately, so joining the lines reduces the
+    number of writes for large exports.
+
+    Args:
+        lines (Iterable[str]): The lines being joined.
+        size (int, optional): The minimum number of characters in each chunk, except
+            the last. Defaults to 65536.
+
+    Returns:
+        Iterator[str]: The chunks of lines.
+    """
+    chunk: List[str] = []
+    length = 0
+    for line in lines:
+        chunk.append(line)
+        length += len(line)
+        if length >= size:
+            yield "".join(chunk)
+            chunk.clear()
+            length = 0
+    if chunk:
+        yield "".join(chunk)
+
+
+def iter_export(
+    rows: Iterable[Mapping[str, Any]],
+    export_format: Union[ExportFormat, ExportFormatLiterals] = ExportFormat.CSV,
+    fields: Optional[Sequence[str]] = None,
+) -> Iterator[str]:
+    """Serializes rows into the requested export format.
+
+    Args:
+        rows (Iterable[Mapping[str, Any]]): The rows being exported.
+        export_format (ExportFormat, optional): The format to export the rows in.
+            Defaults to ExportFormat.CSV.
+        fields (Optional[Sequence[str]], optional): The fields to export, in order.
+            Defaults to None.
+
+    Raises:
+        ValueError: Raised when an invalid export format was received.
+
+    Returns:
+        Iterator[str]: The lines of the exported document.
+    """
+    if export_format == ExportFormat.CSV:
+        return iter_csv(rows=rows, fields=fields)
+    if export_format == ExportFormat.NDJSON:
+        return iter_ndjson(rows=rows, fields=fields)
+    raise ValueError(f"Invalid export format: {export_format}")
@@ -1,4 +1,5 @@
 from mui.v6.grid.base import GridBaseModel
+from mui.v6.grid.columns import GridColumnFields, GridColumnVisibilityModel
 from mui.v6.grid.filter import (
     CamelCaseGridFilterModelDict,
     GridFilterItem,
@@ -19,7 +20,11 @@ from mui.v6.grid.filter import (
 )
 from mui.v6.grid.filter import Field as FilterField
 from mui.v6.grid.logic import GridLogicOperator, GridLogicOperatorLiterals
-from mui.v6.grid.pagination import GridPaginationModel
+from mui.v6.grid.pagination import (
+    GridCursorCodec,
+    GridPaginationModel,
+    InvalidCursorError,
+)
 from mui.v6.grid.request import RequestGridModels
 from mui.v6.grid.sort import Field as SortField
 from mui.v6.grid.sort import GridSortDirection, GridSortItem, GridSortModel, Sort
@@ -29,6 +34,9 @@ __all__ = [
     "CamelCaseGridFilterModelDict",
     "FilterField",
     "GridBaseModel",
+    "GridColumnFields",
+    "GridColumnVisibilityModel",
+    "GridCursorCodec",
     "GridFilterItem",
     "GridFilterItemDict",
     "GridFilterModel",
@@ -40,6 +48,7 @@ __all__ = [
     "GridSortItem",
     "GridSortModel",
     "Id",
+    "InvalidCursorError",
     "Items",
     "ItemsLiterals",
     "LogicOperator",
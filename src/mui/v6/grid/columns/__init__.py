@@ -0,0 +1,4 @@
+from mui.v6.grid.columns.visibility import GridColumnFields, GridColumnVisibilityModel
+
+# isort: unique-list
+__all__ = ["GridColumnFields", "GridColumnVisibilityModel"]
@@ -0,0 +1,20 @@
+"""The visibility module holds the GridColumnVisibilityModel, a type alias."""
+
+from typing import Dict, List
+
+from typing_extensions import TypeAlias
+
+"""The model describing which columns of the data grid are hidden.
+
+Columns mapped to False are hidden, while columns which are mapped to True or absent
+from the model are visible.
+
+Documentation:
+    https://mui.com/x/react-data-grid/column-visibility/
+Code:
+    https://github.com/mui/mui-x/blob/0cdee3369bbf6df792c9228ef55ea1a61a246ff3/packages/grid/x-data-grid/src/hooks/features/columns/gridColumnsInterfaces.ts#L6
+"""
+GridColumnVisibilityModel: TypeAlias = Dict[str, bool]
+
+"""An explicit list of the fields being displayed by the data grid."""
+GridColumnFields: TypeAlias = List[str]
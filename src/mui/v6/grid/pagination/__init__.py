@@ -1,4 +1,5 @@
+from mui.v6.grid.pagination.cursor import GridCursorCodec, InvalidCursorError
 from mui.v6.grid.pagination.model import GridPaginationModel
 
 # isort: unique-list
-__all__ = ["GridPaginationModel"]
+__all__ = ["GridCursorCodec", "GridPaginationModel", "InvalidCursorError"]
@@ -0,0 +1,199 @@
+"""The cursor module contains the encoding used for opaque pagination cursors.
+
+A cursor captures the sort key values of the row at the boundary of a page, so that the
+adjacent page can be located with a seek predicate instead of an OFFSET scan. Cursors
+are handed to the browser, so they are signed with an HMAC to detect tampering.
+Encoding and decoding never touch the database.
+"""
+
+import hmac
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import date, datetime, time
+from decimal import Decimal
+from hashlib import sha256
+from typing import Any, Callable, Dict, Sequence, Tuple, Union
+from uuid import UUID
+
+# the tag is stored as the only key of a JSON object, the value being the string
+# representation of the original value.
+_DECODERS: Dict[str, Callable[[str], Any]] = {
+    "$dt": datetime.fromisoformat,
+    "$d": date.fromisoformat,
+    "$t": time.fromisoformat,
+    "$dec": Decimal,
+    "$uuid": UUID,
+}
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed or its signature does not match."""
+
+
+def _encode_value(value: Any) -> Any:
+    """Converts values which JSON does not natively support into tagged objects.
+
+    Args:
+        value (Any): The value being encoded.
+
+    Raises:
+        TypeError: Raised when the value's type is not supported.
+
+    Returns:
+        Any: The JSON serializable representation of the value.
+    """
+    # datetime must be checked before date, as datetime is a subclass of date
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    if isinstance(value, time):
+        return {"$t": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$dec": str(value)}
+    if isinstance(value, UUID):
+        return {"$uuid": str(value)}
+    raise TypeError(f"Unsupported cursor value type: {type(value).__name__}")
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    """Converts tagged objects back into their original values.
+
+    Args:
+        obj (dict[str, Any]): The JSON object being decoded.
+
+    Returns:
+        Any: The original value, if the object was tagged, otherwise the object.
+    """
+    if len(obj) == 1:
+        ((tag, value),) = obj.items()
+        decoder = _DECODERS.get(tag)
+        if decoder is not None:
+            return decoder(value)
+    return obj
+
+
+def _b64encode(data: bytes) -> str:
+    """Base64 encodes data using the URL-safe alphabet, without padding.
+
+    Args:
+        data (bytes): The data being encoded.
+
+    Returns:
+        str: The encoded data.
+    """
+    return urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    """Decodes URL-safe base64 data which may have had its padding removed.
+
+    Args:
+        data (str): The data being decoded.
+
+    Returns:
+        bytes: The decoded data.
+    """
+    return urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class GridCursorCodec:
+    """Encodes and decodes opaque, tamper-evident pagination cursors.
+
+    The cursor is the URL-safe base64 encoding of a truncated HMAC-SHA256 signature
+    followed by a compact JSON array holding the direction flag and the boundary
+    row's sort key values.
+
+    Supported values are those supported by JSON, plus datetime, date, time, Decimal,
+    and UUID.
+
+    Attributes:
+        digest_size (int): The number of signature bytes stored in each cursor.
+    """
+
+    digest_size: int
+
+    def __init__(self, secret: Union[str, bytes], digest_size: int = 12) -> None:
+        """Initialize a new cursor codec.
+
+        Args:
+            secret (str | bytes): The secret key used to sign cursors. This should be
+                kept private, such as an application's secret key.
+            digest_size (int, optional): The number of signature bytes to store in
+                each cursor. Larger values are harder to forge, at the expense of a
+                longer cursor. Defaults to 12.
+
+        Raises:
+            ValueError: Raised when the secret is empty or the digest size is not
+                between 8 and 32 bytes.
+        """
+        if not secret:
+            raise ValueError("A cursor secret is required")
+        if not 8 <= digest_size <= 32:  # noqa: PLR2004
+            raise ValueError("The digest size must be between 8 and 32 bytes")
+        self._secret = secret.encode("utf-8") if isinstance(secret, str) else secret
+        self.digest_size = digest_size
+
+    def _sign(self, payload: bytes) -> bytes:
+        """Calculates the truncated signature of a payload.
+
+        Args:
+            payload (bytes): The payload being signed.
+
+        Returns:
+            bytes: The signature.
+        """
+        return hmac.new(self._secret, payload, sha256).digest()[: self.digest_size]
+
+    def encode(self, values: Sequence[Any], backward: bool = False) -> str:
+        """Encodes the boundary row's sort key values into an opaque cursor.
+
+        Args:
+            values (Sequence[Any]): The sort key values of the boundary row.
+            backward (bool, optional): Whether the cursor requests the rows before
+                the boundary, rather than after it. Defaults to False.
+
+        Raises:
+            TypeError: Raised when a value's type is not supported.
+
+        Returns:
+            str: The opaque cursor.
+        """
+        payload = json.dumps(
+            [int(backward), *values],
+            default=_encode_value,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        ).encode("utf-8")
+        return _b64encode(self._sign(payload) + payload)
+
+    def decode(self, cursor: str) -> Tuple[Tuple[Any, ...], bool]:
+        """Decodes and verifies an opaque cursor.
+
+        Args:
+            cursor (str): The cursor received from the client.
+
+        Raises:
+            InvalidCursorError: Raised when the cursor is malformed or was not signed
+                by this codec's secret.
+
+        Returns:
+            tuple[tuple[Any, ...], bool]: The boundary row's sort key values and
+                whether the rows before the boundary are being requested.
+        """
+        try:
+            raw = _b64decode(cursor)
+        except (BinasciiError, ValueError) as e:
+            raise InvalidCursorError("Malformed cursor") from e
+        signature, payload = raw[: self.digest_size], raw[self.digest_size :]
+        if not payload or not hmac.compare_digest(signature, self._sign(payload)):
+            raise InvalidCursorError("Invalid cursor signature")
+        try:
+            decoded = json.loads(payload, object_hook=_decode_object)
+        except ValueError as e:
+            raise InvalidCursorError("Malformed cursor") from e
+        if not isinstance(decoded, list) or not decoded:
+            raise InvalidCursorError("Malformed cursor")
+        direction, *values = decoded
+        return tuple(values), bool(direction)
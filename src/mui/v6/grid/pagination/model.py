@@ -1,6 +1,8 @@
 """The pagination model is designed to abstract the pagination-related data grid state.
 """
 
+from typing import Optional
+
 from pydantic import AliasChoices, Field, PositiveInt
 
 from mui.v6.grid.base import GridBaseModel
@@ -12,6 +14,8 @@ class GridPaginationModel(GridBaseModel):
     Attributes:
         page (int): The current page number. Defaults to 0. First page is page zero.
         page_size (int): The size of each page. Defaults to 15.
+        cursor (str | None): The opaque cursor identifying the boundary of the
+            requested page, when using cursor-based pagination. Defaults to None.
     """
 
     page: int = Field(
@@ -28,6 +32,12 @@ class GridPaginationModel(GridBaseModel):
         validation_alias=AliasChoices("page_size", "pageSize"),
         examples=[15],
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        title="Cursor",
+        description="The opaque cursor identifying the boundary of the page.",
+        examples=[None],
+    )
 
     @property
     def offset(self) -> int:
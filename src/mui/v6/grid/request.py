@@ -1,10 +1,11 @@
 """The request module contains the model used to store parsed models."""
 
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from pydantic import AliasChoices, Field, field_validator
 
 from mui.v6.grid.base import GridBaseModel, OptionalKeys
+from mui.v6.grid.columns import GridColumnFields, GridColumnVisibilityModel
 from mui.v6.grid.filter import GridFilterItem, GridFilterModel
 from mui.v6.grid.logic import GridLogicOperator
 from mui.v6.grid.pagination import GridPaginationModel
@@ -27,6 +28,10 @@ class RequestGridModels(GridBaseModel):
             to paginate the table's data.
         sort_model (GridSortModel): The sort model representing how to sort the
             table's data.
+        column_visibility_model (GridColumnVisibilityModel): The column visibility
+            model representing which of the table's columns are hidden.
+        fields (Optional[GridColumnFields]): The fields being displayed, when the
+            client sends an explicit list rather than a column visibility model.
     """
 
     filter_model: GridFilterModel = Field(
@@ -66,6 +71,24 @@ class RequestGridModels(GridBaseModel):
         validation_alias=AliasChoices("sort_model", "sortModel"),
         examples=[[GridSortItem(field="fieldName", sort=GridSortDirection.DESC)]],
     )
+    column_visibility_model: GridColumnVisibilityModel = Field(
+        default_factory=dict,
+        title="Column Visibility Model",
+        description=(
+            "The column visibility model representing which of the table's columns "
+            "are hidden."
+        ),
+        validation_alias=AliasChoices(
+            "column_visibility_model", "columnVisibilityModel"
+        ),
+        examples=[{"fieldName": False}],
+    )
+    fields: Optional[GridColumnFields] = Field(
+        default=None,
+        title="Fields",
+        description="The fields being displayed by the table, if provided.",
+        examples=[["fieldName"]],
+    )
 
     @field_validator("filter_model", mode="before")
     @classmethod
@@ -85,8 +108,15 @@ class RequestGridModels(GridBaseModel):
         """Ensures that the key used the correct default when dynamically set."""
         return [] if v is None else v
 
+    @field_validator("column_visibility_model", mode="before")
+    @classmethod
+    def ensure_column_visibility_model_isnt_none(cls, v: object) -> object:
+        """Ensures that the key used the correct default when dynamically set."""
+        return {} if v is None else v
+
     _optional_keys: ClassVar[OptionalKeys] = {
         ("pagination_model", "paginationModel"),
         ("sort_model", "sortModel"),
         ("filter_model", "filterModel"),
+        ("column_visibility_model", "columnVisibilityModel"),
     }
@@ -0,0 +1,26 @@
+"""The Arrow integration.
+
+This provides exporting the grid's rows as Arrow IPC streams or Parquet files, with
+the column types derived from the resolved SQLAlchemy columns. It requires pyarrow.
+"""
+
+from mui.v6.integrations.arrow.schema import Converter, get_arrow_schema, get_arrow_type
+from mui.v6.integrations.arrow.writers import (
+    ARROW_STREAM_MEDIA_TYPE,
+    PARQUET_MEDIA_TYPE,
+    iter_arrow_ipc,
+    iter_parquet,
+    iter_record_batches,
+)
+
+# isort: unique-list
+__all__ = [
+    "ARROW_STREAM_MEDIA_TYPE",
+    "Converter",
+    "PARQUET_MEDIA_TYPE",
+    "get_arrow_schema",
+    "get_arrow_type",
+    "iter_arrow_ipc",
+    "iter_parquet",
+    "iter_record_batches",
+]
@@ -0,0 +1,150 @@
+"""The schema module derives an Arrow schema from the grid's resolved columns.
+
+Each exported field is resolved to its SQLAlchemy column, and the column's type is
+converted to the equivalent Arrow type. Types without an Arrow equivalent are exported
+as strings.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pyarrow as pa
+from sqlalchemy import types
+from typing_extensions import TypeAlias
+
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+
+"""Converts a value into a representation supported by the field's Arrow type."""
+Converter: TypeAlias = Callable[[Any], Any]
+
+
+def _to_json(value: Any) -> Optional[str]:
+    """Serializes a JSON column's value.
+
+    Args:
+        value (Any): The deserialized value.
+
+    Returns:
+        Optional[str]: The JSON document, or None when the value is None.
+    """
+    return None if value is None else json.dumps(value, default=str)
+
+
+def _to_str(value: Any) -> Optional[str]:
+    """Converts a value without an Arrow equivalent into a string.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        Optional[str]: The string representation, or None when the value is None.
+    """
+    return None if value is None else str(value)
+
+
+def _to_enum_name(value: Any) -> Optional[str]:
+    """Converts an enumerated value into the name stored by SQLAlchemy.
+
+    Args:
+        value (Any): The enum member, or the string when the Enum type is not backed
+            by a Python enum.
+
+    Returns:
+        Optional[str]: The name, or None when the value is None.
+    """
+    return None if value is None else getattr(value, "name", value)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Converts a Decimal into a float, for numeric columns without a precision.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        Optional[float]: The float, or None when the value is None.
+    """
+    return None if value is None else float(value)
+
+
+def _get_decimal_type(type_: Any) -> Tuple[Any, Optional[Converter]]:
+    """Converts a Numeric type into a decimal type, when its precision is known.
+
+    Args:
+        type_ (Any): The SQLAlchemy Numeric type.
+
+    Returns:
+        Tuple[pa.DataType, Optional[Converter]]: The Arrow type and converter.
+    """
+    if not type_.precision:
+        return pa.float64(), _to_float
+    decimal = pa.decimal128 if type_.precision <= 38 else pa.decimal256  # noqa: PLR2004
+    return decimal(type_.precision, type_.scale or 0), None
+
+
+# ordered from the most to the least specific, as the checks use isinstance
+_ARROW_TYPES: List[Tuple[type, Callable[[Any], Tuple[Any, Optional[Converter]]]]] = [
+    (types.JSON, lambda _: (pa.string(), _to_json)),
+    (types.Boolean, lambda _: (pa.bool_(), None)),
+    (types.SmallInteger, lambda _: (pa.int16(), None)),
+    (types.Integer, lambda _: (pa.int64(), None)),
+    (types.Float, lambda _: (pa.float64(), None)),
+    (types.Numeric, _get_decimal_type),
+    (
+        types.DateTime,
+        lambda type_: (pa.timestamp("us", tz="UTC" if type_.timezone else None), None),
+    ),
+    (types.Date, lambda _: (pa.date32(), None)),
+    (types.Time, lambda _: (pa.time64("us"), None)),
+    (types.Interval, lambda _: (pa.duration("us"), None)),
+    (types.LargeBinary, lambda _: (pa.binary(), None)),
+    (types.Enum, lambda _: (pa.string(), _to_enum_name)),
+    (types.String, lambda _: (pa.string(), None)),
+]
+
+
+def get_arrow_type(type_: Any) -> Tuple[Any, Optional[Converter]]:
+    """Converts a SQLAlchemy type into the equivalent Arrow type.
+
+    Args:
+        type_ (Any): The SQLAlchemy type, such as `Integer()`.
+
+    Returns:
+        Tuple[pa.DataType, Optional[Converter]]: The Arrow type, and the converter
+            which must be applied to each value, if the value isn't natively
+            supported by the Arrow type.
+    """
+    # type decorators are stored using their implementation's type
+    if isinstance(type_, types.TypeDecorator):
+        type_ = type_.impl
+    for sqlalchemy_type, get_type in _ARROW_TYPES:
+        if isinstance(type_, sqlalchemy_type):
+            return get_type(type_)
+    return pa.string(), _to_str
+
+
+def get_arrow_schema(
+    fields: Sequence[str], resolver: Resolver
+) -> Tuple[Any, Dict[str, Converter]]:
+    """Builds the Arrow schema of the exported fields.
+
+    Args:
+        fields (Sequence[str]): The exported fields, in order.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+
+    Returns:
+        Tuple[pa.Schema, Dict[str, Converter]]: The schema, and the converters of the
+            fields whose values must be converted before being written.
+    """
+    arrow_fields: List[Any] = []
+    converters: Dict[str, Converter] = {}
+    for field in fields:
+        column = resolver(field)
+        arrow_type, converter = get_arrow_type(getattr(column, "type", None))
+        if converter is not None:
+            converters[field] = converter
+        expression = getattr(column, "expression", column)
+        nullable = getattr(expression, "nullable", True)
+        arrow_fields.append(pa.field(field, arrow_type, nullable=bool(nullable)))
+    return pa.schema(arrow_fields), converters
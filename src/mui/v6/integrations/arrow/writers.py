@@ -0,0 +1,118 @@
+"""The writers module streams exported rows as Arrow IPC or Parquet.
+
+The rows are collected into record batches of `batch_size` rows, and the encoded bytes
+are yielded as each batch is written, so only a single batch is held in memory.
+"""
+
+from io import BytesIO
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet
+
+from mui.v6.integrations.arrow.schema import Converter
+
+"""The media type of an Arrow IPC stream."""
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+"""The media type of a Parquet file."""
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+
+
+def iter_record_batches(
+    rows: Iterable[Mapping[str, Any]],
+    schema: Any,
+    converters: Optional[Dict[str, Converter]] = None,
+    batch_size: int = 10000,
+) -> Iterator[Any]:
+    """Collects rows into record batches.
+
+    Args:
+        rows (Iterable[Mapping[str, Any]]): The rows being exported, keyed by field.
+        schema (pa.Schema): The schema of the record batches, from
+            `get_arrow_schema`. Keys which aren't in the schema are ignored.
+        converters (Optional[Dict[str, Converter]], optional): The converters of the
+            fields whose values must be converted. Defaults to None.
+        batch_size (int, optional): The number of rows in each record batch.
+            Defaults to 10000.
+
+    Returns:
+        Iterator[pa.RecordBatch]: The record batches.
+    """
+    converters = converters or {}
+    names: List[str] = list(schema.names)
+    columns: Dict[str, List[Any]] = {name: [] for name in names}
+    count = 0
+    for row in rows:
+        for name in names:
+            value = row.get(name)
+            converter = converters.get(name)
+            columns[name].append(converter(value) if converter else value)
+        count += 1
+        if count == batch_size:
+            yield pa.RecordBatch.from_pydict(columns, schema=schema)
+            columns = {name: [] for name in names}
+            count = 0
+    if count:
+        yield pa.RecordBatch.from_pydict(columns, schema=schema)
+
+
+def _drain(buffer: BytesIO) -> bytes:
+    """Retrieves the bytes written to the buffer, and empties it.
+
+    Args:
+        buffer (BytesIO): The buffer being written to.
+
+    Returns:
+        bytes: The bytes written since the buffer was last drained.
+    """
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+
+def iter_arrow_ipc(batches: Iterable[Any], schema: Any) -> Iterator[bytes]:
+    """Encodes record batches as an Arrow IPC stream.
+
+    The stream can be read batch by batch with `pyarrow.ipc.open_stream`, without
+    copying or parsing the values.
+
+    Args:
+        batches (Iterable[pa.RecordBatch]): The record batches being written.
+        schema (pa.Schema): The schema of the record batches.
+
+    Returns:
+        Iterator[bytes]: The encoded stream.
+    """
+    buffer = BytesIO()
+    with pyarrow.ipc.new_stream(buffer, schema) as writer:
+        yield _drain(buffer)
+        for batch in batches:
+            writer.write_batch(batch)
+            yield _drain(buffer)
+    yield _drain(buffer)
+
+
+def iter_parquet(
+    batches: Iterable[Any], schema: Any, compression: str = "snappy"
+) -> Iterator[bytes]:
+    """Encodes record batches as a Parquet file, writing a row group per batch.
+
+    Args:
+        batches (Iterable[pa.RecordBatch]): The record batches being written.
+        schema (pa.Schema): The schema of the record batches.
+        compression (str, optional): The compression codec. Defaults to "snappy".
+
+    Returns:
+        Iterator[bytes]: The encoded file.
+    """
+    buffer = BytesIO()
+    with pyarrow.parquet.ParquetWriter(
+        buffer, schema, compression=compression
+    ) as writer:
+        for batch in batches:
+            writer.write_table(pa.Table.from_batches([batch], schema=schema))
+            yield _drain(buffer)
+    yield _drain(buffer)
@@ -4,6 +4,11 @@ This provides native support for parsing the filter, pagination, and sort model
 from request.args.
 """
 
+from mui.v6.integrations.flask.columns import (
+    get_grid_column_fields_from_request,
+    get_grid_column_visibility_model_from_request,
+)
+from mui.v6.integrations.flask.export import get_export_response
 from mui.v6.integrations.flask.filter import get_grid_filter_model_from_request
 from mui.v6.integrations.flask.pagination import get_grid_pagination_model_from_request
 from mui.v6.integrations.flask.request import get_grid_models_from_request
@@ -11,6 +16,9 @@ from mui.v6.integrations.flask.sort import get_grid_sort_model_from_request
 
 # isort: unique-list
 __all__ = [
+    "get_export_response",
+    "get_grid_column_fields_from_request",
+    "get_grid_column_visibility_model_from_request",
     "get_grid_filter_model_from_request",
     "get_grid_models_from_request",
     "get_grid_pagination_model_from_request",
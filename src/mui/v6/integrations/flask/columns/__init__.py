@@ -0,0 +1,12 @@
+"""The columns module contains the column visibility model integration for Flask."""
+
+from mui.v6.integrations.flask.columns.model import (
+    get_grid_column_fields_from_request,
+    get_grid_column_visibility_model_from_request,
+)
+
+# isort: unique-list
+__all__ = [
+    "get_grid_column_fields_from_request",
+    "get_grid_column_visibility_model_from_request",
+]
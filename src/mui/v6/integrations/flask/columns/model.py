@@ -0,0 +1,78 @@
+"""The columns model Flask integration.
+
+Supports parsing a GridColumnVisibilityModel and a list of fields from Flask's
+request.args
+"""
+
+from typing import Optional
+
+from flask import request
+from pydantic import TypeAdapter
+from typing_extensions import Literal
+
+from mui.v6.grid.columns import GridColumnFields, GridColumnVisibilityModel
+
+grid_column_visibility_model_adapter: TypeAdapter[GridColumnVisibilityModel] = (
+    TypeAdapter(GridColumnVisibilityModel)
+)
+grid_column_fields_adapter: TypeAdapter[GridColumnFields] = TypeAdapter(
+    GridColumnFields
+)
+
+
+def get_grid_column_visibility_model_from_request(
+    key: str = "column_visibility_model", model_format: Literal["json"] = "json"
+) -> GridColumnVisibilityModel:
+    """Retrieves a GridColumnVisibilityModel from request.args.
+
+    Args:
+        key (str): The key in the request args where the column visibility model
+            should be parsed from. Defaults to "column_visibility_model".
+        model_format (Literal["json"]): The format of the model. Currently, only a
+            URL-encoded JSON object is supported. Defaults to "json".
+
+    Raises:
+        ValidationError: Raised when an invalid type was received.
+        ValueError: Raised when an invalid model format was received.
+
+    Returns:
+        GridColumnVisibilityModel: The parsed column visibility model, or an empty
+            model when the key doesn't exist.
+    """
+    if model_format == "json":
+        value = request.args.get(key=key)
+        return (
+            grid_column_visibility_model_adapter.validate_json(value)
+            if value is not None
+            else {}
+        )
+    raise ValueError(f"Invalid model format: {model_format}")
+
+
+def get_grid_column_fields_from_request(
+    key: str = "fields", model_format: Literal["json"] = "json"
+) -> Optional[GridColumnFields]:
+    """Retrieves the list of displayed fields from request.args.
+
+    Args:
+        key (str): The key in the request args where the fields should be parsed
+            from. Defaults to "fields".
+        model_format (Literal["json"]): The format of the fields. Currently, only a
+            URL-encoded JSON list is supported. Defaults to "json".
+
+    Raises:
+        ValidationError: Raised when an invalid type was received.
+        ValueError: Raised when an invalid model format was received.
+
+    Returns:
+        Optional[GridColumnFields]: The parsed fields, or None when the key doesn't
+            exist.
+    """
+    if model_format == "json":
+        value = request.args.get(key=key)
+        return (
+            grid_column_fields_adapter.validate_json(value)
+            if value is not None
+            else None
+        )
+    raise ValueError(f"Invalid model format: {model_format}")
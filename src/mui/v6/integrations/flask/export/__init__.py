@@ -0,0 +1,6 @@
+"""The export module contains the streaming export response integration for Flask."""
+
+from mui.v6.integrations.flask.export.response import get_export_response
+
+# isort: unique-list
+__all__ = ["get_export_response"]
@@ -0,0 +1,54 @@
+"""The response module contains the streaming export response Flask integration."""
+
+from typing import Any, Iterable, Mapping, Optional, Sequence, Union
+
+from flask import Response, stream_with_context
+
+from mui.v6.export import (
+    EXPORT_FILE_EXTENSIONS,
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    ExportFormatLiterals,
+    iter_buffered,
+    iter_export,
+)
+
+
+def get_export_response(
+    rows: Iterable[Mapping[str, Any]],
+    export_format: Union[ExportFormat, ExportFormatLiterals] = ExportFormat.CSV,
+    fields: Optional[Sequence[str]] = None,
+    filename: str = "export",
+) -> Response:
+    """Creates a streaming response which downloads the exported rows.
+
+    The rows are serialized while the response is being sent, within the request
+    context, so a lazily evaluated iterable, such as `iter_export_items`, is read
+    incrementally and the response's memory use stays flat.
+
+    Args:
+        rows (Iterable[Mapping[str, Any]]): The rows being exported.
+        export_format (ExportFormat, optional): The format to export the rows in.
+            Defaults to ExportFormat.CSV.
+        fields (Optional[Sequence[str]], optional): The fields to export, in order.
+            Defaults to None, exporting the keys of the rows.
+        filename (str, optional): The name of the downloaded file, without the
+            extension. Defaults to "export".
+
+    Raises:
+        ValueError: Raised when an invalid export format was received.
+
+    Returns:
+        Response: The streaming response.
+    """
+    lines = iter_export(rows=rows, export_format=export_format, fields=fields)
+    return Response(
+        stream_with_context(iter_buffered(lines=lines)),
+        mimetype=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{filename}'
+                f'{EXPORT_FILE_EXTENSIONS[export_format]}"'
+            )
+        },
+    )
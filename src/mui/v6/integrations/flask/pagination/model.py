@@ -33,6 +33,14 @@ def get_grid_pagination_model_from_request(
                 /api/v1/endpoint?page=0&page_size=15
             Key-based structure:
                 /api/v1/endpoint?page_model=%7B%22page%22%3A%200%2C%20%22page_size%22%3A%2015%7D
+        Cursor-based:
+            Default structure:
+                /api/v1/endpoint?pageSize=15&cursor=AbC123
+            Key-based structure:
+                /api/v1/endpoint?pageModel=%7B%22pageSize%22%3A%2015%2C%20%22cursor%22%3A%20%22AbC123%22%7D
+
+    The cursor is parsed as an opaque string. It is decoded and verified by a
+    GridCursorCodec when the query is built, rather than while parsing the request.
 
     Raises:
         ValidationError: Raised when an invalid type was received.
@@ -1,12 +1,17 @@
 """The request grid model Flask integration.
 
-Supports parsing the filter, pagination, and sort models from Flask's request.args."""
+Supports parsing the filter, pagination, sort, and column visibility models from Flask's
+request.args."""
 
 from typing import Optional
 
 from typing_extensions import Literal
 
 from mui.v6.grid.request import RequestGridModels
+from mui.v6.integrations.flask.columns.model import (
+    get_grid_column_fields_from_request,
+    get_grid_column_visibility_model_from_request,
+)
 from mui.v6.integrations.flask.filter.model import get_grid_filter_model_from_request
 from mui.v6.integrations.flask.pagination.model import (
     get_grid_pagination_model_from_request,
@@ -14,14 +19,17 @@ from mui.v6.integrations.flask.pagination.model import (
 from mui.v6.integrations.flask.sort.model import get_grid_sort_model_from_request
 
 
-def get_grid_models_from_request(
+def get_grid_models_from_request(  # noqa: PLR0917
     sort_model_key: str = "sort_model[]",
     filter_model_key: str = "filter_model",
     pagination_model_key: Optional[str] = None,
     sort_model_format: Literal["json"] = "json",
     filter_model_format: Literal["json"] = "json",
+    column_visibility_model_key: Optional[str] = None,
+    fields_key: Optional[str] = None,
 ) -> RequestGridModels:
-    """Parses the filter, sort, and pagination models from the request.
+    """Parses the filter, sort, pagination, and column visibility models from the
+    request.
 
     Args:
         sort_model_key (str, optional): The key to retrieve the grid sort model from in
@@ -40,6 +48,17 @@ def get_grid_models_from_request(
                     ?page=0&pageSize=12
                 Example "pagination_model" query string:
                     ?pagination_model=%7B%22page%22%3A%200%2C%20%22pageSize%22%3A%2015%7D
+        column_visibility_model_key (str | None, optional): The key to retrieve the
+            grid column visibility model from in the request.args. The column
+            visibility model is a URL-encoded JSON object mapping fields to their
+            visibility. If the provided key is None, the column visibility model isn't
+            parsed and every column is visible. Defaults to None.
+                Example "column_visibility_model" query string:
+                    ?column_visibility_model=%7B%22name%22%3A%20false%7D
+        fields_key (str | None, optional): The key to retrieve the list of displayed
+            fields from in the request.args. The fields are a URL-encoded JSON list.
+            If the provided key is None, the fields aren't parsed and every field is
+            displayed. Defaults to None.
 
     Raises:
         ValidationError: Raised when an invalid or partial data structure is received
@@ -58,4 +77,16 @@ def get_grid_models_from_request(
         pagination_model=get_grid_pagination_model_from_request(
             key=pagination_model_key
         ),
+        column_visibility_model=(
+            get_grid_column_visibility_model_from_request(
+                key=column_visibility_model_key
+            )
+            if column_visibility_model_key is not None
+            else {}
+        ),
+        fields=(
+            get_grid_column_fields_from_request(key=fields_key)
+            if fields_key is not None
+            else None
+        ),
     )
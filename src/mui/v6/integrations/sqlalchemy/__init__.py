@@ -1,30 +1,72 @@
 from mui.v6.integrations.sqlalchemy.apply_models import (
+    apply_data_grid_models_to_async_query,
     apply_data_grid_models_to_query,
+    apply_request_grid_models_to_async_query,
     apply_request_grid_models_to_query,
 )
+from mui.v6.integrations.sqlalchemy.cache import CountCache, PageCache, PlanCache
+from mui.v6.integrations.sqlalchemy.export import iter_export_items
 from mui.v6.integrations.sqlalchemy.filter import (
+    OperatorPlan,
     apply_filter_items_to_query_from_items,
     apply_filter_to_query_from_model,
+    register_operator,
+    register_operator_layer,
+    reset_operators,
+    unregister_operator_layer,
 )
 from mui.v6.integrations.sqlalchemy.pagination import (
+    Keyset,
+    PaginationStrategy,
+    apply_keyset_to_query_from_model,
     apply_limit_offset_to_query_from_model,
 )
+from mui.v6.integrations.sqlalchemy.quick_filter import (
+    FullTextIndex,
+    register_quick_filter_backend,
+)
 from mui.v6.integrations.sqlalchemy.resolver import Resolver
 from mui.v6.integrations.sqlalchemy.sort import (
     apply_sort_to_query_from_model,
     get_sort_expression_from_item,
 )
-from mui.v6.integrations.sqlalchemy.structures import DataGridQuery
+from mui.v6.integrations.sqlalchemy.structures import (
+    AsyncDataGridQuery,
+    DataGridQuery,
+    TotalCount,
+    UnknownRowCountResponse,
+    get_unknown_row_count_response,
+)
 
 # isort: unique-list
 __all__ = [
+    "AsyncDataGridQuery",
+    "CountCache",
     "DataGridQuery",
+    "FullTextIndex",
+    "Keyset",
+    "OperatorPlan",
+    "PageCache",
+    "PaginationStrategy",
+    "PlanCache",
     "Resolver",
+    "TotalCount",
+    "UnknownRowCountResponse",
+    "apply_data_grid_models_to_async_query",
     "apply_data_grid_models_to_query",
     "apply_filter_items_to_query_from_items",
     "apply_filter_to_query_from_model",
+    "apply_keyset_to_query_from_model",
     "apply_limit_offset_to_query_from_model",
+    "apply_request_grid_models_to_async_query",
     "apply_request_grid_models_to_query",
     "apply_sort_to_query_from_model",
     "get_sort_expression_from_item",
+    "get_unknown_row_count_response",
+    "iter_export_items",
+    "register_operator",
+    "register_operator_layer",
+    "register_quick_filter_backend",
+    "reset_operators",
+    "unregister_operator_layer",
 ]
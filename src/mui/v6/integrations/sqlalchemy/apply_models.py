@@ -1,27 +1,46 @@
 """The apply_models module is used to apply the X-Data-Grid state models, such as the
-GridFilterModel, GridSortModel, and GridPaginationModel to a SQLAlchemy ORM query.
+GridFilterModel, GridSortModel, and GridPaginationModel to a SQLAlchemy ORM query, or
+to a select statement executed by an AsyncSession.
 """
 
-from typing import Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 from sqlalchemy.orm import Query
+from sqlalchemy.sql import Select
 
 from mui.v6.grid import (
+    GridColumnFields,
+    GridColumnVisibilityModel,
+    GridCursorCodec,
     GridFilterModel,
     GridPaginationModel,
     GridSortModel,
     RequestGridModels,
 )
+from mui.v6.integrations.sqlalchemy.cache import CountCache, PageCache, PlanCache
+from mui.v6.integrations.sqlalchemy.pagination import Keyset, PaginationStrategy
+from mui.v6.integrations.sqlalchemy.quick_filter import FullTextIndex
 from mui.v6.integrations.sqlalchemy.resolver import Resolver
-from mui.v6.integrations.sqlalchemy.structures import DataGridQuery
+from mui.v6.integrations.sqlalchemy.structures import AsyncDataGridQuery, DataGridQuery
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 T = TypeVar("T")
 
 
-def apply_request_grid_models_to_query(
+def apply_request_grid_models_to_query(  # noqa: PLR0917
     query: "Query[T]",
     request_model: RequestGridModels,
     column_resolver: Resolver,
+    pagination_strategy: PaginationStrategy = PaginationStrategy.OFFSET,
+    keyset: Optional[Keyset] = None,
+    cursor_codec: Optional[GridCursorCodec] = None,
+    count_cache: Optional[CountCache] = None,
+    page_cache: Optional[PageCache] = None,
+    plan_cache: Optional[PlanCache] = None,
+    optimize_filter: bool = False,
+    quick_filter_index: Optional[FullTextIndex] = None,
 ) -> "DataGridQuery[T]":
     """Applies a RequestGridModels object to a query.
 
@@ -36,6 +55,25 @@ def apply_request_grid_models_to_query(
         column_resolver (Resolver): The resolver responsible for taking an X-Data-Grid
             field name (from the UI configuration) and resolving it to the appropriate
             SQLAlchemy model column.
+        pagination_strategy (PaginationStrategy, optional): How the page of results
+            is located. Defaults to PaginationStrategy.OFFSET.
+        keyset (Optional[Keyset], optional): The boundary of the requested page when
+            using the keyset pagination strategy. Defaults to None.
+        cursor_codec (Optional[GridCursorCodec], optional): The codec used to decode
+            the pagination model's cursor into the keyset, and to encode the adjacent
+            keysets into cursors. Defaults to None.
+        count_cache (Optional[CountCache], optional): The cache used to store the
+            total number of rows with the filter. Defaults to None.
+        page_cache (Optional[PageCache], optional): The cache used to store
+            serialized pages, including prefetched pages. Defaults to None.
+        plan_cache (Optional[PlanCache], optional): The cache of the filter and sort
+            clauses built for each shape of request. Defaults to None.
+        optimize_filter (bool, optional): Whether to simplify the filter model before
+            it's applied, skipping the database when it can't match any rows.
+            Defaults to False.
+        quick_filter_index (Optional[FullTextIndex], optional): The full-text index
+            searched for the filter model's quick filter values. When None, the quick
+            filter values are ignored. Defaults to None.
 
     Returns:
         Query[T]: The query, after it's paginated, ordered, and paginated. The caller
@@ -48,15 +86,35 @@ def apply_request_grid_models_to_query(
         filter_model=request_model.filter_model,
         sort_model=request_model.sort_model,
         pagination_model=request_model.pagination_model,
+        pagination_strategy=pagination_strategy,
+        keyset=keyset,
+        cursor_codec=cursor_codec,
+        count_cache=count_cache,
+        page_cache=page_cache,
+        fields=request_model.fields,
+        column_visibility_model=request_model.column_visibility_model,
+        plan_cache=plan_cache,
+        optimize_filter=optimize_filter,
+        quick_filter_index=quick_filter_index,
     )
 
 
-def apply_data_grid_models_to_query(
+def apply_data_grid_models_to_query(  # noqa: PLR0917
     query: "Query[T]",
     column_resolver: Resolver,
     filter_model: Optional[GridFilterModel] = None,
     sort_model: Optional[GridSortModel] = None,
     pagination_model: Optional[GridPaginationModel] = None,
+    pagination_strategy: PaginationStrategy = PaginationStrategy.OFFSET,
+    keyset: Optional[Keyset] = None,
+    cursor_codec: Optional[GridCursorCodec] = None,
+    count_cache: Optional[CountCache] = None,
+    page_cache: Optional[PageCache] = None,
+    fields: Optional[GridColumnFields] = None,
+    column_visibility_model: Optional[GridColumnVisibilityModel] = None,
+    plan_cache: Optional[PlanCache] = None,
+    optimize_filter: bool = False,
+    quick_filter_index: Optional[FullTextIndex] = None,
 ) -> "DataGridQuery[T]":
     """Applies the provided X-Data-Grid state models to the SQLAlchemy ORM Query.
 
@@ -76,6 +134,31 @@ def apply_data_grid_models_to_query(
         pagination_model (Optional[GridPaginationModel], optional): The pagination
             model to apply to the query. If None, this stage will be skipped.
             Defaults to None.
+        pagination_strategy (PaginationStrategy, optional): How the page of results
+            is located. Defaults to PaginationStrategy.OFFSET.
+        keyset (Optional[Keyset], optional): The boundary of the requested page when
+            using the keyset pagination strategy. Defaults to None.
+        cursor_codec (Optional[GridCursorCodec], optional): The codec used to decode
+            the pagination model's cursor into the keyset, and to encode the adjacent
+            keysets into cursors. Defaults to None.
+        count_cache (Optional[CountCache], optional): The cache used to store the
+            total number of rows with the filter. Defaults to None.
+        page_cache (Optional[PageCache], optional): The cache used to store
+            serialized pages, including prefetched pages. Defaults to None.
+        fields (Optional[GridColumnFields], optional): The fields displayed by the
+            grid. When provided, only the displayed columns are loaded. Defaults to
+            None.
+        column_visibility_model (Optional[GridColumnVisibilityModel], optional): The
+            visibility of the grid's fields. When provided, hidden columns are not
+            loaded. Defaults to None.
+        plan_cache (Optional[PlanCache], optional): The cache of the filter and sort
+            clauses built for each shape of request. Defaults to None.
+        optimize_filter (bool, optional): Whether to simplify the filter model before
+            it's applied, skipping the database when it can't match any rows.
+            Defaults to False.
+        quick_filter_index (Optional[FullTextIndex], optional): The full-text index
+            searched for the filter model's quick filter values. When None, the quick
+            filter values are ignored. Defaults to None.
 
     Returns:
         Query[T]: The query, with the filter, sort, and/or pagination models applied.
@@ -86,4 +169,122 @@ def apply_data_grid_models_to_query(
         filter_model=filter_model,
         sort_model=sort_model,
         pagination_model=pagination_model,
+        pagination_strategy=pagination_strategy,
+        keyset=keyset,
+        cursor_codec=cursor_codec,
+        count_cache=count_cache,
+        page_cache=page_cache,
+        fields=fields,
+        column_visibility_model=column_visibility_model,
+        plan_cache=plan_cache,
+        optimize_filter=optimize_filter,
+        quick_filter_index=quick_filter_index,
+    )
+
+
+def apply_request_grid_models_to_async_query(  # noqa: PLR0917
+    statement: Select,
+    session: "AsyncSession",
+    request_model: RequestGridModels,
+    column_resolver: Resolver,
+    pagination_strategy: PaginationStrategy = PaginationStrategy.OFFSET,
+    keyset: Optional[Keyset] = None,
+    cursor_codec: Optional[GridCursorCodec] = None,
+) -> "AsyncDataGridQuery[Any]":
+    """Applies a RequestGridModels object to a select statement for an AsyncSession.
+
+    Args:
+        statement (Select): The base select statement which will be filtered,
+            ordered, and paginated.
+        session (AsyncSession): The session used to execute the statement.
+        request_model (RequestGridModels): The X-Data-Grid state models being applied
+            to the statement.
+        column_resolver (Resolver): The resolver responsible for taking an X-Data-Grid
+            field name (from the UI configuration) and resolving it to the appropriate
+            SQLAlchemy model column.
+        pagination_strategy (PaginationStrategy, optional): How the page of results
+            is located. Defaults to PaginationStrategy.OFFSET.
+        keyset (Optional[Keyset], optional): The boundary of the requested page when
+            using the keyset pagination strategy. Defaults to None.
+        cursor_codec (Optional[GridCursorCodec], optional): The codec used to decode
+            the pagination model's cursor into the keyset, and to encode the adjacent
+            keysets into cursors. Defaults to None.
+
+    Returns:
+        AsyncDataGridQuery[Any]: The async query, whose results should be awaited.
+    """
+    return apply_data_grid_models_to_async_query(
+        statement=statement,
+        session=session,
+        column_resolver=column_resolver,
+        filter_model=request_model.filter_model,
+        sort_model=request_model.sort_model,
+        pagination_model=request_model.pagination_model,
+        pagination_strategy=pagination_strategy,
+        keyset=keyset,
+        cursor_codec=cursor_codec,
+        fields=request_model.fields,
+        column_visibility_model=request_model.column_visibility_model,
+    )
+
+
+def apply_data_grid_models_to_async_query(  # noqa: PLR0917
+    statement: Select,
+    session: "AsyncSession",
+    column_resolver: Resolver,
+    filter_model: Optional[GridFilterModel] = None,
+    sort_model: Optional[GridSortModel] = None,
+    pagination_model: Optional[GridPaginationModel] = None,
+    pagination_strategy: PaginationStrategy = PaginationStrategy.OFFSET,
+    keyset: Optional[Keyset] = None,
+    cursor_codec: Optional[GridCursorCodec] = None,
+    fields: Optional[GridColumnFields] = None,
+    column_visibility_model: Optional[GridColumnVisibilityModel] = None,
+) -> "AsyncDataGridQuery[Any]":
+    """Applies the provided X-Data-Grid state models to a select statement for an
+    AsyncSession.
+
+    Args:
+        statement (Select): The base select statement which will be filtered,
+            ordered, and paginated.
+        session (AsyncSession): The session used to execute the statement.
+        column_resolver (Resolver): The resolver responsible for taking an X-Data-Grid
+            field name (from the UI configuration) and resolving it to the appropriate
+            SQLAlchemy model column.
+        filter_model (Optional[GridFilterModel], optional): The filter model to apply
+            to the statement. If None, this stage will be skipped. Defaults to None.
+        sort_model (Optional[GridSortModel], optional): The sort model to apply to the
+            statement. If None, this stage will be skipped. Defaults to None.
+        pagination_model (Optional[GridPaginationModel], optional): The pagination
+            model to apply to the statement. If None, this stage will be skipped.
+            Defaults to None.
+        pagination_strategy (PaginationStrategy, optional): How the page of results
+            is located. Defaults to PaginationStrategy.OFFSET.
+        keyset (Optional[Keyset], optional): The boundary of the requested page when
+            using the keyset pagination strategy. Defaults to None.
+        cursor_codec (Optional[GridCursorCodec], optional): The codec used to decode
+            the pagination model's cursor into the keyset, and to encode the adjacent
+            keysets into cursors. Defaults to None.
+        fields (Optional[GridColumnFields], optional): The fields displayed by the
+            grid. When provided, only the displayed columns are loaded. Defaults to
+            None.
+        column_visibility_model (Optional[GridColumnVisibilityModel], optional): The
+            visibility of the grid's fields. When provided, hidden columns are not
+            loaded. Defaults to None.
+
+    Returns:
+        AsyncDataGridQuery[Any]: The async query, whose results should be awaited.
+    """
+    return AsyncDataGridQuery[Any](
+        statement=statement,
+        session=session,
+        column_resolver=column_resolver,
+        filter_model=filter_model,
+        sort_model=sort_model,
+        pagination_model=pagination_model,
+        pagination_strategy=pagination_strategy,
+        keyset=keyset,
+        cursor_codec=cursor_codec,
+        fields=fields,
+        column_visibility_model=column_visibility_model,
     )
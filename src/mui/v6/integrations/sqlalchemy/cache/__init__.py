@@ -0,0 +1,34 @@
+"""The cache module contains the total count cache, its storage backends, the page
+cache used to prefetch pages, and the plan cache of filter and sort clauses."""
+
+from mui.v6.integrations.sqlalchemy.cache.backend import (
+    CachedCount,
+    CountCacheBackend,
+    LRUCountCacheBackend,
+)
+from mui.v6.integrations.sqlalchemy.cache.count import CountCache
+from mui.v6.integrations.sqlalchemy.cache.fingerprint import (
+    get_count_fingerprint,
+    get_page_fingerprint,
+)
+from mui.v6.integrations.sqlalchemy.cache.page import CachedPage, PageCache
+from mui.v6.integrations.sqlalchemy.cache.plan import (
+    PlanCache,
+    QueryPlan,
+    get_query_shape,
+)
+
+# isort: unique-list
+__all__ = [
+    "CachedCount",
+    "CachedPage",
+    "CountCache",
+    "CountCacheBackend",
+    "LRUCountCacheBackend",
+    "PageCache",
+    "PlanCache",
+    "QueryPlan",
+    "get_count_fingerprint",
+    "get_page_fingerprint",
+    "get_query_shape",
+]
@@ -0,0 +1,111 @@
+"""The backend module contains the storage used by the total count cache.
+
+Backends only store counts, the count cache is responsible for deciding whether a
+stored count is fresh, stale, or expired. This allows a shared store, such as Redis,
+to be used by implementing the `CountCacheBackend` protocol.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import NamedTuple, Optional
+
+from typing_extensions import Protocol
+
+
+class CachedCount(NamedTuple):
+    """A total count stored by a count cache backend.
+
+    Attributes:
+        total (int): The total number of rows.
+        stored_at (float): The clock time at which the total was counted.
+    """
+
+    total: int
+    stored_at: float
+
+
+class CountCacheBackend(Protocol):
+    """The storage used by a count cache."""
+
+    def get(self, key: str) -> Optional[CachedCount]:
+        """Retrieves the count stored for a key.
+
+        Args:
+            key (str): The fingerprint of the counted query.
+
+        Returns:
+            Optional[CachedCount]: The stored count, if one exists.
+        """
+
+    def set(self, key: str, value: CachedCount) -> None:
+        """Stores the count for a key.
+
+        Args:
+            key (str): The fingerprint of the counted query.
+            value (CachedCount): The count being stored.
+        """
+
+
+class LRUCountCacheBackend:
+    """An in-process backend which evicts the least recently used counts.
+
+    The backend is safe to share between threads.
+
+    Attributes:
+        maxsize (int): The maximum number of counts stored.
+    """
+
+    maxsize: int
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initialize a new LRU backend.
+
+        Args:
+            maxsize (int, optional): The maximum number of counts stored. Defaults to
+                1024.
+
+        Raises:
+            ValueError: Raised when the maximum size is less than one.
+        """
+        if maxsize < 1:
+            raise ValueError("The cache must be able to store at least one count")
+        self.maxsize = maxsize
+        self._counts: "OrderedDict[str, CachedCount]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of counts stored.
+
+        Returns:
+            int: The number of counts stored.
+        """
+        return len(self._counts)
+
+    def get(self, key: str) -> Optional[CachedCount]:
+        """Retrieves the count stored for a key, marking it as recently used.
+
+        Args:
+            key (str): The fingerprint of the counted query.
+
+        Returns:
+            Optional[CachedCount]: The stored count, if one exists.
+        """
+        with self._lock:
+            value = self._counts.get(key)
+            if value is not None:
+                self._counts.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: CachedCount) -> None:
+        """Stores the count for a key, evicting the least recently used count if the
+        backend is full.
+
+        Args:
+            key (str): The fingerprint of the counted query.
+            value (CachedCount): The count being stored.
+        """
+        with self._lock:
+            self._counts[key] = value
+            self._counts.move_to_end(key)
+            while len(self._counts) > self.maxsize:
+                self._counts.popitem(last=False)
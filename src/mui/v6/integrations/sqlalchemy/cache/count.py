@@ -0,0 +1,177 @@
+"""The count module contains the total count cache.
+
+Paging through a filtered view repeats the same count for every page. The count cache
+remembers each count for a time to live (TTL). Optionally, once the TTL has passed,
+the stale count continues to be served for a grace period while the count is refreshed
+in the background (stale-while-revalidate).
+"""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from threading import Lock
+from time import monotonic
+from typing import Callable, Optional, Set
+
+from mui.v6.integrations.sqlalchemy.cache.backend import (
+    CachedCount,
+    CountCacheBackend,
+    LRUCountCacheBackend,
+)
+
+
+class CountCache:
+    """Caches total counts, keyed by the fingerprint of the counted query.
+
+    Attributes:
+        backend (CountCacheBackend): The storage used for the counts.
+        ttl (float): The number of seconds a count is fresh for.
+        stale_ttl (float): The number of seconds after the TTL during which a stale
+            count is served while it is refreshed in the background. When zero, stale
+            counts are never served.
+        hits (int): The number of fresh counts served.
+        stale_hits (int): The number of stale counts served.
+        misses (int): The number of counts which had to be counted.
+    """
+
+    backend: CountCacheBackend
+    hits: int
+    misses: int
+    stale_hits: int
+    stale_ttl: float
+    ttl: float
+
+    def __init__(  # noqa: PLR0917
+        self,
+        backend: Optional[CountCacheBackend] = None,
+        ttl: float = 60.0,
+        stale_ttl: float = 0.0,
+        executor: Optional[Executor] = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        """Initialize a new count cache.
+
+        Args:
+            backend (Optional[CountCacheBackend], optional): The storage used for the
+                counts. Defaults to an in-process LRUCountCacheBackend.
+            ttl (float, optional): The number of seconds a count is fresh for.
+                Defaults to 60.0.
+            stale_ttl (float, optional): The number of seconds after the TTL during
+                which a stale count is served while it is refreshed in the
+                background. Defaults to 0.0.
+            executor (Optional[Executor], optional): The executor which runs
+                background refreshes. Defaults to a single worker thread, created
+                when first needed.
+            clock (Callable[[], float], optional): The clock used to timestamp
+                counts. Defaults to time.monotonic.
+
+        Raises:
+            ValueError: Raised when the TTL is not positive or the stale TTL is
+                negative.
+        """
+        if ttl <= 0:
+            raise ValueError("The count TTL must be positive")
+        if stale_ttl < 0:
+            raise ValueError("The stale count TTL must not be negative")
+        self.backend = backend if backend is not None else LRUCountCacheBackend()
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self._executor = executor
+        self._clock = clock
+        self._lock = Lock()
+        self._refreshing: Set[str] = set()
+
+    def get(
+        self, key: str, refresh: Optional[Callable[[], int]] = None
+    ) -> Optional[int]:
+        """Retrieves the cached count for a key.
+
+        A stale count is only served when a refresh is provided, in which case the
+        refresh is scheduled in the background, unless one is already running for
+        the key.
+
+        Args:
+            key (str): The fingerprint of the counted query.
+            refresh (Optional[Callable[[], int]], optional): Counts the rows again.
+                As it runs on another thread, it must not use the caller's session.
+                Defaults to None.
+
+        Returns:
+            Optional[int]: The cached count, or None if no usable count is cached.
+        """
+        cached = self.backend.get(key)
+        if cached is None:
+            self.misses += 1
+            return None
+        age = self._clock() - cached.stored_at
+        if age < self.ttl:
+            self.hits += 1
+            return cached.total
+        if refresh is None or age >= self.ttl + self.stale_ttl:
+            self.misses += 1
+            return None
+        self.stale_hits += 1
+        self._schedule_refresh(key=key, refresh=refresh)
+        return cached.total
+
+    def set(self, key: str, total: int) -> None:
+        """Stores the count for a key.
+
+        Args:
+            key (str): The fingerprint of the counted query.
+            total (int): The total number of rows.
+        """
+        self.backend.set(key, CachedCount(total=total, stored_at=self._clock()))
+
+    def get_or_count(
+        self,
+        key: str,
+        count: Callable[[], int],
+        refresh: Optional[Callable[[], int]] = None,
+    ) -> int:
+        """Retrieves the cached count for a key, counting the rows on a miss.
+
+        Args:
+            key (str): The fingerprint of the counted query.
+            count (Callable[[], int]): Counts the rows on the calling thread.
+            refresh (Optional[Callable[[], int]], optional): Counts the rows on a
+                background thread, when a stale count is served. Defaults to None,
+                in which case stale counts are not served.
+
+        Returns:
+            int: The total number of rows.
+        """
+        total = self.get(key=key, refresh=refresh)
+        if total is not None:
+            return total
+        total = count()
+        self.set(key=key, total=total)
+        return total
+
+    def _schedule_refresh(self, key: str, refresh: Callable[[], int]) -> None:
+        """Refreshes the count for a key in the background.
+
+        Args:
+            key (str): The fingerprint of the counted query.
+            refresh (Callable[[], int]): Counts the rows.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="mui-count-cache"
+                )
+            executor = self._executor
+
+        def run() -> None:
+            try:
+                self.set(key=key, total=refresh())
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        # a failed refresh leaves the stale count in place until it expires
+        executor.submit(run)
@@ -0,0 +1,135 @@
+"""The fingerprint module identifies the rows counted by a data grid query.
+
+Two requests which filter the same base query with equivalent filter models count the
+same rows. The fingerprint is a hash of the base query's compiled SQL and parameters,
+and of the filter model with the parts which don't affect the result removed, such as
+item IDs and the order of the items, and of the full-text index searched for the quick
+filter values. The base query is taken before the displayed columns are projected, as
+hiding a column doesn't change the count. A page is further identified by the sort
+model, the page size, the position of the page, and the loaded columns.
+"""
+
+import json
+from hashlib import sha256
+from typing import Any, Dict, Optional, Sequence, TypeVar
+
+from sqlalchemy.orm import Query
+
+from mui.v6.grid import GridFilterModel, GridSortModel
+from mui.v6.integrations.sqlalchemy.dialect import get_query_dialect
+from mui.v6.integrations.sqlalchemy.quick_filter.types import FullTextIndex
+
+T = TypeVar("T")
+
+
+def _get_canonical_filter_model(model: Optional[GridFilterModel]) -> Any:
+    """Converts the filter model into a canonical JSON serializable form.
+
+    Args:
+        model (Optional[GridFilterModel]): The filter model being converted.
+
+    Returns:
+        Any: The canonical form of the filter model.
+    """
+    if model is None:
+        return None
+    items = sorted(
+        json.dumps(
+            {"field": item.field, "operator": item.operator, "value": item.value},
+            default=str,
+            sort_keys=True,
+        )
+        for item in model.items
+    )
+    return {
+        "items": items,
+        # a single item is filtered identically regardless of the logic operator
+        "logic_operator": str(model.logic_operator) if len(items) > 1 else None,
+        "quick_filter_values": model.quick_filter_values,
+        "quick_filter_logic_operator": str(model.quick_filter_logic_operator)
+        if model.quick_filter_values
+        else None,
+    }
+
+
+def _get_canonical_index(index: Optional[FullTextIndex]) -> Any:
+    """Converts the full-text index into a canonical JSON serializable form.
+
+    Args:
+        index (Optional[FullTextIndex]): The full-text index being converted.
+
+    Returns:
+        Any: The canonical form of the full-text index.
+    """
+    if index is None:
+        return None
+    return [index.name, str(index.rowid), list(index.columns), index.backend]
+
+
+def get_count_fingerprint(
+    query: "Query[T]",
+    model: Optional[GridFilterModel],
+    quick_filter_index: Optional[FullTextIndex] = None,
+) -> str:
+    """Calculates the fingerprint of the rows counted by a filtered query.
+
+    Args:
+        query (Query[T]): The base query, before the filter model is applied.
+        model (Optional[GridFilterModel]): The filter model applied to the query.
+        quick_filter_index (Optional[FullTextIndex], optional): The full-text index
+            searched for the filter model's quick filter values. When None, the
+            quick filter values are ignored. Defaults to None.
+
+    Returns:
+        str: The hexadecimal fingerprint.
+    """
+    compiled = query.statement.compile(dialect=get_query_dialect(query=query))
+    params: Dict[str, Any] = compiled.params
+    payload = json.dumps(
+        [
+            str(compiled),
+            sorted((key, repr(value)) for key, value in params.items()),
+            _get_canonical_filter_model(model=model),
+            _get_canonical_index(index=quick_filter_index),
+        ],
+        default=str,
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    return sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_page_fingerprint(
+    count_fingerprint: str,
+    sort_model: Optional[GridSortModel],
+    page_size: int,
+    position: Any,
+    columns: Optional[Sequence[str]] = None,
+) -> str:
+    """Calculates the fingerprint of a page of a filtered query.
+
+    Args:
+        count_fingerprint (str): The fingerprint of the filtered query, from
+            `get_count_fingerprint`.
+        sort_model (Optional[GridSortModel]): The sort model applied to the query.
+        page_size (int): The number of rows on the page.
+        position (Any): The JSON serializable position of the page, such as the page
+            number or the keyset of the page's boundary.
+        columns (Optional[Sequence[str]], optional): The names of the loaded columns,
+            when only the displayed columns are loaded. Defaults to None.
+
+    Returns:
+        str: The hexadecimal fingerprint.
+    """
+    payload = json.dumps(
+        [
+            count_fingerprint,
+            [(item.field, item.sort) for item in sort_model or []],
+            page_size,
+            position,
+            columns,
+        ],
+        default=str,
+        separators=(",", ":"),
+    )
+    return sha256(payload.encode("utf-8")).hexdigest()
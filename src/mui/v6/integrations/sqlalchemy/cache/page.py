@@ -0,0 +1,219 @@
+"""The page module contains the page cache, which supports next-page prefetching.
+
+Users page forward far more often than they jump elsewhere. After a page has been
+served, the next page can be retrieved speculatively on a background thread and
+stored for a short time, so the next request is served from memory. A prefetch which
+fails is logged, and the page is retrieved when it's requested.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, List, NamedTuple, Optional, Set, Tuple
+
+logger = getLogger(__name__)
+
+
+class CachedPage(NamedTuple):
+    """A page of serialized rows stored by the page cache.
+
+    Attributes:
+        items (list[Any]): The serialized rows of the page.
+        has_next_page (Optional[bool]): Whether another page exists after this
+            page, if known.
+        next_keyset (Optional[Any]): The keyset of the next page, when using the
+            keyset pagination strategy.
+        previous_keyset (Optional[Any]): The keyset of the previous page, when using
+            the keyset pagination strategy.
+    """
+
+    items: List[Any]
+    has_next_page: Optional[bool] = None
+    next_keyset: Optional[Any] = None
+    previous_keyset: Optional[Any] = None
+
+
+class PageCache:
+    """Caches serialized pages and prefetches pages on a bounded thread pool.
+
+    The cache is safe to share between threads, and is intended to be shared between
+    requests.
+
+    Attributes:
+        hits (int): The number of pages served from the cache.
+        max_pending (int): The maximum number of prefetches queued or running.
+        maxsize (int): The maximum number of pages stored.
+        misses (int): The number of pages which were not cached.
+        prefetch_errors (int): The number of prefetches which raised an exception,
+            each of which is logged.
+        prefetched (int): The number of pages stored by prefetching.
+        skipped (int): The number of prefetches skipped because too many were
+            already pending.
+        ttl (float): The number of seconds a page is stored for.
+    """
+
+    hits: int
+    max_pending: int
+    maxsize: int
+    misses: int
+    prefetch_errors: int
+    prefetched: int
+    skipped: int
+    ttl: float
+
+    def __init__(  # noqa: PLR0917
+        self,
+        ttl: float = 10.0,
+        maxsize: int = 256,
+        max_workers: int = 2,
+        max_pending: Optional[int] = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        """Initialize a new page cache.
+
+        Args:
+            ttl (float, optional): The number of seconds a page is stored for. This
+                should be short, as the rows may change. Defaults to 10.0.
+            maxsize (int, optional): The maximum number of pages stored, the least
+                recently used page is evicted first. Defaults to 256.
+            max_workers (int, optional): The number of threads used to prefetch
+                pages. Defaults to 2.
+            max_pending (Optional[int], optional): The maximum number of prefetches
+                queued or running, additional prefetches are skipped. Defaults to
+                twice the number of workers.
+            clock (Callable[[], float], optional): The clock used to expire pages.
+                Defaults to time.monotonic.
+
+        Raises:
+            ValueError: Raised when the TTL, maximum size, or number of workers is not
+                positive.
+        """
+        if ttl <= 0:
+            raise ValueError("The page TTL must be positive")
+        if maxsize < 1:
+            raise ValueError("The cache must be able to store at least one page")
+        if max_workers < 1:
+            raise ValueError("At least one prefetch worker is required")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.max_pending = max_pending if max_pending is not None else max_workers * 2
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self.prefetch_errors = 0
+        self.skipped = 0
+        self._clock = clock
+        self._lock = Lock()
+        self._pages: "OrderedDict[str, Tuple[float, CachedPage]]" = OrderedDict()
+        self._pending: Set[str] = set()
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def get(self, key: str) -> Optional[CachedPage]:
+        """Retrieves a cached page.
+
+        Args:
+            key (str): The fingerprint of the page.
+
+        Returns:
+            Optional[CachedPage]: The cached page, if one is stored and has not
+                expired.
+        """
+        with self._lock:
+            stored = self._pages.get(key)
+            if stored is not None and self._clock() - stored[0] < self.ttl:
+                self._pages.move_to_end(key)
+                self.hits += 1
+                return stored[1]
+            if stored is not None:
+                del self._pages[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: str, page: CachedPage) -> None:
+        """Stores a page.
+
+        Args:
+            key (str): The fingerprint of the page.
+            page (CachedPage): The page being stored.
+        """
+        with self._lock:
+            self._pages[key] = (self._clock(), page)
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.maxsize:
+                self._pages.popitem(last=False)
+
+    def __contains__(self, key: object) -> bool:
+        """Determines whether an unexpired page is stored, without counting a hit.
+
+        Args:
+            key (object): The fingerprint of the page.
+
+        Returns:
+            bool: True if an unexpired page is stored.
+        """
+        with self._lock:
+            stored = self._pages.get(key) if isinstance(key, str) else None
+            return stored is not None and self._clock() - stored[0] < self.ttl
+
+    def prefetch(self, key: str, load: Callable[[], CachedPage]) -> bool:
+        """Loads and stores a page on a background thread.
+
+        The prefetch is skipped when the page is already stored or being prefetched,
+        or when too many prefetches are pending. An exception raised by the load is
+        logged and counted by `prefetch_errors`.
+
+        Args:
+            key (str): The fingerprint of the page.
+            load (Callable[[], CachedPage]): Retrieves the page. As it runs on
+                another thread, it must not use the caller's session.
+
+        Returns:
+            bool: True if the prefetch was scheduled.
+        """
+        if key in self:
+            return False
+        with self._lock:
+            if key in self._pending:
+                return False
+            if len(self._pending) >= self.max_pending:
+                self.skipped += 1
+                return False
+            self._pending.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="mui-prefetch"
+                )
+            executor = self._executor
+
+        def run() -> None:
+            try:
+                page = load()
+            except Exception:
+                logger.exception("Failed to prefetch the page %s", key)
+                with self._lock:
+                    self.prefetch_errors += 1
+            else:
+                self.set(key=key, page=page)
+                with self._lock:
+                    self.prefetched += 1
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+
+        executor.submit(run)
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the prefetch workers.
+
+        Args:
+            wait (bool, optional): Whether to wait for pending prefetches to finish.
+                Defaults to True.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
@@ -0,0 +1,302 @@
+"""The plan module caches the filter and sort clauses built for a request's shape.
+
+Building the filter clause resolves every field and applies every operator, and each
+new expression tree must have its SQLAlchemy cache key generated before the compiled
+statement cache can be used. Most requests for a grid share a small number of shapes,
+the fields, operators, logic operator, and sort directions, and only differ by their
+values. A plan builds the clauses for a shape once, with named bind parameters in
+place of the values, so later requests with the same shape only bind their values:
+
+    query.filter(plan.filter_clause).order_by(*plan.order_by).params(**params)
+
+Each item is planned using the `OperatorPlan` registered with its operator's
+applicator, which binds its values, so custom operators registered with a plan are
+planned like the built-in operators. isAnyOf values are bound as an expanding
+parameter, so lists of any length share a single plan and a single compiled statement.
+The scalable isAnyOf applicator has a plan for each strategy, while lists loaded into
+temporary tables aren't planned.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import bindparam
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.elements import BindParameter
+
+from mui.v6.grid import GridFilterModel, GridSortModel
+from mui.v6.integrations.sqlalchemy.filter.apply_items import get_link_operator
+from mui.v6.integrations.sqlalchemy.filter.registry import (
+    Binder,
+    get_operator_applicator,
+    get_operator_plan,
+)
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from mui.v6.integrations.sqlalchemy.sort import get_sort_expression_from_item
+
+"""The shape of a None value, which is applied as a constant clause."""
+_NULL_SHAPE = ("null",)
+
+
+def get_query_shape(
+    filter_model: Optional[GridFilterModel],
+    sort_model: Optional[GridSortModel],
+    resolver: Resolver,
+) -> Optional[Hashable]:
+    """Calculates the shape of the filter and sort models, excluding their values.
+
+    Args:
+        filter_model (Optional[GridFilterModel]): The filter model.
+        sort_model (Optional[GridSortModel]): The sort model.
+        resolver (Resolver): The column resolver, resolving the columns which the
+            shapes of the items' values depend on.
+
+    Returns:
+        Optional[Hashable]: The shape, or None when the filter model uses an operator
+            which can't be planned, such as an unregistered operator, or a custom
+            operator registered without a plan.
+    """
+    items = filter_model.items if filter_model is not None else []
+    filters = []
+    for item in items:
+        plan = get_operator_plan(operator=item.operator)
+        if plan is None:
+            return None
+        value_shape = (
+            plan.shape(resolver(item.field), item.value)
+            if item.value is not None
+            else _NULL_SHAPE
+        )
+        if value_shape is None:
+            return None
+        applicator = get_operator_applicator(operator=item.operator)
+        filters.append((item.field, applicator, value_shape))
+    return (
+        filter_model.logic_operator if filter_model is not None else None,
+        tuple(filters),
+        tuple((item.field, item.sort) for item in sort_model or []),
+    )
+
+
+class QueryPlan:
+    """The filter and sort clauses built for a shape, with named bind parameters.
+
+    Attributes:
+        filter_clause (Optional[Any]): The filter clause, or None when the filter
+            model has no items.
+        order_by (List[Any]): The ORDER BY expressions.
+    """
+
+    __slots__ = ("_binders", "filter_clause", "order_by")
+
+    filter_clause: Optional[Any]
+    order_by: List[Any]
+
+    def __init__(
+        self,
+        filter_clause: Optional[Any],
+        order_by: List[Any],
+        binders: List[Tuple[Tuple[str, ...], int, Any, Binder]],
+    ) -> None:
+        """Initialize a new query plan.
+
+        Args:
+            filter_clause (Optional[Any]): The filter clause.
+            order_by (List[Any]): The ORDER BY expressions.
+            binders (List[Tuple[Tuple[str, ...], int, Any, Binder]]): The names of
+                each item's bind parameters, with the index of the item, the item's
+                resolved column, and the binder converting the item's value.
+        """
+        self.filter_clause = filter_clause
+        self.order_by = order_by
+        self._binders = binders
+
+    def get_params(self, filter_model: Optional[GridFilterModel]) -> Dict[str, Any]:
+        """Retrieves the bind parameter values of a filter model with this shape.
+
+        Args:
+            filter_model (Optional[GridFilterModel]): The filter model.
+
+        Raises:
+            ValueError: Raised when an item's value is invalid for its operator.
+
+        Returns:
+            Dict[str, Any]: The values, keyed by bind parameter name.
+        """
+        if filter_model is None:
+            return {}
+        items = filter_model.items
+        params: Dict[str, Any] = {}
+        for names, index, column, binder in self._binders:
+            # the shape ensures the values of a planned item are always bound
+            params.update(zip(names, binder(column, items[index].value) or ()))
+        return params
+
+
+def _name_bind_parameters(clause: Any, prefix: str) -> Tuple[Any, Tuple[str, ...]]:
+    """Replaces the anonymous bind parameters of a clause with named parameters.
+
+    Args:
+        clause (Any): The clause built by an operator.
+        prefix (str): The prefix of the parameters' names, which are suffixed by
+            their position within the clause.
+
+    Returns:
+        Tuple[Any, Tuple[str, ...]]: The copied clause, and the names of the
+            parameters, in the order they appear.
+    """
+    names: List[str] = []
+
+    def replace(element: Any) -> Optional[Any]:
+        if not isinstance(element, BindParameter):
+            return None
+        names.append(f"{prefix}_{len(names)}")
+        return bindparam(
+            names[-1], type_=element.type, expanding=element.expanding, unique=False
+        )
+
+    return visitors.replacement_traverse(clause, {}, replace), tuple(names)
+
+
+def _build_plan(
+    filter_model: Optional[GridFilterModel],
+    sort_model: Optional[GridSortModel],
+    resolver: Resolver,
+) -> Optional[QueryPlan]:
+    """Builds the plan of a request, replacing its bound values with parameters.
+
+    Args:
+        filter_model (Optional[GridFilterModel]): The filter model.
+        sort_model (Optional[GridSortModel]): The sort model.
+        resolver (Resolver): The column resolver.
+
+    Returns:
+        Optional[QueryPlan]: The plan, or None if an operator's clause doesn't bind
+            the expected number of values, in which case the request can't be
+            planned.
+    """
+    clauses: List[Any] = []
+    binders: List[Tuple[Tuple[str, ...], int, Any, Binder]] = []
+    for index, item in enumerate(filter_model.items if filter_model else []):
+        applicator = get_operator_applicator(operator=item.operator)
+        plan = get_operator_plan(operator=item.operator)
+        column = resolver(item.field)
+        clause = applicator(column, item.value)
+        values = (
+            plan.bind(column, item.value)
+            if plan is not None and item.value is not None
+            else None
+        )
+        if plan is None or values is None:
+            clauses.append(clause)
+            continue
+        clause, names = _name_bind_parameters(
+            clause=clause, prefix=f"mui_filter_{index}"
+        )
+        if len(names) != len(values):
+            return None
+        clauses.append(clause)
+        binders.append((names, index, column, plan.bind))
+    filter_clause = (
+        get_link_operator(model=filter_model)(*clauses)
+        if filter_model is not None and clauses
+        else None
+    )
+    order_by = [
+        get_sort_expression_from_item(item=item, resolver=resolver)
+        for item in sort_model or []
+        if item.sort is not None
+    ]
+    return QueryPlan(filter_clause=filter_clause, order_by=order_by, binders=binders)
+
+
+class PlanCache:
+    """Caches the query plans built for each shape of filter and sort models.
+
+    Plans contain the resolved columns, so the resolver must resolve each field to
+    the same column on every request. The cache is safe to share between threads.
+
+    Attributes:
+        maxsize (int): The maximum number of plans stored.
+        hits (int): The number of requests served by a cached plan.
+        misses (int): The number of requests which built a plan.
+        unplanned (int): The number of requests which couldn't be planned.
+    """
+
+    hits: int
+    maxsize: int
+    misses: int
+    unplanned: int
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Initialize a new plan cache.
+
+        Args:
+            maxsize (int, optional): The maximum number of plans stored, evicting
+                the least recently used plan. Defaults to 256.
+
+        Raises:
+            ValueError: Raised when the maximum size is less than one.
+        """
+        if maxsize < 1:
+            raise ValueError("The cache must be able to store at least one plan")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.unplanned = 0
+        self._plans: "OrderedDict[Hashable, Optional[QueryPlan]]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of plans stored.
+
+        Returns:
+            int: The number of plans stored.
+        """
+        return len(self._plans)
+
+    def get(
+        self,
+        filter_model: Optional[GridFilterModel],
+        sort_model: Optional[GridSortModel],
+        resolver: Resolver,
+    ) -> Optional[QueryPlan]:
+        """Retrieves the plan for the models' shape, building it if necessary.
+
+        Args:
+            filter_model (Optional[GridFilterModel]): The filter model.
+            sort_model (Optional[GridSortModel]): The sort model.
+            resolver (Resolver): The column resolver, which is part of the key.
+
+        Returns:
+            Optional[QueryPlan]: The plan, or None if the models can't be planned,
+                in which case they should be applied directly.
+        """
+        shape = get_query_shape(
+            filter_model=filter_model, sort_model=sort_model, resolver=resolver
+        )
+        if shape is None:
+            with self._lock:
+                self.unplanned += 1
+            return None
+        key = (resolver, shape)
+        with self._lock:
+            if key in self._plans:
+                self._plans.move_to_end(key)
+                plan = self._plans[key]
+                self.hits += 1
+                return plan
+        # plans are built outside of the lock, a race only builds a plan twice
+        plan = _build_plan(
+            filter_model=filter_model, sort_model=sort_model, resolver=resolver
+        )
+        with self._lock:
+            self.misses += 1
+            if plan is None:
+                self.unplanned += 1
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+        return plan
@@ -0,0 +1,14 @@
+"""The dialect module contains helpers for detecting database dialect capabilities.
+
+Some optimizations depend on features which are not available on every database, or
+every version of a database. These helpers allow the integration to fall back to a
+portable implementation when a feature is unavailable.
+"""
+
+from mui.v6.integrations.sqlalchemy.dialect.support import (
+    get_query_dialect,
+    supports_window_functions,
+)
+
+# isort: unique-list
+__all__ = ["get_query_dialect", "supports_window_functions"]
@@ -0,0 +1,79 @@
+"""The support module detects whether a dialect supports optional SQL features."""
+
+from typing import Any, Optional, Tuple, TypeVar
+
+from sqlalchemy.engine import Dialect
+from sqlalchemy.exc import UnboundExecutionError
+from sqlalchemy.orm import Query
+
+T = TypeVar("T")
+
+# https://www.sqlite.org/windowfunctions.html
+SQLITE_WINDOW_FUNCTION_VERSION = (3, 25, 0)
+# https://dev.mysql.com/doc/refman/8.0/en/window-functions.html
+MYSQL_WINDOW_FUNCTION_VERSION = (8, 0)
+# https://mariadb.com/kb/en/window-functions/
+MARIADB_WINDOW_FUNCTION_VERSION = (10, 2)
+
+
+def get_query_dialect(query: "Query[T]") -> Optional[Dialect]:
+    """Retrieves the dialect of the engine or connection a query is bound to.
+
+    Args:
+        query (Query[T]): The query whose dialect is being retrieved.
+
+    Returns:
+        Optional[Dialect]: The dialect, or None if the query is not bound to a
+            session with a bind.
+    """
+    session = query.session
+    if session is None:
+        return None
+    try:
+        return session.get_bind().dialect
+    except UnboundExecutionError:
+        return None
+
+
+def _get_version(dialect: Dialect, attribute: str) -> Optional[Tuple[Any, ...]]:
+    """Retrieves a version tuple from the dialect, or its DBAPI module.
+
+    Args:
+        dialect (Dialect): The dialect being inspected.
+        attribute (str): The attribute which holds the version tuple.
+
+    Returns:
+        Optional[Tuple[Any, ...]]: The version, if it is known.
+    """
+    version = getattr(dialect, attribute, None)
+    if version is None:
+        version = getattr(getattr(dialect, "dbapi", None), attribute, None)
+    return tuple(version) if version is not None else None
+
+
+def supports_window_functions(dialect: Optional[Dialect]) -> bool:
+    """Determines whether the dialect supports window functions, such as
+    `count(*) OVER ()`.
+
+    Unknown dialects are assumed to support window functions, as every major database
+    has supported them for many years.
+
+    Args:
+        dialect (Optional[Dialect]): The dialect being inspected.
+
+    Returns:
+        bool: True if window functions are supported.
+    """
+    if dialect is None:
+        return False
+    if dialect.name == "sqlite":
+        version = _get_version(dialect=dialect, attribute="sqlite_version_info")
+        return version is not None and version >= SQLITE_WINDOW_FUNCTION_VERSION
+    if dialect.name in {"mysql", "mariadb"}:
+        version = _get_version(dialect=dialect, attribute="server_version_info")
+        if version is None:
+            return False
+        if getattr(dialect, "is_mariadb", False):
+            return version >= MARIADB_WINDOW_FUNCTION_VERSION
+        return version >= MYSQL_WINDOW_FUNCTION_VERSION
+    return True
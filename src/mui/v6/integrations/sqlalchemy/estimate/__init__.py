@@ -0,0 +1,21 @@
+"""The estimate module contains the row estimators.
+
+A row estimator uses the database's statistics to estimate how many rows a table
+contains, or how many rows match an equality filter on indexed columns, without
+scanning the table.
+"""
+
+from mui.v6.integrations.sqlalchemy.estimate.registry import (
+    estimate_rows,
+    register_row_estimator,
+)
+from mui.v6.integrations.sqlalchemy.estimate.sqlite import estimate_sqlite_rows
+from mui.v6.integrations.sqlalchemy.estimate.types import RowEstimator
+
+# isort: unique-list
+__all__ = [
+    "RowEstimator",
+    "estimate_rows",
+    "estimate_sqlite_rows",
+    "register_row_estimator",
+]
@@ -0,0 +1,56 @@
+"""The registry module dispatches row estimates to the estimator for a dialect.
+
+Estimators for additional dialects may be registered, for example using PostgreSQL's
+`pg_class.reltuples`:
+
+    def estimate_postgresql_rows(session, table, columns):
+        if columns:
+            return None
+        return session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = :t::regclass"),
+            {"t": table.fullname},
+        ).scalar()
+
+    register_row_estimator("postgresql", estimate_postgresql_rows)
+"""
+
+from typing import Dict, Optional, Sequence
+
+from sqlalchemy import Table
+from sqlalchemy.orm import Session
+
+from mui.v6.integrations.sqlalchemy.estimate.sqlite import estimate_sqlite_rows
+from mui.v6.integrations.sqlalchemy.estimate.types import RowEstimator
+
+_ROW_ESTIMATORS: Dict[str, RowEstimator] = {"sqlite": estimate_sqlite_rows}
+
+
+def register_row_estimator(dialect_name: str, estimator: RowEstimator) -> None:
+    """Registers the row estimator used for a dialect.
+
+    Args:
+        dialect_name (str): The name of the dialect, such as "postgresql".
+        estimator (RowEstimator): The estimator to use for the dialect. This replaces
+            any previously registered estimator.
+    """
+    _ROW_ESTIMATORS[dialect_name] = estimator
+
+
+def estimate_rows(
+    session: Session, table: Table, columns: Sequence[str]
+) -> Optional[int]:
+    """Estimates the number of rows using the estimator registered for the dialect.
+
+    Args:
+        session (Session): The session used to read the statistics.
+        table (Table): The table whose rows are being estimated.
+        columns (Sequence[str]): The names of the columns filtered by equality.
+
+    Returns:
+        Optional[int]: The estimated number of rows, or None if no estimator is
+            registered for the dialect or the estimator could not estimate the rows.
+    """
+    estimator = _ROW_ESTIMATORS.get(session.get_bind().dialect.name)
+    if estimator is None:
+        return None
+    return estimator(session, table, columns)
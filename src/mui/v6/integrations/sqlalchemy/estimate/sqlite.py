@@ -0,0 +1,84 @@
+"""The sqlite module estimates row counts using SQLite's sqlite_stat1 table.
+
+The sqlite_stat1 table is populated by the ANALYZE command. Each row describes an index
+using a list of integers: the first is the number of rows in the index, and each
+subsequent integer is the average number of rows which share the same values for the
+index's leading columns.
+
+Documentation:
+    https://www.sqlite.org/fileformat2.html#stat1tab
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import Table, text
+from sqlalchemy.orm import Session
+
+
+def _parse_stat(stat: str) -> List[int]:
+    """Parses the leading integers of a sqlite_stat1 stat value.
+
+    Args:
+        stat (str): The stat value, such as "1000 100 34" or "1000 1 unordered".
+
+    Returns:
+        list[int]: The leading integers of the stat value.
+    """
+    values: List[int] = []
+    for part in stat.split():
+        if not part.isdigit():
+            break
+        values.append(int(part))
+    return values
+
+
+def estimate_sqlite_rows(
+    session: Session, table: Table, columns: Sequence[str]
+) -> Optional[int]:
+    """Estimates the number of rows using the sqlite_stat1 statistics table.
+
+    When no columns are provided, the number of rows in the table is estimated.
+    Otherwise, an index whose leading columns are exactly the filtered columns is
+    located, and the average number of rows per distinct value of those columns is
+    returned.
+
+    Args:
+        session (Session): The session used to read the statistics.
+        table (Table): The table whose rows are being estimated.
+        columns (Sequence[str]): The names of the columns filtered by equality.
+
+    Returns:
+        Optional[int]: The estimated number of rows, or None if ANALYZE has not been
+            run or no suitable index exists.
+    """
+    has_statistics = session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": "sqlite_stat1"},
+    ).first()
+    if has_statistics is None:
+        return None
+    stats: Dict[Optional[str], List[int]] = {
+        index: _parse_stat(stat)
+        for index, stat in session.execute(
+            text("SELECT idx, stat FROM sqlite_stat1 WHERE tbl = :table"),
+            {"table": table.name},
+        )
+    }
+    if not columns:
+        row_counts = [values[0] for values in stats.values() if values]
+        return max(row_counts) if row_counts else None
+
+    filtered = set(columns)
+    for index, values in stats.items():
+        if index is None or len(values) <= len(filtered):
+            continue
+        index_columns = [
+            name
+            for (name,) in session.execute(
+                text("SELECT name FROM pragma_index_info(:index) ORDER BY seqno"),
+                {"index": index},
+            )
+        ]
+        if set(index_columns[: len(filtered)]) == filtered:
+            return values[len(filtered)]
+    return None
@@ -0,0 +1,14 @@
+"""The types module holds types related to the row estimator callable.
+
+A row estimator receives the session, the table, and the names of the columns which
+are filtered by equality. It returns the estimated number of matching rows, or None if
+no estimate is available, in which case the rows are counted instead.
+"""
+
+from typing import Callable, Optional, Sequence
+
+from sqlalchemy import Table
+from sqlalchemy.orm import Session
+from typing_extensions import TypeAlias
+
+RowEstimator: TypeAlias = Callable[[Session, Table, Sequence[str]], Optional[int]]
@@ -0,0 +1,4 @@
+from mui.v6.integrations.sqlalchemy.export.keyset import iter_export_items
+
+# isort: unique-list
+__all__ = ["iter_export_items"]
@@ -0,0 +1,71 @@
+"""The keyset module streams the full filtered and sorted result set for export.
+
+Paging through an export with LIMIT / OFFSET scans every preceding row for each page,
+so the total cost grows quadratically with the number of rows. The export instead
+reads the result set in keyset ordered chunks, so each chunk seeks directly to its
+first row and the total cost grows linearly.
+"""
+
+from typing import Iterator, Optional, TypeVar
+
+from sqlalchemy.orm import Query
+
+from mui.v6.grid import GridPaginationModel, RequestGridModels
+from mui.v6.integrations.sqlalchemy.pagination import Keyset, PaginationStrategy
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from mui.v6.integrations.sqlalchemy.structures import DataGridQuery
+from mui.v6.integrations.sqlalchemy.structures.factory import Factory
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def iter_export_items(
+    query: "Query[_T]",
+    request_model: RequestGridModels,
+    column_resolver: Resolver,
+    factory: Factory[_T, _R],
+    chunk_size: int = 1000,
+) -> Iterator[_R]:
+    """Yields every row of the filtered and sorted query, for export.
+
+    The request's filter, sort, and column visibility models are applied, while its
+    pagination model is ignored. The rows are read in keyset ordered chunks of
+    `chunk_size`, each streamed with `yield_per`, so memory use is independent of
+    the number of rows. The primary key is appended to the sort model as a
+    tiebreaker, so rows with equal sort values are exported in a stable order. NULL
+    values of nullable sort columns are exported before every other value when
+    sorted in ascending order, and after every other value when descending.
+
+    Args:
+        query (Query[_T]): The base query being exported.
+        request_model (RequestGridModels): The X-Data-Grid state models being applied
+            to the query.
+        column_resolver (Resolver): The resolver responsible for taking an X-Data-Grid
+            field name and resolving it to the appropriate SQLAlchemy model column.
+        factory (Callable[[_T], _R]): The factory converting each model into the
+            exported row, usually a mapping of field to value.
+        chunk_size (int, optional): The number of rows read by each query.
+            Defaults to 1000.
+
+    Returns:
+        Iterator[_R]: The exported rows.
+    """
+    pagination_model = GridPaginationModel(page=0, page_size=chunk_size)
+    keyset: Optional[Keyset] = None
+    while True:
+        dg_query = DataGridQuery(
+            query=query,
+            column_resolver=column_resolver,
+            filter_model=request_model.filter_model,
+            sort_model=request_model.sort_model,
+            pagination_model=pagination_model,
+            pagination_strategy=PaginationStrategy.KEYSET,
+            keyset=keyset,
+            fields=request_model.fields,
+            column_visibility_model=request_model.column_visibility_model,
+        )
+        yield from dg_query.iter_items(factory=factory, chunk_size=chunk_size)
+        if dg_query.next_keyset is None:
+            return
+        keyset = dg_query.next_keyset
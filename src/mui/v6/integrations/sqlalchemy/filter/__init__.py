@@ -1,9 +1,114 @@
 from mui.v6.integrations.sqlalchemy.filter.apply_items import (
     apply_filter_items_to_query_from_items,
+    get_link_operator,
 )
 from mui.v6.integrations.sqlalchemy.filter.apply_model import (
     apply_filter_to_query_from_model,
 )
+from mui.v6.integrations.sqlalchemy.filter.case_insensitive import (
+    apply_contains_case_insensitive_operator,
+    apply_endswith_case_insensitive_operator,
+    apply_equal_case_insensitive_operator,
+    apply_is_any_of_case_insensitive_operator,
+    apply_not_equal_case_insensitive_operator,
+    apply_startswith_case_insensitive_operator,
+    get_case_insensitive_ddl,
+    is_case_insensitive_column,
+    register_case_insensitive_column,
+    reset_case_insensitive_columns,
+    unregister_case_insensitive_column,
+)
+from mui.v6.integrations.sqlalchemy.filter.is_any_of import (
+    IsAnyOfStrategy,
+    IsAnyOfThresholds,
+    apply_is_any_of_scalable_operator,
+    get_is_any_of_strategy,
+    get_loaded_temporary_tables,
+    register_scalable_is_any_of_operator,
+)
+from mui.v6.integrations.sqlalchemy.filter.optimize import (
+    OptimizedFilterModel,
+    optimize_filter_model,
+)
+from mui.v6.integrations.sqlalchemy.filter.registry import (
+    ColumnKey,
+    OperatorLayer,
+    OperatorPlan,
+    get_column_key,
+    get_operator_applicator,
+    get_operator_plan,
+    is_operator_registered,
+    register_operator,
+    register_operator_layer,
+    reset_operators,
+    unregister_operator_layer,
+)
+from mui.v6.integrations.sqlalchemy.filter.rewrite import (
+    apply_contains_escaped_operator,
+    apply_endswith_reversed_operator,
+    apply_startswith_range_operator,
+    get_prefix_upper_bound,
+    get_reversed_expression,
+    register_index_friendly_operators,
+    register_reversed_expression,
+    reset_reversed_expressions,
+    unregister_reversed_expression,
+)
+from mui.v6.integrations.sqlalchemy.filter.trigram import (
+    apply_contains_trigram_operator,
+    get_searchable_index,
+    register_searchable_column,
+    reset_searchable_columns,
+    unregister_searchable_column,
+)
 
 # isort: unique-list
-__all__ = ["apply_filter_items_to_query_from_items", "apply_filter_to_query_from_model"]
+__all__ = [
+    "ColumnKey",
+    "IsAnyOfStrategy",
+    "IsAnyOfThresholds",
+    "OperatorLayer",
+    "OperatorPlan",
+    "OptimizedFilterModel",
+    "apply_contains_case_insensitive_operator",
+    "apply_contains_escaped_operator",
+    "apply_contains_trigram_operator",
+    "apply_filter_items_to_query_from_items",
+    "apply_endswith_case_insensitive_operator",
+    "apply_endswith_reversed_operator",
+    "apply_equal_case_insensitive_operator",
+    "apply_filter_to_query_from_model",
+    "apply_is_any_of_case_insensitive_operator",
+    "apply_is_any_of_scalable_operator",
+    "apply_not_equal_case_insensitive_operator",
+    "apply_startswith_case_insensitive_operator",
+    "apply_startswith_range_operator",
+    "get_case_insensitive_ddl",
+    "get_column_key",
+    "get_is_any_of_strategy",
+    "get_link_operator",
+    "get_loaded_temporary_tables",
+    "get_operator_applicator",
+    "get_operator_plan",
+    "get_prefix_upper_bound",
+    "get_reversed_expression",
+    "get_searchable_index",
+    "is_case_insensitive_column",
+    "is_operator_registered",
+    "optimize_filter_model",
+    "register_case_insensitive_column",
+    "register_index_friendly_operators",
+    "register_operator",
+    "register_operator_layer",
+    "register_reversed_expression",
+    "register_scalable_is_any_of_operator",
+    "register_searchable_column",
+    "reset_case_insensitive_columns",
+    "reset_operators",
+    "reset_reversed_expressions",
+    "reset_searchable_columns",
+    "unregister_case_insensitive_column",
+    "unregister_operator_layer",
+    "unregister_reversed_expression",
+    "unregister_searchable_column",
+]
@@ -6,12 +6,22 @@ in a SQLAlchemy compatible way, to the query.
 
 from mui.v6.integrations.sqlalchemy.filter.applicators.after import apply_after_operator
 from mui.v6.integrations.sqlalchemy.filter.applicators.basic import (
+    BASIC_OPERATORS,
     SUPPORTED_BASIC_OPERATORS,
     apply_basic_operator,
+    apply_equal_operator,
+    apply_greater_than_operator,
+    apply_greater_than_or_equal_to_operator,
+    apply_less_than_operator,
+    apply_less_than_or_equal_to_operator,
+    apply_not_equal_operator,
 )
 from mui.v6.integrations.sqlalchemy.filter.applicators.before import (
     apply_before_operator,
 )
+from mui.v6.integrations.sqlalchemy.filter.applicators.between import (
+    apply_between_operator,
+)
 from mui.v6.integrations.sqlalchemy.filter.applicators.contains import (
     apply_contains_operator,
 )
@@ -28,6 +38,11 @@ from mui.v6.integrations.sqlalchemy.filter.applicators.is_empty import (
 from mui.v6.integrations.sqlalchemy.filter.applicators.is_not_empty import (
     apply_is_not_empty_operator,
 )
+from mui.v6.integrations.sqlalchemy.filter.applicators.like import (
+    LIKE_ESCAPE,
+    escape_like,
+    get_like_pattern,
+)
 from mui.v6.integrations.sqlalchemy.filter.applicators.not_ import apply_not_operator
 from mui.v6.integrations.sqlalchemy.filter.applicators.on_or_after import (
     apply_on_or_after_operator,
@@ -38,21 +53,34 @@ from mui.v6.integrations.sqlalchemy.filter.applicators.on_or_before import (
 from mui.v6.integrations.sqlalchemy.filter.applicators.startswith import (
     apply_startswith_operator,
 )
+from mui.v6.integrations.sqlalchemy.filter.applicators.types import Applicator
 
 # isort: unique-list
 __all__ = [
+    "BASIC_OPERATORS",
+    "LIKE_ESCAPE",
     "SUPPORTED_BASIC_OPERATORS",
+    "Applicator",
     "apply_after_operator",
     "apply_basic_operator",
     "apply_before_operator",
+    "apply_between_operator",
     "apply_contains_operator",
     "apply_endswith_operator",
+    "apply_equal_operator",
+    "apply_greater_than_operator",
+    "apply_greater_than_or_equal_to_operator",
     "apply_is_any_of_operator",
     "apply_is_empty_operator",
     "apply_is_not_empty_operator",
     "apply_is_operator",
+    "apply_less_than_operator",
+    "apply_less_than_or_equal_to_operator",
+    "apply_not_equal_operator",
     "apply_not_operator",
     "apply_on_or_after_operator",
     "apply_on_or_before_operator",
     "apply_startswith_operator",
+    "escape_like",
+    "get_like_pattern",
 ]
@@ -4,9 +4,10 @@ Literal operators are literal representations of a built-in operator.
 """
 
 from operator import eq, ge, gt, le, lt, ne
-from typing import Any
+from typing import Any, Dict
 
 from mui.v6.grid import GridFilterItem
+from mui.v6.integrations.sqlalchemy.filter.applicators.types import Applicator
 
 EQUAL_OPERATOR_LITERALS = {"==", "=", "equals", "eq"}
 NOT_EQUAL_OPERATOR_LITERALS = {"!=", "ne"}
@@ -24,6 +25,111 @@ SUPPORTED_BASIC_OPERATORS = EQUAL_OPERATOR_LITERALS.union(
 )
 
 
+def apply_equal_operator(column: Any, value: Any) -> Any:
+    """Handles applying the equal (=, ==, equals, eq) operator to a column.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered. None is compared using `IS NULL`.
+
+    Returns:
+        Any: The column after applying the equal filter using the provided value.
+    """
+    return eq(column, value)
+
+
+def apply_not_equal_operator(column: Any, value: Any) -> Any:
+    """Handles applying the not equal (!=, ne) operator to a column.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered. None is compared using `IS NOT NULL`.
+
+    Returns:
+        Any: The column after applying the not equal filter using the provided value.
+    """
+    return ne(column, value)
+
+
+def apply_greater_than_operator(column: Any, value: Any) -> Any:
+    """Handles applying the greater than (>, gt) operator to a column.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered. None is treated as 0.
+
+    Returns:
+        Any: The column after applying the greater than filter using the value.
+    """
+    return gt(column, value if value is not None else 0)
+
+
+def apply_greater_than_or_equal_to_operator(column: Any, value: Any) -> Any:
+    """Handles applying the greater than or equal to (>=, ge) operator to a column.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered. None is treated as 0.
+
+    Returns:
+        Any: The column after applying the greater than or equal to filter using
+            the provided value.
+    """
+    return ge(column, value if value is not None else 0)
+
+
+def apply_less_than_operator(column: Any, value: Any) -> Any:
+    """Handles applying the less than (<, lt) operator to a column.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered. None is treated as 0.
+
+    Returns:
+        Any: The column after applying the less than filter using the value.
+    """
+    return lt(column, value if value is not None else 0)
+
+
+def apply_less_than_or_equal_to_operator(column: Any, value: Any) -> Any:
+    """Handles applying the less than or equal to (<=, le) operator to a column.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered. None is treated as 0.
+
+    Returns:
+        Any: The column after applying the less than or equal to filter using the
+            provided value.
+    """
+    return le(column, value if value is not None else 0)
+
+
+BASIC_OPERATORS: Dict[str, Applicator] = {
+    **{literal: apply_equal_operator for literal in EQUAL_OPERATOR_LITERALS},
+    **{literal: apply_not_equal_operator for literal in NOT_EQUAL_OPERATOR_LITERALS},
+    **{
+        literal: apply_greater_than_operator
+        for literal in GREATER_THAN_OPERATOR_LITERALS
+    },
+    **{
+        literal: apply_greater_than_or_equal_to_operator
+        for literal in GREATER_THAN_OR_EQUAL_TO_OPERATOR_LITERALS
+    },
+    **{literal: apply_less_than_operator for literal in LESS_THAN_OPERATOR_LITERALS},
+    **{
+        literal: apply_less_than_or_equal_to_operator
+        for literal in LESS_THAN_OR_EQUAL_TO_OPERATOR_LITERALS
+    },
+}
+
+
 def apply_basic_operator(column: Any, item: GridFilterItem) -> Any:
     """Retrieve the Python operator function from the filter item's operator value.
 
@@ -33,7 +139,6 @@ def apply_basic_operator(column: Any, item: GridFilterItem) -> Any:
     This has special support for the "equals" operator which is treated as an alias
     for the "==" operator.
 
-
     Args:
         item (GridFilterItem): The grid filter item being operated on.
 
@@ -43,23 +148,7 @@ def apply_basic_operator(column: Any, item: GridFilterItem) -> Any:
     Returns:
         Callable[[Any, Any], Any]: The operator.
     """
-    if item.operator in EQUAL_OPERATOR_LITERALS:
-        # equal
-        return eq(column, item.value)
-    elif item.operator in NOT_EQUAL_OPERATOR_LITERALS:
-        # not equal
-        return ne(column, item.value)
-    elif item.operator in GREATER_THAN_OPERATOR_LITERALS:
-        # greater than
-        return gt(column, item.value if item.value is not None else 0)
-    elif item.operator in GREATER_THAN_OR_EQUAL_TO_OPERATOR_LITERALS:
-        # greater than or equal to
-        return ge(column, item.value if item.value is not None else 0)
-    elif item.operator in LESS_THAN_OPERATOR_LITERALS:
-        # greater than
-        return lt(column, item.value if item.value is not None else 0)
-    elif item.operator in LESS_THAN_OR_EQUAL_TO_OPERATOR_LITERALS:
-        # greater than or equal to
-        return le(column, item.value if item.value is not None else 0)
-    else:
+    applicator = BASIC_OPERATORS.get(item.operator)
+    if applicator is None:
         raise ValueError(f"Unsupported operator {item.operator}")
+    return applicator(column, item.value)
@@ -0,0 +1,30 @@
+"""The between applicator applies the between operator to the data.
+
+between is meant as in 5 is between [1, 10], inclusive of both bounds.
+"""
+
+from typing import Any
+
+
+def apply_between_operator(column: Any, value: Any) -> Any:
+    """Handles applying the between operator to a column.
+
+    This is not a built-in x-data-grid operator. It's produced by the filter optimizer
+    when ranges are merged, and may be used by custom filter operators in the grid.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The inclusive `[low, high]` bounds being filtered.
+
+    Raises:
+        ValueError: Raised when the value isn't a pair of bounds.
+
+    Returns:
+        Any: The column after applying the between filter using the provided value.
+    """
+    bounds = list(value) if isinstance(value, (list, tuple)) else []
+    if len(bounds) != 2:  # noqa: PLR2004
+        raise ValueError(f"Expected [low, high] bounds for between, received {value}")
+    low, high = bounds
+    return column.between(low, high)
@@ -7,7 +7,7 @@ from operator import eq
 from typing import Any
 
 
-def apply_is_empty_operator(column: Any) -> Any:
+def apply_is_empty_operator(column: Any, value: Any = None) -> Any:  # noqa: ARG001
     """Handles applying the isEmpty x-data-grid operator to a column.
 
     Args:
@@ -7,7 +7,7 @@ from operator import ne
 from typing import Any
 
 
-def apply_is_not_empty_operator(column: Any) -> Any:
+def apply_is_not_empty_operator(column: Any, value: Any = None) -> Any:  # noqa: ARG001
     """Handles applying the isNotEmpty x-data-grid operator to a column.
 
     Args:
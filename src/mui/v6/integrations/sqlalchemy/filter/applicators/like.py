@@ -0,0 +1,44 @@
+"""The like module escapes values compared using LIKE patterns.
+
+The data grid's text operators match the user's input literally. To do the same using a
+LIKE pattern, the wildcards `%` and `_` in the input are escaped, along with the escape
+character itself.
+"""
+
+from typing import Any
+
+LIKE_ESCAPE = "/"
+
+
+def escape_like(value: Any) -> Any:
+    """Escapes the LIKE wildcards in a value, using the `LIKE_ESCAPE` character.
+
+    Args:
+        value (Any): The value being matched. Values which aren't strings are
+            returned as-is.
+
+    Returns:
+        Any: The escaped value.
+    """
+    if not isinstance(value, str):
+        return value
+    return (
+        value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", f"{LIKE_ESCAPE}%")
+        .replace("_", f"{LIKE_ESCAPE}_")
+    )
+
+
+def get_like_pattern(value: Any, prefix: str = "", suffix: str = "") -> str:
+    """Converts a value into a LIKE pattern matching it literally.
+
+    Args:
+        value (Any): The value being matched, which is converted to a string.
+        prefix (str, optional): The wildcards before the value. Defaults to "".
+        suffix (str, optional): The wildcards after the value. Defaults to "".
+
+    Returns:
+        str: The pattern, such as `%50/%%` for contains "50%".
+    """
+    escaped: str = escape_like(str(value))
+    return prefix + escaped + suffix
@@ -0,0 +1,12 @@
+"""The types module holds types related to the applicator callables.
+
+An applicator receives the resolved column, or equivalent property, expression,
+subquery, etc., and the filter item's value. It returns the clause which filters the
+column by the value, for use in a SQLAlchemy filter.
+"""
+
+from typing import Any, Callable
+
+from typing_extensions import TypeAlias
+
+Applicator: TypeAlias = Callable[[Any, Any], Any]
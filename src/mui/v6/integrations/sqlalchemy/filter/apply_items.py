@@ -1,33 +1,20 @@
 """The apply_model module is responsible for applying a GridSortModel to a query."""
 
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, TypeVar, Union, overload
 
 from sqlalchemy import and_, or_
 from sqlalchemy.orm import Query
+from sqlalchemy.sql import FromClause, Select
 
 from mui.v6.grid import GridFilterItem, GridFilterModel, GridLogicOperator
-from mui.v6.integrations.sqlalchemy.filter.applicators import (
-    SUPPORTED_BASIC_OPERATORS,
-    apply_after_operator,
-    apply_basic_operator,
-    apply_before_operator,
-    apply_contains_operator,
-    apply_endswith_operator,
-    apply_is_any_of_operator,
-    apply_is_empty_operator,
-    apply_is_not_empty_operator,
-    apply_is_operator,
-    apply_not_operator,
-    apply_on_or_after_operator,
-    apply_on_or_before_operator,
-    apply_startswith_operator,
-)
+from mui.v6.integrations.sqlalchemy.filter.registry import get_operator_applicator
 from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from mui.v6.integrations.sqlalchemy.statement import Statement, as_statement
 
 _Q = TypeVar("_Q")
 
 
-def _get_link_operator(
+def get_link_operator(
     model: GridFilterModel,
 ) -> Callable[[Any], Any]:
     """Retrieves the correct filter operator for a model.
@@ -60,7 +47,8 @@ def apply_operator_to_column(item: GridFilterItem, resolver: Resolver) -> Any:
     other filterable expression, and applies the appropriate SQLAlchemy or Python
     operator.
 
-    This does not currently support custom operators.
+    The applicator is retrieved from the operator registry with a single lookup.
+    Custom operators are supported once registered using `register_operator`.
 
     Support:
         * Equal to
@@ -98,59 +86,68 @@ def apply_operator_to_column(item: GridFilterItem, resolver: Resolver) -> Any:
         resolver (Resolver): The resolver to use to locate the column or
             filterable expression.
 
+    Raises:
+        ValueError: Raised when no applicator is registered for the operator.
+
     Returns:
         Any: The comparison operator for use in SQLAlchemy queries.
     """
-    column = resolver(item.field)
-    # we have 1:1 mappings of these operators in Python
-    if item.operator in SUPPORTED_BASIC_OPERATORS:
-        return apply_basic_operator(column, item)
-    elif item.operator == "is":
-        return apply_is_operator(column, item.value)
-    elif item.operator == "isEmpty":
-        return apply_is_empty_operator(column)
-    elif item.operator == "isNotEmpty":
-        return apply_is_not_empty_operator(column)
-    elif item.operator == "isAnyOf":
-        return apply_is_any_of_operator(column, item.value)
-    elif item.operator == "contains":
-        return apply_contains_operator(column, item.value)
-    elif item.operator == "startsWith":
-        return apply_startswith_operator(column, item.value)
-    elif item.operator == "endsWith":
-        return apply_endswith_operator(column, item.value)
-    elif item.operator == "not":
-        return apply_not_operator(column, item.value)
-    elif item.operator == "before":
-        return apply_before_operator(column, item.value)
-    elif item.operator == "after":
-        return apply_after_operator(column, item.value)
-    elif item.operator == "onOrBefore":
-        return apply_on_or_before_operator(column, item.value)
-    elif item.operator == "onOrAfter":
-        return apply_on_or_after_operator(column, item.value)
-    else:
-        raise ValueError(f"Unsupported operator {item.operator}")
+    applicator = get_operator_applicator(operator=item.operator)
+    return applicator(resolver(item.field), item.value)
 
 
+@overload
 def apply_filter_items_to_query_from_items(
     query: "Query[_Q]", model: GridFilterModel, resolver: Resolver
 ) -> "Query[_Q]":
+    """When a query is provided, a query is returned.
+
+    Args:
+        query (Query[_Q]): The query.
+        model (GridFilterModel): The filter model.
+        resolver (Resolver): The column resolver.
+
+    Returns:
+        Query[_Q]: The query.
+    """
+
+
+@overload
+def apply_filter_items_to_query_from_items(
+    query: Union[Select, FromClause], model: GridFilterModel, resolver: Resolver
+) -> Select:
+    """When a select statement or table is provided, a select statement is returned.
+
+    Args:
+        query (Select | FromClause): The select statement or table.
+        model (GridFilterModel): The filter model.
+        resolver (Resolver): The column resolver.
+
+    Returns:
+        Select: The select statement.
+    """
+
+
+def apply_filter_items_to_query_from_items(
+    query: Statement, model: GridFilterModel, resolver: Resolver
+) -> Union["Query[Any]", Select]:
     """Applies a grid filter model's items section to a SQLAlchemy query.
 
     Args:
-        query (Query[_Q]): The query to be filtered.
+        query (Query[_Q] | Select | FromClause): The query, select statement, or
+            table to be filtered. A table is converted into a select statement.
         model (GridFilterModel): The filter model being applied.
         resolver (Resolver): A resolver to convert field names from the model to
             SQLAlchemy column's or expressions.
 
     Returns:
-        Query[_Q]: The filtered query.
+        Query[_Q] | Select: The filtered query or select statement.
     """
+    query = as_statement(query)
     if len(model.items) == 0:
         return query
 
-    link_operator = _get_link_operator(model=model)
+    link_operator = get_link_operator(model=model)
     # this is a bit gross, but is the easiest way to ensure it's applied properly
     return query.filter(
         # the link operator is either the and_ or or_ sqlalchemy function to determine
@@ -1,35 +1,93 @@
 """The apply_model module is responsible for applying a GridSortModel to a query."""
 
-from typing import TypeVar
+from typing import Any, Optional, TypeVar, Union, overload
 
 from sqlalchemy.orm import Query
+from sqlalchemy.sql import FromClause, Select
 
 from mui.v6.grid import GridFilterModel
 from mui.v6.integrations.sqlalchemy.filter.apply_items import (
     apply_filter_items_to_query_from_items,
 )
+from mui.v6.integrations.sqlalchemy.quick_filter import (
+    FullTextIndex,
+    apply_quick_filter_to_query_from_model,
+)
 from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from mui.v6.integrations.sqlalchemy.statement import Statement
 
 _Q = TypeVar("_Q")
 
 
+@overload
 def apply_filter_to_query_from_model(
-    query: "Query[_Q]", model: GridFilterModel, resolver: Resolver
+    query: "Query[_Q]",
+    model: GridFilterModel,
+    resolver: Resolver,
+    quick_filter_index: Optional[FullTextIndex] = None,
 ) -> "Query[_Q]":
+    """When a query is provided, a query is returned.
+
+    Args:
+        query (Query[_Q]): The query.
+        model (GridFilterModel): The filter model.
+        resolver (Resolver): The column resolver.
+        quick_filter_index (Optional[FullTextIndex], optional): The full-text index.
+            Defaults to None.
+
+    Returns:
+        Query[_Q]: The query.
+    """
+
+
+@overload
+def apply_filter_to_query_from_model(
+    query: Union[Select, FromClause],
+    model: GridFilterModel,
+    resolver: Resolver,
+    quick_filter_index: Optional[FullTextIndex] = None,
+) -> Select:
+    """When a select statement or table is provided, a select statement is returned.
+
+    Args:
+        query (Select | FromClause): The select statement or table.
+        model (GridFilterModel): The filter model.
+        resolver (Resolver): The column resolver.
+        quick_filter_index (Optional[FullTextIndex], optional): The full-text index.
+            Defaults to None.
+
+    Returns:
+        Select: The select statement.
+    """
+
+
+def apply_filter_to_query_from_model(
+    query: Statement,
+    model: GridFilterModel,
+    resolver: Resolver,
+    quick_filter_index: Optional[FullTextIndex] = None,
+) -> Union["Query[Any]", Select]:
     """Applies a GridFilterModel to a SQLAlchemy query.
 
-    If the model is an empty list, the query is returned, as-is.
+    If the model is an empty list, the query is returned, as-is. A Core table is
+    converted into a select statement. The quick filter values are only applied when
+    a full-text index is provided.
 
     Args:
-        query (Query[_Q]): The query to apply the sort model to.
+        query (Query[_Q] | Select | FromClause): The query, select statement, or
+            table to apply the filter model to.
         model (GridFilterModel): The filter model to apply to the query.
         resolver (Resolver): The resolver is responsible for retrieving the column or
             other property on a SQLAlchemy model.
+        quick_filter_index (Optional[FullTextIndex], optional): The full-text index
+            searched for the model's quick filter values. Defaults to None.
 
     Returns:
-        Query[_Q]: The filtered query.
+        Query[_Q] | Select: The filtered query or select statement.
     """
     query = apply_filter_items_to_query_from_items(
         query=query, model=model, resolver=resolver
     )
-    return query
+    return apply_quick_filter_to_query_from_model(
+        query=query, model=model, index=quick_filter_index
+    )
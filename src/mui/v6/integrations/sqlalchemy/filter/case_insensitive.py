@@ -0,0 +1,475 @@
+"""The case_insensitive module applies the text operators to case-insensitive columns
+in a form which each database can serve from an index.
+
+The data grid matches text case-insensitively, while the built-in applicators compare
+values using the column's collation. Wrapping the column in `lower()` in a resolver
+matches the same rows, but can't use an index on the column. A column declared as
+case-insensitive is compared using the case-folded form which an index can be created
+on, which is compiled for the database the query is executed against:
+
+- SQLite compares `col COLLATE NOCASE`, served by an index on `(col COLLATE NOCASE)`,
+  and matches LIKE patterns, which already ignore case, using the same index.
+- PostgreSQL compares `lower(col)`, served by an index on `(lower(col))`, and matches
+  patterns using `ILIKE`, served by a `pg_trgm` trigram index on the column.
+- Other databases compare `lower(col)`, served by an index on `(lower(col))`, and
+  match patterns using `lower(col) LIKE lower(pattern)`.
+
+The columns are declared when the application starts, and their indexes are created
+using the statements generated for the database:
+
+    register_case_insensitive_column(User.email)
+    for statement in get_case_insensitive_ddl(User.email, dialect=engine.dialect):
+        connection.execute(text(statement))
+
+SQLite's NOCASE collation and LIKE operator only fold the case of ASCII characters.
+
+Documentation:
+    https://www.sqlite.org/datatype3.html#collating_sequences
+    https://www.postgresql.org/docs/current/indexes-expressional.html
+    https://www.postgresql.org/docs/current/pgtrgm.html#PGTRGM-INDEX
+"""
+
+from typing import Any, List, Optional, Sequence, Set
+
+from sqlalchemy import Index, String
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import NullType, TypeDecorator
+
+from mui.v6.integrations.sqlalchemy.filter.applicators import (
+    LIKE_ESCAPE,
+    apply_contains_operator,
+    apply_endswith_operator,
+    apply_equal_operator,
+    apply_is_any_of_operator,
+    apply_not_equal_operator,
+    apply_startswith_operator,
+    get_like_pattern,
+)
+from mui.v6.integrations.sqlalchemy.filter.applicators.basic import (
+    EQUAL_OPERATOR_LITERALS,
+    NOT_EQUAL_OPERATOR_LITERALS,
+)
+from mui.v6.integrations.sqlalchemy.filter.registry import (
+    ColumnKey,
+    OperatorPlan,
+    bind_is_any_of_values,
+    bind_value,
+    get_column_key,
+    register_operator_layer,
+    unregister_operator_layer,
+)
+
+_CASE_INSENSITIVE_COLUMNS: Set[ColumnKey] = set()
+
+
+class CaseFoldedString(TypeDecorator):  # type: ignore[type-arg]
+    """The type of case-folded values, whose bound values are also case-folded, so
+    that comparisons such as `==` and `IN` fold both sides.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def bind_expression(self, bindvalue: Any) -> Any:  # noqa: PLR6301
+        """Case-folds a bound value.
+
+        Args:
+            bindvalue (Any): The bind parameter.
+
+        Returns:
+            Any: The case-folded bind parameter.
+        """
+        return CaseFolded(bindvalue)
+
+
+class CaseFolded(FunctionElement):  # type: ignore[type-arg]
+    """The case-folded form of an expression, compiled for each database."""
+
+    name = "case_folded"
+    inherit_cache = True
+    type = CaseFoldedString()  # type: ignore[assignment]
+
+
+class CaseInsensitiveLike(FunctionElement):  # type: ignore[type-arg]
+    """A case-insensitive LIKE comparison of an expression and an escaped pattern,
+    compiled for each database.
+    """
+
+    name = "case_insensitive_like"
+    inherit_cache = True
+    # a boolean function is compared with 1 by databases without a boolean type,
+    # which prevents SQLite from serving the pattern from an index
+    type = NullType()  # type: ignore[assignment]
+
+
+@compiles(CaseFolded)  # type: ignore[misc]
+def _compile_case_folded(element: CaseFolded, compiler: Any, **kwargs: Any) -> str:
+    return f"lower({compiler.process(element.clauses, **kwargs)})"
+
+
+@compiles(CaseFolded, "sqlite")  # type: ignore[misc]
+def _compile_case_folded_sqlite(
+    element: CaseFolded, compiler: Any, **kwargs: Any
+) -> str:
+    return f"{compiler.process(element.clauses, **kwargs)} COLLATE NOCASE"
+
+
+@compiles(CaseInsensitiveLike)  # type: ignore[misc]
+def _compile_case_insensitive_like(
+    element: CaseInsensitiveLike, compiler: Any, **kwargs: Any
+) -> str:
+    expression, pattern = element.clauses.clauses
+    return (
+        f"lower({compiler.process(expression, **kwargs)}) "
+        f"LIKE lower({compiler.process(pattern, **kwargs)}) ESCAPE '{LIKE_ESCAPE}'"
+    )
+
+
+@compiles(CaseInsensitiveLike, "postgresql")  # type: ignore[misc]
+def _compile_case_insensitive_like_postgresql(
+    element: CaseInsensitiveLike, compiler: Any, **kwargs: Any
+) -> str:
+    expression, pattern = element.clauses.clauses
+    return (
+        f"{compiler.process(expression, **kwargs)} "
+        f"ILIKE {compiler.process(pattern, **kwargs)} ESCAPE '{LIKE_ESCAPE}'"
+    )
+
+
+@compiles(CaseInsensitiveLike, "sqlite")  # type: ignore[misc]
+def _compile_case_insensitive_like_sqlite(
+    element: CaseInsensitiveLike, compiler: Any, **kwargs: Any
+) -> str:
+    expression, pattern = element.clauses.clauses
+    return (
+        f"{compiler.process(expression, **kwargs)} "
+        f"LIKE {compiler.process(pattern, **kwargs)} ESCAPE '{LIKE_ESCAPE}'"
+    )
+
+
+def _bind_contains_pattern(column: Any, value: Any) -> Optional[Sequence[Any]]:  # noqa: ARG001
+    """Binds the LIKE pattern matching the strings containing a value.
+
+    Args:
+        column (Any): The resolved case-insensitive column.
+        value (Any): The item's value.
+
+    Returns:
+        Optional[Sequence[Any]]: The pattern.
+    """
+    return [get_like_pattern(value, prefix="%", suffix="%")]
+
+
+def _bind_prefix_pattern(column: Any, value: Any) -> Optional[Sequence[Any]]:  # noqa: ARG001
+    """Binds the LIKE pattern matching the strings starting with a value.
+
+    Args:
+        column (Any): The resolved case-insensitive column.
+        value (Any): The item's value.
+
+    Returns:
+        Optional[Sequence[Any]]: The pattern.
+    """
+    return [get_like_pattern(value, suffix="%")]
+
+
+def _bind_suffix_pattern(column: Any, value: Any) -> Optional[Sequence[Any]]:  # noqa: ARG001
+    """Binds the LIKE pattern matching the strings ending with a value.
+
+    Args:
+        column (Any): The resolved case-insensitive column.
+        value (Any): The item's value.
+
+    Returns:
+        Optional[Sequence[Any]]: The pattern.
+    """
+    return [get_like_pattern(value, prefix="%")]
+
+
+def _is_case_insensitive_value(column: Any, value: Any) -> bool:
+    """Determines whether a filter is applied ignoring case.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's value.
+
+    Returns:
+        bool: True when the column is case-insensitive and the value isn't None,
+            which is compared using `IS NULL`.
+    """
+    return value is not None and is_case_insensitive_column(column=column)
+
+
+def _is_case_insensitive_values(column: Any, value: Any) -> bool:
+    """Determines whether an isAnyOf filter is applied ignoring case.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's values.
+
+    Returns:
+        bool: True when the column is case-insensitive and there are values.
+    """
+    return bool(value) and is_case_insensitive_column(column=column)
+
+
+def register_case_insensitive_column(column: Any) -> None:
+    """Declares a column as case-insensitive, so its text filters ignore case.
+
+    This layers the case-insensitive applicators of the equals, not equal, isAnyOf,
+    contains, startsWith, and endsWith operators over their registered applicators,
+    which still apply the filters of columns which aren't case-insensitive, such as
+    the index-friendly applicators when they were registered first.
+
+    Args:
+        column (Any): The column, or the ORM attribute of the column.
+
+    Raises:
+        ValueError: Raised when the column isn't a table's column.
+    """
+    key = get_column_key(column=column)
+    if key is None:
+        raise ValueError(f"Expected a table's column, received {column}")
+    _CASE_INSENSITIVE_COLUMNS.add(key)
+    value_plan = OperatorPlan(bind=bind_value)
+    for literal in EQUAL_OPERATOR_LITERALS:
+        register_operator_layer(
+            literal,
+            apply_equal_case_insensitive_operator,
+            handles=_is_case_insensitive_value,
+            plan=value_plan,
+        )
+    for literal in NOT_EQUAL_OPERATOR_LITERALS:
+        register_operator_layer(
+            literal,
+            apply_not_equal_case_insensitive_operator,
+            handles=_is_case_insensitive_value,
+            plan=value_plan,
+        )
+    register_operator_layer(
+        "isAnyOf",
+        apply_is_any_of_case_insensitive_operator,
+        handles=_is_case_insensitive_values,
+        plan=OperatorPlan(bind=bind_is_any_of_values),
+    )
+    register_operator_layer(
+        "contains",
+        apply_contains_case_insensitive_operator,
+        handles=_is_case_insensitive_value,
+        plan=OperatorPlan(bind=_bind_contains_pattern),
+    )
+    register_operator_layer(
+        "startsWith",
+        apply_startswith_case_insensitive_operator,
+        handles=_is_case_insensitive_value,
+        plan=OperatorPlan(bind=_bind_prefix_pattern),
+    )
+    register_operator_layer(
+        "endsWith",
+        apply_endswith_case_insensitive_operator,
+        handles=_is_case_insensitive_value,
+        plan=OperatorPlan(bind=_bind_suffix_pattern),
+    )
+
+
+def _unregister_case_insensitive_layers() -> None:
+    """Removes the case-insensitive applicators layered over the text operators."""
+    for literal in EQUAL_OPERATOR_LITERALS:
+        unregister_operator_layer(literal, apply_equal_case_insensitive_operator)
+    for literal in NOT_EQUAL_OPERATOR_LITERALS:
+        unregister_operator_layer(literal, apply_not_equal_case_insensitive_operator)
+    unregister_operator_layer("isAnyOf", apply_is_any_of_case_insensitive_operator)
+    unregister_operator_layer("contains", apply_contains_case_insensitive_operator)
+    unregister_operator_layer("startsWith", apply_startswith_case_insensitive_operator)
+    unregister_operator_layer("endsWith", apply_endswith_case_insensitive_operator)
+
+
+def unregister_case_insensitive_column(column: Any) -> None:
+    """Removes a column's case-insensitive declaration, so its text filters are
+    applied by the previously registered applicators. The layers are removed with the
+    last case-insensitive column.
+
+    Args:
+        column (Any): The column, or the ORM attribute of the column.
+    """
+    key = get_column_key(column=column)
+    if key is not None:
+        _CASE_INSENSITIVE_COLUMNS.discard(key)
+    if not _CASE_INSENSITIVE_COLUMNS:
+        _unregister_case_insensitive_layers()
+
+
+def reset_case_insensitive_columns() -> None:
+    """Removes the case-insensitive declaration of every column, and their layers."""
+    _CASE_INSENSITIVE_COLUMNS.clear()
+    _unregister_case_insensitive_layers()
+
+
+def is_case_insensitive_column(column: Any) -> bool:
+    """Determines whether a column is declared as case-insensitive.
+
+    Args:
+        column (Any): The column, or the ORM attribute of the column.
+
+    Returns:
+        bool: True when the column's text filters ignore case.
+    """
+    key = get_column_key(column=column)
+    return key is not None and key in _CASE_INSENSITIVE_COLUMNS
+
+
+def get_case_insensitive_ddl(
+    column: Any, dialect: Dialect, name: Optional[str] = None
+) -> List[str]:
+    """Generates the statements which create the indexes serving a case-insensitive
+    column's filters.
+
+    The indexes are built from the same case-folded expression as the filters, so the
+    two always match. Each statement is idempotent, so they may be executed when the
+    application starts.
+
+    Args:
+        column (Any): The column, or the ORM attribute of the column.
+        dialect (Dialect): The dialect of the database, such as `engine.dialect`.
+        name (Optional[str], optional): The name of the index. Defaults to
+            `ix_<table>_<column>_ci`. PostgreSQL's trigram index is suffixed by
+            `_trgm`.
+
+    Raises:
+        ValueError: Raised when the column isn't a table's column.
+
+    Returns:
+        List[str]: The SQL statements, to be executed in order.
+    """
+    key = get_column_key(column=column)
+    if key is None:
+        raise ValueError(f"Expected a table's column, received {column}")
+    expression = getattr(column, "expression", column)
+    index_name = name or f"ix_{expression.table.name}_{expression.name}_ci"
+    indexes = [Index(index_name, CaseFolded(expression))]
+    statements = []
+    if dialect.name == "postgresql":
+        statements.append("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        indexes.append(
+            Index(
+                f"{index_name}_trgm",
+                expression,
+                postgresql_using="gin",
+                postgresql_ops={expression.name: "gin_trgm_ops"},
+            )
+        )
+    for index in indexes:
+        statements.append(
+            str(CreateIndex(index, if_not_exists=True).compile(dialect=dialect))
+        )
+        # the indexes are attached to the table when created, but are only described
+        expression.table.indexes.discard(index)
+    return statements
+
+
+def apply_equal_case_insensitive_operator(column: Any, value: Any) -> Any:
+    """Handles applying the equal (=, ==, equals, eq) operator to a column, ignoring
+    case when the column is case-insensitive.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered. None is compared using `IS NULL`.
+
+    Returns:
+        Any: The column after applying the equal filter using the provided value.
+    """
+    if value is None or not is_case_insensitive_column(column=column):
+        return apply_equal_operator(column, value)
+    return CaseFolded(column) == value
+
+
+def apply_not_equal_case_insensitive_operator(column: Any, value: Any) -> Any:
+    """Handles applying the not equal (!=, ne) operator to a column, ignoring case
+    when the column is case-insensitive.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered. None is compared using `IS NOT NULL`.
+
+    Returns:
+        Any: The column after applying the not equal filter using the provided value.
+    """
+    if value is None or not is_case_insensitive_column(column=column):
+        return apply_not_equal_operator(column, value)
+    return CaseFolded(column) != value
+
+
+def apply_is_any_of_case_insensitive_operator(column: Any, value: Any) -> Any:
+    """Handles applying the isAnyOf x-data-grid operator to a column, ignoring case
+    when the column is case-insensitive.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the isAnyOf filter using the provided value.
+    """
+    if not value or not is_case_insensitive_column(column=column):
+        return apply_is_any_of_operator(column, value)
+    return CaseFolded(column).in_(value)
+
+
+def apply_contains_case_insensitive_operator(column: Any, value: Any) -> Any:
+    """Handles applying the contains x-data-grid operator to a column, ignoring case
+    when the column is case-insensitive.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the contains filter using the provided value.
+    """
+    if value is None or not is_case_insensitive_column(column=column):
+        return apply_contains_operator(column, value)
+    return CaseInsensitiveLike(column, get_like_pattern(value, prefix="%", suffix="%"))
+
+
+def apply_startswith_case_insensitive_operator(column: Any, value: Any) -> Any:
+    """Handles applying the startsWith x-data-grid operator to a column, ignoring
+    case when the column is case-insensitive.
+
+    The pattern is bound as a single value, rather than concatenated in SQL, so that
+    SQLite serves it from the column's NOCASE index.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the startsWith filter using the provided value.
+    """
+    if value is None or not is_case_insensitive_column(column=column):
+        return apply_startswith_operator(column, value)
+    return CaseInsensitiveLike(column, get_like_pattern(value, suffix="%"))
+
+
+def apply_endswith_case_insensitive_operator(column: Any, value: Any) -> Any:
+    """Handles applying the endsWith x-data-grid operator to a column, ignoring case
+    when the column is case-insensitive.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the endsWith filter using the provided value.
+    """
+    if value is None or not is_case_insensitive_column(column=column):
+        return apply_endswith_operator(column, value)
+    return CaseInsensitiveLike(column, get_like_pattern(value, prefix="%"))
@@ -0,0 +1,412 @@
+"""The is_any_of module applies isAnyOf filters using a strategy chosen by the number of
+values.
+
+Each value of `col IN (...)` is a bind parameter, so a selection of thousands of
+values produces an enormous statement, runs into the database's limit on the number of
+bind parameters, such as SQLite's 32,766, and is slow to compile and execute. The
+scalable applicator chooses the strategy from the number of values:
+
+- EXPANDING lists are bound as an expanding parameter, `col IN (?, ?, ?)`, which
+  shares a compiled statement between lists of any length.
+- JSON lists are bound as a single JSON array, which is expanded into rows by the
+  database, such as `col IN (SELECT value FROM json_each(?))` on SQLite,
+  `json_array_elements_text` on PostgreSQL, and `JSON_TABLE` on MySQL.
+- TEMPORARY_TABLE lists are bulk loaded into a temporary table with the values as its
+  primary key, which the rows are semi-joined with,
+  `col IN (SELECT value FROM mui_values_<digest>)`.
+
+The applicator is layered over the registered isAnyOf applicator, with the thresholds
+between the strategies, when the application starts. Lists below the JSON threshold
+are applied by the previously registered applicator:
+
+    register_scalable_is_any_of_operator(
+        IsAnyOfThresholds(json=100, temporary_table=10_000),
+        sessions=SessionLocal,
+    )
+
+Temporary tables are loaded by a `do_orm_execute` listener of the sessions executing
+the statement, on the session's connection, so statements executed by a Core
+connection should disable them. The listener inspects every statement its sessions
+execute, so it should be scoped to the sessions which query the data grid, such as
+their sessionmaker, rather than every session. Tables are named after a digest of their
+values and type, so the count and page queries of a request share a table, which is
+only loaded once for each connection, and again after the connection rolls back.
+"""
+
+import json
+from collections import OrderedDict
+from functools import partial
+from hashlib import sha256
+from typing import Any, Collection, Hashable, List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import Column, MetaData, Table, event, select
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.schema import DropTable
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import NullType
+
+from mui.compat import StrEnum
+from mui.v6.integrations.sqlalchemy.filter.applicators import apply_is_any_of_operator
+from mui.v6.integrations.sqlalchemy.filter.registry import (
+    OperatorPlan,
+    register_operator_layer,
+)
+
+"""The key of a temporary table's values, in the table's info."""
+TEMPORARY_VALUES_KEY = "mui_is_any_of_values"
+"""The key of the temporary tables loaded on a connection, in the connection's info."""
+_LOADED_TABLES_KEY = "mui_is_any_of_tables"
+"""The number of temporary tables kept on a connection, dropping the least recently
+used table."""
+MAX_TEMPORARY_TABLES = 16
+
+
+class IsAnyOfStrategy(StrEnum):
+    """The strategy used to apply an isAnyOf filter.
+
+    Attributes:
+        EXPANDING: The values are bound as an expanding parameter, with a bind
+            parameter for each value.
+        JSON: The values are bound as a single JSON array, expanded into rows by the
+            database.
+        TEMPORARY_TABLE: The values are loaded into a temporary table, which the rows
+            are semi-joined with.
+    """
+
+    EXPANDING = "expanding"
+    JSON = "json"
+    TEMPORARY_TABLE = "temporary_table"
+
+
+class IsAnyOfThresholds(NamedTuple):
+    """The number of values from which each isAnyOf strategy is used.
+
+    Attributes:
+        json (Optional[int]): The number of values from which the values are bound
+            as JSON, or None to never bind them as JSON. Defaults to 100.
+        temporary_table (Optional[int]): The number of values from which the values
+            are loaded into a temporary table, or None to never load them into a
+            temporary table. Defaults to 10,000.
+    """
+
+    json: Optional[int] = 100
+    temporary_table: Optional[int] = 10_000
+
+
+class JsonValuesIn(FunctionElement):  # type: ignore[type-arg]
+    """Compares an expression with the values of a bound JSON array, compiled for
+    each database. The expression and the array are compiled by SQLAlchemy, so no
+    values are included in the SQL.
+    """
+
+    name = "json_values_in"
+    inherit_cache = True
+    # a boolean function is compared with 1 by databases without a boolean type
+    type = NullType()  # type: ignore[assignment]
+
+
+@compiles(JsonValuesIn)  # type: ignore[misc]
+def _compile_json_values_in(
+    element: JsonValuesIn,  # noqa: ARG001
+    compiler: Any,
+    **kwargs: Any,  # noqa: ARG001
+) -> str:
+    raise CompileError(
+        f"The {compiler.dialect.name} dialect doesn't support isAnyOf values bound as "
+        "JSON, set the JSON threshold to None"
+    )
+
+
+@compiles(JsonValuesIn, "sqlite")  # type: ignore[misc]
+def _compile_json_values_in_sqlite(
+    element: JsonValuesIn, compiler: Any, **kwargs: Any
+) -> str:
+    expression, values = element.clauses.clauses
+    return (
+        f"{compiler.process(expression, **kwargs)} IN "  # noqa: S608
+        f"(SELECT value FROM json_each({compiler.process(values, **kwargs)}))"
+    )
+
+
+@compiles(JsonValuesIn, "postgresql")  # type: ignore[misc]
+def _compile_json_values_in_postgresql(
+    element: JsonValuesIn, compiler: Any, **kwargs: Any
+) -> str:
+    expression, values = element.clauses.clauses
+    value_type = compiler.dialect.type_compiler.process(expression.type)
+    return (
+        f"{compiler.process(expression, **kwargs)} IN "  # noqa: S608
+        f"(SELECT CAST(value AS {value_type}) FROM json_array_elements_text("
+        f"CAST({compiler.process(values, **kwargs)} AS JSON)))"
+    )
+
+
+@compiles(JsonValuesIn, "mysql")  # type: ignore[misc]
+def _compile_json_values_in_mysql(
+    element: JsonValuesIn, compiler: Any, **kwargs: Any
+) -> str:
+    expression, values = element.clauses.clauses
+    value_type = compiler.dialect.type_compiler.process(expression.type)
+    return (
+        f"{compiler.process(expression, **kwargs)} IN "  # noqa: S608
+        f"(SELECT value FROM JSON_TABLE({compiler.process(values, **kwargs)}, "
+        f"'$[*]' COLUMNS (value {value_type} PATH '$')) AS mui_values)"
+    )
+
+
+def get_is_any_of_strategy(
+    count: int, thresholds: Optional[IsAnyOfThresholds] = None
+) -> IsAnyOfStrategy:
+    """Chooses the strategy used to apply an isAnyOf filter.
+
+    Args:
+        count (int): The number of values.
+        thresholds (Optional[IsAnyOfThresholds], optional): The thresholds between
+            the strategies. Defaults to `IsAnyOfThresholds()`.
+
+    Returns:
+        IsAnyOfStrategy: The strategy.
+    """
+    thresholds = thresholds or IsAnyOfThresholds()
+    if thresholds.temporary_table is not None and count >= thresholds.temporary_table:
+        return IsAnyOfStrategy.TEMPORARY_TABLE
+    if thresholds.json is not None and count >= thresholds.json:
+        return IsAnyOfStrategy.JSON
+    return IsAnyOfStrategy.EXPANDING
+
+
+def get_json_values(values: Collection[Any]) -> str:
+    """Converts isAnyOf values into a JSON array.
+
+    Args:
+        values (Collection[Any]): The values. Values which aren't JSON types, such as
+            dates, are converted to strings.
+
+    Returns:
+        str: The JSON array.
+    """
+    return json.dumps(list(values), default=str)
+
+
+def get_temporary_values_table(column: Any, values: Collection[Any]) -> Table:
+    """Describes the temporary table which isAnyOf values are loaded into.
+
+    The table is named after a digest of the values and the column's type, so values
+    compared with columns of different types don't share a table, and stores them in
+    its info, to be loaded when a statement using it is executed.
+
+    Args:
+        column (Any): The column the values are compared with, whose type is used as
+            the type of the values.
+        values (Collection[Any]): The values.
+
+    Returns:
+        Table: The temporary table, with the distinct values as its primary key.
+    """
+    distinct = list(dict.fromkeys(values))
+    payload = f"{column.type}\n{get_json_values(values=distinct)}"
+    digest = sha256(payload.encode()).hexdigest()[:16]
+    table = Table(
+        f"mui_values_{digest}",
+        MetaData(),
+        Column("value", column.type, primary_key=True),
+        prefixes=["TEMPORARY"],
+    )
+    table.info[TEMPORARY_VALUES_KEY] = distinct
+    return table
+
+
+def _forget_temporary_tables(connection: Any) -> None:
+    """Forgets the temporary tables loaded on a connection which rolled back, as the
+    tables created by the transaction no longer exist.
+
+    Args:
+        connection (Any): The connection.
+    """
+    connection.info.pop(_LOADED_TABLES_KEY, None)
+
+
+def _load_temporary_values(orm_execute_state: ORMExecuteState) -> None:
+    """Loads the temporary tables used by a statement on the session's connection.
+
+    The tables loaded on the connection are tracked in its info, which is cleared when
+    the connection rolls back, so the database's catalog isn't queried each time a
+    statement is executed.
+
+    Args:
+        orm_execute_state (ORMExecuteState): The statement being executed.
+    """
+    tables = [
+        element
+        for element in visitors.iterate(orm_execute_state.statement)
+        if isinstance(element, Table) and TEMPORARY_VALUES_KEY in element.info
+    ]
+    if not tables:
+        return
+    connection = orm_execute_state.session.connection(
+        bind_arguments=orm_execute_state.bind_arguments
+    )
+    if not event.contains(connection.engine, "rollback", _forget_temporary_tables):
+        event.listen(connection.engine, "rollback", _forget_temporary_tables)
+    loaded: "OrderedDict[str, Table]" = connection.info.setdefault(
+        _LOADED_TABLES_KEY, OrderedDict()
+    )
+    for table in tables:
+        if table.name not in loaded:
+            # a table created before a rollback may still exist, such as on MySQL,
+            # whose temporary tables aren't transactional
+            connection.execute(DropTable(table, if_exists=True))
+            table.create(bind=connection)
+            connection.execute(
+                table.insert(),
+                [{"value": value} for value in table.info[TEMPORARY_VALUES_KEY]],
+            )
+        loaded[table.name] = table
+        loaded.move_to_end(table.name)
+    while len(loaded) > MAX_TEMPORARY_TABLES:
+        _, table = loaded.popitem(last=False)
+        table.drop(bind=connection)
+
+
+def _get_scalable_strategy(
+    value: Any, thresholds: IsAnyOfThresholds
+) -> IsAnyOfStrategy:
+    """Chooses the strategy used to apply an isAnyOf filter's value.
+
+    Args:
+        value (Any): The item's values.
+        thresholds (IsAnyOfThresholds): The thresholds between the strategies.
+
+    Returns:
+        IsAnyOfStrategy: The strategy, where empty values and values which aren't
+            lists are applied as an expanding parameter.
+    """
+    if not value or not isinstance(value, Collection) or isinstance(value, str):
+        return IsAnyOfStrategy.EXPANDING
+    return get_is_any_of_strategy(count=len(value), thresholds=thresholds)
+
+
+def _is_scalable_value(
+    column: Any,  # noqa: ARG001
+    value: Any,
+    thresholds: IsAnyOfThresholds,
+) -> bool:
+    """Determines whether an isAnyOf filter is applied by the scalable applicator.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's values.
+        thresholds (IsAnyOfThresholds): The thresholds between the strategies.
+
+    Returns:
+        bool: True when the values are bound as JSON or loaded into a temporary table.
+    """
+    return _get_scalable_strategy(value=value, thresholds=thresholds) != (
+        IsAnyOfStrategy.EXPANDING
+    )
+
+
+def _get_scalable_shape(
+    column: Any,  # noqa: ARG001
+    value: Any,
+    thresholds: IsAnyOfThresholds,
+) -> Optional[Hashable]:
+    """Determines the shape of the values applied by the scalable applicator.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's values.
+        thresholds (IsAnyOfThresholds): The thresholds between the strategies.
+
+    Returns:
+        Optional[Hashable]: The strategy, or None for values loaded into a temporary
+            table, which is named after its values and so can't be planned.
+    """
+    strategy = _get_scalable_strategy(value=value, thresholds=thresholds)
+    return strategy if strategy != IsAnyOfStrategy.TEMPORARY_TABLE else None
+
+
+def _bind_json_values(column: Any, value: Any) -> Optional[Sequence[Any]]:  # noqa: ARG001
+    """Binds the values of the scalable applicator as a JSON array.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's values.
+
+    Returns:
+        Optional[Sequence[Any]]: The JSON array.
+    """
+    return [get_json_values(values=value)]
+
+
+def register_scalable_is_any_of_operator(
+    thresholds: Optional[IsAnyOfThresholds] = None, sessions: Any = Session
+) -> None:
+    """Layers the scalable applicator over the registered isAnyOf applicator, which
+    still applies the lists bound as an expanding parameter. Registering it again
+    replaces its thresholds.
+
+    Args:
+        thresholds (Optional[IsAnyOfThresholds], optional): The thresholds between
+            the strategies. Defaults to `IsAnyOfThresholds()`.
+        sessions (Any, optional): The sessions which load the temporary tables used
+            by the statements they execute, when temporary tables are enabled, such
+            as a sessionmaker, a Session subclass, or a session. Defaults to
+            Session, every ORM session.
+    """
+    thresholds = thresholds or IsAnyOfThresholds()
+    register_operator_layer(
+        "isAnyOf",
+        partial(apply_is_any_of_scalable_operator, thresholds=thresholds),
+        handles=partial(_is_scalable_value, thresholds=thresholds),
+        plan=OperatorPlan(
+            bind=_bind_json_values,
+            shape=partial(_get_scalable_shape, thresholds=thresholds),
+        ),
+    )
+    if thresholds.temporary_table is not None and not event.contains(
+        sessions, "do_orm_execute", _load_temporary_values
+    ):
+        event.listen(sessions, "do_orm_execute", _load_temporary_values)
+
+
+def apply_is_any_of_scalable_operator(
+    column: Any, value: Any, thresholds: Optional[IsAnyOfThresholds] = None
+) -> Any:
+    """Handles applying the isAnyOf x-data-grid operator to a column, using the
+    strategy chosen by the number of values.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+        thresholds (Optional[IsAnyOfThresholds], optional): The thresholds between
+            the strategies. Defaults to `IsAnyOfThresholds()`.
+
+    Returns:
+        Any: The column after applying the isAnyOf filter using the provided value.
+    """
+    strategy = _get_scalable_strategy(
+        value=value, thresholds=thresholds or IsAnyOfThresholds()
+    )
+    if strategy == IsAnyOfStrategy.JSON:
+        return JsonValuesIn(column, get_json_values(values=value))
+    if strategy == IsAnyOfStrategy.TEMPORARY_TABLE:
+        table = get_temporary_values_table(column=column, values=value)
+        return column.in_(select(table.c.value))
+    return apply_is_any_of_operator(column, value)
+
+
+def get_loaded_temporary_tables(connection: Any) -> List[str]:
+    """Retrieves the names of the temporary tables loaded on a connection.
+
+    Args:
+        connection (Any): The connection, such as `session.connection()`.
+
+    Returns:
+        List[str]: The names, from the least to the most recently used.
+    """
+    return list(connection.info.get(_LOADED_TABLES_KEY, {}))
@@ -0,0 +1,426 @@
+"""The optimize module simplifies a filter model before it's converted into SQL.
+
+Saved views often contain redundant items, such as several equalities on one field
+joined by OR, or overlapping ranges joined by AND. These produce long WHERE clauses
+which databases plan poorly. The optimizer rewrites the items, without changing the
+rows they match:
+
+    * Duplicate items are removed.
+    * Equalities and isAnyOf items on one field joined by OR are folded into a single
+      isAnyOf item, `x = 1 OR x = 2` becoming `x IN (1, 2)`.
+    * Equalities and isAnyOf items of numbers on one field joined by AND are
+      intersected.
+    * Numeric ranges on one field joined by AND are narrowed to their tightest
+      bounds, and inclusive bounds are merged into a single between item,
+      `x >= 1 AND x <= 5 AND x > 0` becoming `x BETWEEN 1 AND 5`.
+    * Contradictions, such as `x = 1 AND x = 2` or `x > 5 AND x < 3`, are detected,
+      so the rows can be known to be empty without querying the database.
+
+Items whose values are of mixed types, such as `x = 1 AND x = "1"`, are left as-is,
+as the database may convert either value to the column's type. Equalities of strings
+joined by AND are also left as-is, as the database compares them using the column's
+type and collation, so distinct strings may be equal, such as "1" and "01" on an
+integer column, or "a" and "A" using a case-insensitive collation.
+"""
+
+import json
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from typing_extensions import TypeAlias
+
+from mui.v6.grid import GridFilterItem, GridFilterModel, GridLogicOperator
+from mui.v6.integrations.sqlalchemy.filter.applicators import (
+    Applicator,
+    apply_between_operator,
+    apply_equal_operator,
+    apply_greater_than_operator,
+    apply_greater_than_or_equal_to_operator,
+    apply_is_any_of_operator,
+    apply_less_than_operator,
+    apply_less_than_or_equal_to_operator,
+)
+from mui.v6.integrations.sqlalchemy.filter.registry import (
+    get_operator_applicator,
+    is_operator_registered,
+)
+
+"""The operators produced by the optimizer, which must not have been replaced."""
+_PRODUCED_OPERATORS: Dict[str, Applicator] = {
+    "=": apply_equal_operator,
+    "isAnyOf": apply_is_any_of_operator,
+    "between": apply_between_operator,
+}
+_LOWER_BOUNDS = {apply_greater_than_operator, apply_greater_than_or_equal_to_operator}
+_UPPER_BOUNDS = {apply_less_than_operator, apply_less_than_or_equal_to_operator}
+_INCLUSIVE_BOUNDS = {
+    apply_greater_than_or_equal_to_operator,
+    apply_less_than_or_equal_to_operator,
+}
+_SCALAR_TYPES = (str, int, float)
+
+"""An equality or isAnyOf item, with the values it matches."""
+_Equality: TypeAlias = Tuple[GridFilterItem, List[Any]]
+"""A numeric range item, with its value, whether the bound is inclusive, and whether
+it's a lower bound."""
+_Bound: TypeAlias = Tuple[GridFilterItem, Any, bool, bool]
+
+
+class OptimizedFilterModel(NamedTuple):
+    """The result of optimizing a filter model.
+
+    Attributes:
+        model (GridFilterModel): The optimized filter model, which matches the same
+            rows as the original model.
+        unsatisfiable (bool): True when the model can't match any rows.
+    """
+
+    model: GridFilterModel
+    unsatisfiable: bool = False
+
+
+def _is_number(value: Any) -> bool:
+    """Determines whether a value is a number which can be compared in Python.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        bool: True for integers and floats, excluding booleans.
+    """
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _get_equal_values(
+    item: GridFilterItem, applicator: Applicator
+) -> Optional[List[Any]]:
+    """Retrieves the values an equality or isAnyOf item matches.
+
+    Args:
+        item (GridFilterItem): The filter item.
+        applicator (Applicator): The applicator registered for the item's operator.
+
+    Returns:
+        Optional[List[Any]]: The matched values, which is empty when the item
+            matches no rows, or None if the item isn't an equality of scalar values.
+    """
+    value = item.value
+    if applicator is apply_equal_operator:
+        return [value] if isinstance(value, _SCALAR_TYPES) else None
+    if applicator is not apply_is_any_of_operator:
+        return None
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)) and all(
+        isinstance(element, _SCALAR_TYPES) for element in value
+    ):
+        return list(value)
+    return None
+
+
+def _get_item_key(item: GridFilterItem, applicator: Applicator) -> Tuple[Any, ...]:
+    """Calculates the key identifying duplicate items.
+
+    Args:
+        item (GridFilterItem): The filter item.
+        applicator (Applicator): The applicator registered for the item's operator.
+
+    Returns:
+        Tuple[Any, ...]: The field, applicator, and serialized value.
+    """
+    return (
+        item.field,
+        applicator,
+        json.dumps(item.value, default=str, sort_keys=True),
+    )
+
+
+def _get_value_key(value: Any) -> Tuple[Any, Any]:
+    """Calculates the key comparing values, as they would be compared in SQL.
+
+    Numbers are compared by value, so 1 and 1.0 are equal, while other values are
+    compared with their type, so 1, "1", and True are distinct.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        Tuple[Any, Any]: The key.
+    """
+    return ("number" if _is_number(value) else type(value), value)
+
+
+def _unique(values: List[Any]) -> List[Any]:
+    """Removes duplicate values, keeping the first occurrence of each value.
+
+    Args:
+        values (List[Any]): The values.
+
+    Returns:
+        List[Any]: The unique values, in order.
+    """
+    seen = set()
+    unique = []
+    for value in values:
+        key = _get_value_key(value=value)
+        if key not in seen:
+            seen.add(key)
+            unique.append(value)
+    return unique
+
+
+def _has_single_type(values: List[Any]) -> bool:
+    """Determines whether all values share a type, treating numbers as one type.
+
+    Args:
+        values (List[Any]): The values.
+
+    Returns:
+        bool: True when the values can be compared with each other in Python.
+    """
+    return all(_is_number(value) for value in values) or (
+        len({type(value) for value in values}) <= 1
+    )
+
+
+def _equal_item(item: GridFilterItem, values: List[Any]) -> GridFilterItem:
+    """Creates the item matching any of the values, based on an existing item.
+
+    Args:
+        item (GridFilterItem): The item being replaced, whose ID and field are kept.
+        values (List[Any]): The values, of which there is at least one.
+
+    Returns:
+        GridFilterItem: An equality item for a single value, otherwise an isAnyOf
+            item.
+    """
+    if len(values) == 1:
+        return item.model_copy(update={"operator": "=", "value": values[0]})
+    return item.model_copy(update={"operator": "isAnyOf", "value": values})
+
+
+def _fold_disjunction(
+    items: List[GridFilterItem], applicators: List[Applicator]
+) -> Tuple[List[GridFilterItem], bool]:
+    """Folds the equalities on each field, joined by OR, into isAnyOf items.
+
+    Args:
+        items (List[GridFilterItem]): The unique items.
+        applicators (List[Applicator]): The applicator of each item.
+
+    Returns:
+        Tuple[List[GridFilterItem], bool]: The folded items, and whether the items
+            can't match any rows.
+    """
+    folded: List[Optional[GridFilterItem]] = []
+    # the position of each field's folded item, and the items being folded
+    fields: Dict[str, Tuple[int, List[_Equality]]] = {}
+    for item, applicator in zip(items, applicators):
+        values = _get_equal_values(item=item, applicator=applicator)
+        if values is None:
+            folded.append(item)
+            continue
+        if item.field not in fields:
+            fields[item.field] = (len(folded), [])
+            folded.append(item)
+        fields[item.field][1].append((item, values))
+    for position, equalities in fields.values():
+        values = _unique([value for _, other in equalities for value in other])
+        if not values:
+            # an empty isAnyOf matches nothing, so it's dropped from the disjunction
+            folded[position] = None
+        elif len(equalities) > 1:
+            folded[position] = _equal_item(item=equalities[0][0], values=values)
+    remaining = [item for item in folded if item is not None]
+    return (remaining, False) if remaining else (items, True)
+
+
+def _narrow_bounds(
+    bounds: List[_Bound],
+) -> Tuple[Optional[_Bound], Optional[_Bound]]:
+    """Selects the tightest lower and upper bounds of a field.
+
+    Args:
+        bounds (List[_Bound]): The numeric range items of a field.
+
+    Returns:
+        Tuple[Optional[_Bound], Optional[_Bound]]: The tightest lower bound and the
+            tightest upper bound, either of which may be None.
+    """
+    lower: Optional[_Bound] = None
+    upper: Optional[_Bound] = None
+    for bound in bounds:
+        _, value, inclusive, is_lower = bound
+        if is_lower:
+            if (
+                lower is None
+                or value > lower[1]
+                or (value == lower[1] and not inclusive)
+            ):
+                lower = bound
+        elif upper is None or value < upper[1] or (value == upper[1] and not inclusive):
+            upper = bound
+    return lower, upper
+
+
+def _is_within(value: Any, lower: Optional[_Bound], upper: Optional[_Bound]) -> bool:
+    """Determines whether a value satisfies the lower and upper bounds.
+
+    Args:
+        value (Any): The value.
+        lower (Optional[_Bound]): The lower bound.
+        upper (Optional[_Bound]): The upper bound.
+
+    Returns:
+        bool: True when the value is within the bounds.
+    """
+    if lower is not None:
+        _, low, inclusive, _ = lower
+        if value < low or (value == low and not inclusive):
+            return False
+    if upper is not None:
+        _, high, inclusive, _ = upper
+        if value > high or (value == high and not inclusive):
+            return False
+    return True
+
+
+def _merge_field(
+    equalities: List[_Equality], bounds: List[_Bound]
+) -> Optional[List[GridFilterItem]]:
+    """Merges the equalities and numeric ranges on a single field, joined by AND.
+
+    Args:
+        equalities (List[_Equality]): The equality and isAnyOf items.
+        bounds (List[_Bound]): The numeric range items.
+
+    Returns:
+        Optional[List[GridFilterItem]]: The merged items, or None if they can't
+            match any rows.
+    """
+    lower, upper = _narrow_bounds(bounds=bounds)
+    if equalities:
+        values = equalities[0][1]
+        for _, other in equalities[1:]:
+            keys = {_get_value_key(value=element) for element in other}
+            values = [value for value in values if _get_value_key(value=value) in keys]
+        values = _unique([value for value in values if _is_within(value, lower, upper)])
+        if not values:
+            return None
+        if len(equalities) == 1 and not bounds:
+            return [equalities[0][0]]
+        return [_equal_item(item=equalities[0][0], values=values)]
+    if lower is None or upper is None:
+        return [bound[0] for bound in (lower, upper) if bound is not None]
+    low_item, low, low_inclusive, _ = lower
+    high_item, high, high_inclusive, _ = upper
+    inclusive = low_inclusive and high_inclusive
+    if low > high or (low == high and not inclusive):
+        return None
+    if not inclusive:
+        return [low_item, high_item]
+    if low == high:
+        return [_equal_item(item=low_item, values=[low])]
+    return [low_item.model_copy(update={"operator": "between", "value": [low, high]})]
+
+
+def _merge_conjunction(
+    items: List[GridFilterItem], applicators: List[Applicator]
+) -> Tuple[List[GridFilterItem], bool]:
+    """Merges the equalities and numeric ranges on each field, joined by AND.
+
+    Args:
+        items (List[GridFilterItem]): The unique items.
+        applicators (List[Applicator]): The applicator of each item.
+
+    Returns:
+        Tuple[List[GridFilterItem], bool]: The merged items, and whether the items
+            can't match any rows.
+    """
+    # each field's mergeable items are replaced by the list of merged items
+    merged: List[Union[GridFilterItem, List[GridFilterItem]]] = []
+    # the position of each field's merged items, and the items being merged
+    fields: Dict[str, Tuple[int, List[_Equality], List[_Bound]]] = {}
+    for item, applicator in zip(items, applicators):
+        values = _get_equal_values(item=item, applicator=applicator)
+        is_bound = applicator in _LOWER_BOUNDS or applicator in _UPPER_BOUNDS
+        if values is None and not (is_bound and _is_number(item.value)):
+            merged.append(item)
+            continue
+        if item.field not in fields:
+            fields[item.field] = (len(merged), [], [])
+            merged.append([])
+        _, equalities, bounds = fields[item.field]
+        if values is not None:
+            equalities.append((item, values))
+        else:
+            bounds.append((
+                item,
+                item.value,
+                applicator in _INCLUSIVE_BOUNDS,
+                applicator in _LOWER_BOUNDS,
+            ))
+    for field, (position, equalities, bounds) in fields.items():
+        values = [value for _, other in equalities for value in other]
+        numbers = all(_is_number(value) for value in values)
+        if (
+            not _has_single_type(values)
+            or (bounds and not numbers)
+            or (len(equalities) > 1 and any(isinstance(v, str) for v in values))
+        ):
+            # the values can't be compared in Python, so the items are kept as-is
+            merged[position] = [item for item, _ in equalities] + [
+                bound[0] for bound in bounds
+            ]
+            continue
+        result = _merge_field(equalities=equalities, bounds=bounds)
+        if result is None:
+            return [item for item in items if item.field == field], True
+        merged[position] = result
+    return [
+        item
+        for entry in merged
+        for item in (entry if isinstance(entry, list) else [entry])
+    ], False
+
+
+def optimize_filter_model(model: GridFilterModel) -> OptimizedFilterModel:
+    """Simplifies a filter model, without changing the rows it matches.
+
+    Models using unregistered operators, or in which the operators produced by the
+    optimizer have been replaced with custom applicators, are returned as-is. The
+    quick filter values are not changed.
+
+    Args:
+        model (GridFilterModel): The filter model being optimized.
+
+    Returns:
+        OptimizedFilterModel: The optimized model, and whether it can't match any
+            rows. When the model is unsatisfiable, its items are the contradicting
+            items.
+    """
+    if any(
+        not is_operator_registered(operator=item.operator) for item in model.items
+    ) or any(
+        not is_operator_registered(operator=operator)
+        or get_operator_applicator(operator=operator) is not applicator
+        for operator, applicator in _PRODUCED_OPERATORS.items()
+    ):
+        return OptimizedFilterModel(model=model)
+    items: List[GridFilterItem] = []
+    applicators: List[Applicator] = []
+    seen = set()
+    for item in model.items:
+        applicator = get_operator_applicator(operator=item.operator)
+        key = _get_item_key(item=item, applicator=applicator)
+        if key not in seen:
+            seen.add(key)
+            items.append(item)
+            applicators.append(applicator)
+    if len(items) > 1 and model.logic_operator == GridLogicOperator.Or:
+        items, unsatisfiable = _fold_disjunction(items=items, applicators=applicators)
+    else:
+        items, unsatisfiable = _merge_conjunction(items=items, applicators=applicators)
+    return OptimizedFilterModel(
+        model=model.model_copy(update={"items": items}),
+        unsatisfiable=unsatisfiable,
+    )
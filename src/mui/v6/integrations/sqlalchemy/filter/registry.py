@@ -0,0 +1,674 @@
+"""The registry module maps filter operators to the applicators which implement them.
+
+Each operator name and alias is mapped directly to its applicator, so dispatching a
+filter item is a single dictionary lookup. Custom operators may be registered, and
+are applied in SQL like the built-in operators, for example an `inLastNDays` operator
+receiving a number of days:
+
+    def apply_in_last_n_days_operator(column, value):
+        return column >= datetime.now() - timedelta(days=int(value))
+
+    register_operator("inLastNDays", apply_in_last_n_days_operator)
+
+An operator may also be registered with a plan, describing the values bound by its
+clause, so that a plan cache builds its clause once and only binds the values of later
+requests:
+
+    register_operator(
+        "inLastNDays",
+        apply_in_last_n_days_operator,
+        plan=OperatorPlan(
+            bind=lambda column, value: [datetime.now() - timedelta(days=int(value))]
+        ),
+    )
+
+An applicator may instead be layered over the registered applicator, applying only the
+columns and values it handles, such as the columns declared by an opt-in module, while
+the others are still applied by the previously registered applicator. Layers registered
+for unrelated columns therefore don't change each other's SQL, whatever order they're
+registered in:
+
+    register_operator_layer(
+        "contains",
+        apply_contains_full_text_operator,
+        handles=lambda column, value: column.key in FULL_TEXT_COLUMNS,
+    )
+
+Operators should be registered when the application starts, before any requests are
+filtered. `unregister_operator_layer` removes a layer, and `reset_operators` restores
+the built-in operators, such as between tests.
+"""
+
+from datetime import date, datetime, time
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from mui.v6.integrations.sqlalchemy.filter.applicators import (
+    BASIC_OPERATORS,
+    Applicator,
+    apply_after_operator,
+    apply_before_operator,
+    apply_between_operator,
+    apply_contains_operator,
+    apply_endswith_operator,
+    apply_is_any_of_operator,
+    apply_is_empty_operator,
+    apply_is_not_empty_operator,
+    apply_is_operator,
+    apply_not_operator,
+    apply_on_or_after_operator,
+    apply_on_or_before_operator,
+    apply_startswith_operator,
+)
+
+"""Converts a filter item's value into the values of its clause's bind parameters,
+given the resolved column."""
+Binder = Callable[[Any, Any], Optional[Sequence[Any]]]
+"""Determines how a filter item's value affects the structure of its clause, given the
+resolved column."""
+Shaper = Callable[[Any, Any], Optional[Hashable]]
+"""Determines whether a layer applies an operator to a resolved column and value."""
+Handler = Callable[[Any, Any], bool]
+
+"""Identifies a table's column by its table and name."""
+ColumnKey = Tuple[Hashable, str]
+
+_TEMPORAL_TYPES = {datetime, time, date}
+_BOOLEAN_VALUES = {"true": True, "false": False}
+
+
+def get_column_key(column: Any) -> Optional[ColumnKey]:
+    """Retrieves the key identifying a table's column, which is shared by the column
+    and its ORM attribute.
+
+    Args:
+        column (Any): The column, or the ORM attribute of the column.
+
+    Returns:
+        Optional[ColumnKey]: The column's table and name, or None if the column isn't
+            a table's column.
+    """
+    expression = getattr(column, "expression", column)
+    table = getattr(expression, "table", None)
+    name = getattr(expression, "name", None)
+    if table is None or not isinstance(name, str):
+        return None
+    return table, name
+
+
+def get_bound_shape(column: Any, value: Any) -> Optional[Hashable]:  # noqa: ARG001
+    """The shape of values which are always bound, sharing a single clause.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The filter item's value.
+
+    Returns:
+        Optional[Hashable]: "bound".
+    """
+    return "bound"
+
+
+class OperatorPlan(NamedTuple):
+    """Describes how a plan cache plans the clauses built by an operator's applicator.
+
+    A plan builds an item's clause once for each shape of its value, replacing the
+    values bound by the clause with named parameters, and only binds the values of
+    later items with the same shape. Items whose value is None are applied as constant
+    clauses, so neither function receives None.
+
+    Attributes:
+        bind (Binder): Converts the resolved column and the item's value into the
+            values of the clause's bind parameters, in the order they appear in the
+            clause, or None when the clause is built as a constant, such as `is`
+            "any" being applied as `IN (true, false)`.
+        shape (Shaper, optional): Partitions the values by the structure of the
+            clause built for the resolved column, so that values with the same shape
+            build the same clause, up to their bound values. Values whose clause is
+            built as a constant must have a shape of their own. Returns None when
+            the value can't be planned.
+            Defaults to `get_bound_shape`.
+    """
+
+    bind: Binder
+    shape: Shaper = get_bound_shape
+
+
+def bind_value(column: Any, value: Any) -> Optional[Sequence[Any]]:  # noqa: ARG001
+    """Binds the value as-is.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's value.
+
+    Returns:
+        Optional[Sequence[Any]]: The value.
+    """
+    return [value]
+
+
+def _bind_datetime(column: Any, value: Any) -> Optional[Sequence[Any]]:  # noqa: ARG001
+    """Binds an ISO 8601 formatted value as a datetime.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's ISO 8601 formatted value.
+
+    Returns:
+        Optional[Sequence[Any]]: The parsed datetime.
+    """
+    return [datetime.fromisoformat(value)]
+
+
+def _is_any_value(value: Any) -> bool:
+    """Determines whether the value of the `is` operator matches either boolean.
+
+    Args:
+        value (Any): The item's value.
+
+    Returns:
+        bool: True for "any", and "" which represents "any" in MUI v5.
+    """
+    return isinstance(value, str) and value in {"", "any"}
+
+
+def _get_is_shape(column: Any, value: Any) -> Optional[Hashable]:  # noqa: ARG001
+    """Determines the shape of the `is` operator's value.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's value.
+
+    Returns:
+        Optional[Hashable]: The value for values matching either boolean, which are
+            applied using a constant IN clause, otherwise "bound".
+    """
+    return ("constant", value) if _is_any_value(value=value) else "bound"
+
+
+def _bind_is(column: Any, value: Any) -> Optional[Sequence[Any]]:
+    """Binds the value of the `is` operator, which depends on the column's type.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's value.
+
+    Raises:
+        ValueError: Raised when an unexpected boolean value is received.
+
+    Returns:
+        Optional[Sequence[Any]]: The parsed datetime or boolean, or the value for
+            other columns, or None for values matching either boolean.
+    """
+    if _is_any_value(value=value):
+        return None
+    python_type = column.type.python_type
+    if python_type in _TEMPORAL_TYPES:
+        return [datetime.fromisoformat(value)]
+    if python_type is bool:
+        if value not in _BOOLEAN_VALUES:
+            raise ValueError(f"Unexpected boolean filter value received: {value}")
+        return [_BOOLEAN_VALUES[value]]
+    return [value]
+
+
+def _bind_not(column: Any, value: Any) -> Optional[Sequence[Any]]:
+    """Binds the value of the `not` operator, which depends on the column's type.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's value.
+
+    Returns:
+        Optional[Sequence[Any]]: The parsed datetime for temporal columns, otherwise
+            the value.
+    """
+    if column.type.python_type in _TEMPORAL_TYPES:
+        return [datetime.fromisoformat(value)]
+    return [value]
+
+
+def _bind_nothing(column: Any, value: Any) -> Optional[Sequence[Any]]:  # noqa: ARG001
+    """Binds no values, for operators which ignore their value.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's value.
+
+    Returns:
+        Optional[Sequence[Any]]: None.
+    """
+    return None
+
+
+def _get_constant_shape(column: Any, value: Any) -> Optional[Hashable]:  # noqa: ARG001
+    """The shape of values which are ignored by their operator.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's value.
+
+    Returns:
+        Optional[Hashable]: "constant".
+    """
+    return "constant"
+
+
+def get_is_any_of_shape(column: Any, value: Any) -> Optional[Hashable]:  # noqa: ARG001
+    """Determines the shape of the isAnyOf operator's values.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's values.
+
+    Returns:
+        Optional[Hashable]: "empty" for an empty list, which is applied as a constant
+            clause, otherwise "bound".
+    """
+    return "bound" if value else "empty"
+
+
+def bind_is_any_of_values(
+    column: Any,  # noqa: ARG001
+    value: Any,
+) -> Optional[Sequence[Any]]:
+    """Binds the values of the isAnyOf operator as a single expanding parameter.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's values.
+
+    Returns:
+        Optional[Sequence[Any]]: The values, or None for an empty list.
+    """
+    return [value] if value else None
+
+
+def _bind_bounds(column: Any, value: Any) -> Optional[Sequence[Any]]:  # noqa: ARG001
+    """Binds the `[low, high]` bounds of the `between` operator.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's bounds.
+
+    Raises:
+        ValueError: Raised when the value isn't a pair of bounds.
+
+    Returns:
+        Optional[Sequence[Any]]: The low and high bounds.
+    """
+    bounds = list(value) if isinstance(value, (list, tuple)) else []
+    if len(bounds) != 2:  # noqa: PLR2004
+        raise ValueError(f"Expected [low, high] bounds for between, received {value}")
+    return bounds
+
+
+_VALUE_PLAN = OperatorPlan(bind=bind_value)
+_DATETIME_PLAN = OperatorPlan(bind=_bind_datetime)
+_CONSTANT_PLAN = OperatorPlan(bind=_bind_nothing, shape=_get_constant_shape)
+
+"""The plans of the built-in applicators, which are used when they're registered."""
+_BUILT_IN_PLANS: Dict[Applicator, OperatorPlan] = {
+    **{applicator: _VALUE_PLAN for applicator in BASIC_OPERATORS.values()},
+    apply_is_operator: OperatorPlan(bind=_bind_is, shape=_get_is_shape),
+    apply_not_operator: OperatorPlan(bind=_bind_not),
+    apply_is_empty_operator: _CONSTANT_PLAN,
+    apply_is_not_empty_operator: _CONSTANT_PLAN,
+    apply_is_any_of_operator: OperatorPlan(
+        bind=bind_is_any_of_values, shape=get_is_any_of_shape
+    ),
+    apply_contains_operator: _VALUE_PLAN,
+    apply_startswith_operator: _VALUE_PLAN,
+    apply_endswith_operator: _VALUE_PLAN,
+    apply_before_operator: _DATETIME_PLAN,
+    apply_after_operator: _DATETIME_PLAN,
+    apply_on_or_before_operator: _DATETIME_PLAN,
+    apply_on_or_after_operator: _DATETIME_PLAN,
+    apply_between_operator: OperatorPlan(bind=_bind_bounds),
+}
+
+_BUILT_IN_OPERATORS: Dict[str, Applicator] = {
+    **BASIC_OPERATORS,
+    "is": apply_is_operator,
+    "not": apply_not_operator,
+    "isEmpty": apply_is_empty_operator,
+    "isNotEmpty": apply_is_not_empty_operator,
+    "isAnyOf": apply_is_any_of_operator,
+    "contains": apply_contains_operator,
+    "startsWith": apply_startswith_operator,
+    "endsWith": apply_endswith_operator,
+    "before": apply_before_operator,
+    "after": apply_after_operator,
+    "onOrBefore": apply_on_or_before_operator,
+    "onOrAfter": apply_on_or_after_operator,
+    "between": apply_between_operator,
+}
+_OPERATORS: Dict[str, Applicator] = dict(_BUILT_IN_OPERATORS)
+_PLANS: Dict[str, OperatorPlan] = {
+    operator: _BUILT_IN_PLANS[applicator]
+    for operator, applicator in _BUILT_IN_OPERATORS.items()
+}
+
+
+def register_operator(
+    operator: str,
+    applicator: Applicator,
+    aliases: Sequence[str] = (),
+    plan: Optional[OperatorPlan] = None,
+) -> None:
+    """Registers the applicator used for an operator.
+
+    Args:
+        operator (str): The name of the operator, as sent by the data grid.
+        applicator (Applicator): The applicator receiving the resolved column and
+            the filter item's value, returning the filter clause. This replaces any
+            previously registered applicator, including the built-in operators.
+        aliases (Sequence[str], optional): Additional names of the operator.
+            Defaults to ().
+        plan (Optional[OperatorPlan], optional): How the applicator's clauses are
+            planned by a plan cache. Defaults to the plan of a built-in applicator,
+            while other applicators are applied without a plan.
+    """
+    if plan is None:
+        plan = _BUILT_IN_PLANS.get(applicator)
+    for name in (operator, *aliases):
+        _OPERATORS[name] = applicator
+        if plan is not None:
+            _PLANS[name] = plan
+        else:
+            _PLANS.pop(name, None)
+
+
+class OperatorLayer:
+    """An applicator layered over the applicator previously registered for an
+    operator, which still applies the columns and values the layer doesn't handle.
+
+    Attributes:
+        applicator (Applicator): The layer's applicator.
+        handles (Handler): Determines whether the layer's applicator applies a
+            resolved column and value.
+        plan (Optional[OperatorPlan]): The plan of the layer's applicator.
+        previous (Applicator): The previously registered applicator.
+        previous_plan (Optional[OperatorPlan]): The plan of the previously
+            registered applicator.
+    """
+
+    __slots__ = ("applicator", "handles", "plan", "previous", "previous_plan")
+
+    applicator: Applicator
+    handles: Handler
+    plan: Optional[OperatorPlan]
+    previous: Applicator
+    previous_plan: Optional[OperatorPlan]
+
+    def __init__(  # noqa: PLR0917
+        self,
+        applicator: Applicator,
+        handles: Handler,
+        plan: Optional[OperatorPlan],
+        previous: Applicator,
+        previous_plan: Optional[OperatorPlan],
+    ) -> None:
+        """Initialize a new operator layer.
+
+        Args:
+            applicator (Applicator): The layer's applicator.
+            handles (Handler): Determines whether the layer's applicator applies a
+                resolved column and value.
+            plan (Optional[OperatorPlan]): The plan of the layer's applicator.
+            previous (Applicator): The previously registered applicator.
+            previous_plan (Optional[OperatorPlan]): The plan of the previously
+                registered applicator.
+        """
+        self.applicator = applicator
+        self.handles = handles
+        self.plan = plan
+        self.previous = previous
+        self.previous_plan = previous_plan
+
+    def __call__(self, column: Any, value: Any) -> Any:
+        """Applies the operator to a column, using the layer's applicator when it
+        handles the column and value, otherwise the previous applicator.
+
+        Args:
+            column (Any): The column the operator is being applied to.
+            value (Any): The value being filtered.
+
+        Returns:
+            Any: The filter clause.
+        """
+        if self.handles(column, value):
+            return self.applicator(column, value)
+        return self.previous(column, value)
+
+    def get_plan(self) -> Optional[OperatorPlan]:
+        """Combines the plans of the layer and the previous applicator, planning each
+        column and value using the plan of the applicator which applies it.
+
+        Returns:
+            Optional[OperatorPlan]: The plan, or None if either applicator can't be
+                planned.
+        """
+        plan, previous_plan, handles = self.plan, self.previous_plan, self.handles
+        if plan is None or previous_plan is None:
+            return None
+
+        def bind(column: Any, value: Any) -> Optional[Sequence[Any]]:
+            if handles(column, value):
+                return plan.bind(column, value)
+            return previous_plan.bind(column, value)
+
+        def shape(column: Any, value: Any) -> Optional[Hashable]:
+            if handles(column, value):
+                applied_by, value_shape = "layer", plan.shape(column, value)
+            else:
+                applied_by, value_shape = "previous", previous_plan.shape(column, value)
+            return (applied_by, value_shape) if value_shape is not None else None
+
+        return OperatorPlan(bind=bind, shape=shape)
+
+
+def _get_layer_key(applicator: Applicator) -> Any:
+    """Identifies a layer by its applicator's function, so a partial of the function
+    with other arguments replaces the layer.
+
+    Args:
+        applicator (Applicator): The layer's applicator.
+
+    Returns:
+        Any: The applicator's function.
+    """
+    return applicator.func if isinstance(applicator, partial) else applicator
+
+
+_LayerArgs = Tuple[Applicator, Handler, Optional[OperatorPlan]]
+
+
+def _get_layers(
+    operator: str,
+) -> Tuple[List[_LayerArgs], Applicator, Optional[OperatorPlan]]:
+    """Unwinds the layers registered over an operator's applicator.
+
+    Args:
+        operator (str): The name or alias of the operator.
+
+    Raises:
+        ValueError: Raised when no applicator is registered for the operator.
+
+    Returns:
+        Tuple[List[_LayerArgs], Applicator, Optional[OperatorPlan]]: The applicator,
+            handler, and plan of each layer, from the bottom layer up, and the
+            applicator and plan beneath the layers.
+    """
+    previous = get_operator_applicator(operator=operator)
+    previous_plan = _PLANS.get(operator)
+    layers: List[_LayerArgs] = []
+    while isinstance(previous, OperatorLayer):
+        layers.insert(0, (previous.applicator, previous.handles, previous.plan))
+        previous_plan = previous.previous_plan
+        previous = previous.previous
+    return layers, previous, previous_plan
+
+
+def _set_layers(
+    operator: str,
+    layers: List[_LayerArgs],
+    previous: Applicator,
+    previous_plan: Optional[OperatorPlan],
+) -> None:
+    """Registers the layers over an applicator for an operator.
+
+    Args:
+        operator (str): The name or alias of the operator.
+        layers (List[_LayerArgs]): The applicator, handler, and plan of each layer,
+            from the bottom layer up.
+        previous (Applicator): The applicator beneath the layers.
+        previous_plan (Optional[OperatorPlan]): The plan of the applicator beneath
+            the layers.
+    """
+    for layer_applicator, layer_handles, layer_plan in layers:
+        layer = OperatorLayer(
+            applicator=layer_applicator,
+            handles=layer_handles,
+            plan=layer_plan,
+            previous=previous,
+            previous_plan=previous_plan,
+        )
+        previous, previous_plan = layer, layer.get_plan()
+    _OPERATORS[operator] = previous
+    if previous_plan is not None:
+        _PLANS[operator] = previous_plan
+    else:
+        _PLANS.pop(operator, None)
+
+
+def register_operator_layer(
+    operator: str,
+    applicator: Applicator,
+    handles: Handler,
+    plan: Optional[OperatorPlan] = None,
+) -> None:
+    """Registers an applicator over the applicator registered for an operator.
+
+    The layer applies the columns and values it handles, and the previously
+    registered applicator applies the others. Registering a layer whose applicator,
+    or a partial of its function, is already layered over the operator replaces that
+    layer where it is, rather than adding another layer.
+
+    Args:
+        operator (str): The name or alias of the operator.
+        applicator (Applicator): The layer's applicator.
+        handles (Handler): Receives the resolved column and the filter item's value,
+            returning whether the layer's applicator applies them.
+        plan (Optional[OperatorPlan], optional): How the layer's clauses are planned
+            by a plan cache. The operator is only planned when the layer and the
+            previous applicator both have a plan. Defaults to None.
+
+    Raises:
+        ValueError: Raised when no applicator is registered for the operator.
+    """
+    layers, previous, previous_plan = _get_layers(operator=operator)
+    key = _get_layer_key(applicator=applicator)
+    keys = [_get_layer_key(applicator=layered) for layered, _, _ in layers]
+    if key in keys:
+        layers[keys.index(key)] = (applicator, handles, plan)
+    else:
+        layers.append((applicator, handles, plan))
+    _set_layers(
+        operator=operator,
+        layers=layers,
+        previous=previous,
+        previous_plan=previous_plan,
+    )
+
+
+def unregister_operator_layer(operator: str, applicator: Applicator) -> None:
+    """Removes the layer whose applicator, or a partial of its function, is layered
+    over an operator.
+
+    The layers above it are layered over the layer or applicator beneath it, so the
+    columns and values it handled are applied as if it was never registered. Nothing
+    is removed when the applicator isn't layered over the operator.
+
+    Args:
+        operator (str): The name or alias of the operator.
+        applicator (Applicator): The layer's applicator.
+    """
+    if not is_operator_registered(operator=operator):
+        return
+    layers, previous, previous_plan = _get_layers(operator=operator)
+    key = _get_layer_key(applicator=applicator)
+    remaining = [
+        layer for layer in layers if _get_layer_key(applicator=layer[0]) != key
+    ]
+    if len(remaining) < len(layers):
+        _set_layers(
+            operator=operator,
+            layers=remaining,
+            previous=previous,
+            previous_plan=previous_plan,
+        )
+
+
+def reset_operators() -> None:
+    """Restores the built-in operators, removing the custom operators and layers."""
+    _OPERATORS.clear()
+    _OPERATORS.update(_BUILT_IN_OPERATORS)
+    _PLANS.clear()
+    _PLANS.update({
+        operator: _BUILT_IN_PLANS[applicator]
+        for operator, applicator in _BUILT_IN_OPERATORS.items()
+    })
+
+
+def get_operator_applicator(operator: str) -> Applicator:
+    """Retrieves the applicator registered for an operator.
+
+    Args:
+        operator (str): The name or alias of the operator.
+
+    Raises:
+        ValueError: Raised when no applicator is registered for the operator.
+
+    Returns:
+        Applicator: The applicator.
+    """
+    applicator = _OPERATORS.get(operator)
+    if applicator is None:
+        raise ValueError(f"Unsupported operator {operator}")
+    return applicator
+
+
+def get_operator_plan(operator: str) -> Optional[OperatorPlan]:
+    """Retrieves the plan registered for an operator.
+
+    Args:
+        operator (str): The name or alias of the operator.
+
+    Returns:
+        Optional[OperatorPlan]: The plan, or None if the operator isn't registered,
+            or its applicator can't be planned.
+    """
+    return _PLANS.get(operator)
+
+
+def is_operator_registered(operator: str) -> bool:
+    """Determines whether an applicator is registered for an operator.
+
+    Args:
+        operator (str): The name or alias of the operator.
+
+    Returns:
+        bool: True when the operator can be applied.
+    """
+    return operator in _OPERATORS
@@ -0,0 +1,316 @@
+"""The rewrite module contains index-friendly, literal applicators for the text
+operators.
+
+A LIKE pattern is only served by a B-tree index under specific conditions, such as
+SQLite's `case_sensitive_like` pragma or PostgreSQL's `text_pattern_ops` operator
+class, and a pattern with a leading wildcard, as used by endsWith, never is. The
+built-in applicators also pass the user's input into the pattern as-is, so `%` and `_`
+act as wildcards. These applicators rewrite:
+
+- startsWith "abc" into the half-open range `col >= 'abc' AND col < 'abd'`, which is
+  served by a range scan of any B-tree index on the column.
+- endsWith "xyz" into the same range over the column's declared reversed-value
+  expression, `reversed >= 'zyx' AND reversed < 'zyy'`, which is served by a range
+  scan of an index on that expression.
+- contains, and the values which can't be rewritten, into LIKE patterns whose
+  wildcards are escaped, so the input is matched literally.
+
+The rewrites are opt-in, as a range compares values using the column's collation. They
+match the same rows as LIKE when the collation orders strings by code point, such as
+SQLite's BINARY, PostgreSQL's "C", or MySQL's binary collations, while SQLite's LIKE
+ignores the case of ASCII characters. They're layered over the registered applicators
+when the application starts:
+
+    register_reversed_expression(User.email, User.reversed_email)
+    register_index_friendly_operators()
+
+`unregister_reversed_expression` and `reset_reversed_expressions` remove the declared
+expressions.
+"""
+
+from typing import Any, Dict, Hashable, Optional, Sequence
+
+from sqlalchemy import and_, func
+
+from mui.v6.integrations.sqlalchemy.filter.applicators import (
+    LIKE_ESCAPE,
+    escape_like,
+)
+from mui.v6.integrations.sqlalchemy.filter.registry import (
+    ColumnKey,
+    OperatorPlan,
+    get_column_key,
+    register_operator_layer,
+)
+
+# the highest code point, which has no successor to bound a prefix with
+_MAX_CHARACTER = chr(0x10FFFF)
+# surrogates can't be encoded, so the successor of U+D7FF is U+E000
+_SURROGATES_START = 0xD800
+_SURROGATES_END = 0xE000
+
+_REVERSED_EXPRESSIONS: Dict[ColumnKey, Any] = {}
+
+
+def get_prefix_upper_bound(prefix: Any) -> Optional[str]:
+    """Calculates the smallest string which is greater than every string starting
+    with the prefix.
+
+    Args:
+        prefix (Any): The prefix.
+
+    Returns:
+        Optional[str]: The exclusive upper bound, such as "abd" for "abc", or None if
+            the prefix isn't a string, is empty, or has no upper bound.
+    """
+    if not isinstance(prefix, str):
+        return None
+    stripped = prefix.rstrip(_MAX_CHARACTER)
+    if not stripped:
+        return None
+    code_point = ord(stripped[-1]) + 1
+    if _SURROGATES_START <= code_point < _SURROGATES_END:
+        code_point = _SURROGATES_END
+    return stripped[:-1] + chr(code_point)
+
+
+def register_reversed_expression(column: Any, expression: Optional[Any] = None) -> None:
+    """Declares the reversed-value expression used to apply endsWith to a column.
+
+    The expression should be indexed, such as a column storing the reversed values,
+    or an expression index on `reverse(column)` for databases which provide it.
+
+    Args:
+        column (Any): The column, or the ORM attribute of the column.
+        expression (Optional[Any], optional): The expression whose values are the
+            column's values reversed. Defaults to `reverse(column)`.
+
+    Raises:
+        ValueError: Raised when the column isn't a table's column.
+    """
+    key = get_column_key(column=column)
+    if key is None:
+        raise ValueError(f"Expected a table's column, received {column}")
+    _REVERSED_EXPRESSIONS[key] = (
+        expression if expression is not None else func.reverse(column)
+    )
+
+
+def unregister_reversed_expression(column: Any) -> None:
+    """Removes the reversed-value expression declared for a column, so endsWith is
+    applied to the column using a LIKE pattern.
+
+    Args:
+        column (Any): The column, or the ORM attribute of the column.
+    """
+    key = get_column_key(column=column)
+    if key is not None:
+        _REVERSED_EXPRESSIONS.pop(key, None)
+
+
+def reset_reversed_expressions() -> None:
+    """Removes the reversed-value expressions declared for every column."""
+    _REVERSED_EXPRESSIONS.clear()
+
+
+def get_reversed_expression(column: Any) -> Optional[Any]:
+    """Retrieves the reversed-value expression declared for a column.
+
+    Args:
+        column (Any): The column, or the ORM attribute of the column.
+
+    Returns:
+        Optional[Any]: The reversed-value expression, or None if none is declared.
+    """
+    key = get_column_key(column=column)
+    if key is None:
+        return None
+    return _REVERSED_EXPRESSIONS.get(key)
+
+
+def _get_like_value(value: Any) -> Any:
+    """Converts a value into the escaped value of a LIKE pattern.
+
+    Args:
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The escaped value, where None matches every non-null value.
+    """
+    return escape_like(value) if value is not None else ""
+
+
+def apply_contains_escaped_operator(column: Any, value: Any) -> Any:
+    """Handles applying the contains x-data-grid operator to a column, matching the
+    value's LIKE wildcards literally.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the contains filter using the provided value.
+    """
+    return column.contains(_get_like_value(value=value), escape=LIKE_ESCAPE)
+
+
+def apply_startswith_range_operator(column: Any, value: Any) -> Any:
+    """Handles applying the startsWith x-data-grid operator to a column, using a
+    half-open range.
+
+    Values which can't be bounded, such as empty values, are applied using an escaped
+    LIKE pattern.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the startsWith filter using the provided value.
+    """
+    upper_bound = get_prefix_upper_bound(prefix=value)
+    if upper_bound is None:
+        return column.startswith(_get_like_value(value=value), escape=LIKE_ESCAPE)
+    return and_(column >= value, column < upper_bound)
+
+
+def apply_endswith_reversed_operator(column: Any, value: Any) -> Any:
+    """Handles applying the endsWith x-data-grid operator to a column, using a
+    half-open range over its reversed-value expression.
+
+    Columns without a declared reversed-value expression, and values which aren't
+    strings, are applied using an escaped LIKE pattern.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the endsWith filter using the provided value.
+    """
+    reversed_expression = get_reversed_expression(column=column)
+    if reversed_expression is None or not isinstance(value, str):
+        return column.endswith(_get_like_value(value=value), escape=LIKE_ESCAPE)
+    return apply_startswith_range_operator(reversed_expression, value[::-1])
+
+
+def _bind_like(column: Any, value: Any) -> Optional[Sequence[Any]]:  # noqa: ARG001
+    """Binds a value matched using a LIKE pattern, escaping its wildcards.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's value.
+
+    Returns:
+        Optional[Sequence[Any]]: The escaped value.
+    """
+    return [escape_like(value)]
+
+
+def _get_prefix_shape(column: Any, value: Any) -> Optional[Hashable]:  # noqa: ARG001
+    """Determines whether a startsWith value is matched using a range.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's value.
+
+    Returns:
+        Optional[Hashable]: "range" for values which can be bounded, otherwise "like".
+    """
+    return "range" if get_prefix_upper_bound(prefix=value) is not None else "like"
+
+
+def _bind_prefix(column: Any, value: Any) -> Optional[Sequence[Any]]:
+    """Binds the bounds of the range matching the strings starting with a prefix.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's prefix.
+
+    Returns:
+        Optional[Sequence[Any]]: The inclusive lower bound and the exclusive upper
+            bound, or the escaped value for values which can't be bounded.
+    """
+    upper_bound = get_prefix_upper_bound(prefix=value)
+    if upper_bound is None:
+        return _bind_like(column, value)
+    return [value, upper_bound]
+
+
+def _get_suffix_shape(column: Any, value: Any) -> Optional[Hashable]:
+    """Determines whether an endsWith value is matched using a range.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's value.
+
+    Returns:
+        Optional[Hashable]: "range" for values whose reversed value can be bounded,
+            when the column has a reversed-value expression, otherwise "like".
+    """
+    if get_reversed_expression(column=column) is None or not isinstance(value, str):
+        return "like"
+    return _get_prefix_shape(column, value[::-1])
+
+
+def _bind_suffix(column: Any, value: Any) -> Optional[Sequence[Any]]:
+    """Binds the bounds of the range matching the reversed strings ending with a
+    suffix, when the column has a reversed-value expression.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's suffix.
+
+    Returns:
+        Optional[Sequence[Any]]: The bounds of the reversed suffix, or the escaped
+            value for other columns.
+    """
+    if get_reversed_expression(column=column) is None or not isinstance(value, str):
+        return _bind_like(column, value)
+    return _bind_prefix(column, value[::-1])
+
+
+def _is_string_value(column: Any, value: Any) -> bool:  # noqa: ARG001
+    """Determines whether a value is a string, whose wildcards need escaping.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's value.
+
+    Returns:
+        bool: True for strings.
+    """
+    return isinstance(value, str)
+
+
+def register_index_friendly_operators() -> None:
+    """Registers the index-friendly, literal applicators for the contains,
+    startsWith, and endsWith operators.
+
+    The applicators are layered over the registered applicators, applying string
+    values, while other values, such as None and numbers, which contain no wildcards,
+    are applied by the previously registered applicators. Layers registered
+    afterwards, such as case-insensitive or searchable columns, apply the columns
+    they declare over these, so these should be registered first.
+    """
+    register_operator_layer(
+        "contains",
+        apply_contains_escaped_operator,
+        handles=_is_string_value,
+        plan=OperatorPlan(bind=_bind_like),
+    )
+    register_operator_layer(
+        "startsWith",
+        apply_startswith_range_operator,
+        handles=_is_string_value,
+        plan=OperatorPlan(bind=_bind_prefix, shape=_get_prefix_shape),
+    )
+    register_operator_layer(
+        "endsWith",
+        apply_endswith_reversed_operator,
+        handles=_is_string_value,
+        plan=OperatorPlan(bind=_bind_suffix, shape=_get_suffix_shape),
+    )
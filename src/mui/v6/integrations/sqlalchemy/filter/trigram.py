@@ -0,0 +1,145 @@
+"""The trigram module answers contains filters on searchable columns using trigram
+indexes.
+
+`LIKE '%value%'` can't be served by a B-tree index, so every contains filter scans the
+whole table. A column declared as searchable is indexed by an FTS5 table using the
+`trigram` tokenizer, which serves the same LIKE pattern from its index, and the rows
+are selected by the row IDs of the matching index rows:
+
+    audit_log_index = FullTextIndex(
+        name="audit_log_trigram",
+        rowid=AuditLog.id,
+        columns=("message",),
+        tokenize="trigram",
+    )
+    maintain_fts5_index(audit_log_index)
+    register_searchable_column(AuditLog.message, audit_log_index)
+
+The trigram tokenizer folds the case of ASCII characters, as SQLite's LIKE does, so the
+index matches the same rows as the column.
+
+Documentation:
+    https://www.sqlite.org/fts5.html#the_trigram_tokenizer
+"""
+
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select
+
+from mui.v6.integrations.sqlalchemy.filter.applicators import apply_contains_operator
+from mui.v6.integrations.sqlalchemy.filter.registry import (
+    ColumnKey,
+    OperatorPlan,
+    bind_value,
+    get_column_key,
+    register_operator_layer,
+    unregister_operator_layer,
+)
+from mui.v6.integrations.sqlalchemy.quick_filter import FullTextIndex, get_fts5_table
+
+_SEARCHABLE_COLUMNS: Dict[ColumnKey, FullTextIndex] = {}
+
+
+def register_searchable_column(column: Any, index: FullTextIndex) -> None:
+    """Declares a column as searchable, so its contains filters are answered by a
+    trigram index.
+
+    This layers `apply_contains_trigram_operator` over the contains operator's
+    registered applicator, which still applies the filters of columns which aren't
+    searchable.
+
+    Args:
+        column (Any): The column, or the ORM attribute of the column.
+        index (FullTextIndex): The FTS5 trigram index, which indexes the column
+            under the column's name.
+
+    Raises:
+        ValueError: Raised when the column isn't a table's column, or the index
+            isn't a trigram index of the column.
+    """
+    key = get_column_key(column=column)
+    if key is None:
+        raise ValueError(f"Expected a table's column, received {column}")
+    if index.backend != "fts5" or "trigram" not in index.tokenize.split():
+        raise ValueError(f"Expected {index.name} to be an FTS5 trigram index")
+    if key[1] not in index.columns:
+        raise ValueError(f"Expected {index.name} to index the {key[1]} column")
+    _SEARCHABLE_COLUMNS[key] = index
+    register_operator_layer(
+        "contains",
+        apply_contains_trigram_operator,
+        handles=_is_searchable,
+        plan=OperatorPlan(bind=bind_value),
+    )
+
+
+def unregister_searchable_column(column: Any) -> None:
+    """Removes a column's searchable declaration, so its contains filters are applied
+    by the previously registered applicator. The layer is removed with the last
+    searchable column.
+
+    Args:
+        column (Any): The column, or the ORM attribute of the column.
+    """
+    key = get_column_key(column=column)
+    if key is not None:
+        _SEARCHABLE_COLUMNS.pop(key, None)
+    if not _SEARCHABLE_COLUMNS:
+        unregister_operator_layer("contains", apply_contains_trigram_operator)
+
+
+def reset_searchable_columns() -> None:
+    """Removes the searchable declaration of every column, and its layer."""
+    _SEARCHABLE_COLUMNS.clear()
+    unregister_operator_layer("contains", apply_contains_trigram_operator)
+
+
+def get_searchable_index(column: Any) -> Optional[FullTextIndex]:
+    """Retrieves the trigram index declared for a searchable column.
+
+    Args:
+        column (Any): The column, or the ORM attribute of the column.
+
+    Returns:
+        Optional[FullTextIndex]: The trigram index, or None if the column isn't
+            searchable.
+    """
+    key = get_column_key(column=column)
+    if key is None:
+        return None
+    return _SEARCHABLE_COLUMNS.get(key)
+
+
+def _is_searchable(column: Any, value: Any) -> bool:
+    """Determines whether a contains filter is answered by a trigram index.
+
+    Args:
+        column (Any): The resolved column.
+        value (Any): The item's value.
+
+    Returns:
+        bool: True when the column is searchable and the value isn't None.
+    """
+    return value is not None and get_searchable_index(column=column) is not None
+
+
+def apply_contains_trigram_operator(column: Any, value: Any) -> Any:
+    """Handles applying the contains x-data-grid operator to a column, using the
+    column's trigram index when it's searchable.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the contains filter using the provided value.
+    """
+    index = get_searchable_index(column=column)
+    key = get_column_key(column=column)
+    if index is None or key is None or value is None:
+        return apply_contains_operator(column, value)
+    fts_table = get_fts5_table(index=index)
+    # the trigram index only serves LIKE patterns without an ESCAPE clause
+    matches = select(fts_table.c.rowid).where(fts_table.c[key[1]].contains(value))
+    return index.rowid.in_(matches)
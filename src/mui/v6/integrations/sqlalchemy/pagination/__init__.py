@@ -1,6 +1,40 @@
 from mui.v6.integrations.sqlalchemy.pagination.apply_model import (
     apply_limit_offset_to_query_from_model,
 )
+from mui.v6.integrations.sqlalchemy.pagination.deferred import (
+    get_deferred_join_keys,
+    load_deferred_join_rows,
+)
+from mui.v6.integrations.sqlalchemy.pagination.keyset import (
+    Keyset,
+    KeysetColumn,
+    apply_keyset_to_query_from_model,
+    get_keyset_columns,
+    get_keyset_order_by,
+    get_keyset_page,
+    get_primary_key_columns,
+    get_seek_predicate,
+    same_expression,
+)
+from mui.v6.integrations.sqlalchemy.pagination.strategy import (
+    PaginationStrategy,
+    PaginationStrategyLiterals,
+)
 
 # isort: unique-list
-__all__ = ["apply_limit_offset_to_query_from_model"]
+__all__ = [
+    "Keyset",
+    "KeysetColumn",
+    "PaginationStrategy",
+    "PaginationStrategyLiterals",
+    "apply_keyset_to_query_from_model",
+    "apply_limit_offset_to_query_from_model",
+    "get_deferred_join_keys",
+    "get_keyset_columns",
+    "get_keyset_order_by",
+    "get_keyset_page",
+    "get_primary_key_columns",
+    "get_seek_predicate",
+    "load_deferred_join_rows",
+    "same_expression",
+]
@@ -1,24 +1,59 @@
 """The apply_model module applies a GridPaginationModel to a query."""
 
-from typing import TypeVar
+from typing import Any, TypeVar, Union, overload
 
 from sqlalchemy.orm import Query
+from sqlalchemy.sql import FromClause, Select
 
 from mui.v6.grid import GridPaginationModel
+from mui.v6.integrations.sqlalchemy.statement import Statement, as_statement
 
 T = TypeVar("T")
 
 
+@overload
 def apply_limit_offset_to_query_from_model(
     query: "Query[T]", model: GridPaginationModel
 ) -> "Query[T]":
+    """When a query is provided, a query is returned.
+
+    Args:
+        query (Query[T]): The query.
+        model (GridPaginationModel): The pagination model.
+
+    Returns:
+        Query[T]: The query.
+    """
+
+
+@overload
+def apply_limit_offset_to_query_from_model(
+    query: Union[Select, FromClause], model: GridPaginationModel
+) -> Select:
+    """When a select statement or table is provided, a select statement is returned.
+
+    Args:
+        query (Select | FromClause): The select statement or table.
+        model (GridPaginationModel): The pagination model.
+
+    Returns:
+        Select: The select statement.
+    """
+
+
+def apply_limit_offset_to_query_from_model(
+    query: Statement, model: GridPaginationModel
+) -> Union["Query[Any]", Select]:
     """Applies the limit and offset to a SQLAlchemy query from a pagination model.
 
     Args:
-        query (Query[T]): The SQLAlchemy query to apply the pagination model to.
+        query (Query[T] | Select | FromClause): The SQLAlchemy query, select
+            statement, or table to apply the pagination model to. A table is
+            converted into a select statement.
         model (GridPaginationModel): The GridPaginationModel to apply to the query.
 
     Returns:
-        Query[T]: The SQLAlchemy query which has had the limit and offset applied.
+        Query[T] | Select: The SQLAlchemy query or select statement which has had the
+            limit and offset applied.
     """
-    return query.limit(model.page_size).offset(model.offset)
+    return as_statement(query).limit(model.page_size).offset(model.offset)
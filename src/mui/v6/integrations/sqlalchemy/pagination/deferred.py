@@ -0,0 +1,74 @@
+"""The deferred module implements deferred join (late row lookup) pagination.
+
+An OFFSET query must produce, and then discard, every row before the requested page.
+When the query selects a wide entity, every skipped row is read in full. A deferred
+join first locates the page using only the primary key:
+
+    SELECT id FROM t WHERE ... ORDER BY a, b LIMIT :page_size OFFSET :offset
+
+This can be answered from an index covering the filter and sort columns. Only the
+rows on the page are then loaded in full:
+
+    SELECT t.* FROM t WHERE id IN (...)
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple, TypeVar, cast
+
+from sqlalchemy import inspect, tuple_
+from sqlalchemy.orm import Query
+
+from mui.v6.integrations.sqlalchemy.pagination.keyset import get_primary_key_columns
+
+T = TypeVar("T")
+
+
+def get_deferred_join_keys(query: "Query[T]") -> List[Tuple[Any, ...]]:
+    """Retrieves the primary keys of the rows selected by a paginated query.
+
+    The query's filter, ordering, limit, and offset are retained, only the selected
+    columns are replaced.
+
+    Args:
+        query (Query[T]): The filtered, ordered, and paginated query.
+
+    Returns:
+        list[tuple[Any, ...]]: The primary keys of the page's rows, in order.
+    """
+    primary_key = get_primary_key_columns(query=query)
+    rows = cast(List[Sequence[Any]], query.with_entities(*primary_key).all())
+    return [tuple(row) for row in rows]
+
+
+def load_deferred_join_rows(
+    query: "Query[T]", keys: Sequence[Tuple[Any, ...]]
+) -> List[T]:
+    """Loads the entities identified by their primary keys, in the keys' order.
+
+    Args:
+        query (Query[T]): The query used to load the entities, usually the base query
+            before any models were applied. It must not be limited.
+        keys (Sequence[tuple[Any, ...]]): The primary keys of the entities to load.
+
+    Raises:
+        ValueError: Raised when the query does not select a single mapped entity.
+
+    Returns:
+        list[T]: The loaded entities, in the same order as the keys. Keys which no
+            longer identify a row are skipped.
+    """
+    if len(query.column_descriptions) != 1:
+        raise ValueError("A deferred join requires a query selecting a single entity")
+    if not keys:
+        return []
+    mapper = inspect(query.column_descriptions[0]["entity"])
+    primary_key = list(mapper.primary_key)
+    predicate = (
+        primary_key[0].in_([key[0] for key in keys])
+        if len(primary_key) == 1
+        else tuple_(*primary_key).in_(keys)
+    )
+    rows: Dict[Tuple[Any, ...], T] = {
+        tuple(mapper.primary_key_from_instance(row)): row
+        for row in query.order_by(None).filter(predicate).all()
+    }
+    return [rows[key] for key in keys if key in rows]
@@ -0,0 +1,425 @@
+"""The keyset module applies keyset (seek) pagination to a query.
+
+Rather than asking the database to skip `page * page_size` rows, keyset pagination
+remembers the sort key of the last row that was displayed and asks for the rows which
+sort after it:
+
+    SELECT ... WHERE (a, b, id) > (:a, :b, :id) ORDER BY a, b, id LIMIT :page_size
+
+When an index exists on the sort columns, the database seeks directly to the start of
+the page, so deep pages cost the same as the first page.
+
+Databases disagree on where NULL values sort, and NULL can't be compared with `>` or
+`<`, so nullable keyset columns sort NULL values before every other value, and are
+compared with explicit `IS NULL` and `IS NOT NULL` branches.
+"""
+
+from operator import eq, gt, lt
+from typing import (
+    Any,
+    Callable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from sqlalchemy import and_, asc, case, desc, false, inspect, or_, tuple_
+from sqlalchemy.orm import Query
+from sqlalchemy.sql import FromClause, Select
+from typing_extensions import TypeAlias
+
+from mui.v6.grid import GridPaginationModel, GridSortDirection, GridSortModel
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from mui.v6.integrations.sqlalchemy.statement import Statement, as_statement
+
+T = TypeVar("T")
+
+"""A keyset column is a resolved column, or other orderable expression, paired with
+the direction the column is sorted in."""
+KeysetColumn: TypeAlias = Tuple[Any, GridSortDirection]
+
+
+class Keyset(NamedTuple):
+    """The position of a page boundary within an ordered result set.
+
+    Attributes:
+        values (tuple[Any, ...]): The values of the keyset columns for the boundary
+            row, in the same order as the keyset columns.
+        backward (bool): False when the rows after the boundary are requested,
+            True when the rows before the boundary are requested.
+    """
+
+    values: Tuple[Any, ...]
+    backward: bool = False
+
+
+def same_expression(left: Any, right: Any) -> bool:
+    """Determines whether two resolved columns refer to the same expression.
+
+    Args:
+        left (Any): The first column, property, or expression.
+        right (Any): The second column, property, or expression.
+
+    Returns:
+        bool: True when both arguments compile to the same SQL expression.
+    """
+    left = getattr(left, "expression", left)
+    right = getattr(right, "expression", right)
+    compare = getattr(left, "compare", None)
+    return bool(compare(right)) if compare is not None else left is right
+
+
+def get_primary_key_columns(query: Statement) -> List[Any]:
+    """Retrieves the primary key columns of the query's first entity.
+
+    The primary key is used as the keyset tiebreaker, which guarantees that every row
+    in the result set has a unique position, even when the sort columns contain
+    duplicate values. Core statements, which don't select an entity, use the primary
+    key of the single table they select from.
+
+    Args:
+        query (Query[T] | Select | FromClause): The query, select statement, or table
+            whose primary entity should be inspected.
+
+    Raises:
+        ValueError: Raised when the query does not select a mapped entity or a single
+            table with a primary key.
+
+    Returns:
+        list[Any]: The primary key columns of the entity.
+    """
+    if isinstance(query, FromClause):
+        froms = [query]
+    else:
+        descriptions = query.column_descriptions
+        entity = descriptions[0].get("entity") if descriptions else None
+        if entity is not None:
+            return list(inspect(entity).primary_key)
+        statement = query.statement if isinstance(query, Query) else query
+        froms = statement.get_final_froms() if isinstance(statement, Select) else []
+    primary_key = list(froms[0].primary_key) if len(froms) == 1 else []
+    if not primary_key:
+        raise ValueError("Unable to determine the primary key of the query's entity")
+    return primary_key
+
+
+def get_keyset_columns(
+    model: GridSortModel, resolver: Resolver, tiebreakers: Sequence[Any]
+) -> List[KeysetColumn]:
+    """Converts the sort model into the list of columns that make up the keyset.
+
+    Unsorted items are skipped. Each tiebreaker is appended, unless the sort model
+    already sorts by it, and follows the direction of the last sorted column. Keeping
+    every column in a single direction allows the seek predicate to be expressed as a
+    row-value comparison.
+
+    Args:
+        model (GridSortModel): The sort model being applied to the query.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+        tiebreakers (Sequence[Any]): The columns which uniquely identify a row,
+            usually the primary key.
+
+    Returns:
+        list[KeysetColumn]: The keyset columns, paired with their sort direction.
+    """
+    columns: List[KeysetColumn] = [
+        (resolver(item.field), item.sort) for item in model if item.sort is not None
+    ]
+    direction = columns[-1][1] if columns else GridSortDirection.ASC
+    columns.extend(
+        (tiebreaker, direction)
+        for tiebreaker in tiebreakers
+        if not any(same_expression(column, tiebreaker) for column, _ in columns)
+    )
+    return columns
+
+
+def _is_nullable(column: Any) -> bool:
+    """Determines whether a resolved column may contain NULL values.
+
+    Expressions which aren't table columns, such as functions or labels, are assumed
+    to be nullable.
+
+    Args:
+        column (Any): The column, property, or expression.
+
+    Returns:
+        bool: False only when the column is declared as non-nullable.
+    """
+    return getattr(getattr(column, "expression", column), "nullable", True) is not False
+
+
+def _is_ascending(direction: GridSortDirection, backward: bool) -> bool:
+    """Determines whether a column is read in ascending order.
+
+    Args:
+        direction (GridSortDirection): The direction the column is sorted in.
+        backward (bool): Whether the rows before the boundary are being requested.
+
+    Returns:
+        bool: True when the column is read in ascending order.
+    """
+    return (direction == GridSortDirection.ASC) != backward
+
+
+def _get_equal_predicate(column: Any, value: Any) -> Any:
+    """Builds the predicate which selects the rows whose column equals the value.
+
+    Args:
+        column (Any): The keyset column.
+        value (Any): The keyset value of the boundary row, which may be None.
+
+    Returns:
+        Any: The predicate for use in a SQLAlchemy filter.
+    """
+    return column.is_(None) if value is None else eq(column, value)
+
+
+def _get_past_predicate(column: Any, value: Any, ascending: bool) -> Any:
+    """Builds the predicate which selects the rows whose column is past the value.
+
+    NULL values sort before every other value, so no row is before NULL, every
+    non-NULL row is after NULL, and NULL rows are before every other value.
+
+    Args:
+        column (Any): The keyset column.
+        value (Any): The keyset value of the boundary row, which may be None.
+        ascending (bool): Whether the column is read in ascending order.
+
+    Returns:
+        Any: The predicate for use in a SQLAlchemy filter.
+    """
+    if value is None:
+        return column.is_not(None) if ascending else false()
+    if ascending:
+        return gt(column, value)
+    return or_(lt(column, value), column.is_(None))
+
+
+def _get_comparator(
+    direction: GridSortDirection, backward: bool
+) -> Callable[[Any, Any], Any]:
+    """Retrieves the comparison operator which selects the rows past the boundary.
+
+    Args:
+        direction (GridSortDirection): The direction the column is sorted in.
+        backward (bool): Whether the rows before the boundary are being requested.
+
+    Returns:
+        Callable[[Any, Any], Any]: `operator.gt` or `operator.lt`.
+    """
+    return gt if _is_ascending(direction=direction, backward=backward) else lt
+
+
+def get_seek_predicate(
+    columns: Sequence[KeysetColumn], values: Sequence[Any], backward: bool = False
+) -> Any:
+    """Builds the predicate which selects the rows after (or before) a keyset.
+
+    When every column is sorted in the same direction a row-value comparison is
+    produced, such as `(a, b, id) > (?, ?, ?)`. Mixed directions cannot be expressed
+    as a single row-value comparison, so the equivalent expanded form is produced:
+    `a > ? OR (a = ? AND b < ?) OR (a = ? AND b = ? AND id < ?)`.
+
+    NULL can't be compared by a row-value comparison, so keysets with a nullable
+    column produce the expanded form, whose nullable columns are compared with
+    `IS NULL` and `IS NOT NULL` branches, as NULL values sort before every other
+    value.
+
+    Args:
+        columns (Sequence[KeysetColumn]): The keyset columns and their directions.
+        values (Sequence[Any]): The keyset values of the boundary row.
+        backward (bool, optional): Whether the rows before the boundary are being
+            requested. Defaults to False.
+
+    Raises:
+        ValueError: Raised when the number of values doesn't match the number of
+            keyset columns, such as when a keyset from a different sort model is used.
+
+    Returns:
+        Any: The predicate for use in a SQLAlchemy filter.
+    """
+    if len(columns) != len(values):
+        raise ValueError(
+            f"Expected {len(columns)} keyset values, received {len(values)}"
+        )
+    directions = {direction for _, direction in columns}
+    if len(directions) == 1 and not any(_is_nullable(column) for column, _ in columns):
+        comparator = _get_comparator(direction=directions.pop(), backward=backward)
+        if len(columns) == 1:
+            return comparator(columns[0][0], values[0])
+        return comparator(tuple_(*[column for column, _ in columns]), tuple(values))
+    return or_(*[
+        and_(
+            *[
+                _get_equal_predicate(column=previous_column, value=previous_value)
+                for (previous_column, _), previous_value in zip(
+                    columns[:index], values[:index]
+                )
+            ],
+            _get_past_predicate(
+                column=column,
+                value=values[index],
+                ascending=_is_ascending(direction=direction, backward=backward),
+            )
+            if _is_nullable(column)
+            else _get_comparator(direction=direction, backward=backward)(
+                column, values[index]
+            ),
+        )
+        for index, (column, direction) in enumerate(columns)
+    ])
+
+
+def get_keyset_order_by(
+    columns: Sequence[KeysetColumn], backward: bool = False
+) -> List[Any]:
+    """Builds the ORDER BY expressions for the keyset columns.
+
+    When paging backward, the order is reversed so that the rows closest to the
+    boundary are retrieved first. The caller is responsible for reversing the
+    retrieved rows back into display order. Nullable columns are preceded by an
+    expression which sorts NULL values before every other value, regardless of the
+    database's default.
+
+    Args:
+        columns (Sequence[KeysetColumn]): The keyset columns and their directions.
+        backward (bool, optional): Whether the rows before the boundary are being
+            requested. Defaults to False.
+
+    Returns:
+        list[Any]: The unary sort expressions.
+    """
+    order_by: List[Any] = []
+    for column, direction in columns:
+        order = asc if _is_ascending(direction=direction, backward=backward) else desc
+        if _is_nullable(column):
+            order_by.append(order(case((column.is_(None), 0), else_=1)))
+        order_by.append(order(column))
+    return order_by
+
+
+def get_keyset_page(
+    rows: List[T],
+    page_size: int,
+    keyset: Optional[Keyset],
+    get_values: Callable[[T], Tuple[Any, ...]],
+) -> Tuple[List[T], Optional[Keyset], Optional[Keyset]]:
+    """Locates the page and its adjacent keysets within the rows retrieved with one
+    additional row.
+
+    The additional row shows whether another page exists in the direction being
+    paged. When paging backward, the rows are reversed back into display order, and
+    a next page always exists.
+
+    Args:
+        rows (List[T]): The rows retrieved, in the order they were retrieved.
+        page_size (int): The number of rows on each page.
+        keyset (Optional[Keyset]): The boundary of the requested page, or None for the
+            first page.
+        get_values (Callable[[T], Tuple[Any, ...]]): Retrieves the keyset column
+            values from a row.
+
+    Returns:
+        Tuple[List[T], Optional[Keyset], Optional[Keyset]]: The page of rows, in
+            display order, and the keysets of the previous and next pages, which are
+            None when there is no such page.
+    """
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    backward = keyset is not None and keyset.backward
+    if backward:
+        rows.reverse()
+    has_previous = has_more if backward else keyset is not None
+    has_next = backward or has_more
+    previous_keyset = (
+        Keyset(values=get_values(rows[0]), backward=True)
+        if has_previous and rows
+        else None
+    )
+    next_keyset = Keyset(values=get_values(rows[-1])) if has_next and rows else None
+    return rows, previous_keyset, next_keyset
+
+
+@overload
+def apply_keyset_to_query_from_model(
+    query: "Query[T]",
+    model: GridPaginationModel,
+    columns: Sequence[KeysetColumn],
+    keyset: Optional[Keyset] = None,
+) -> "Query[T]":
+    """When a query is provided, a query is returned.
+
+    Args:
+        query (Query[T]): The query.
+        model (GridPaginationModel): The pagination model.
+        columns (Sequence[KeysetColumn]): The keyset columns and their directions.
+        keyset (Optional[Keyset], optional): The boundary of the page.
+
+    Returns:
+        Query[T]: The query.
+    """
+
+
+@overload
+def apply_keyset_to_query_from_model(
+    query: Union[Select, FromClause],
+    model: GridPaginationModel,
+    columns: Sequence[KeysetColumn],
+    keyset: Optional[Keyset] = None,
+) -> Select:
+    """When a select statement or table is provided, a select statement is returned.
+
+    Args:
+        query (Select | FromClause): The select statement or table.
+        model (GridPaginationModel): The pagination model.
+        columns (Sequence[KeysetColumn]): The keyset columns and their directions.
+        keyset (Optional[Keyset], optional): The boundary of the page.
+
+    Returns:
+        Select: The select statement.
+    """
+
+
+def apply_keyset_to_query_from_model(
+    query: Statement,
+    model: GridPaginationModel,
+    columns: Sequence[KeysetColumn],
+    keyset: Optional[Keyset] = None,
+) -> Union["Query[Any]", Select]:
+    """Applies keyset pagination to a SQLAlchemy query from a pagination model.
+
+    Any existing ordering is replaced by the keyset ordering. The page number of the
+    pagination model is ignored, the keyset determines where the page begins.
+
+    Args:
+        query (Query[T] | Select | FromClause): The filtered SQLAlchemy query, select
+            statement, or table to paginate.
+        model (GridPaginationModel): The GridPaginationModel to apply to the query.
+        columns (Sequence[KeysetColumn]): The keyset columns and their directions.
+        keyset (Optional[Keyset], optional): The boundary of the page being requested.
+            If None, the first page is requested. Defaults to None.
+
+    Returns:
+        Query[T] | Select: The SQLAlchemy query or select statement with the seek
+            predicate, ordering, and limit applied.
+    """
+    query = as_statement(query)
+    backward = keyset is not None and keyset.backward
+    if keyset is not None:
+        query = query.filter(
+            get_seek_predicate(
+                columns=columns, values=keyset.values, backward=keyset.backward
+            )
+        )
+    return (
+        query.order_by(None)
+        .order_by(*get_keyset_order_by(columns=columns, backward=backward))
+        .limit(model.page_size)
+    )
@@ -0,0 +1,32 @@
+"""The strategy module contains the pagination strategy enumeration."""
+
+from enum import unique
+
+from typing_extensions import Literal, TypeAlias
+
+from mui.compat import StrEnum
+
+PaginationStrategyLiterals: TypeAlias = Literal["offset", "keyset", "deferred_join"]
+
+
+@unique
+class PaginationStrategy(StrEnum):
+    """The strategy used by a DataGridQuery to retrieve a page of results.
+
+    Attributes:
+        OFFSET: The page is located using LIMIT / OFFSET. The database must scan and
+            discard every row before the requested page, so the cost of a page grows
+            with the page number.
+        KEYSET: The page is located using a seek predicate built from the sort model
+            and the last row of the previous page, such as
+            `WHERE (a, b, id) > (:a, :b, :id)`. The cost of a page is independent of
+            how deep into the result set it is.
+        DEFERRED_JOIN: The page is located using LIMIT / OFFSET, selecting only the
+            primary key, and the page's rows are then loaded by primary key. The
+            skipped rows can be read from an index, rather than loading every column
+            of every skipped row, which benefits wide entities.
+    """
+
+    OFFSET = "offset"
+    KEYSET = "keyset"
+    DEFERRED_JOIN = "deferred_join"
@@ -0,0 +1,12 @@
+from mui.v6.integrations.sqlalchemy.projection.apply_model import (
+    apply_projection_to_query_from_model,
+    get_model_fields,
+    get_projected_columns,
+)
+
+# isort: unique-list
+__all__ = [
+    "apply_projection_to_query_from_model",
+    "get_model_fields",
+    "get_projected_columns",
+]
@@ -0,0 +1,290 @@
+"""The apply_model module projects a query onto the columns displayed by the grid.
+
+The data grid usually displays a fraction of an entity's columns. Loading only the
+displayed columns, plus the primary key and the columns the sort and filter models
+refer to, reduces the I/O and serialization cost in proportion to the hidden columns.
+"""
+
+from typing import Any, Iterable, List, Optional, TypeVar, Union, overload
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Query, load_only
+from sqlalchemy.sql import Select
+
+from mui.v6.grid.columns import GridColumnFields, GridColumnVisibilityModel
+from mui.v6.grid.filter import GridFilterModel
+from mui.v6.grid.sort import GridSortModel
+from mui.v6.integrations.sqlalchemy.pagination.keyset import (
+    get_primary_key_columns,
+    same_expression,
+)
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+
+_Q = TypeVar("_Q")
+
+
+def _get_entity(query: Union["Query[Any]", Select]) -> Any:
+    """Retrieves the entity selected by the query, if it selects a single entity.
+
+    Args:
+        query (Query[Any] | Select): The query or select statement.
+
+    Returns:
+        Any: The mapped class, or None if the query selects columns, multiple
+            entities, or an aliased entity.
+    """
+    descriptions = query.column_descriptions
+    if len(descriptions) != 1 or descriptions[0].get("aliased"):
+        return None
+    entity = descriptions[0].get("entity")
+    return entity if entity is not None and descriptions[0]["expr"] is entity else None
+
+
+def _get_candidate_columns(query: Union["Query[Any]", Select]) -> Optional[List[Any]]:
+    """Retrieves the columns which may be projected.
+
+    Args:
+        query (Query[Any] | Select): The query or select statement.
+
+    Returns:
+        Optional[List[Any]]: The entity's mapped column attributes, the columns of a
+            Core select statement, or None if the query can not be projected.
+    """
+    entity = _get_entity(query=query)
+    if entity is not None:
+        return [
+            getattr(entity, attribute.key) for attribute in inspect(entity).column_attrs
+        ]
+    if isinstance(query, Select) and not any(
+        description.get("entity") is not None
+        for description in query.column_descriptions
+    ):
+        return list(query.selected_columns)
+    return None
+
+
+def get_model_fields(
+    filter_model: Optional[GridFilterModel] = None,
+    sort_model: Optional[GridSortModel] = None,
+) -> List[str]:
+    """Retrieves the fields which the filter and sort models refer to.
+
+    Args:
+        filter_model (Optional[GridFilterModel], optional): The filter model.
+            Defaults to None.
+        sort_model (Optional[GridSortModel], optional): The sort model. Defaults to
+            None.
+
+    Returns:
+        List[str]: The unique fields, in the order they're referred to.
+    """
+    fields = [item.field for item in filter_model.items] if filter_model else []
+    fields.extend(item.field for item in sort_model or [])
+    return list(dict.fromkeys(fields))
+
+
+def _resolve_field(resolver: Resolver, field: str) -> Optional[Any]:
+    """Resolves a field, if the resolver can map it to a column.
+
+    The grid's fields and column visibility model include virtual columns, such as
+    the `__check__` selection column and `actions` columns, which aren't properties
+    of the model.
+
+    Args:
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+        field (str): The field being resolved.
+
+    Returns:
+        Optional[Any]: The resolved column, or None if the field can't be resolved.
+    """
+    try:
+        return resolver(field)
+    except (AttributeError, KeyError, ValueError):
+        return None
+
+
+def _resolve_fields(resolver: Resolver, fields: Iterable[str]) -> List[Any]:
+    """Resolves the fields which the resolver can map, skipping the others.
+
+    Args:
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+        fields (Iterable[str]): The fields being resolved.
+
+    Returns:
+        List[Any]: The resolved columns, in the order of the fields.
+    """
+    columns = (_resolve_field(resolver=resolver, field=field) for field in fields)
+    return [column for column in columns if column is not None]
+
+
+def _matches_any(column: Any, others: Iterable[Any]) -> bool:
+    """Determines whether the column is one of the other columns.
+
+    Args:
+        column (Any): The column being located.
+        others (Iterable[Any]): The columns being searched.
+
+    Returns:
+        bool: True if any of the other columns is the same expression as the column.
+    """
+    return any(same_expression(column, other) for other in others)
+
+
+def get_projected_columns(
+    query: Union["Query[Any]", Select],
+    resolver: Resolver,
+    fields: Optional[GridColumnFields] = None,
+    column_visibility_model: Optional[GridColumnVisibilityModel] = None,
+    required_fields: Iterable[str] = (),
+) -> Optional[List[Any]]:
+    """Determines the columns to load, from the displayed fields.
+
+    When a list of fields is provided, only the resolved fields are displayed,
+    otherwise every column is displayed. Fields hidden by the column visibility model
+    are then removed. The primary key, and the required fields, such as the fields
+    the sort and filter models refer to, are always loaded.
+
+    Args:
+        query (Query[Any] | Select): The query or select statement being projected.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model. Displayed and hidden fields which
+            it can't map, raising an AttributeError, KeyError, or ValueError, such
+            as the `__check__` and `actions` columns, are skipped. The required
+            fields must be resolvable.
+        fields (Optional[GridColumnFields], optional): The fields being displayed.
+            Defaults to None, displaying every field.
+        column_visibility_model (Optional[GridColumnVisibilityModel], optional): The
+            visibility of the grid's fields. Defaults to None.
+        required_fields (Iterable[str], optional): The fields which must be loaded,
+            even when hidden. Defaults to ().
+
+    Returns:
+        Optional[List[Any]]: The columns to load, in the order they are selected, or
+            None when every column is displayed or the query can't be projected.
+    """
+    hidden = _resolve_fields(
+        resolver=resolver,
+        fields=[
+            field
+            for field, visible in (column_visibility_model or {}).items()
+            if not visible
+        ],
+    )
+    if fields is None and not hidden:
+        return None
+    candidates = _get_candidate_columns(query=query)
+    if candidates is None:
+        return None
+    displayed = (
+        _resolve_fields(resolver=resolver, fields=fields)
+        if fields is not None
+        else None
+    )
+    required = [
+        *get_primary_key_columns(query=query),
+        *[resolver(field) for field in required_fields],
+    ]
+    columns = [
+        column
+        for column in candidates
+        if _matches_any(column, required)
+        or (
+            (displayed is None or _matches_any(column, displayed))
+            and not _matches_any(column, hidden)
+        )
+    ]
+    return columns if len(columns) < len(candidates) else None
+
+
+@overload
+def apply_projection_to_query_from_model(
+    query: "Query[_Q]",
+    resolver: Resolver,
+    fields: Optional[GridColumnFields] = None,
+    column_visibility_model: Optional[GridColumnVisibilityModel] = None,
+    required_fields: Iterable[str] = (),
+) -> "Query[_Q]":
+    """When a query is provided, a query is returned.
+
+    Args:
+        query (Query[_Q]): The query.
+        resolver (Resolver): The column resolver.
+        fields (Optional[GridColumnFields], optional): The displayed fields.
+        column_visibility_model (Optional[GridColumnVisibilityModel], optional): The
+            column visibility model.
+        required_fields (Iterable[str], optional): The fields which must be loaded.
+
+    Returns:
+        Query[_Q]: The query.
+    """
+
+
+@overload
+def apply_projection_to_query_from_model(
+    query: Select,
+    resolver: Resolver,
+    fields: Optional[GridColumnFields] = None,
+    column_visibility_model: Optional[GridColumnVisibilityModel] = None,
+    required_fields: Iterable[str] = (),
+) -> Select:
+    """When a select statement is provided, a select statement is returned.
+
+    Args:
+        query (Select): The select statement.
+        resolver (Resolver): The column resolver.
+        fields (Optional[GridColumnFields], optional): The displayed fields.
+        column_visibility_model (Optional[GridColumnVisibilityModel], optional): The
+            column visibility model.
+        required_fields (Iterable[str], optional): The fields which must be loaded.
+
+    Returns:
+        Select: The select statement.
+    """
+
+
+def apply_projection_to_query_from_model(
+    query: Union["Query[Any]", Select],
+    resolver: Resolver,
+    fields: Optional[GridColumnFields] = None,
+    column_visibility_model: Optional[GridColumnVisibilityModel] = None,
+    required_fields: Iterable[str] = (),
+) -> Union["Query[Any]", Select]:
+    """Loads only the displayed columns of a SQLAlchemy query.
+
+    Entities are projected with `load_only`, so the models are still returned, with
+    the hidden columns deferred. Core select statements select only the displayed
+    columns. Queries which select multiple entities, or an aliased entity, are
+    returned as-is.
+
+    Args:
+        query (Query[_Q] | Select): The query or select statement to project.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model. Displayed and hidden fields which
+            it can't map, raising an AttributeError, KeyError, or ValueError, such
+            as the `__check__` and `actions` columns, are skipped. The required
+            fields must be resolvable.
+        fields (Optional[GridColumnFields], optional): The fields being displayed.
+            Defaults to None, displaying every field.
+        column_visibility_model (Optional[GridColumnVisibilityModel], optional): The
+            visibility of the grid's fields. Defaults to None.
+        required_fields (Iterable[str], optional): The fields which must be loaded,
+            even when hidden, such as the fields being sorted or filtered. Defaults
+            to ().
+
+    Returns:
+        Query[_Q] | Select: The projected query or select statement.
+    """
+    columns = get_projected_columns(
+        query=query,
+        resolver=resolver,
+        fields=fields,
+        column_visibility_model=column_visibility_model,
+        required_fields=required_fields,
+    )
+    if columns is None:
+        return query
+    if _get_entity(query=query) is not None:
+        return query.options(load_only(*columns))
+    return query.with_only_columns(*columns) if isinstance(query, Select) else query
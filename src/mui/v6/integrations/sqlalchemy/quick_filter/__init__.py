@@ -0,0 +1,41 @@
+"""The quick_filter module applies the grid's quick filter values.
+
+Rather than comparing every column with `LIKE '%value%'`, which scans the whole table
+on each keystroke, the quick filter searches a declared full-text index, such as an
+SQLite FTS5 table, and filters the rows by the row IDs of the matching index rows.
+"""
+
+from mui.v6.integrations.sqlalchemy.quick_filter.apply_model import (
+    apply_quick_filter_to_query_from_model,
+)
+from mui.v6.integrations.sqlalchemy.quick_filter.fts5 import (
+    apply_fts5_quick_filter,
+    get_fts5_ddl,
+    get_fts5_match_query,
+    get_fts5_table,
+    maintain_fts5_index,
+)
+from mui.v6.integrations.sqlalchemy.quick_filter.registry import (
+    get_quick_filter_clause,
+    get_quick_filter_values,
+    register_quick_filter_backend,
+)
+from mui.v6.integrations.sqlalchemy.quick_filter.types import (
+    FullTextIndex,
+    QuickFilterBackend,
+)
+
+# isort: unique-list
+__all__ = [
+    "FullTextIndex",
+    "QuickFilterBackend",
+    "apply_fts5_quick_filter",
+    "apply_quick_filter_to_query_from_model",
+    "get_fts5_ddl",
+    "get_fts5_match_query",
+    "get_fts5_table",
+    "get_quick_filter_clause",
+    "get_quick_filter_values",
+    "maintain_fts5_index",
+    "register_quick_filter_backend",
+]
@@ -0,0 +1,80 @@
+"""The apply_model module is responsible for applying a GridFilterModel's quick
+filter values to a query.
+"""
+
+from typing import Any, Optional, TypeVar, Union, overload
+
+from sqlalchemy.orm import Query
+from sqlalchemy.sql import FromClause, Select
+
+from mui.v6.grid import GridFilterModel
+from mui.v6.integrations.sqlalchemy.quick_filter.registry import (
+    get_quick_filter_clause,
+)
+from mui.v6.integrations.sqlalchemy.quick_filter.types import FullTextIndex
+from mui.v6.integrations.sqlalchemy.statement import Statement, as_statement
+
+_Q = TypeVar("_Q")
+
+
+@overload
+def apply_quick_filter_to_query_from_model(
+    query: "Query[_Q]", model: GridFilterModel, index: Optional[FullTextIndex]
+) -> "Query[_Q]":
+    """When a query is provided, a query is returned.
+
+    Args:
+        query (Query[_Q]): The query.
+        model (GridFilterModel): The filter model.
+        index (Optional[FullTextIndex]): The full-text index.
+
+    Returns:
+        Query[_Q]: The query.
+    """
+
+
+@overload
+def apply_quick_filter_to_query_from_model(
+    query: Union[Select, FromClause],
+    model: GridFilterModel,
+    index: Optional[FullTextIndex],
+) -> Select:
+    """When a select statement or table is provided, a select statement is returned.
+
+    Args:
+        query (Select | FromClause): The select statement or table.
+        model (GridFilterModel): The filter model.
+        index (Optional[FullTextIndex]): The full-text index.
+
+    Returns:
+        Select: The select statement.
+    """
+
+
+def apply_quick_filter_to_query_from_model(
+    query: Statement, model: GridFilterModel, index: Optional[FullTextIndex]
+) -> Union["Query[Any]", Select]:
+    """Applies a GridFilterModel's quick filter values to a SQLAlchemy query, by
+    searching a full-text index.
+
+    If no index is provided, or the model has no quick filter values, the query is
+    returned, as-is. A Core table is converted into a select statement.
+
+    Args:
+        query (Query[_Q] | Select | FromClause): The query, select statement, or
+            table to apply the quick filter to.
+        model (GridFilterModel): The filter model whose quick filter values are
+            applied.
+        index (Optional[FullTextIndex]): The full-text index searched for the quick
+            filter values.
+
+    Returns:
+        Query[_Q] | Select: The filtered query or select statement.
+    """
+    query = as_statement(query)
+    if index is None:
+        return query
+    clause = get_quick_filter_clause(model=model, index=index)
+    if clause is None:
+        return query
+    return query.filter(clause)
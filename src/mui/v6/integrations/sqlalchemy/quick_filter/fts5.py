@@ -0,0 +1,253 @@
+"""The fts5 module searches SQLite FTS5 full-text indexes.
+
+The index is an external content FTS5 table, storing the indexed columns of the
+filtered table with its integer primary key as the row ID. The quick filter values are
+matched as prefixes, so search-as-you-type matches partially typed words, and the
+filtered rows are selected by the row IDs of the matching index rows, which SQLite
+looks up through the primary key rather than scanning the table.
+
+Documentation:
+    https://www.sqlite.org/fts5.html#external_content_tables
+"""
+
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import DDL, Column, event, inspect, select, table, text
+from sqlalchemy import column as sql_column
+from sqlalchemy.sql import TableClause
+
+from mui.v6.grid import GridLogicOperator
+from mui.v6.integrations.sqlalchemy.quick_filter.types import FullTextIndex
+
+
+def _quote_identifier(name: str) -> str:
+    """Quotes an SQLite identifier.
+
+    Args:
+        name (str): The name of the table, column, or trigger.
+
+    Returns:
+        str: The quoted identifier.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _quote_string(value: str) -> str:
+    """Quotes an SQLite string literal.
+
+    Args:
+        value (str): The value being quoted.
+
+    Returns:
+        str: The quoted string literal.
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
+def get_fts5_table(index: FullTextIndex) -> TableClause:
+    """Describes an FTS5 index as a table, for use in SQLAlchemy expressions.
+
+    Args:
+        index (FullTextIndex): The FTS5 index.
+
+    Returns:
+        TableClause: The table, with the `rowid` column, the hidden column named after
+            the table which is used by MATCH queries, and the indexed columns.
+    """
+    return table(
+        index.name,
+        sql_column("rowid"),
+        sql_column(index.name),
+        *(sql_column(name) for name in index.columns),
+    )
+
+
+def get_fts5_match_query(
+    values: Sequence[str], logic_operator: GridLogicOperator
+) -> str:
+    """Converts the quick filter values into an FTS5 full-text query.
+
+    Each value is quoted as an FTS5 string, so that characters such as `-`, `*`, and
+    `"` in the user's input are matched rather than interpreted as query syntax, and
+    is matched as a prefix.
+
+    Args:
+        values (Sequence[str]): The quick filter values.
+        logic_operator (GridLogicOperator): The operator joining the values.
+
+    Returns:
+        str: The FTS5 full-text query, such as `"ali"* AND "smi"*`.
+    """
+    joiner = " OR " if logic_operator == GridLogicOperator.Or else " AND "
+    return joiner.join('"' + value.replace('"', '""') + '"*' for value in values)
+
+
+def apply_fts5_quick_filter(
+    index: FullTextIndex, values: Sequence[str], logic_operator: GridLogicOperator
+) -> Any:
+    """Filters the rows to those whose row ID matches the quick filter in an FTS5
+    index.
+
+    Args:
+        index (FullTextIndex): The FTS5 index being searched.
+        values (Sequence[str]): The quick filter values, which are not empty.
+        logic_operator (GridLogicOperator): The operator joining the values.
+
+    Returns:
+        Any: The clause filtering the rows by the index's matching row IDs.
+    """
+    fts_table = get_fts5_table(index=index)
+    matches = select(fts_table.c.rowid).where(
+        fts_table.c[index.name].op("MATCH")(
+            get_fts5_match_query(values=values, logic_operator=logic_operator)
+        )
+    )
+    return index.rowid.in_(matches)
+
+
+def _get_rowid_column(index: FullTextIndex) -> "Column[Any]":
+    """Retrieves the table's column stored as the row ID of an index.
+
+    Args:
+        index (FullTextIndex): The FTS5 index.
+
+    Raises:
+        ValueError: Raised when the index's row ID isn't a column of a table.
+
+    Returns:
+        Column[Any]: The column.
+    """
+    rowid = getattr(index.rowid, "expression", index.rowid)
+    if not isinstance(rowid, Column) or getattr(rowid.table, "name", None) is None:
+        raise ValueError(
+            f"Expected the row ID of the {index.name} index to be a table's column"
+        )
+    return rowid
+
+
+def get_fts5_ddl(index: FullTextIndex) -> List[str]:
+    """Generates the statements which create an external content FTS5 index, and the
+    triggers which keep it in sync with the indexed table.
+
+    The final statement rebuilds the index from the rows already in the table. Each
+    statement is idempotent, so they may be executed when the application starts.
+
+    Args:
+        index (FullTextIndex): The FTS5 index being created.
+
+    Raises:
+        ValueError: Raised when the index's row ID isn't a column of a table.
+
+    Returns:
+        List[str]: The SQL statements, to be executed in order.
+    """
+    rowid = _get_rowid_column(index=index)
+    name = _quote_identifier(index.name)
+    table_name = _quote_identifier(rowid.table.name)
+    columns = ", ".join(_quote_identifier(c) for c in index.columns)
+    new_values = ", ".join(f"new.{_quote_identifier(c)}" for c in index.columns)
+    old_values = ", ".join(f"old.{_quote_identifier(c)}" for c in index.columns)
+    rowid_name = _quote_identifier(rowid.name)
+    # every identifier is quoted, and no values from requests are included
+    insert = (
+        f"INSERT INTO {name}(rowid, {columns}) VALUES (new.{rowid_name}, {new_values});"  # noqa: S608
+    )
+    delete = (
+        f"INSERT INTO {name}({name}, rowid, {columns}) "  # noqa: S608
+        f"VALUES ('delete', old.{rowid_name}, {old_values});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5({columns}, "
+        f"content={_quote_string(rowid.table.name)}, "
+        f"content_rowid={_quote_string(rowid.name)}, "
+        f"tokenize={_quote_string(index.tokenize)})",
+        f"CREATE TRIGGER IF NOT EXISTS {_quote_identifier(index.name + '_ai')} "
+        f"AFTER INSERT ON {table_name} BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {_quote_identifier(index.name + '_ad')} "
+        f"AFTER DELETE ON {table_name} BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {_quote_identifier(index.name + '_au')} "
+        f"AFTER UPDATE ON {table_name} BEGIN {delete} {insert} END",
+        f"INSERT INTO {name}({name}) VALUES ('rebuild')",  # noqa: S608
+    ]
+
+
+def maintain_fts5_index(index: FullTextIndex) -> None:
+    """Maintains an FTS5 index using SQLAlchemy events, rather than triggers.
+
+    The index stores its own copy of the indexed columns. It's created after the
+    model's table, and dropped before it, by `create_all` and `drop_all`. Rows which
+    are inserted, updated, and deleted through an ORM session are indexed when they're
+    flushed. Rows modified by Core statements or bulk ORM statements bypass the
+    events, as do the rows of a table which existed before the index, and they should
+    be indexed using SQL, such as:
+
+        DELETE FROM index_name;
+        INSERT INTO index_name(rowid, name) SELECT id, name FROM table_name;
+
+    The events should be registered once, when the application starts.
+
+    Args:
+        index (FullTextIndex): The FTS5 index, whose row ID is the ORM attribute of
+            the model's integer primary key.
+
+    Raises:
+        ValueError: Raised when the index's row ID isn't the ORM attribute of a
+            table's column.
+    """
+    rowid = _get_rowid_column(index=index)
+    model = getattr(index.rowid, "class_", None)
+    if model is None:
+        raise ValueError(
+            f"Expected the row ID of the {index.name} index to be an ORM attribute"
+        )
+    mapper = inspect(model)
+    rowid_key = mapper.get_property_by_column(rowid).key
+    keys = [
+        mapper.get_property_by_column(rowid.table.c[name]).key for name in index.columns
+    ]
+    name = _quote_identifier(index.name)
+    columns = ", ".join(_quote_identifier(c) for c in index.columns)
+    values = ", ".join(f":value_{position}" for position in range(len(keys)))
+    # every identifier is quoted, and the values are bound
+    insert = text(f"INSERT INTO {name}(rowid, {columns}) VALUES (:rowid, {values})")  # noqa: S608
+    delete = text(f"DELETE FROM {name} WHERE rowid = :rowid")  # noqa: S608
+
+    def get_params(target: Any) -> Dict[str, Any]:
+        params = {
+            f"value_{position}": getattr(target, key)
+            for position, key in enumerate(keys)
+        }
+        params["rowid"] = getattr(target, rowid_key)
+        return params
+
+    def get_previous_rowid(target: Any) -> Any:
+        history = inspect(target).attrs[rowid_key].history
+        return history.deleted[0] if history.deleted else getattr(target, rowid_key)
+
+    def after_insert(mapper: Any, connection: Any, target: Any) -> None:  # noqa: ARG001
+        connection.execute(insert, get_params(target=target))
+
+    def after_update(mapper: Any, connection: Any, target: Any) -> None:  # noqa: ARG001
+        state = inspect(target)
+        if not any(
+            state.attrs[key].history.has_changes() for key in [rowid_key, *keys]
+        ):
+            return
+        connection.execute(delete, {"rowid": get_previous_rowid(target=target)})
+        connection.execute(insert, get_params(target=target))
+
+    def after_delete(mapper: Any, connection: Any, target: Any) -> None:  # noqa: ARG001
+        connection.execute(delete, {"rowid": get_previous_rowid(target=target)})
+
+    event.listen(
+        rowid.table,
+        "after_create",
+        DDL(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5({columns}, "
+            f"tokenize={_quote_string(index.tokenize)})"
+        ),
+    )
+    event.listen(rowid.table, "before_drop", DDL(f"DROP TABLE IF EXISTS {name}"))
+    event.listen(model, "after_insert", after_insert)
+    event.listen(model, "after_update", after_update)
+    event.listen(model, "after_delete", after_delete)
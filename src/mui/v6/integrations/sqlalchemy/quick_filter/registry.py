@@ -0,0 +1,79 @@
+"""The registry module dispatches quick filters to the backend searching an index.
+
+Backends for additional full-text engines may be registered, for example a
+PostgreSQL `tsvector` column, indexed with a GIN index:
+
+    def apply_tsvector_quick_filter(index, values, logic_operator):
+        joiner = " | " if logic_operator == GridLogicOperator.Or else " & "
+        query = joiner.join(f"{value}:*" for value in values)
+        return column(index.name).op("@@")(func.to_tsquery("simple", query))
+
+    register_quick_filter_backend("tsvector", apply_tsvector_quick_filter)
+"""
+
+from typing import Any, Dict, List, Optional
+
+from mui.v6.grid import GridFilterModel, GridLogicOperator
+from mui.v6.integrations.sqlalchemy.quick_filter.fts5 import apply_fts5_quick_filter
+from mui.v6.integrations.sqlalchemy.quick_filter.types import (
+    FullTextIndex,
+    QuickFilterBackend,
+)
+
+_QUICK_FILTER_BACKENDS: Dict[str, QuickFilterBackend] = {
+    "fts5": apply_fts5_quick_filter
+}
+
+
+def register_quick_filter_backend(name: str, backend: QuickFilterBackend) -> None:
+    """Registers a quick filter backend.
+
+    Args:
+        name (str): The name of the backend, as declared by full-text indexes.
+        backend (QuickFilterBackend): The backend receiving the index, the quick
+            filter values, and their logic operator, returning the filter clause.
+            This replaces any previously registered backend.
+    """
+    _QUICK_FILTER_BACKENDS[name] = backend
+
+
+def get_quick_filter_values(model: GridFilterModel) -> List[str]:
+    """Retrieves the quick filter values which should be searched for.
+
+    Args:
+        model (GridFilterModel): The filter model.
+
+    Returns:
+        List[str]: The quick filter values, as strings, without blank values.
+    """
+    values = (str(value).strip() for value in model.quick_filter_values or [])
+    return [value for value in values if value]
+
+
+def get_quick_filter_clause(
+    model: GridFilterModel, index: FullTextIndex
+) -> Optional[Any]:
+    """Retrieves the clause which applies the filter model's quick filter values using
+    the index's backend.
+
+    If the logic operator is None, `AND` is used by default, matching the data grid.
+
+    Args:
+        model (GridFilterModel): The filter model.
+        index (FullTextIndex): The full-text index being searched.
+
+    Raises:
+        ValueError: Raised when no backend is registered for the index's backend.
+
+    Returns:
+        Optional[Any]: The filter clause, or None if there are no quick filter values.
+    """
+    backend = _QUICK_FILTER_BACKENDS.get(index.backend)
+    if backend is None:
+        raise ValueError(f"Unsupported quick filter backend {index.backend}")
+    values = get_quick_filter_values(model=model)
+    if not values:
+        return None
+    return backend(
+        index, values, model.quick_filter_logic_operator or GridLogicOperator.And
+    )
@@ -0,0 +1,39 @@
+"""The types module holds types related to quick filtering.
+
+A full-text index declares the index which answers the grid's quick filter, and the
+backend which searches it. A quick filter backend receives the index, the quick filter
+values, and the logic operator joining them. It returns the clause which filters the
+rows to those matching the values, for use in a SQLAlchemy filter.
+"""
+
+from typing import Any, Callable, NamedTuple, Sequence
+
+from typing_extensions import TypeAlias
+
+from mui.v6.grid import GridLogicOperator
+
+
+class FullTextIndex(NamedTuple):
+    """A full-text index searched by the quick filter.
+
+    Attributes:
+        name (str): The name of the index, such as the name of the FTS5 table.
+        rowid (Any): The column, or equivalent property, of the filtered rows which
+            is stored as the index's row ID, such as an integer primary key.
+        columns (Sequence[str]): The names of the indexed columns.
+        backend (str): The name of the quick filter backend which searches the
+            index. Defaults to "fts5".
+        tokenize (str): The tokenizer used when creating the index, for backends
+            which support one. Defaults to "unicode61".
+    """
+
+    name: str
+    rowid: Any
+    columns: Sequence[str]
+    backend: str = "fts5"
+    tokenize: str = "unicode61"
+
+
+QuickFilterBackend: TypeAlias = Callable[
+    [FullTextIndex, Sequence[str], GridLogicOperator], Any
+]
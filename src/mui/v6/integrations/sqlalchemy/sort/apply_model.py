@@ -1,33 +1,70 @@
 """The apply_model module is responsible for applying a GridSortModel to a query."""
 
-from typing import TypeVar
+from typing import Any, TypeVar, Union, overload
 
 from sqlalchemy.orm import Query
+from sqlalchemy.sql import FromClause, Select
 
 from mui.v6.grid.sort import GridSortModel
 from mui.v6.integrations.sqlalchemy.resolver import Resolver
 from mui.v6.integrations.sqlalchemy.sort.apply_item import get_sort_expression_from_item
+from mui.v6.integrations.sqlalchemy.statement import Statement, as_statement
 
 _Q = TypeVar("_Q")
 
 
+@overload
 def apply_sort_to_query_from_model(
     query: "Query[_Q]", model: GridSortModel, resolver: Resolver
 ) -> "Query[_Q]":
+    """When a query is provided, a query is returned.
+
+    Args:
+        query (Query[_Q]): The query.
+        model (GridSortModel): The sort model.
+        resolver (Resolver): The column resolver.
+
+    Returns:
+        Query[_Q]: The query.
+    """
+
+
+@overload
+def apply_sort_to_query_from_model(
+    query: Union[Select, FromClause], model: GridSortModel, resolver: Resolver
+) -> Select:
+    """When a select statement or table is provided, a select statement is returned.
+
+    Args:
+        query (Select | FromClause): The select statement or table.
+        model (GridSortModel): The sort model.
+        resolver (Resolver): The column resolver.
+
+    Returns:
+        Select: The select statement.
+    """
+
+
+def apply_sort_to_query_from_model(
+    query: Statement, model: GridSortModel, resolver: Resolver
+) -> Union["Query[Any]", Select]:
     """Applies a GridSortModel to a SQLAlchemy query.
 
-    If the model is an empty list, the query is returned, as-is.
+    If the model is an empty list, the query is returned, as-is. A Core table is
+    converted into a select statement.
 
     Args:
-        query (Query[_Q]): The query to apply the sort model to.
+        query (Query[_Q] | Select | FromClause): The query, select statement, or
+            table to apply the sort model to.
         model (GridSortModel): The sort model to apply to the query. This contains zero
             or more GridSortItems.
         resolver (Resolver): The resolver is responsible for retrieving the column or
             other property on a SQLAlchemy model.
 
     Returns:
-        Query[_Q]: The ordered query.
+        Query[_Q] | Select: The ordered query or select statement.
     """
+    query = as_statement(query)
     if len(model) == 0:
         return query
 
@@ -0,0 +1,9 @@
+"""The statement module holds details about the statements accepted by the appliers.
+
+The appliers accept a legacy ORM `Query`, a 2.0 style `Select`, or a Core `Table`.
+"""
+
+from mui.v6.integrations.sqlalchemy.statement.convert import Statement, as_statement
+
+# isort: unique-list
+__all__ = ["Statement", "as_statement"]
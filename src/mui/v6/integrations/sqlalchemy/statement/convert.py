@@ -0,0 +1,69 @@
+"""The convert module converts the statements accepted by the appliers.
+
+The appliers accept a legacy ORM `Query`, a 2.0 style `Select`, or a Core `Table`
+(or other FROM clause). Query and Select share the generative methods used by the
+appliers, such as `filter`, `order_by`, `limit`, and `offset`, so only a FROM clause
+needs to be converted, into a `SELECT * FROM table` statement.
+"""
+
+from typing import Any, TypeVar, Union, overload
+
+from sqlalchemy import select
+from sqlalchemy.orm import Query
+from sqlalchemy.sql import FromClause, Select
+from typing_extensions import TypeAlias
+
+_Q = TypeVar("_Q")
+
+Statement: TypeAlias = Union["Query[Any]", Select, FromClause]
+
+
+@overload
+def as_statement(query: "Query[_Q]") -> "Query[_Q]":
+    """A query is returned as-is.
+
+    Args:
+        query (Query[_Q]): The query.
+
+    Returns:
+        Query[_Q]: The query.
+    """
+
+
+@overload
+def as_statement(query: Select) -> Select:
+    """A select statement is returned as-is.
+
+    Args:
+        query (Select): The select statement.
+
+    Returns:
+        Select: The select statement.
+    """
+
+
+@overload
+def as_statement(query: FromClause) -> Select:
+    """A table, or other FROM clause, is converted into a select statement.
+
+    Args:
+        query (FromClause): The table.
+
+    Returns:
+        Select: The statement selecting every column of the table.
+    """
+
+
+def as_statement(query: Statement) -> Union["Query[Any]", Select]:
+    """Converts a table into a select statement, returning queries and select
+    statements as-is.
+
+    Args:
+        query (Statement): The query, select statement, or table.
+
+    Returns:
+        Query[Any] | Select: The query or select statement.
+    """
+    if isinstance(query, FromClause):
+        return select(query)
+    return query
@@ -1,4 +1,16 @@
+from mui.v6.integrations.sqlalchemy.structures.async_query import AsyncDataGridQuery
 from mui.v6.integrations.sqlalchemy.structures.query import DataGridQuery
+from mui.v6.integrations.sqlalchemy.structures.response import (
+    UnknownRowCountResponse,
+    get_unknown_row_count_response,
+)
+from mui.v6.integrations.sqlalchemy.structures.total import TotalCount
 
 # isort: unique-list
-__all__ = ["DataGridQuery"]
+__all__ = [
+    "AsyncDataGridQuery",
+    "DataGridQuery",
+    "TotalCount",
+    "UnknownRowCountResponse",
+    "get_unknown_row_count_response",
+]
@@ -0,0 +1,583 @@
+"""The async_query module contains the AsyncDataGridQuery data structure.
+
+This structure is the asyncio counterpart of the DataGridQuery, applying the models to
+a 2.0 style `select()` statement which is executed by an AsyncSession.
+"""
+
+from asyncio import gather
+from math import ceil
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+from sqlalchemy import func, select
+from sqlalchemy.sql import FromClause, Select
+
+from mui.v6.grid import (
+    GridColumnFields,
+    GridColumnVisibilityModel,
+    GridCursorCodec,
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortModel,
+)
+from mui.v6.integrations.sqlalchemy.dialect import supports_window_functions
+from mui.v6.integrations.sqlalchemy.filter import apply_filter_to_query_from_model
+from mui.v6.integrations.sqlalchemy.pagination import (
+    Keyset,
+    KeysetColumn,
+    PaginationStrategy,
+    apply_keyset_to_query_from_model,
+    apply_limit_offset_to_query_from_model,
+    get_keyset_columns,
+    get_keyset_page,
+    get_primary_key_columns,
+)
+from mui.v6.integrations.sqlalchemy.projection import (
+    apply_projection_to_query_from_model,
+    get_model_fields,
+)
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from mui.v6.integrations.sqlalchemy.sort import apply_sort_to_query_from_model
+from mui.v6.integrations.sqlalchemy.statement import as_statement
+from mui.v6.integrations.sqlalchemy.structures.factory import Factory
+from mui.v6.integrations.sqlalchemy.structures.total import TotalCount
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _selects_single_entity(statement: Select) -> bool:
+    """Determines whether a statement selects a single mapped entity.
+
+    Such statements return the entity itself, rather than a row containing it, which
+    matches the behavior of a Query.
+
+    Args:
+        statement (Select): The statement being inspected.
+
+    Returns:
+        bool: True when a single mapped entity is selected.
+    """
+    descriptions = statement.column_descriptions
+    return (
+        len(descriptions) == 1
+        and descriptions[0].get("entity") is not None
+        and descriptions[0]["expr"] is descriptions[0]["entity"]
+    )
+
+
+class AsyncDataGridQuery(Generic[_T]):
+    """An async data grid query handles utilities related to our statement.
+
+    When the keyset pagination strategy is used, `next_keyset` and `previous_keyset`
+    are populated once `items()` has been awaited, and are available as opaque
+    cursors through `next_cursor` and `previous_cursor` when a cursor codec is
+    provided.
+
+    Args:
+        Generic (_type_): The model being retrieved by the statement.
+    """
+
+    _statement: Select
+    column_resovler: Resolver
+    cursor_codec: Optional[GridCursorCodec]
+    filter_model: Optional[GridFilterModel]
+    has_next_page: Optional[bool]
+    keyset: Optional[Keyset]
+    keyset_columns: List[KeysetColumn]
+    next_keyset: Optional[Keyset]
+    pagination_model: Optional[GridPaginationModel]
+    pagination_strategy: PaginationStrategy
+    previous_keyset: Optional[Keyset]
+    session: "AsyncSession"
+    sort_model: Optional[GridSortModel]
+    statement: Select
+
+    def __init__(  # noqa: PLR0917
+        self,
+        statement: Union[Select, FromClause],
+        session: "AsyncSession",
+        column_resolver: Resolver,
+        filter_model: Optional[GridFilterModel] = None,
+        sort_model: Optional[GridSortModel] = None,
+        pagination_model: Optional[GridPaginationModel] = None,
+        pagination_strategy: PaginationStrategy = PaginationStrategy.OFFSET,
+        keyset: Optional[Keyset] = None,
+        cursor_codec: Optional[GridCursorCodec] = None,
+        fields: Optional[GridColumnFields] = None,
+        column_visibility_model: Optional[GridColumnVisibilityModel] = None,
+    ) -> None:
+        """Initialize a new async data grid query.
+
+        Args:
+            statement (Select | FromClause): The base select statement, or Core
+                table, which the models will be applied to.
+            session (AsyncSession): The session used to execute the statement.
+            column_resolver (Resolver): The field resolver which converts a UI field
+                to the corresponding SQLAlchemy column, column property, etc.
+            filter_model (Optional[GridFilterModel], optional): The filter model to
+                apply, if provided. Defaults to None.
+            sort_model (Optional[GridSortModel], optional): The sort model to apply,
+                if provided. Defaults to None.
+            pagination_model (Optional[GridPaginationModel], optional): The pagination
+                model to apply, if provided. Defaults to None.
+            pagination_strategy (PaginationStrategy, optional): How the page of
+                results is located. The deferred join strategy is not supported.
+                Defaults to PaginationStrategy.OFFSET.
+            keyset (Optional[Keyset], optional): The boundary of the requested page
+                when using the keyset pagination strategy. If None, the first page is
+                retrieved. Defaults to None.
+            cursor_codec (Optional[GridCursorCodec], optional): The codec used to
+                decode the pagination model's cursor into the keyset, and to encode
+                the adjacent keysets into cursors. Defaults to None.
+            fields (Optional[GridColumnFields], optional): The fields displayed by
+                the grid. When provided, only the displayed columns are loaded.
+                Defaults to None.
+            column_visibility_model (Optional[GridColumnVisibilityModel], optional):
+                The visibility of the grid's fields. When provided, hidden columns are
+                not loaded. Defaults to None.
+
+        Raises:
+            InvalidCursorError: Raised when the pagination model's cursor is
+                malformed or has been tampered with.
+            ValueError: Raised when the deferred join pagination strategy is used.
+        """
+        if pagination_strategy == PaginationStrategy.DEFERRED_JOIN:
+            raise ValueError("The deferred join strategy is not supported by async")
+        self.session = session
+        self.column_resovler = column_resolver
+        self.filter_model = filter_model
+        self.sort_model = sort_model
+        self.pagination_model = pagination_model
+        self.pagination_strategy = pagination_strategy
+        self.cursor_codec = cursor_codec
+        if (
+            keyset is None
+            and cursor_codec is not None
+            and pagination_model is not None
+            and pagination_model.cursor
+        ):
+            values, backward = cursor_codec.decode(pagination_model.cursor)
+            keyset = Keyset(values=values, backward=backward)
+        self.keyset = keyset
+        self.keyset_columns = (
+            get_keyset_columns(
+                model=sort_model or [],
+                resolver=column_resolver,
+                tiebreakers=get_primary_key_columns(query=statement),
+            )
+            if pagination_strategy == PaginationStrategy.KEYSET
+            else []
+        )
+        self.next_keyset = None
+        self.has_next_page = None
+        self.previous_keyset = None
+        filtered = statement = apply_projection_to_query_from_model(
+            query=as_statement(statement),
+            resolver=column_resolver,
+            fields=fields,
+            column_visibility_model=column_visibility_model,
+            required_fields=get_model_fields(
+                filter_model=filter_model, sort_model=sort_model
+            ),
+        )
+        if filter_model is not None:
+            filtered = apply_filter_to_query_from_model(
+                query=filtered, model=filter_model, resolver=column_resolver
+            )
+        # we filter it first, so that our total is accurate
+        self._statement = filtered
+        paginated = filtered
+        if sort_model is not None:
+            paginated = apply_sort_to_query_from_model(
+                query=paginated, model=sort_model, resolver=column_resolver
+            )
+        if pagination_model is not None:
+            paginated = (
+                apply_keyset_to_query_from_model(
+                    query=paginated,
+                    model=pagination_model,
+                    columns=self.keyset_columns,
+                    keyset=keyset,
+                )
+                if pagination_strategy == PaginationStrategy.KEYSET
+                else apply_limit_offset_to_query_from_model(
+                    query=paginated, model=pagination_model
+                )
+            )
+        self.statement = paginated
+
+    def _count_statement(self) -> Select:
+        """Builds the statement which counts the rows that exist with the filter.
+
+        Returns:
+            Select: The count statement, with ordering disabled.
+        """
+        return select(func.count()).select_from(
+            self._statement.order_by(None).subquery()
+        )
+
+    async def total(self) -> int:
+        """Returns the total number of rows that exist with the filter.
+
+        This disables ordering (sorting) to improve performance.
+
+        Returns:
+            int: The count of total items before pagination, but after filtering.
+        """
+        return int((await self.session.execute(self._count_statement())).scalar_one())
+
+    def _to_items(self, rows: Sequence[Any], entity_count: int) -> List[Any]:
+        """Converts result rows into items, matching the behavior of a Query.
+
+        Args:
+            rows (Sequence[Any]): The rows returned by the statement.
+            entity_count (int): The number of leading columns which make up an item.
+
+        Returns:
+            List[Any]: The entities, when a single entity is selected, otherwise the
+                rows.
+        """
+        if entity_count == 1 and _selects_single_entity(statement=self.statement):
+            return [row[0] for row in rows]
+        return [tuple(row[:entity_count]) for row in rows]
+
+    @overload
+    async def items(self, factory: None = ...) -> List[_T]:
+        """When a factory function is not provided, simply return the models.
+
+        Args:
+            factory (None, optional): This is not provided. Defaults to None.
+
+        Returns:
+            List[_T]: The list of models, without conversion.
+        """
+
+    @overload
+    async def items(self, factory: Factory[_T, _R]) -> List[_R]:
+        """When a factory function is provided, return a list of items created by
+        the factory.
+
+        Args:
+            factory (Callable[[_T], _R]): The factory to convert the type(s).
+
+        Returns:
+            List[_R]: The list of created items.
+        """
+
+    async def items(
+        self, factory: Optional[Factory[_T, _R]] = None
+    ) -> Union[List[_T], List[_R]]:
+        """Returns all results of the statement, after all models have been applied.
+
+        Args:
+            factory (Optional[Callable[[_T], _R]]): The factory function to convert the
+                model into a different type.
+
+        Returns:
+            List[_T]: The list of individual items located by the statement after all
+                models have been applied.
+        """
+        if (
+            self.pagination_strategy == PaginationStrategy.KEYSET
+            and self.pagination_model is not None
+        ):
+            items = await self._keyset_items()
+        else:
+            rows = (await self.session.execute(self.statement)).all()
+            items = self._to_items(
+                rows=rows, entity_count=len(self.statement.column_descriptions)
+            )
+        return [factory(item) for item in items] if factory is not None else items
+
+    @overload
+    async def items_and_total(self, factory: None = ...) -> Tuple[List[_T], int]:
+        """When a factory function is not provided, simply return the models.
+
+        Args:
+            factory (None, optional): This is not provided. Defaults to None.
+
+        Returns:
+            Tuple[List[_T], int]: The list of models, without conversion, and the
+                total.
+        """
+
+    @overload
+    async def items_and_total(self, factory: Factory[_T, _R]) -> Tuple[List[_R], int]:
+        """When a factory function is provided, return a list of items created by
+        the factory.
+
+        Args:
+            factory (Callable[[_T], _R]): The factory to convert the type(s).
+
+        Returns:
+            Tuple[List[_R], int]: The list of created items and the total.
+        """
+
+    async def items_and_total(
+        self, factory: Optional[Factory[_T, _R]] = None
+    ) -> Tuple[Union[List[_T], List[_R]], int]:
+        """Returns the page of results and the total number of rows with the filter.
+
+        When the database supports window functions, the total is calculated by a
+        `count(*) OVER ()` column on the page statement, so the rows and the total
+        are retrieved by a single statement. If the page is empty, a plain count is
+        used. The keyset pagination strategy uses a separate count statement.
+
+        Args:
+            factory (Optional[Callable[[_T], _R]]): The factory function to convert the
+                model into a different type.
+
+        Returns:
+            Tuple[List[_T], int]: The list of individual items located by the
+                statement after all models have been applied, and the count of total
+                items before pagination, but after filtering.
+        """
+        if self.pagination_strategy == PaginationStrategy.KEYSET or (
+            not supports_window_functions(dialect=self.session.get_bind().dialect)
+        ):
+            total = await self.total()
+            return await self.items(factory=factory), total
+
+        entity_count = len(self.statement.column_descriptions)
+        rows = (
+            await self.session.execute(self.statement.add_columns(func.count().over()))
+        ).all()
+        total = int(rows[0][entity_count]) if rows else await self.total()
+        items: List[_T] = self._to_items(rows=rows, entity_count=entity_count)
+        return (
+            [factory(item) for item in items] if factory is not None else items,
+            total,
+        )
+
+    @overload
+    async def items_and_total_concurrently(
+        self, factory: None = ...
+    ) -> Tuple[List[_T], int]:
+        """When a factory function is not provided, simply return the models.
+
+        Args:
+            factory (None, optional): This is not provided. Defaults to None.
+
+        Returns:
+            Tuple[List[_T], int]: The list of models, without conversion, and the
+                total.
+        """
+
+    @overload
+    async def items_and_total_concurrently(
+        self, factory: Factory[_T, _R]
+    ) -> Tuple[List[_R], int]:
+        """When a factory function is provided, return a list of items created by
+        the factory.
+
+        Args:
+            factory (Callable[[_T], _R]): The factory to convert the type(s).
+
+        Returns:
+            Tuple[List[_R], int]: The list of created items and the total.
+        """
+
+    async def items_and_total_concurrently(
+        self, factory: Optional[Factory[_T, _R]] = None
+    ) -> Tuple[Union[List[_T], List[_R]], int]:
+        """Returns the page of results and the total, retrieving them concurrently.
+
+        The total is counted by a new session, and therefore a separate pooled
+        connection, while the page is retrieved by the query's session. The latency
+        is the maximum of the two statements, rather than their sum.
+
+        Args:
+            factory (Optional[Callable[[_T], _R]]): The factory function to convert the
+                model into a different type.
+
+        Returns:
+            Tuple[List[_T], int]: The list of individual items located by the
+                statement after all models have been applied, and the count of total
+                items before pagination, but after filtering.
+        """
+
+        async def count() -> int:
+            async with type(self.session)(bind=self.session.bind) as session:
+                return int(
+                    (await session.execute(self._count_statement())).scalar_one()
+                )
+
+        items, total = await gather(self.items(factory=factory), count())
+        return cast(Union[List[_T], List[_R]], items), total
+
+    @overload
+    def stream(self, factory: None = ...) -> AsyncIterator[_T]:
+        """When a factory function is not provided, simply yield the models.
+
+        Args:
+            factory (None, optional): This is not provided. Defaults to None.
+
+        Returns:
+            AsyncIterator[_T]: The models, without conversion.
+        """
+
+    @overload
+    def stream(self, factory: Factory[_T, _R]) -> AsyncIterator[_R]:
+        """When a factory function is provided, yield the items created by the
+        factory.
+
+        Args:
+            factory (Callable[[_T], _R]): The factory to convert the type(s).
+
+        Returns:
+            AsyncIterator[_R]: The created items.
+        """
+
+    async def stream(
+        self, factory: Optional[Factory[_T, _R]] = None
+    ) -> AsyncIterator[Union[_T, _R]]:
+        """Yields the results of the statement as they are received.
+
+        The rows are retrieved using a server side cursor, where supported, so the
+        results are never held in memory at once. Streaming ignores the keyset
+        pagination strategy's adjacent keysets.
+
+        Args:
+            factory (Optional[Callable[[_T], _R]]): The factory function to convert the
+                model into a different type.
+
+        Yields:
+            _T | _R: The individual items located by the statement after all models
+                have been applied.
+        """
+        result = await self.session.stream(self.statement)
+        rows = cast(
+            AsyncIterator[Any],
+            result.scalars()
+            if _selects_single_entity(statement=self.statement)
+            else result,
+        )
+        async for row in rows:
+            item = cast(_T, row)
+            yield factory(item) if factory is not None else item
+
+    async def _keyset_items(self) -> List[_T]:
+        """Retrieves the page of items using the keyset pagination strategy.
+
+        One additional row is requested to determine whether another page exists in
+        the direction being paged, and the keyset column values are selected
+        alongside each row so the adjacent keysets can be built without inspecting
+        the models.
+
+        Returns:
+            List[_T]: The page of items, in display order.
+        """
+        entity_count = len(self.statement.column_descriptions)
+        rows = list(
+            (
+                await self.session.execute(
+                    self.statement.limit(self.page_size + 1).add_columns(*[
+                        column for column, _ in self.keyset_columns
+                    ])
+                )
+            ).all()
+        )
+        rows, self.previous_keyset, self.next_keyset = get_keyset_page(
+            rows=rows,
+            page_size=self.page_size,
+            keyset=self.keyset,
+            get_values=lambda row: tuple(row[entity_count:]),
+        )
+        self.has_next_page = self.next_keyset is not None
+        return self._to_items(rows=rows, entity_count=entity_count)
+
+    def _encode_keyset(self, keyset: Optional[Keyset]) -> Optional[str]:
+        """Encodes a keyset into an opaque cursor using the cursor codec.
+
+        Args:
+            keyset (Optional[Keyset]): The keyset being encoded.
+
+        Raises:
+            ValueError: Raised when no cursor codec was provided.
+
+        Returns:
+            Optional[str]: The cursor, or None if the keyset is None.
+        """
+        if keyset is None:
+            return None
+        if self.cursor_codec is None:
+            raise ValueError("A cursor codec is required to encode cursors")
+        return self.cursor_codec.encode(values=keyset.values, backward=keyset.backward)
+
+    @property
+    def next_cursor(self) -> Optional[str]:
+        """Returns the cursor of the next page.
+
+        Returns:
+            Optional[str]: None if there is no next page, or `items()` has not been
+                awaited, otherwise the opaque cursor of the next page.
+        """
+        return self._encode_keyset(keyset=self.next_keyset)
+
+    @property
+    def previous_cursor(self) -> Optional[str]:
+        """Returns the cursor of the previous page.
+
+        Returns:
+            Optional[str]: None if there is no previous page, or `items()` has not
+                been awaited, otherwise the opaque cursor of the previous page.
+        """
+        return self._encode_keyset(keyset=self.previous_keyset)
+
+    @property
+    def per_page(self) -> int:
+        """Alias for page_size."""
+        return self.page_size
+
+    @property
+    def page_size(self) -> int:
+        """Returns the page size.
+
+        Returns:
+            int: 0 if no pagination model exists, otherwise the page size.
+        """
+        return self.pagination_model.page_size if self.pagination_model else 0
+
+    @property
+    def page(self) -> int:
+        """Returns the current page number.
+
+        Returns:
+            int: 0 if no pagination model exists, otherwise the page number.
+        """
+        return self.pagination_model.page if self.pagination_model else 0
+
+    async def pages(self, total: Union[int, TotalCount, None] = None) -> int:
+        """Returns the number of pages to display all results.
+
+        Args:
+            total (Union[int, TotalCount, None], optional): The total number of
+                results. This may be provided to avoid the overhead of an additional
+                database query to retrieve the total. Defaults to None.
+
+        Returns:
+            int: The number of pages required to display all results at the current
+                page size.
+        """
+        if total is None:
+            total = await self.total()
+        elif isinstance(total, TotalCount):
+            capped = not total.exact and not total.estimated
+            total = total.total + 1 if capped else total.total
+        return int(ceil(total / float(self.per_page)))
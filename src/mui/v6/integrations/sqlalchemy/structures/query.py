@@ -4,37 +4,147 @@ This structure is used to provide helpers related to pagination, such as
 total row counts.
 """
 
+from concurrent.futures import Executor, ThreadPoolExecutor
 from math import ceil
-from typing import Generic, List, Optional, TypeVar, Union, overload
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
-from sqlalchemy.orm import Query
+from sqlalchemy import Column, Table, func, inspect
+from sqlalchemy.engine import Row, RowMapping
+from sqlalchemy.orm import Query, Session, load_only
 
-from mui.v6.grid import GridFilterModel, GridPaginationModel, GridSortModel
-from mui.v6.integrations.sqlalchemy.filter import apply_filter_to_query_from_model
+from mui.v6.grid import (
+    GridColumnFields,
+    GridColumnVisibilityModel,
+    GridCursorCodec,
+    GridFilterModel,
+    GridLogicOperator,
+    GridPaginationModel,
+    GridSortModel,
+)
+from mui.v6.integrations.sqlalchemy.cache import (
+    CachedPage,
+    CountCache,
+    PageCache,
+    PlanCache,
+    QueryPlan,
+    get_count_fingerprint,
+    get_page_fingerprint,
+)
+from mui.v6.integrations.sqlalchemy.dialect import (
+    get_query_dialect,
+    supports_window_functions,
+)
+from mui.v6.integrations.sqlalchemy.estimate import RowEstimator, estimate_rows
+from mui.v6.integrations.sqlalchemy.filter import (
+    apply_filter_to_query_from_model,
+    optimize_filter_model,
+)
+from mui.v6.integrations.sqlalchemy.filter.applicators.basic import (
+    EQUAL_OPERATOR_LITERALS,
+)
 from mui.v6.integrations.sqlalchemy.pagination import (
+    Keyset,
+    KeysetColumn,
+    PaginationStrategy,
+    apply_keyset_to_query_from_model,
     apply_limit_offset_to_query_from_model,
+    get_deferred_join_keys,
+    get_keyset_columns,
+    get_keyset_page,
+    get_primary_key_columns,
+    load_deferred_join_rows,
+    same_expression,
+)
+from mui.v6.integrations.sqlalchemy.projection import (
+    get_model_fields,
+    get_projected_columns,
+)
+from mui.v6.integrations.sqlalchemy.quick_filter import (
+    FullTextIndex,
+    apply_quick_filter_to_query_from_model,
 )
 from mui.v6.integrations.sqlalchemy.resolver import Resolver
 from mui.v6.integrations.sqlalchemy.sort import apply_sort_to_query_from_model
 from mui.v6.integrations.sqlalchemy.structures.factory import Factory
+from mui.v6.integrations.sqlalchemy.structures.total import TotalCount
 
 _T = TypeVar("_T")
 _R = TypeVar("_R")
+_S = TypeVar("_S")
+
+ESTIMABLE_OPERATORS = EQUAL_OPERATOR_LITERALS.union({"is"})
 
 
-class DataGridQuery(Generic[_T]):
+class DataGridQuery(Generic[_T]):  # noqa: PLR0904
     """A data grid query handles utilities related to our query.
 
+    When the keyset pagination strategy is used, `next_keyset` and `previous_keyset`
+    are populated once `items()` has been called. They may be provided as the
+    `keyset` of a subsequent DataGridQuery to retrieve the adjacent pages. When a
+    cursor codec is provided, the keyset is decoded from the pagination model's
+    cursor and the adjacent keysets are available as opaque cursors through
+    `next_cursor` and `previous_cursor`.
+
+    `has_next_page` is populated once the page has been retrieved by
+    `items_and_has_next_page()`, or by `items()` when using the keyset pagination
+    strategy.
+
+    When the displayed fields or the column visibility model are provided, only the
+    displayed columns, the primary key, and the columns the filter and sort models
+    refer to are loaded. The remaining columns are deferred.
+
+    When a count cache is provided, totals are cached using the fingerprint of the
+    base query and the filter model, so paging through a filtered view only counts
+    the rows once. When a page cache is provided, `cached_items()` serves pages from
+    the cache and prefetches the next page in the background.
+
+    When the filter is optimized and can't match any rows, `unsatisfiable` is True,
+    and the results and totals are empty without querying the database.
+
     Args:
         Generic (_type_): The model being retrieved by the query.
     """
 
+    _base_query: "Query[_T]"
+    _count_fingerprint: Optional[str]
     _query: "Query[_T]"
+    _unprojected_query: "Query[_T]"
     column_resovler: Resolver
+    column_visibility_model: Optional[GridColumnVisibilityModel]
+    count_cache: Optional[CountCache]
+    cursor_codec: Optional[GridCursorCodec]
+    fields: Optional[GridColumnFields]
     filter_model: Optional[GridFilterModel]
+    has_next_page: Optional[bool]
+    keyset: Optional[Keyset]
+    keyset_columns: List[KeysetColumn]
+    next_keyset: Optional[Keyset]
+    optimize_filter: bool
+    page_cache: Optional[PageCache]
     pagination_model: Optional[GridPaginationModel]
+    pagination_strategy: PaginationStrategy
+    plan: Optional[QueryPlan]
+    plan_cache: Optional[PlanCache]
+    previous_keyset: Optional[Keyset]
+    projected_columns: Optional[List[Any]]
     query: "Query[_T]"
+    quick_filter_index: Optional[FullTextIndex]
     sort_model: Optional[GridSortModel]
+    unsatisfiable: bool
 
     def __init__(  # noqa: PLR0917
         self,
@@ -43,6 +153,16 @@ class DataGridQuery(Generic[_T]):
         filter_model: Optional[GridFilterModel] = None,
         sort_model: Optional[GridSortModel] = None,
         pagination_model: Optional[GridPaginationModel] = None,
+        pagination_strategy: PaginationStrategy = PaginationStrategy.OFFSET,
+        keyset: Optional[Keyset] = None,
+        cursor_codec: Optional[GridCursorCodec] = None,
+        count_cache: Optional[CountCache] = None,
+        page_cache: Optional[PageCache] = None,
+        fields: Optional[GridColumnFields] = None,
+        column_visibility_model: Optional[GridColumnVisibilityModel] = None,
+        plan_cache: Optional[PlanCache] = None,
+        optimize_filter: bool = False,
+        quick_filter_index: Optional[FullTextIndex] = None,
     ) -> None:
         """Initialize a new data grid query.
 
@@ -56,11 +176,101 @@ class DataGridQuery(Generic[_T]):
                 if provided. Defaults to None.
             pagination_model (Optional[GridPaginationModel], optional): The pagination
                 model to apply, if provided. Defaults to None.
+            pagination_strategy (PaginationStrategy, optional): How the page of
+                results is located. Defaults to PaginationStrategy.OFFSET.
+            keyset (Optional[Keyset], optional): The boundary of the requested page
+                when using the keyset pagination strategy. If None, the first page is
+                retrieved. Defaults to None.
+            cursor_codec (Optional[GridCursorCodec], optional): The codec used to
+                decode the pagination model's cursor into the keyset, and to encode
+                the adjacent keysets into cursors. Defaults to None.
+            count_cache (Optional[CountCache], optional): The cache used to store
+                the total number of rows with the filter. Defaults to None.
+            page_cache (Optional[PageCache], optional): The cache used to store
+                serialized pages, including prefetched pages. Defaults to None.
+            fields (Optional[GridColumnFields], optional): The fields displayed by
+                the grid. When provided, only the displayed columns are loaded.
+                Defaults to None.
+            column_visibility_model (Optional[GridColumnVisibilityModel], optional):
+                The visibility of the grid's fields. When provided, hidden columns are
+                not loaded. Defaults to None.
+            plan_cache (Optional[PlanCache], optional): The cache of the filter and
+                sort clauses built for each shape of request. When provided, requests
+                which only differ by their filter values reuse the same clauses.
+                Defaults to None.
+            optimize_filter (bool, optional): Whether to simplify the filter model
+                before it's applied, merging redundant items. When the filter can't
+                match any rows, results are returned without querying the database.
+                Defaults to False.
+            quick_filter_index (Optional[FullTextIndex], optional): The full-text
+                index searched for the filter model's quick filter values. When None,
+                the quick filter values are ignored. Defaults to None.
+
+        Raises:
+            InvalidCursorError: Raised when the pagination model's cursor is
+                malformed or has been tampered with.
         """
+        self.unsatisfiable = False
+        if optimize_filter and filter_model is not None:
+            filter_model, self.unsatisfiable = optimize_filter_model(model=filter_model)
         self.column_resovler = column_resolver
         self.filter_model = filter_model
+        self.quick_filter_index = quick_filter_index
         self.sort_model = sort_model
         self.pagination_model = pagination_model
+        self.pagination_strategy = pagination_strategy
+        self.cursor_codec = cursor_codec
+        self.count_cache = count_cache
+        self.page_cache = page_cache
+        self.plan_cache = plan_cache
+        self.fields = fields
+        self.column_visibility_model = column_visibility_model
+        self.optimize_filter = optimize_filter
+        self.plan = (
+            plan_cache.get(
+                filter_model=filter_model,
+                sort_model=sort_model,
+                resolver=column_resolver,
+            )
+            if plan_cache is not None
+            else None
+        )
+        self._count_fingerprint = None
+        if (
+            keyset is None
+            and cursor_codec is not None
+            and pagination_model is not None
+            and pagination_model.cursor
+        ):
+            values, backward = cursor_codec.decode(pagination_model.cursor)
+            keyset = Keyset(values=values, backward=backward)
+        self.keyset = keyset
+        self.keyset_columns = (
+            get_keyset_columns(
+                model=sort_model or [],
+                resolver=column_resolver,
+                tiebreakers=get_primary_key_columns(query=query),
+            )
+            if pagination_strategy == PaginationStrategy.KEYSET
+            else []
+        )
+        self.next_keyset = None
+        self.has_next_page = None
+        self.previous_keyset = None
+        # the displayed columns don't change the count
+        self._unprojected_query = query
+        self.projected_columns = get_projected_columns(
+            query=query,
+            resolver=column_resolver,
+            fields=fields,
+            column_visibility_model=column_visibility_model,
+            required_fields=get_model_fields(
+                filter_model=filter_model, sort_model=sort_model
+            ),
+        )
+        if self.projected_columns is not None:
+            query = query.options(load_only(*self.projected_columns))
+        self._base_query = query
         query = self._filter_query(query=query)
         # we filter it first, so that our total is accurate
         self._query = query
@@ -80,8 +290,19 @@ class DataGridQuery(Generic[_T]):
         """
         if self.filter_model is None:
             return query
-        return apply_filter_to_query_from_model(
-            query=query, model=self.filter_model, resolver=self.column_resovler
+        if self.plan is None:
+            return apply_filter_to_query_from_model(
+                query=query,
+                model=self.filter_model,
+                resolver=self.column_resovler,
+                quick_filter_index=self.quick_filter_index,
+            )
+        if self.plan.filter_clause is not None:
+            query = query.filter(self.plan.filter_clause).params(
+                **self.plan.get_params(filter_model=self.filter_model)
+            )
+        return apply_quick_filter_to_query_from_model(
+            query=query, model=self.filter_model, index=self.quick_filter_index
         )
 
     def _order_query(self, query: "Query[_T]") -> "Query[_T]":
@@ -95,6 +316,8 @@ class DataGridQuery(Generic[_T]):
         """
         if self.sort_model is None:
             return query
+        if self.plan is not None:
+            return query.order_by(*self.plan.order_by)
         return apply_sort_to_query_from_model(
             query=query, model=self.sort_model, resolver=self.column_resovler
         )
@@ -110,19 +333,185 @@ class DataGridQuery(Generic[_T]):
         """
         if self.pagination_model is None:
             return query
+        if self.pagination_strategy == PaginationStrategy.KEYSET:
+            return apply_keyset_to_query_from_model(
+                query=query,
+                model=self.pagination_model,
+                columns=self.keyset_columns,
+                keyset=self.keyset,
+            )
         return apply_limit_offset_to_query_from_model(
             query=query, model=self.pagination_model
         )
 
+    @property
+    def count_fingerprint(self) -> str:
+        """The fingerprint of the base query, before the displayed columns are
+        projected, the filter model, and the quick filter index, used as the key of
+        the count cache.
+
+        Returns:
+            str: The hexadecimal fingerprint.
+        """
+        if self._count_fingerprint is None:
+            self._count_fingerprint = get_count_fingerprint(
+                query=self._unprojected_query,
+                model=self.filter_model,
+                quick_filter_index=self.quick_filter_index,
+            )
+        return self._count_fingerprint
+
+    def _count(self) -> int:
+        """Counts the rows that exist with the filter.
+
+        Returns:
+            int: The count of total items before pagination, but after filtering.
+        """
+        return self._query.order_by(None).count()
+
+    def _count_in_new_session(self) -> int:
+        """Counts the rows that exist with the filter using a new session.
+
+        This is used to refresh stale counts in the background, as a session must not
+        be shared between threads.
+
+        Returns:
+            int: The count of total items before pagination, but after filtering.
+        """
+        session = cast(Session, self._query.session)
+        with Session(bind=session.get_bind()) as refresh_session:
+            return self._query.with_session(refresh_session).order_by(None).count()
+
+    def _get_cached_total(self) -> Optional[int]:
+        """Retrieves the total from the count cache, if one was provided.
+
+        Returns:
+            Optional[int]: The cached total, or None if it is not cached.
+        """
+        if self.count_cache is None:
+            return None
+        return self.count_cache.get(
+            key=self.count_fingerprint, refresh=self._count_in_new_session
+        )
+
     def total(self) -> int:
         """Returns the total number of rows that exist with the filter.
 
-        This disables ordering (sorting) to improve performance.
+        This disables ordering (sorting) to improve performance. When a count cache
+        was provided, a cached total is returned if one is available.
 
         Returns:
             int: The count of total items before pagination, but after filtering.
         """
-        return self._query.order_by(None).count()
+        if self.unsatisfiable:
+            return 0
+        if self.count_cache is None:
+            return self._count()
+        return self.count_cache.get_or_count(
+            key=self.count_fingerprint,
+            count=self._count,
+            refresh=self._count_in_new_session,
+        )
+
+    def capped_total(self, cap: int) -> TotalCount:
+        """Returns the total number of rows that exist with the filter, up to a cap.
+
+        At most `cap + 1` matching rows are counted, using a limited subquery, so the
+        cost of counting is bounded by the cap rather than by the size of the table.
+        When more than `cap` rows match, the cap is returned as an inexact total,
+        which may be displayed as "N+".
+
+        This disables ordering (sorting) to improve performance.
+
+        Args:
+            cap (int): The maximum number of rows to count.
+
+        Raises:
+            ValueError: Raised when the cap is less than one.
+
+        Returns:
+            TotalCount: The count of total items before pagination, but after
+                filtering, and whether the count is exact.
+        """
+        if cap < 1:
+            raise ValueError("The count cap must be at least one")
+        if self.unsatisfiable:
+            return TotalCount(total=0, exact=True)
+        limited = self._query.order_by(None).limit(cap + 1).subquery()
+        session = cast(Session, self._query.session)
+        count = session.query(func.count()).select_from(limited).scalar()
+        if count > cap:
+            return TotalCount(total=cap, exact=False)
+        return TotalCount(total=count, exact=True)
+
+    def _get_estimable_columns(self) -> Optional[Tuple[Table, List[str]]]:
+        """Determines whether the filter can be answered by row estimates.
+
+        The total can be estimated when the base query selects from a single table
+        without criteria of its own, and the filter model is either empty or only
+        filters the table's columns by equality, joined by AND.
+
+        Returns:
+            Optional[Tuple[Table, List[str]]]: The table and the names of the columns
+                filtered by equality, or None if the total can not be estimated.
+        """
+        base = self._base_query
+        descriptions = base.column_descriptions
+        if base.whereclause is not None or len(descriptions) != 1:
+            return None
+        entity = descriptions[0]["entity"]
+        if entity is None:
+            return None
+        table = inspect(entity).local_table
+        if not isinstance(table, Table) or base.statement.get_final_froms() != [table]:
+            return None
+
+        model = self.filter_model
+        if model is None:
+            return table, []
+        if model.quick_filter_values or (
+            len(model.items) > 1 and model.logic_operator == GridLogicOperator.Or
+        ):
+            return None
+        columns: List[str] = []
+        for item in model.items:
+            if item.operator not in ESTIMABLE_OPERATORS or item.value is None:
+                return None
+            resolved = self.column_resovler(item.field)
+            column = getattr(resolved, "expression", resolved)
+            if not isinstance(column, Column) or column.table is not table:
+                return None
+            if column.name not in columns:
+                columns.append(column.name)
+        return table, columns
+
+    def estimated_total(self, estimator: RowEstimator = estimate_rows) -> TotalCount:
+        """Returns an estimate of the number of rows that exist with the filter.
+
+        When the filter is empty, or only filters indexed columns by equality, the
+        database's statistics are used to estimate the total in constant time. The
+        estimator may return None when no statistics are available, such as when
+        ANALYZE has never been run, in which case the rows are counted.
+
+        Args:
+            estimator (RowEstimator, optional): The estimator used to read the
+                database's statistics. Defaults to the estimator registered for the
+                query's dialect.
+
+        Returns:
+            TotalCount: The estimated total, or the exact total if it could not be
+                estimated.
+        """
+        if self.unsatisfiable:
+            return TotalCount(total=0)
+        estimable = self._get_estimable_columns()
+        if estimable is not None:
+            table, columns = estimable
+            session = cast(Session, self._base_query.session)
+            estimate = estimator(session, table, columns)
+            if estimate is not None:
+                return TotalCount(total=estimate, exact=False, estimated=True)
+        return TotalCount(total=self.total())
 
     @property
     def per_page(self) -> int:
@@ -174,23 +563,788 @@ class DataGridQuery(Generic[_T]):
             List[_T]: The list of individual items located by the query after all
                 models have been applied.
         """
-        items = self.query.all()
+        if self.unsatisfiable:
+            self.has_next_page = False
+            return []
+        if (
+            self.pagination_strategy == PaginationStrategy.KEYSET
+            and self.pagination_model is not None
+        ):
+            items = self._keyset_items()
+        else:
+            items = self._fetch(query=self.query)
         return [factory(item) for item in items] if factory is not None else items
 
-    def pages(self, total: Optional[int] = None) -> int:
+    @overload
+    def iter_items(self, factory: None = ..., chunk_size: int = ...) -> Iterator[_T]:
+        """When a factory function is not provided, simply yield the models.
+
+        Args:
+            factory (None, optional): This is not provided. Defaults to None.
+            chunk_size (int, optional): The number of rows fetched at a time.
+
+        Returns:
+            Iterator[_T]: The models, without conversion.
+        """
+
+    @overload
+    def iter_items(
+        self, factory: Factory[_T, _R], chunk_size: int = ...
+    ) -> Iterator[_R]:
+        """When a factory function is provided, yield the items created by the
+        factory.
+
+        Args:
+            factory (Callable[[_T], _R]): The factory to convert the type(s).
+            chunk_size (int, optional): The number of rows fetched at a time.
+
+        Returns:
+            Iterator[_R]: The created items.
+        """
+
+    def iter_items(
+        self, factory: Optional[Factory[_T, _R]] = None, chunk_size: int = 1000
+    ) -> Union[Iterator[_T], Iterator[_R]]:
+        """Yields the results of the query, after all models have been applied.
+
+        Unlike `items()`, the results are streamed from the database using
+        `yield_per`, so only `chunk_size` rows are held in memory at a time, and each
+        item is converted by the factory as it is retrieved. This is intended for
+        large page sizes, or when no pagination model is provided.
+
+        The session must not be used for other queries until the iterator has been
+        exhausted or closed, and eagerly loaded collections are not supported. When
+        using the keyset pagination strategy, the adjacent keysets are populated
+        once the iterator has been exhausted. Backward keyset pages and the deferred
+        join strategy retrieve the page before yielding it.
+
+        Args:
+            factory (Optional[Callable[[_T], _R]]): The factory function to convert the
+                model into a different type.
+            chunk_size (int, optional): The number of rows fetched from the database
+                at a time. Defaults to 1000.
+
+        Returns:
+            Iterator[_T]: The individual items located by the query after all models
+                have been applied.
+        """
+        if self.unsatisfiable or (
+            self.pagination_model is not None
+            and (
+                self.pagination_strategy == PaginationStrategy.DEFERRED_JOIN
+                or (self.keyset is not None and self.keyset.backward)
+            )
+        ):
+            items: Iterable[_T] = self.items()
+        elif (
+            self.pagination_strategy == PaginationStrategy.KEYSET
+            and self.pagination_model is not None
+        ):
+            items = self._iter_keyset_items(chunk_size=chunk_size)
+        else:
+            items = self.query.yield_per(chunk_size)
+        if factory is not None:
+            return (factory(item) for item in items)
+        return iter(items)
+
+    def _iter_keyset_items(self, chunk_size: int) -> Iterator[_T]:
+        """Streams a forward page of items using the keyset pagination strategy.
+
+        The keyset values of the first and last rows are retained while streaming,
+        and the adjacent keysets are populated once the page has been exhausted.
+
+        Args:
+            chunk_size (int): The number of rows fetched at a time.
+
+        Returns:
+            Iterator[_T]: The page of items, in display order.
+        """
+        entity_count = len(self.query.column_descriptions)
+        rows = cast(
+            Iterable[Sequence[Any]],
+            self.query.limit(self.page_size + 1)
+            .add_columns(*[column for column, _ in self.keyset_columns])
+            .yield_per(chunk_size),
+        )
+        first_values: Optional[Tuple[Any, ...]] = None
+        last_values: Optional[Tuple[Any, ...]] = None
+        count = 0
+        for row in rows:
+            count += 1
+            # the additional row only determines whether another page exists
+            if count > self.page_size:
+                continue
+            last_values = tuple(row[entity_count:])
+            if first_values is None:
+                first_values = last_values
+            yield row[0] if entity_count == 1 else tuple(row[:entity_count])
+        self.previous_keyset = (
+            Keyset(values=first_values, backward=True)
+            if self.keyset is not None and first_values is not None
+            else None
+        )
+        self.next_keyset = (
+            Keyset(values=last_values)
+            if count > self.page_size and last_values is not None
+            else None
+        )
+        self.has_next_page = self.next_keyset is not None
+
+    def _fetch(self, query: "Query[_T]") -> List[_T]:
+        """Retrieves the rows selected by a paginated query.
+
+        When using the deferred join pagination strategy, the primary keys of the
+        page's rows are selected first, and the rows are then loaded by primary key.
+
+        Args:
+            query (Query[_T]): The paginated query.
+
+        Returns:
+            List[_T]: The page of items, in order.
+        """
+        if (
+            self.pagination_strategy == PaginationStrategy.DEFERRED_JOIN
+            and self.pagination_model is not None
+        ):
+            return load_deferred_join_rows(
+                query=self._base_query, keys=get_deferred_join_keys(query=query)
+            )
+        return query.all()
+
+    @overload
+    def items_and_total(self, factory: None = ...) -> Tuple[List[_T], int]:
+        """When a factory function is not provided, simply return the models.
+
+        Args:
+            factory (None, optional): This is not provided. Defaults to None.
+
+        Returns:
+            Tuple[List[_T], int]: The list of models, without conversion, and the
+                total.
+        """
+
+    @overload
+    def items_and_total(self, factory: Factory[_T, _R]) -> Tuple[List[_R], int]:
+        """When a factory function is provided, return a list of items created by
+        the factory.
+
+        Args:
+            factory (Callable[[_T], _R]): The factory to convert the type(s).
+
+        Returns:
+            Tuple[List[_R], int]: The list of created items and the total.
+        """
+
+    def items_and_total(
+        self, factory: Optional[Factory[_T, _R]] = None
+    ) -> Tuple[Union[List[_T], List[_R]], int]:
+        """Returns the page of results and the total number of rows with the filter.
+
+        When the database supports window functions, the total is calculated by a
+        `count(*) OVER ()` column on the page query, so the rows and the total are
+        retrieved by a single statement and the filter is only evaluated once. If the
+        page is empty, such as a page beyond the last page, a plain count is used.
+        With the deferred join pagination strategy, the window function is added to
+        the primary key query.
+
+        The keyset pagination strategy, and databases without window functions, use
+        a separate count query. When a count cache was provided and holds the total,
+        only the page is retrieved.
+
+        Args:
+            factory (Optional[Callable[[_T], _R]]): The factory function to convert the
+                model into a different type.
+
+        Returns:
+            Tuple[List[_T], int]: The list of individual items located by the query
+                after all models have been applied, and the count of total items
+                before pagination, but after filtering.
+        """
+        if self.unsatisfiable:
+            return self.items(factory=factory), 0
+        cached = self._get_cached_total()
+        if cached is not None:
+            return self.items(factory=factory), cached
+        if self.pagination_strategy == PaginationStrategy.KEYSET or (
+            not supports_window_functions(dialect=get_query_dialect(query=self.query))
+        ):
+            total = self.total()
+            return self.items(factory=factory), total
+
+        deferred = (
+            self.pagination_strategy == PaginationStrategy.DEFERRED_JOIN
+            and self.pagination_model is not None
+        )
+        query = (
+            self.query.with_entities(*get_primary_key_columns(query=self.query))
+            if deferred
+            else self.query
+        )
+        entity_count = len(query.column_descriptions)
+        rows = cast(
+            List[Sequence[Any]],
+            query.add_columns(func.count().over()).all(),
+        )
+        if rows:
+            total = int(rows[0][entity_count])
+            if self.count_cache is not None:
+                self.count_cache.set(key=self.count_fingerprint, total=total)
+        else:
+            total = self.total()
+        items: List[_T] = (
+            load_deferred_join_rows(
+                query=self._base_query,
+                keys=[tuple(row[:entity_count]) for row in rows],
+            )
+            if deferred
+            else [
+                row[0] if entity_count == 1 else tuple(row[:entity_count])
+                for row in rows
+            ]
+        )
+        return (
+            [factory(item) for item in items] if factory is not None else items,
+            total,
+        )
+
+    @overload
+    def items_and_total_concurrently(
+        self, factory: None = ..., executor: Optional[Executor] = ...
+    ) -> Tuple[List[_T], int]:
+        """When a factory function is not provided, simply return the models.
+
+        Args:
+            factory (None, optional): This is not provided. Defaults to None.
+            executor (Optional[Executor], optional): The executor which runs the
+                count.
+
+        Returns:
+            Tuple[List[_T], int]: The list of models, without conversion, and the
+                total.
+        """
+
+    @overload
+    def items_and_total_concurrently(
+        self, factory: Factory[_T, _R], executor: Optional[Executor] = ...
+    ) -> Tuple[List[_R], int]:
+        """When a factory function is provided, return a list of items created by
+        the factory.
+
+        Args:
+            factory (Callable[[_T], _R]): The factory to convert the type(s).
+            executor (Optional[Executor], optional): The executor which runs the
+                count.
+
+        Returns:
+            Tuple[List[_R], int]: The list of created items and the total.
+        """
+
+    def items_and_total_concurrently(
+        self,
+        factory: Optional[Factory[_T, _R]] = None,
+        executor: Optional[Executor] = None,
+    ) -> Tuple[Union[List[_T], List[_R]], int]:
+        """Returns the page of results and the total, retrieving them concurrently.
+
+        The total is counted on another thread, using a new session and therefore a
+        separate pooled connection, while the page is retrieved using the query's
+        session. The latency is the maximum of the two queries, rather than their sum.
+        When a count cache was provided and holds the total, only the page is
+        retrieved.
+
+        The query's session must be bound to an engine whose pool can provide a
+        second connection to the same database, which excludes SQLite in-memory
+        databases.
+
+        Args:
+            factory (Optional[Callable[[_T], _R]]): The factory function to convert the
+                model into a different type.
+            executor (Optional[Executor], optional): The executor which runs the
+                count, such as a thread pool shared between requests. Defaults to a
+                single thread created for this call.
+
+        Returns:
+            Tuple[List[_T], int]: The list of individual items located by the query
+                after all models have been applied, and the count of total items
+                before pagination, but after filtering.
+        """
+        if self.unsatisfiable:
+            return self.items(factory=factory), 0
+        cached = self._get_cached_total()
+        if cached is not None:
+            return self.items(factory=factory), cached
+
+        pool = executor if executor is not None else ThreadPoolExecutor(max_workers=1)
+        try:
+            counting = pool.submit(self._count_in_new_session)
+            items = self.items(factory=factory)
+            total = counting.result()
+        finally:
+            if executor is None:
+                pool.shutdown(wait=False)
+        if self.count_cache is not None:
+            self.count_cache.set(key=self.count_fingerprint, total=total)
+        return items, total
+
+    @overload
+    def items_and_has_next_page(self, factory: None = ...) -> Tuple[List[_T], bool]:
+        """When a factory function is not provided, simply return the models.
+
+        Args:
+            factory (None, optional): This is not provided. Defaults to None.
+
+        Returns:
+            Tuple[List[_T], bool]: The list of models, without conversion, and
+                whether another page exists.
+        """
+
+    @overload
+    def items_and_has_next_page(
+        self, factory: Factory[_T, _R]
+    ) -> Tuple[List[_R], bool]:
+        """When a factory function is provided, return a list of items created by
+        the factory.
+
+        Args:
+            factory (Callable[[_T], _R]): The factory to convert the type(s).
+
+        Returns:
+            Tuple[List[_R], bool]: The list of created items and whether another
+                page exists.
+        """
+
+    def items_and_has_next_page(
+        self, factory: Optional[Factory[_T, _R]] = None
+    ) -> Tuple[Union[List[_T], List[_R]], bool]:
+        """Returns the page of results and whether another page exists after it.
+
+        This supports the data grid's unknown row count mode (`rowCount = -1`),
+        where the total is never counted. Instead, one more row than the page size
+        is retrieved and trimmed; its presence means another page exists.
+
+        Args:
+            factory (Optional[Callable[[_T], _R]]): The factory function to convert the
+                model into a different type.
+
+        Returns:
+            Tuple[List[_T], bool]: The list of individual items located by the query
+                after all models have been applied, and whether another page exists.
+        """
+        if (
+            self.unsatisfiable
+            or self.pagination_model is None
+            or self.pagination_strategy == PaginationStrategy.KEYSET
+        ):
+            page = self.items(factory=factory)
+            self.has_next_page = bool(self.has_next_page)
+            return page, self.has_next_page
+
+        items = self._fetch(query=self.query.limit(self.page_size + 1))
+        self.has_next_page = len(items) > self.page_size
+        items = items[: self.page_size]
+        return (
+            [factory(item) for item in items] if factory is not None else items,
+            self.has_next_page,
+        )
+
+    def _get_page_fingerprint(self, page: int, keyset: Optional[Keyset]) -> str:
+        """Calculates the fingerprint of a page, used as the key of the page cache.
+
+        Args:
+            page (int): The page number.
+            keyset (Optional[Keyset]): The boundary of the page, when using the
+                keyset pagination strategy.
+
+        Returns:
+            str: The hexadecimal fingerprint.
+        """
+        return get_page_fingerprint(
+            count_fingerprint=self.count_fingerprint,
+            sort_model=self.sort_model,
+            page_size=self.page_size,
+            position=[self.pagination_strategy, keyset]
+            if self.pagination_strategy == PaginationStrategy.KEYSET
+            else [self.pagination_strategy, page],
+            columns=[str(column) for column in self.projected_columns]
+            if self.projected_columns is not None
+            else None,
+        )
+
+    @property
+    def page_fingerprint(self) -> str:
+        """The fingerprint of the requested page, used as the key of the page cache.
+
+        Returns:
+            str: The hexadecimal fingerprint.
+        """
+        return self._get_page_fingerprint(page=self.page, keyset=self.keyset)
+
+    def cached_items(self, factory: Factory[_T, _R], prefetch: bool = True) -> List[_R]:
+        """Returns the page of serialized results, using the page cache.
+
+        The factory's results are cached rather than the models, as models are bound
+        to the session which loaded them. A single factory should therefore be used
+        with each page cache. A page which isn't cached is retrieved and stored. When
+        no page cache was provided, this is equivalent to `items()`.
+
+        Args:
+            factory (Callable[[_T], _R]): The factory function to convert the model
+                into a serializable type.
+            prefetch (bool, optional): Whether to prefetch the next page in the
+                background. Defaults to True.
+
+        Returns:
+            List[_R]: The list of created items.
+        """
+        if self.page_cache is None or self.pagination_model is None:
+            return self.items(factory=factory)
+        key = self.page_fingerprint
+        cached = self.page_cache.get(key=key)
+        if cached is not None:
+            items: List[_R] = cached.items
+            self.has_next_page = cached.has_next_page
+            self.next_keyset = cached.next_keyset
+            self.previous_keyset = cached.previous_keyset
+        else:
+            items = self.items(factory=factory)
+            self.page_cache.set(
+                key=key,
+                page=CachedPage(
+                    items=items,
+                    has_next_page=self.has_next_page,
+                    next_keyset=self.next_keyset,
+                    previous_keyset=self.previous_keyset,
+                ),
+            )
+        if prefetch and len(items) >= self.page_size:
+            self.prefetch_next_page(factory=factory)
+        return items
+
+    def prefetch_next_page(self, factory: Factory[_T, _R]) -> bool:
+        """Retrieves the next page on the page cache's thread pool.
+
+        The next page is retrieved using a new session, with the same models and
+        options as this query, and stored in the page cache with the serialized rows
+        created by the factory. With the keyset pagination strategy, the current page
+        must have been retrieved first.
+
+        Args:
+            factory (Callable[[_T], _R]): The factory function to convert the model
+                into a serializable type.
+
+        Returns:
+            bool: True if the prefetch was scheduled.
+        """
+        if (
+            self.page_cache is None
+            or self.pagination_model is None
+            or self.has_next_page is False
+        ):
+            return False
+        keyset: Optional[Keyset] = None
+        if self.pagination_strategy == PaginationStrategy.KEYSET:
+            if self.next_keyset is None:
+                return False
+            keyset = self.next_keyset
+        page = self.page + 1
+        pagination_model = self.pagination_model.model_copy(
+            update={"page": page, "cursor": None}
+        )
+        bind = cast(Session, self._base_query.session).get_bind()
+        base_query = self._base_query
+
+        def load() -> CachedPage:
+            with Session(bind=bind) as session:
+                dg_query = DataGridQuery(
+                    query=base_query.with_session(session),
+                    column_resolver=self.column_resovler,
+                    filter_model=self.filter_model,
+                    sort_model=self.sort_model,
+                    pagination_model=pagination_model,
+                    pagination_strategy=self.pagination_strategy,
+                    keyset=keyset,
+                    cursor_codec=self.cursor_codec,
+                    count_cache=self.count_cache,
+                    page_cache=self.page_cache,
+                    fields=self.fields,
+                    column_visibility_model=self.column_visibility_model,
+                    plan_cache=self.plan_cache,
+                    optimize_filter=self.optimize_filter,
+                    quick_filter_index=self.quick_filter_index,
+                )
+                return CachedPage(
+                    items=dg_query.items(factory=factory),
+                    has_next_page=dg_query.has_next_page,
+                    next_keyset=dg_query.next_keyset,
+                    previous_keyset=dg_query.previous_keyset,
+                )
+
+        return self.page_cache.prefetch(
+            key=self._get_page_fingerprint(page=page, keyset=keyset), load=load
+        )
+
+    def _keyset_items(self) -> List[_T]:
+        """Retrieves the page of items using the keyset pagination strategy.
+
+        One additional row is requested to determine whether another page exists in
+        the direction being paged, and the keyset column values are selected
+        alongside each row so the adjacent keysets can be built without inspecting
+        the models.
+
+        Returns:
+            List[_T]: The page of items, in display order.
+        """
+        entity_count = len(self.query.column_descriptions)
+        rows = cast(
+            List[Sequence[Any]],
+            self.query.limit(self.page_size + 1)
+            .add_columns(*[column for column, _ in self.keyset_columns])
+            .all(),
+        )
+        rows = self._set_adjacent_keysets(
+            rows=rows, get_values=lambda row: tuple(row[entity_count:])
+        )
+        return [
+            row[0] if entity_count == 1 else tuple(row[:entity_count]) for row in rows
+        ]
+
+    def _set_adjacent_keysets(
+        self,
+        rows: List[_S],
+        get_values: Callable[[_S], Tuple[Any, ...]],
+    ) -> List[_S]:
+        """Sets the adjacent keysets from a page retrieved with one additional row.
+
+        Args:
+            rows (List[_S]): The rows retrieved, in the order they were retrieved.
+            get_values (Callable[[_S], Tuple[Any, ...]]): Retrieves the keyset column
+                values from a row.
+
+        Returns:
+            List[_S]: The page of rows, in display order.
+        """
+        rows, self.previous_keyset, self.next_keyset = get_keyset_page(
+            rows=rows,
+            page_size=self.page_size,
+            keyset=self.keyset,
+            get_values=get_values,
+        )
+        self.has_next_page = self.next_keyset is not None
+        return rows
+
+    def _get_row_query(self) -> "Query[Any]":
+        """Replaces the query's entity with the entity's mapped columns.
+
+        Selecting columns rather than the entity returns Row objects, which skips
+        creating the models and adding them to the session's identity map. Queries
+        which don't select a single entity are returned as-is.
+
+        Returns:
+            Query[Any]: The paginated query, selecting columns.
+        """
+        descriptions = self.query.column_descriptions
+        entity = descriptions[0]["entity"] if len(descriptions) == 1 else None
+        if entity is None or descriptions[0]["expr"] is not entity:
+            return self.query
+        return self.query.with_entities(
+            *self.projected_columns
+            if self.projected_columns is not None
+            else [
+                getattr(entity, attribute.key)
+                for attribute in inspect(entity).column_attrs
+            ]
+        )
+
+    def _fetch_rows(self) -> List[Row]:
+        """Retrieves the page as rows, without creating models.
+
+        With the keyset pagination strategy, keyset columns which aren't already
+        selected, such as sorted expressions which aren't mapped columns, are appended
+        to the end of each row.
+
+        Returns:
+            List[Row]: The page of rows, in display order.
+        """
+        if self.unsatisfiable:
+            self.has_next_page = False
+            return []
+        query = self._get_row_query()
+        session = cast(Session, query.session)
+        if (
+            self.pagination_strategy != PaginationStrategy.KEYSET
+            or self.pagination_model is None
+        ):
+            return list(session.execute(query.statement).all())
+        selected = [description["expr"] for description in query.column_descriptions]
+        # the position of each keyset column within the row, appending the columns
+        # which aren't already selected
+        positions: List[int] = []
+        missing: List[Any] = []
+        for column, _ in self.keyset_columns:
+            position = next(
+                (
+                    index
+                    for index, other in enumerate(selected)
+                    if same_expression(column, other)
+                ),
+                None,
+            )
+            if position is None:
+                position = len(selected) + len(missing)
+                missing.append(column)
+            positions.append(position)
+        statement = query.limit(self.page_size + 1).add_columns(*missing).statement
+        return self._set_adjacent_keysets(
+            rows=list(session.execute(statement).all()),
+            get_values=lambda row: tuple(row[position] for position in positions),
+        )
+
+    @overload
+    def rows(self, factory: None = ...) -> List[Row]:
+        """When a factory function is not provided, simply return the rows.
+
+        Args:
+            factory (None, optional): This is not provided. Defaults to None.
+
+        Returns:
+            List[Row]: The list of rows, without conversion.
+        """
+
+    @overload
+    def rows(self, factory: Factory[Row, _R]) -> List[_R]:
+        """When a factory function is provided, return a list of items created by
+        the factory.
+
+        Args:
+            factory (Callable[[Row], _R]): The factory to convert the rows.
+
+        Returns:
+            List[_R]: The list of created items.
+        """
+
+    def rows(
+        self, factory: Optional[Factory[Row, _R]] = None
+    ) -> Union[List[Row], List[_R]]:
+        """Returns the page of results as rows, bypassing the ORM.
+
+        The entity's mapped columns are selected and executed as a Core statement,
+        so no models are created or added to the session. This is significantly
+        cheaper than `items()` for read-only pages which are serialized anyway. The
+        deferred join pagination strategy is treated as LIMIT / OFFSET.
+
+        Args:
+            factory (Optional[Callable[[Row], _R]]): The factory function to convert
+                each row into a different type.
+
+        Returns:
+            List[Row]: The rows located by the query after all models have been
+                applied.
+        """
+        rows = self._fetch_rows()
+        return [factory(row) for row in rows] if factory is not None else rows
+
+    @overload
+    def mappings(self, factory: None = ...) -> List[RowMapping]:
+        """When a factory function is not provided, simply return the mappings.
+
+        Args:
+            factory (None, optional): This is not provided. Defaults to None.
+
+        Returns:
+            List[RowMapping]: The list of mappings, without conversion.
+        """
+
+    @overload
+    def mappings(self, factory: Factory[RowMapping, _R]) -> List[_R]:
+        """When a factory function is provided, return a list of items created by
+        the factory.
+
+        Args:
+            factory (Callable[[RowMapping], _R]): The factory to convert the
+                mappings.
+
+        Returns:
+            List[_R]: The list of created items.
+        """
+
+    def mappings(
+        self, factory: Optional[Factory[RowMapping, _R]] = None
+    ) -> Union[List[RowMapping], List[_R]]:
+        """Returns the page of results as mappings of column name to value, bypassing
+        the ORM.
+
+        This behaves like `rows()`, and is useful when the rows are serialized as
+        dictionaries, such as `mappings(factory=dict)`.
+
+        Args:
+            factory (Optional[Callable[[RowMapping], _R]]): The factory function to
+                convert each mapping into a different type.
+
+        Returns:
+            List[RowMapping]: The mappings located by the query after all models have
+                been applied.
+        """
+        # Row._mapping is public API, the underscore avoids conflicts with column names
+        mappings = [row._mapping for row in self._fetch_rows()]  # noqa: SLF001
+        return [factory(item) for item in mappings] if factory is not None else mappings
+
+    def _encode_keyset(self, keyset: Optional[Keyset]) -> Optional[str]:
+        """Encodes a keyset into an opaque cursor using the cursor codec.
+
+        Args:
+            keyset (Optional[Keyset]): The keyset being encoded.
+
+        Raises:
+            ValueError: Raised when no cursor codec was provided.
+
+        Returns:
+            Optional[str]: The cursor, or None if the keyset is None.
+        """
+        if keyset is None:
+            return None
+        if self.cursor_codec is None:
+            raise ValueError("A cursor codec is required to encode cursors")
+        return self.cursor_codec.encode(values=keyset.values, backward=keyset.backward)
+
+    @property
+    def next_cursor(self) -> Optional[str]:
+        """Returns the cursor of the next page.
+
+        Returns:
+            Optional[str]: None if there is no next page, or `items()` has not been
+                called, otherwise the opaque cursor of the next page.
+        """
+        return self._encode_keyset(keyset=self.next_keyset)
+
+    @property
+    def previous_cursor(self) -> Optional[str]:
+        """Returns the cursor of the previous page.
+
+        Returns:
+            Optional[str]: None if there is no previous page, or `items()` has not
+                been called, otherwise the opaque cursor of the previous page.
+        """
+        return self._encode_keyset(keyset=self.previous_keyset)
+
+    def pages(self, total: Union[int, TotalCount, None] = None) -> int:
         """Returns the number of pages to display all results.
 
         Args:
-            total (Optional[int], optional): The total number of results. This may
-                be provided to avoid the overhead of an additional database query to
-                retrieve the total. Defaults to None.
+            total (Union[int, TotalCount, None], optional): The total number of
+                results. This may be provided to avoid the overhead of an additional
+                database query to retrieve the total. When a capped TotalCount is
+                provided, at least one more row than the total exists, so the result
+                is the minimum number of pages. Defaults to None.
 
         Returns:
             int: The number of pages required to display all results at the current
                 page size.
         """
-        if not total:
+        if total is None:
             total = self.total()
+        elif isinstance(total, TotalCount):
+            capped = not total.exact and not total.estimated
+            total = total.total + 1 if capped else total.total
         return int(ceil(total / float(self.per_page)))
 
     @property
@@ -0,0 +1,63 @@
+"""The response module contains helpers for building data grid responses.
+
+The helpers return plain dictionaries, so they may be serialized by any web framework,
+such as with Flask's `jsonify`.
+"""
+
+from typing import Any, List, Optional, TypeVar
+
+from typing_extensions import Literal, TypedDict
+
+from mui.v6.integrations.sqlalchemy.structures.factory import Factory
+from mui.v6.integrations.sqlalchemy.structures.query import DataGridQuery
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+class UnknownRowCountResponse(TypedDict):
+    """A page of results for a data grid using the unknown row count mode.
+
+    Documentation:
+        https://mui.com/x/react-data-grid/pagination/#unknown-row-count
+
+    Attributes:
+        items (list[Any]): The page of results.
+        page (int): The current page number.
+        pageSize (int): The size of each page.
+        hasNextPage (bool): Whether another page exists after this page.
+        rowCount (-1): The row count, which is always -1 to indicate that the total
+            number of rows is unknown.
+    """
+
+    items: List[Any]
+    page: int
+    pageSize: int
+    hasNextPage: bool
+    rowCount: Literal[-1]
+
+
+def get_unknown_row_count_response(
+    query: DataGridQuery[_T], factory: Optional[Factory[_T, _R]] = None
+) -> UnknownRowCountResponse:
+    """Builds a response for the data grid's unknown row count mode.
+
+    The total is never counted, the page is retrieved with a single statement which
+    also determines whether another page exists.
+
+    Args:
+        query (DataGridQuery[_T]): The data grid query being responded to.
+        factory (Optional[Callable[[_T], _R]]): The factory function to convert the
+            model into a different type.
+
+    Returns:
+        UnknownRowCountResponse: The response, without a total.
+    """
+    items, has_next_page = query.items_and_has_next_page(factory=factory)
+    return {
+        "items": list(items),
+        "page": query.page,
+        "pageSize": query.page_size,
+        "hasNextPage": has_next_page,
+        "rowCount": -1,
+    }
@@ -0,0 +1,35 @@
+"""The total module contains the TotalCount data structure.
+
+Counting every row which matches a filter can be the most expensive part of a data
+grid request. The TotalCount allows a count which is not exact, such as a count which
+stopped at a cap or an estimate from the database's statistics, to be reported
+alongside whether it is exact.
+"""
+
+from typing import NamedTuple
+
+
+class TotalCount(NamedTuple):
+    """The total number of rows which match the filter.
+
+    Attributes:
+        total (int): The number of rows. When the count is not exact, and not
+            estimated, this is a lower bound, and more rows than this may exist.
+        exact (bool): True when the total is the exact number of rows.
+        estimated (bool): True when the total is an estimate, which may be more or
+            less than the exact number of rows.
+    """
+
+    total: int
+    exact: bool = True
+    estimated: bool = False
+
+    def __str__(self) -> str:
+        """Formats the total for display, such as "1000", "1000+", or "~1000".
+
+        Returns:
+            str: The formatted total.
+        """
+        if self.exact:
+            return str(self.total)
+        return f"~{self.total}" if self.estimated else f"{self.total}+"
@@ -1,9 +1,10 @@
 from datetime import datetime, timedelta
 from math import floor
-from typing import Generator, Union
+from pathlib import Path
+from typing import Any, Generator, List, Union
 
-from pytest import fixture
-from sqlalchemy import create_engine
+from pytest import TempPathFactory, fixture
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Query, Session
 
@@ -14,6 +15,8 @@ GENERATED_PARENT_MODEL_COUNT = 400
 GENERATED_CHILD_MODEL_COUNT = 100
 GENERATED_PARENT_GROUPS = 10
 PARENT_MODELS_PER_GROUP = floor(GENERATED_PARENT_MODEL_COUNT / GENERATED_PARENT_GROUPS)
+FILE_DATABASE_PARENT_MODEL_COUNT = 50
+NULLABLE_PARENT_MODEL_COUNT = 20
 
 PARENT_MODEL_RESOLVABLE_FIELDS = (
     "created_at",
@@ -182,6 +185,23 @@ def engine() -> Generator[Engine, None, None]:
     Base.metadata.drop_all(bind=engine)
 
 
+@fixture()
+def executed_statements(engine: Engine) -> Generator[List[str], None, None]:
+    """Records the SQL statements executed by the engine during a test.
+
+    Yields:
+        List[str]: The executed statements, in execution order.
+    """
+    statements: List[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
 @fixture(scope="session")
 def session(engine: Engine, parent_model_count: int) -> Generator[Session, None, None]:
     """The SQLAlchemy session, after committing models to the database.
@@ -227,3 +247,60 @@ def joined_query(session: Session) -> Generator["Query[ChildModel]", None, None]
 @fixture(scope="module")
 def resolver() -> Resolver:
     return query_resolver
+
+
+@fixture(scope="session")
+def database_file(tmp_path_factory: TempPathFactory) -> Path:
+    """A database file containing parent models, for tests which use multiple
+    connections, such as background threads, that must see the same rows.
+
+    Returns:
+        Path: The path of the SQLite database file.
+    """
+    path = tmp_path_factory.mktemp("database") / "test.db"
+    engine = create_engine(url=f"sqlite:///{path}", future=True)
+    Base.metadata.create_all(bind=engine)
+    with Session(bind=engine, future=True) as session:
+        session.add_all(
+            ParentModel(name=f"ParentModel {i:02}", grouping_id=i % 10)
+            for i in range(1, FILE_DATABASE_PARENT_MODEL_COUNT + 1)
+        )
+        session.commit()
+    engine.dispose()
+    return path
+
+
+@fixture(scope="session")
+def file_engine(database_file: Path) -> Generator[Engine, None, None]:
+    """The SQLAlchemy engine of the database file.
+
+    Yields:
+        Engine: The SQLAlchemy engine
+    """
+    engine = create_engine(url=f"sqlite:///{database_file}", future=True)
+    yield engine
+    engine.dispose()
+
+
+@fixture(scope="session")
+def nullable_query() -> Generator["Query[ParentModel]", None, None]:
+    """A query of a database separate from the shared fixture database, where the
+    null_field of every fourth parent model is NULL, and the remaining values repeat.
+
+    Yields:
+        Query[ParentModel]: The SQLAlchemy query
+    """
+    engine = create_engine(url="sqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    with Session(bind=engine, future=True) as session:
+        session.add_all(
+            ParentModel(
+                name=f"ParentModel {i:02}",
+                grouping_id=i % 2,
+                null_field=None if i % 4 == 0 else i % 3,
+            )
+            for i in range(1, NULLABLE_PARENT_MODEL_COUNT + 1)
+        )
+        session.commit()
+        yield session.query(ParentModel)
+    engine.dispose()
@@ -0,0 +1,48 @@
+import csv
+import json
+from datetime import datetime
+from io import StringIO
+
+from pytest import raises
+
+from mui.v6.export import iter_buffered, iter_csv, iter_export, iter_ndjson
+
+ROWS = [
+    {"id": 1, "name": "First, with a comma", "created_at": datetime(2023, 1, 1)},
+    {"id": 2, "name": 'Second "quoted"', "created_at": datetime(2023, 1, 2)},
+]
+
+
+def test_iter_csv() -> None:
+    lines = list(iter_csv(rows=iter(ROWS), fields=["id", "name"]))
+    assert len(lines) == len(ROWS)
+    parsed = list(csv.DictReader(StringIO("".join(lines))))
+    assert parsed == [{"id": str(row["id"]), "name": row["name"]} for row in ROWS]
+
+
+def test_iter_csv_defaults_to_first_row_keys() -> None:
+    header = "".join(iter_csv(rows=ROWS)).splitlines()[0]
+    assert header == "id,name,created_at"
+
+
+def test_iter_csv_writes_header_without_rows() -> None:
+    assert "".join(iter_csv(rows=[], fields=["id", "name"])) == "id,name\r\n"
+
+
+def test_iter_ndjson() -> None:
+    lines = list(iter_ndjson(rows=ROWS, fields=["id", "created_at"]))
+    assert [json.loads(line) for line in lines] == [
+        {"id": 1, "created_at": "2023-01-01 00:00:00"},
+        {"id": 2, "created_at": "2023-01-02 00:00:00"},
+    ]
+    assert all(line.endswith("\n") for line in lines)
+
+
+def test_iter_export_rejects_unknown_format() -> None:
+    with raises(ValueError, match="Invalid export format"):
+        iter_export(rows=ROWS, export_format="xml")  # type: ignore[arg-type]
+
+
+def test_iter_buffered() -> None:
+    chunks = list(iter_buffered(lines=["ab", "cd", "ef", "g"], size=4))
+    assert chunks == ["abcd", "efg"]
@@ -0,0 +1,127 @@
+import enum
+from datetime import datetime
+from decimal import Decimal
+from io import BytesIO
+from typing import Any, Dict
+from uuid import UUID, uuid4
+
+from pytest import importorskip, mark
+from sqlalchemy import types
+from sqlalchemy.orm import Query
+
+from mui.v6.grid import RequestGridModels
+from mui.v6.grid.sort import GridSortDirection, GridSortItem
+from mui.v6.integrations.sqlalchemy import iter_export_items
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+
+pa = importorskip("pyarrow")
+ipc = importorskip("pyarrow.ipc")
+pq = importorskip("pyarrow.parquet")
+
+from mui.v6.integrations.arrow import (  # noqa: E402
+    get_arrow_schema,
+    get_arrow_type,
+    iter_arrow_ipc,
+    iter_parquet,
+    iter_record_batches,
+)
+
+FIELDS = ["id", "created_at", "grouping_id", "null_field", "name"]
+
+
+class Color(enum.Enum):
+    RED = 1
+
+
+@mark.parametrize(
+    ("type_", "arrow_type", "value", "converted"),
+    (
+        (types.Integer(), pa.int64(), 1, 1),
+        (types.Boolean(), pa.bool_(), True, True),
+        (types.Numeric(10, 2), pa.decimal128(10, 2), Decimal("1.5"), Decimal("1.5")),
+        (types.Numeric(), pa.float64(), Decimal("1.5"), 1.5),
+        (types.DateTime(timezone=True), pa.timestamp("us", tz="UTC"), None, None),
+        (types.Enum(Color), pa.string(), Color.RED, "RED"),
+        (types.JSON(), pa.string(), {"a": 1}, '{"a": 1}'),
+        (types.PickleType(), pa.binary(), b"", b""),
+        (types.NullType(), pa.string(), UUID(int=1), str(UUID(int=1))),
+    ),
+)
+def test_get_arrow_type(
+    type_: Any, arrow_type: Any, value: Any, converted: Any
+) -> None:
+    result, converter = get_arrow_type(type_)
+    assert result == arrow_type
+    assert (converter(value) if converter else value) == converted
+
+
+def test_schema_uses_resolved_column_types(resolver: Resolver) -> None:
+    schema, converters = get_arrow_schema(fields=FIELDS, resolver=resolver)
+    assert schema.names == FIELDS
+    assert schema.field("id").type == pa.int64()
+    assert schema.field("created_at").type == pa.timestamp("us", tz="UTC")
+    assert schema.field("name").type == pa.string()
+    assert not schema.field("name").nullable
+    assert schema.field("null_field").nullable
+    assert converters == {}
+
+
+def test_record_batches_are_bounded() -> None:
+    schema = pa.schema([pa.field("id", pa.int64()), pa.field("key", pa.string())])
+    rows = ({"id": index, "key": uuid4(), "extra": index} for index in range(25))
+    batches = list(
+        iter_record_batches(
+            rows=rows, schema=schema, converters={"key": str}, batch_size=10
+        )
+    )
+    assert [batch.num_rows for batch in batches] == [10, 10, 5]
+    assert batches[-1].column(0).to_pylist() == list(range(20, 25))
+
+
+def _factory(item: ParentModel) -> Dict[str, Any]:
+    return {field: getattr(item, field) for field in FIELDS}
+
+
+def _export_rows(query: "Query[ParentModel]", resolver: Resolver) -> Any:
+    return iter_export_items(
+        query=query,
+        request_model=RequestGridModels(
+            sort_model=[GridSortItem(field="id", sort=GridSortDirection.ASC)]
+        ),
+        column_resolver=resolver,
+        factory=_factory,
+        chunk_size=100,
+    )
+
+
+def test_arrow_ipc_stream(query: "Query[ParentModel]", resolver: Resolver) -> None:
+    schema, converters = get_arrow_schema(fields=FIELDS, resolver=resolver)
+    batches = iter_record_batches(
+        rows=_export_rows(query=query, resolver=resolver),
+        schema=schema,
+        converters=converters,
+        batch_size=64,
+    )
+    data = b"".join(iter_arrow_ipc(batches=batches, schema=schema))
+    table = ipc.open_stream(BytesIO(data)).read_all()
+    assert table.schema == schema
+    assert table.column("id").to_pylist() == sorted(
+        item.id for item in query.order_by(None)
+    )
+    assert isinstance(table.column("created_at")[0].as_py(), datetime)
+
+
+def test_parquet(query: "Query[ParentModel]", resolver: Resolver) -> None:
+    schema, converters = get_arrow_schema(fields=FIELDS, resolver=resolver)
+    batches = iter_record_batches(
+        rows=_export_rows(query=query, resolver=resolver),
+        schema=schema,
+        converters=converters,
+        batch_size=64,
+    )
+    chunks = list(iter_parquet(batches=batches, schema=schema))
+    assert len(chunks) > 1
+    parquet_file = pq.ParquetFile(BytesIO(b"".join(chunks)))
+    assert parquet_file.metadata.num_rows == query.count()
+    assert parquet_file.num_row_groups == -(-query.count() // 64)
@@ -0,0 +1,59 @@
+from json import dumps
+from typing import Dict, List
+from urllib.parse import quote
+
+from flask import Flask
+from hypothesis import given
+from hypothesis import strategies as st
+
+from mui.v6.integrations.flask import (
+    get_grid_column_fields_from_request,
+    get_grid_column_visibility_model_from_request,
+    get_grid_models_from_request,
+)
+
+app = Flask(__name__)
+
+
+@given(st.dictionaries(st.text(min_size=1), st.booleans()))
+def test_parse_grid_column_visibility_model_from_flask_request(
+    column_visibility_model: Dict[str, bool],
+) -> None:
+    key = "column_visibility_model"
+    with app.test_request_context(
+        path=f"/?{key}={quote(dumps(column_visibility_model))}"
+    ):
+        assert get_grid_column_visibility_model_from_request(key=key) == (
+            column_visibility_model
+        )
+
+
+@given(st.lists(st.text(min_size=1)))
+def test_parse_grid_column_fields_from_flask_request(fields: List[str]) -> None:
+    with app.test_request_context(path=f"/?fields={quote(dumps(fields))}"):
+        assert get_grid_column_fields_from_request() == fields
+
+
+def test_missing_columns_models_use_defaults() -> None:
+    with app.test_request_context(path="/"):
+        assert get_grid_column_fields_from_request() is None
+        model = get_grid_models_from_request()
+        assert model.column_visibility_model == {}
+        assert model.fields is None
+
+
+def test_columns_models_are_parsed_when_keys_are_provided() -> None:
+    query_string = (
+        f"column_visibility_model={quote(dumps({'name': False}))}"
+        f"&fields={quote(dumps(['name']))}"
+    )
+    with app.test_request_context(path=f"/?{query_string}"):
+        model = get_grid_models_from_request()
+        assert model.column_visibility_model == {}
+        assert model.fields is None
+        model = get_grid_models_from_request(
+            column_visibility_model_key="column_visibility_model",
+            fields_key="fields",
+        )
+        assert model.column_visibility_model == {"name": False}
+        assert model.fields == ["name"]
@@ -0,0 +1,30 @@
+from flask import Flask
+
+from mui.v6.integrations.flask import get_export_response
+
+app = Flask(__name__)
+
+ROWS = [{"id": index, "name": f"Row {index}"} for index in range(3)]
+
+
+def test_csv_export_response() -> None:
+    with app.test_request_context(path="/"):
+        response = get_export_response(rows=iter(ROWS), fields=["id", "name"])
+        assert response.is_streamed
+        assert response.mimetype == "text/csv"
+        assert response.headers["Content-Disposition"] == (
+            'attachment; filename="export.csv"'
+        )
+        body = response.get_data(as_text=True)
+    assert body.splitlines() == ["id,name", "0,Row 0", "1,Row 1", "2,Row 2"]
+
+
+def test_ndjson_export_response() -> None:
+    with app.test_request_context(path="/"):
+        response = get_export_response(
+            rows=ROWS, export_format="ndjson", filename="rows"
+        )
+        assert response.mimetype == "application/x-ndjson"
+        assert 'filename="rows.ndjson"' in response.headers["Content-Disposition"]
+        body = response.get_data(as_text=True)
+    assert len(body.splitlines()) == len(ROWS)
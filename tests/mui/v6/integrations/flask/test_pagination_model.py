@@ -4,7 +4,7 @@ from flask import Flask
 from hypothesis import given
 from hypothesis import strategies as st
 
-from mui.v6.grid.pagination.model import GridPaginationModel
+from mui.v6.grid.pagination import GridCursorCodec, GridPaginationModel
 from mui.v6.integrations.flask.pagination.model import (
     get_grid_pagination_model_from_request,
 )
@@ -46,3 +46,19 @@ def test_parse_grid_pagination_model_from_flask_request_with_key(
             assert model.page_size >= 1
             assert instance.page == instance.page
             assert model.page_size == instance.page_size
+
+
+def test_parse_grid_pagination_model_from_flask_request_with_cursor() -> None:
+    cursor = GridCursorCodec(secret="test-secret").encode(values=[1, "name"])
+    with app.app_context():
+        with app.test_request_context(path=f"/?pageSize=25&cursor={cursor}"):
+            model = get_grid_pagination_model_from_request()
+        assert model.cursor == cursor
+        assert model.page_size == 25  # noqa: PLR2004
+
+        query_str = quote(
+            GridPaginationModel(page_size=25, cursor=cursor).model_dump_json()
+        )
+        with app.test_request_context(path=f"/?pagination_model={query_str}"):
+            model = get_grid_pagination_model_from_request(key="pagination_model")
+        assert model.cursor == cursor
@@ -0,0 +1,142 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+from pytest import raises
+from sqlalchemy.orm import Query
+
+from mui.v6.grid import GridFilterItem, GridFilterModel, GridPaginationModel
+from mui.v6.integrations.sqlalchemy import CountCache, DataGridQuery, FullTextIndex
+from mui.v6.integrations.sqlalchemy.cache import (
+    CachedCount,
+    LRUCountCacheBackend,
+    get_count_fingerprint,
+)
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+
+FILTER_MODEL = GridFilterModel(
+    items=[
+        GridFilterItem(id=1, field="grouping_id", operator=">", value=4),
+        GridFilterItem(id=2, field="name", operator="contains", value="1"),
+    ]
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_backend_evicts_least_recently_used() -> None:
+    backend = LRUCountCacheBackend(maxsize=2)
+    backend.set("a", CachedCount(total=1, stored_at=0))
+    backend.set("b", CachedCount(total=2, stored_at=0))
+    assert backend.get("a") is not None
+    backend.set("c", CachedCount(total=3, stored_at=0))
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert len(backend) == 2  # noqa: PLR2004
+    with raises(ValueError):
+        LRUCountCacheBackend(maxsize=0)
+
+
+def test_count_cache_expires_after_ttl() -> None:
+    clock = FakeClock()
+    cache = CountCache(ttl=10, clock=clock)
+    counts = iter((1, 2))
+    assert cache.get_or_count(key="key", count=lambda: next(counts)) == 1
+    clock.now = 9
+    assert cache.get_or_count(key="key", count=lambda: next(counts)) == 1
+    clock.now = 10
+    assert cache.get_or_count(key="key", count=lambda: next(counts)) == 2  # noqa: PLR2004
+    assert (cache.hits, cache.misses, cache.stale_hits) == (1, 2, 0)
+
+
+def test_count_cache_serves_stale_while_revalidating() -> None:
+    clock = FakeClock()
+    executor = ThreadPoolExecutor(max_workers=1)
+    cache = CountCache(ttl=10, stale_ttl=5, executor=executor, clock=clock)
+    cache.set(key="key", total=1)
+    refreshes: List[int] = []
+
+    def refresh() -> int:
+        refreshes.append(2)
+        return 2
+
+    clock.now = 12
+    assert cache.get_or_count(key="key", count=lambda: 3, refresh=refresh) == 1
+    executor.shutdown(wait=True)
+    assert refreshes == [2]
+    assert cache.get_or_count(key="key", count=lambda: 3, refresh=refresh) == 2  # noqa: PLR2004
+    assert cache.stale_hits == 1
+
+    # beyond the stale window, the rows are counted again
+    clock.now = 30
+    assert cache.get_or_count(key="key", count=lambda: 3, refresh=refresh) == 3  # noqa: PLR2004
+
+
+def test_fingerprint_ignores_item_order_and_ids(query: "Query[ParentModel]") -> None:
+    reordered = GridFilterModel(
+        items=[
+            GridFilterItem(id=7, field="name", operator="contains", value="1"),
+            GridFilterItem(id=8, field="grouping_id", operator=">", value=4),
+        ]
+    )
+    changed = GridFilterModel(
+        items=[GridFilterItem(field="grouping_id", operator=">", value=5)]
+    )
+    fingerprint = get_count_fingerprint(query=query, model=FILTER_MODEL)
+    assert fingerprint == get_count_fingerprint(query=query, model=reordered)
+    assert fingerprint != get_count_fingerprint(query=query, model=changed)
+    assert fingerprint != get_count_fingerprint(
+        query=query.filter(ParentModel.id > 1), model=FILTER_MODEL
+    )
+
+
+def test_count_fingerprint_ignores_column_visibility(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    def count_fingerprint(
+        filter_model: GridFilterModel = FILTER_MODEL, **kwargs: Any
+    ) -> str:
+        return DataGridQuery(
+            query=query, column_resolver=resolver, filter_model=filter_model, **kwargs
+        ).count_fingerprint
+
+    fingerprint = count_fingerprint()
+    assert fingerprint == count_fingerprint(column_visibility_model={"name": False})
+    assert fingerprint == count_fingerprint(fields=["id", "created_at"])
+    # the quick filter values are only searched when an index is provided
+    quick_filter_model = FILTER_MODEL.model_copy(update={"quick_filter_values": ["1"]})
+    assert count_fingerprint(filter_model=quick_filter_model) != count_fingerprint(
+        filter_model=quick_filter_model,
+        quick_filter_index=FullTextIndex(
+            name="parent_fts", rowid=ParentModel.id, columns=["name"]
+        ),
+    )
+
+
+def test_paging_through_filtered_view_counts_once(
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    executed_statements: List[str],
+) -> None:
+    cache = CountCache()
+    totals = set()
+    for page in range(3):
+        dg_query = DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            filter_model=FILTER_MODEL,
+            pagination_model=GridPaginationModel(page=page, page_size=5),
+            count_cache=cache,
+        )
+        totals.add(dg_query.total())
+        dg_query.items_and_total()
+    counts = [statement for statement in executed_statements if "count(" in statement]
+    assert len(counts) == 1
+    assert len(totals) == 1
+    assert (cache.hits, cache.misses) == (5, 1)
@@ -0,0 +1,126 @@
+from typing import Any, Dict, List, Optional
+
+from pytest import LogCaptureFixture, mark
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from mui.v6.grid import (
+    GridCursorCodec,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+)
+from mui.v6.integrations.sqlalchemy import DataGridQuery, PageCache, PaginationStrategy
+from mui.v6.integrations.sqlalchemy.cache import CachedPage
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.conftest import FILE_DATABASE_PARENT_MODEL_COUNT as ROW_COUNT
+from tests.fixtures.sqlalchemy import ParentModel
+
+PAGE_SIZE = 10
+SORT_MODEL = [GridSortItem(field="name", sort=GridSortDirection.ASC)]
+
+
+def factory(model: ParentModel) -> Dict[str, object]:
+    return {"id": model.id, "name": model.name}
+
+
+def test_page_cache_expires_and_evicts() -> None:
+    now = [0.0]
+    cache = PageCache(ttl=5, maxsize=1, clock=lambda: now[0])
+    cache.set(key="a", page=CachedPage(items=[1]))
+    assert cache.get(key="a") == CachedPage(items=[1])
+    cache.set(key="b", page=CachedPage(items=[2]))
+    assert cache.get(key="a") is None
+    now[0] = 5
+    assert cache.get(key="b") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_page_cache_skips_prefetch_when_saturated() -> None:
+    cache = PageCache(max_workers=1, max_pending=1)
+    assert cache.prefetch(key="a", load=lambda: CachedPage(items=[]))
+    # the key is pending or stored, either way it isn't loaded twice
+    assert not cache.prefetch(key="a", load=lambda: CachedPage(items=[]))
+    cache.shutdown()
+
+
+def test_failed_prefetch_is_logged(caplog: LogCaptureFixture) -> None:
+    def load() -> CachedPage:
+        raise RuntimeError("database is unavailable")
+
+    cache = PageCache()
+    assert cache.prefetch(key="a", load=load)
+    cache.shutdown(wait=True)
+    assert cache.prefetch_errors == 1
+    assert "a" not in cache
+    (record,) = caplog.records
+    assert record.getMessage() == "Failed to prefetch the page a"
+    assert record.exc_info is not None
+    assert str(record.exc_info[1]) == "database is unavailable"
+
+
+@mark.parametrize("strategy", (PaginationStrategy.OFFSET, PaginationStrategy.KEYSET))
+def test_paging_forward_is_served_from_prefetch(
+    strategy: PaginationStrategy, file_engine: Engine, resolver: Resolver
+) -> None:
+    cache = PageCache(ttl=60)
+    codec = GridCursorCodec(secret="test-secret")
+    seen: List[object] = []
+    cursor: Optional[str] = None
+    with Session(bind=file_engine, future=True) as session:
+        for page in range(ROW_COUNT // PAGE_SIZE):
+            dg_query = DataGridQuery(
+                query=session.query(ParentModel),
+                column_resolver=resolver,
+                sort_model=SORT_MODEL,
+                pagination_model=GridPaginationModel(
+                    page=page, page_size=PAGE_SIZE, cursor=cursor
+                ),
+                pagination_strategy=strategy,
+                cursor_codec=codec,
+                page_cache=cache,
+            )
+            seen.extend(dg_query.cached_items(factory=factory))
+            cursor = dg_query.next_cursor
+            # wait for the prefetch, as the next click would arrive later
+            cache.shutdown(wait=True)
+    assert seen == [
+        {"id": i, "name": f"ParentModel {i:02}"} for i in range(1, ROW_COUNT + 1)
+    ]
+    assert cache.misses == 1
+    assert cache.hits == ROW_COUNT // PAGE_SIZE - 1
+    assert cache.prefetch_errors == 0
+
+
+def test_current_and_prefetched_pages_are_cached(
+    file_engine: Engine, resolver: Resolver
+) -> None:
+    cache = PageCache(ttl=60)
+    statements: List[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(file_engine, "before_cursor_execute", before_cursor_execute)
+    with Session(bind=file_engine, future=True) as session:
+        for page in (0, 0, 1):
+            dg_query = DataGridQuery(
+                query=session.query(ParentModel),
+                column_resolver=resolver,
+                sort_model=SORT_MODEL,
+                pagination_model=GridPaginationModel(page=page, page_size=PAGE_SIZE),
+                page_cache=cache,
+                fields=["id", "name"],
+            )
+            assert dg_query.cached_items(factory=factory) == [
+                {"id": i, "name": f"ParentModel {i:02}"}
+                for i in range(page * PAGE_SIZE + 1, (page + 1) * PAGE_SIZE + 1)
+            ]
+            cache.shutdown(wait=True)
+    event.remove(file_engine, "before_cursor_execute", before_cursor_execute)
+    # the current page was stored on the miss, and the next pages were prefetched
+    assert (cache.misses, cache.hits, cache.prefetched) == (1, 2, 2)
+    # the prefetched pages only load the displayed columns
+    assert len(statements) == 3  # noqa: PLR2004
+    assert not any("grouping_id" in statement for statement in statements)
@@ -0,0 +1,152 @@
+from typing import Any, List
+
+from pytest import mark, raises
+from sqlalchemy.orm import Query
+
+from mui.v6.grid import (
+    GridFilterItem,
+    GridFilterModel,
+    GridLogicOperator,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+    GridSortModel,
+)
+from mui.v6.integrations.sqlalchemy import DataGridQuery, PaginationStrategy, PlanCache
+from mui.v6.integrations.sqlalchemy.cache import get_query_shape
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+
+SORT_MODEL = [GridSortItem(field="name", sort=GridSortDirection.DESC)]
+
+
+def _filter_model(
+    *items: GridFilterItem, logic_operator: GridLogicOperator = GridLogicOperator.And
+) -> GridFilterModel:
+    return GridFilterModel(items=list(items), logic_operator=logic_operator)
+
+
+FILTER_MODELS = (
+    _filter_model(GridFilterItem(field="grouping_id", operator=">", value=4)),
+    _filter_model(GridFilterItem(field="grouping_id", operator=">", value=None)),
+    _filter_model(
+        GridFilterItem(field="grouping_id", operator="isAnyOf", value=[1, 2, 3]),
+        GridFilterItem(field="name", operator="contains", value="1"),
+        logic_operator=GridLogicOperator.Or,
+    ),
+    _filter_model(GridFilterItem(field="grouping_id", operator="isAnyOf", value=[])),
+    _filter_model(GridFilterItem(field="null_field", operator="isEmpty")),
+    _filter_model(GridFilterItem(field="name", operator="startsWith", value="Child")),
+    _filter_model(
+        GridFilterItem(field="created_at", operator="after", value="2020-01-01")
+    ),
+    _filter_model(GridFilterItem(field="grouping_id", operator="==", value=None)),
+)
+
+
+def _ids(dg_query: "DataGridQuery[ParentModel]") -> List[Any]:
+    return [item.id for item in dg_query.items()]
+
+
+@mark.parametrize("filter_model", FILTER_MODELS)
+@mark.parametrize(
+    "pagination_strategy",
+    (
+        PaginationStrategy.OFFSET,
+        PaginationStrategy.DEFERRED_JOIN,
+        PaginationStrategy.KEYSET,
+    ),
+)
+def test_plan_matches_unplanned_query(
+    filter_model: GridFilterModel,
+    pagination_strategy: PaginationStrategy,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    def build(plan_cache: Any = None) -> "DataGridQuery[ParentModel]":
+        return DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            filter_model=filter_model,
+            sort_model=SORT_MODEL,
+            pagination_model=GridPaginationModel(page=0, page_size=15),
+            pagination_strategy=pagination_strategy,
+            plan_cache=plan_cache,
+        )
+
+    plan_cache = PlanCache()
+    planned = build(plan_cache=plan_cache)
+    expected = build()
+    assert planned.plan is not None
+    assert _ids(planned) == _ids(expected)
+    assert planned.total() == expected.total()
+
+
+def test_plan_is_reused_with_different_values(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    plan_cache = PlanCache()
+    results = []
+    for values in ([1, 2], [3, 4, 5, 6], [7]):
+        filter_model = _filter_model(
+            GridFilterItem(field="grouping_id", operator="isAnyOf", value=values)
+        )
+        planned = DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            filter_model=filter_model,
+            sort_model=SORT_MODEL,
+            plan_cache=plan_cache,
+        )
+        expected = DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            filter_model=filter_model,
+            sort_model=SORT_MODEL,
+        )
+        assert _ids(planned) == _ids(expected)
+        assert "mui_filter_0" in str(planned.query)
+        results.append(planned.plan)
+    assert results[0] is results[1] is results[2]
+    assert (plan_cache.hits, plan_cache.misses, len(plan_cache)) == (2, 1, 1)
+
+
+def test_plan_is_keyed_by_shape(resolver: Resolver) -> None:
+    plan_cache = PlanCache(maxsize=2)
+    sort_model: GridSortModel = []
+    first = _filter_model(GridFilterItem(field="grouping_id", operator=">", value=1))
+    empty = _filter_model(GridFilterItem(field="grouping_id", operator=">", value=None))
+    other = _filter_model(GridFilterItem(field="grouping_id", operator="<", value=1))
+    plan = plan_cache.get(filter_model=first, sort_model=sort_model, resolver=resolver)
+    assert plan_cache.get(first, SORT_MODEL, resolver) is not plan
+    assert plan_cache.get(empty, sort_model, resolver) is not plan
+    # the least recently used plan was evicted
+    assert plan_cache.get(other, sort_model, resolver) is not plan
+    assert len(plan_cache) == 2  # noqa: PLR2004
+    assert plan_cache.get(first, sort_model, resolver) is not plan
+    assert plan_cache.hits == 0
+
+
+def test_unsupported_operator_is_not_planned(resolver: Resolver) -> None:
+    plan_cache = PlanCache()
+    filter_model = _filter_model(
+        GridFilterItem(field="grouping_id", operator="custom", value=1)
+    )
+    assert plan_cache.get(filter_model, SORT_MODEL, resolver) is None
+    assert plan_cache.unplanned == 1
+    assert len(plan_cache) == 0
+
+
+@mark.parametrize("value", (["any"], 1, "any"))
+def test_is_shape_of_values_which_are_not_strings(
+    value: Any, resolver: Resolver
+) -> None:
+    filter_model = _filter_model(
+        GridFilterItem(field="grouping_id", operator="is", value=value)
+    )
+    assert get_query_shape(filter_model, sort_model=None, resolver=resolver) is not None
+
+
+def test_invalid_maxsize() -> None:
+    with raises(ValueError):
+        PlanCache(maxsize=0)
@@ -0,0 +1,124 @@
+from typing import Generator, List
+
+from pytest import fixture, mark
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from mui.v6.grid import (
+    GridFilterItem,
+    GridFilterModel,
+    GridLogicOperator,
+    GridPaginationModel,
+)
+from mui.v6.integrations.sqlalchemy import DataGridQuery, TotalCount
+from mui.v6.integrations.sqlalchemy.estimate import estimate_rows
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import Base, ParentModel
+
+ROW_COUNT = 200
+GROUP_COUNT = 10
+
+
+@fixture(scope="module")
+def estimate_session() -> Generator[Session, None, None]:
+    """A session whose database is separate from the shared fixture database, so that
+    its statistics can be created without affecting other tests.
+
+    Yields:
+        Session: The SQLAlchemy session
+    """
+    engine = create_engine(url="sqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    session = Session(bind=engine, future=True)
+    session.add_all(
+        ParentModel(name=f"ParentModel {i}", grouping_id=i % GROUP_COUNT)
+        for i in range(1, ROW_COUNT + 1)
+    )
+    session.execute(
+        text(
+            f"CREATE INDEX ix_grouping_id ON {ParentModel.__tablename__} (grouping_id)"
+        )
+    )
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_estimate_without_statistics(estimate_session: Session) -> None:
+    assert estimate_rows(estimate_session, ParentModel.__table__, []) is None
+
+
+@mark.parametrize(
+    "filter_model, expected",
+    (
+        (None, TotalCount(total=ROW_COUNT, exact=False, estimated=True)),
+        (
+            GridFilterModel(
+                items=[GridFilterItem(field="grouping_id", operator="=", value=3)]
+            ),
+            TotalCount(total=ROW_COUNT // GROUP_COUNT, exact=False, estimated=True),
+        ),
+        # not an equality, so the rows are counted
+        (
+            GridFilterModel(
+                items=[GridFilterItem(field="grouping_id", operator=">", value=3)]
+            ),
+            TotalCount(total=120),
+        ),
+        # OR can not be answered from a single index statistic
+        (
+            GridFilterModel(
+                items=[
+                    GridFilterItem(field="grouping_id", operator="=", value=3),
+                    GridFilterItem(field="name", operator="equals", value="x"),
+                ],
+                logic_operator=GridLogicOperator.Or,
+            ),
+            TotalCount(total=ROW_COUNT // GROUP_COUNT),
+        ),
+        # there is no index on name
+        (
+            GridFilterModel(
+                items=[GridFilterItem(field="name", operator="equals", value="x")]
+            ),
+            TotalCount(total=0),
+        ),
+    ),
+)
+def test_estimated_total(
+    filter_model: GridFilterModel,
+    expected: TotalCount,
+    estimate_session: Session,
+    resolver: Resolver,
+) -> None:
+    estimate_session.execute(text("ANALYZE"))
+    dg_query = DataGridQuery(
+        query=estimate_session.query(ParentModel),
+        column_resolver=resolver,
+        filter_model=filter_model,
+    )
+    assert dg_query.estimated_total() == expected
+
+
+def test_estimated_total_uses_custom_estimator(
+    estimate_session: Session, resolver: Resolver
+) -> None:
+    calls: List[List[str]] = []
+
+    def estimator(session: Session, table: object, columns: List[str]) -> int:
+        calls.append(list(columns))
+        return 42
+
+    dg_query = DataGridQuery(
+        query=estimate_session.query(ParentModel),
+        column_resolver=resolver,
+        filter_model=GridFilterModel(
+            items=[GridFilterItem(field="grouping_id", operator="=", value=3)]
+        ),
+        pagination_model=GridPaginationModel(page=0, page_size=25),
+    )
+    total = dg_query.estimated_total(estimator=estimator)
+    assert calls == [["grouping_id"]]
+    assert str(total) == "~42"
+    assert dg_query.pages(total=total) == 2  # noqa: PLR2004
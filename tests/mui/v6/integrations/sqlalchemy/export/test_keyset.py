@@ -0,0 +1,105 @@
+from typing import Any, Dict, List
+
+from pytest import mark
+from sqlalchemy.orm import Query
+
+from mui.v6.grid import (
+    GridFilterItem,
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+    RequestGridModels,
+)
+from mui.v6.integrations.sqlalchemy import DataGridQuery, iter_export_items
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.conftest import NULLABLE_PARENT_MODEL_COUNT
+from tests.fixtures.sqlalchemy import ParentModel
+
+FILTER_MODEL = GridFilterModel(
+    items=[GridFilterItem(field="grouping_id", operator=">", value=4)]
+)
+SORT_MODEL = [GridSortItem(field="name", sort=GridSortDirection.DESC)]
+
+
+def _factory(item: ParentModel) -> Dict[str, Any]:
+    return {"id": item.id, "name": item.name}
+
+
+def test_export_streams_every_row_in_keyset_chunks(
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    executed_statements: List[str],
+) -> None:
+    request_model = RequestGridModels(
+        filter_model=FILTER_MODEL,
+        sort_model=SORT_MODEL,
+        # the pagination model is ignored
+        pagination_model=GridPaginationModel(page=3, page_size=5),
+    )
+    expected = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=FILTER_MODEL,
+        sort_model=[*SORT_MODEL, GridSortItem(field="id", sort=GridSortDirection.DESC)],
+    ).items(factory=_factory)
+    executed_statements.clear()
+
+    rows = iter_export_items(
+        query=query,
+        request_model=request_model,
+        column_resolver=resolver,
+        factory=_factory,
+        chunk_size=40,
+    )
+    assert not executed_statements
+    assert list(rows) == expected
+    assert len(executed_statements) == -(-len(expected) // 40)
+    # every chunk after the first seeks past the last row of the previous chunk
+    assert all(
+        f"({ParentModel.__tablename__}.name, {ParentModel.__tablename__}.id) < (?, ?)"
+        in statement
+        for statement in executed_statements[1:]
+    )
+
+
+def test_export_of_empty_result(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    request_model = RequestGridModels(
+        filter_model=GridFilterModel(
+            items=[GridFilterItem(field="grouping_id", operator=">", value=1000)]
+        )
+    )
+    rows = iter_export_items(
+        query=query,
+        request_model=request_model,
+        column_resolver=resolver,
+        factory=_factory,
+    )
+    assert list(rows) == []
+
+
+@mark.parametrize("sort", (GridSortDirection.ASC, GridSortDirection.DESC))
+def test_export_sorted_on_nullable_column(
+    sort: GridSortDirection, nullable_query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    rows = list(
+        iter_export_items(
+            query=nullable_query,
+            request_model=RequestGridModels(
+                sort_model=[GridSortItem(field="null_field", sort=sort)]
+            ),
+            column_resolver=resolver,
+            factory=_factory,
+            chunk_size=3,
+        )
+    )
+    assert sorted(row["id"] for row in rows) == list(
+        range(1, NULLABLE_PARENT_MODEL_COUNT + 1)
+    )
+    # NULL values sort before every other value
+    ids = [row["id"] for row in rows]
+    nulls = [id_ for id_ in ids if id_ % 4 == 0]
+    edge = ids[: len(nulls)] if sort == GridSortDirection.ASC else ids[-len(nulls) :]
+    assert edge == nulls
@@ -0,0 +1,82 @@
+from typing import Any, Generator, List
+
+from pytest import fixture
+from sqlalchemy import text
+from sqlalchemy.orm import Query, Session
+
+from mui.v6.grid import GridFilterItem, GridFilterModel
+from mui.v6.integrations.sqlalchemy.filter import (
+    apply_filter_to_query_from_model,
+    reset_case_insensitive_columns,
+    reset_operators,
+    reset_reversed_expressions,
+    reset_searchable_columns,
+)
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+
+
+def filter_model(operator: str, value: Any, field: str = "name") -> GridFilterModel:
+    """Creates a filter model of a single item.
+
+    Args:
+        operator (str): The item's operator.
+        value (Any): The item's value.
+        field (str, optional): The item's field. Defaults to "name".
+
+    Returns:
+        GridFilterModel: The filter model.
+    """
+    return GridFilterModel(
+        items=[GridFilterItem(field=field, operator=operator, value=value)]
+    )
+
+
+def filtered_names(
+    query: "Query[ParentModel]", model: GridFilterModel, resolver: Resolver
+) -> List[str]:
+    """Applies a filter model to a query of parent models.
+
+    Args:
+        query (Query[ParentModel]): The query.
+        model (GridFilterModel): The filter model.
+        resolver (Resolver): The column resolver.
+
+    Returns:
+        List[str]: The sorted names of the matching parent models.
+    """
+    filtered = apply_filter_to_query_from_model(
+        query=query, model=model, resolver=resolver
+    )
+    return sorted(item.name for item in filtered)
+
+
+def query_plan(session: Session, query: "Query[Any]") -> List[str]:
+    """Retrieves SQLite's plan of a query.
+
+    Args:
+        session (Session): The session of a SQLite database.
+        query (Query[Any]): The query.
+
+    Returns:
+        List[str]: The detail of each step of the plan.
+    """
+    statement = query.statement.compile(
+        dialect=session.get_bind().dialect, compile_kwargs={"literal_binds": True}
+    )
+    return [row[-1] for row in session.execute(text(f"EXPLAIN QUERY PLAN {statement}"))]
+
+
+@fixture()
+def operator_registry() -> Generator[None, None, None]:
+    """Restores the built-in operators after a test, removing the operators, layers,
+    and column declarations it registered.
+
+    Yields:
+        None
+    """
+    yield
+    reset_case_insensitive_columns()
+    reset_searchable_columns()
+    reset_reversed_expressions()
+    reset_operators()
@@ -0,0 +1,240 @@
+from typing import Any, Generator, List
+
+from pytest import fixture, mark, raises
+from sqlalchemy import Column, MetaData, String, Table, create_engine, func, text
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.orm import Session
+
+from mui.v6.integrations.sqlalchemy import DataGridQuery, PlanCache
+from mui.v6.integrations.sqlalchemy.filter import (
+    apply_filter_to_query_from_model,
+    get_case_insensitive_ddl,
+    get_operator_applicator,
+    is_case_insensitive_column,
+    register_case_insensitive_column,
+    register_index_friendly_operators,
+    reset_case_insensitive_columns,
+    unregister_case_insensitive_column,
+)
+from mui.v6.integrations.sqlalchemy.filter.applicators import (
+    apply_contains_operator,
+    apply_equal_operator,
+    apply_is_any_of_operator,
+)
+from mui.v6.integrations.sqlalchemy.filter.case_insensitive import (
+    apply_contains_case_insensitive_operator,
+    apply_equal_case_insensitive_operator,
+)
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import Base, ParentModel
+from tests.mui.v6.integrations.sqlalchemy.filter.conftest import (
+    filter_model,
+    filtered_names,
+    query_plan,
+)
+
+NAMES = ("Alpha", "ALPHABET", "alpine", "Beta", "100% Zeta", "ZETA")
+
+
+@fixture(scope="module")
+def case_insensitive_database() -> Generator[Session, None, None]:
+    """A session whose database is separate from the shared fixture database, with
+    the name indexed by the generated index.
+
+    Yields:
+        Session: The SQLAlchemy session
+    """
+    engine = create_engine(url="sqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    session = Session(bind=engine, future=True)
+    session.add_all(
+        ParentModel(name=name, grouping_id=i) for i, name in enumerate(NAMES, 1)
+    )
+    for statement in get_case_insensitive_ddl(ParentModel.name, dialect=engine.dialect):
+        session.execute(text(statement))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@fixture()
+def case_insensitive_session(
+    case_insensitive_database: Session,
+    operator_registry: None,  # noqa: ARG001
+) -> Session:
+    """The case-insensitive database's session, with the name declared as
+    case-insensitive for the duration of a test.
+
+    Returns:
+        Session: The SQLAlchemy session
+    """
+    register_case_insensitive_column(ParentModel.name)
+    return case_insensitive_database
+
+
+@mark.parametrize(
+    ("operator", "value", "expected"),
+    (
+        ("equals", "alpha", ["Alpha"]),
+        ("=", "ZeTa", ["ZETA"]),
+        ("!=", "zeta", ["100% Zeta", "ALPHABET", "Alpha", "Beta", "alpine"]),
+        ("isAnyOf", ["alphabet", "BETA"], ["ALPHABET", "Beta"]),
+        ("isAnyOf", [], []),
+        ("contains", "ZET", ["100% Zeta", "ZETA"]),
+        ("contains", "0%", ["100% Zeta"]),
+        ("startsWith", "alp", ["ALPHABET", "Alpha", "alpine"]),
+        ("startsWith", "a_", []),
+        ("endsWith", "ETA", ["100% Zeta", "Beta", "ZETA"]),
+        ("contains", None, list(NAMES)),
+    ),
+)
+def test_case_insensitive_operators(
+    operator: str,
+    value: Any,
+    expected: List[str],
+    case_insensitive_session: Session,
+    resolver: Resolver,
+) -> None:
+    model = filter_model(operator=operator, value=value)
+    assert filtered_names(
+        query=case_insensitive_session.query(ParentModel),
+        model=model,
+        resolver=resolver,
+    ) == sorted(expected)
+    # the plan binds the values and patterns
+    dg_query = DataGridQuery(
+        query=case_insensitive_session.query(ParentModel),
+        column_resolver=resolver,
+        filter_model=model,
+        plan_cache=PlanCache(),
+    )
+    assert dg_query.plan is not None
+    assert sorted(item.name for item in dg_query.items()) == sorted(expected)
+
+
+@mark.parametrize(
+    ("operator", "value"),
+    (("equals", "alpha"), ("isAnyOf", ["alpha", "beta"]), ("startsWith", "alp")),
+)
+def test_case_insensitive_operators_use_index(
+    operator: str, value: Any, case_insensitive_session: Session, resolver: Resolver
+) -> None:
+    query = apply_filter_to_query_from_model(
+        query=case_insensitive_session.query(ParentModel),
+        model=filter_model(operator=operator, value=value),
+        resolver=resolver,
+    )
+    details = query_plan(session=case_insensitive_session, query=query)
+    assert any("INDEX ix_test_model_name_ci (" in detail for detail in details)
+
+
+def test_columns_which_are_not_case_insensitive(
+    case_insensitive_session: Session, resolver: Resolver
+) -> None:
+    assert not is_case_insensitive_column(ParentModel.grouping_id)
+    model = filter_model(operator="equals", value=2, field="grouping_id")
+    assert filtered_names(
+        query=case_insensitive_session.query(ParentModel),
+        model=model,
+        resolver=resolver,
+    ) == ["ALPHABET"]
+
+
+def test_case_insensitive_operators_are_planned(
+    case_insensitive_session: Session, resolver: Resolver
+) -> None:
+    plan_cache = PlanCache()
+    for value, expected in (("ALP", 3), ("be", 1)):
+        dg_query = DataGridQuery(
+            query=case_insensitive_session.query(ParentModel),
+            column_resolver=resolver,
+            filter_model=filter_model(operator="startsWith", value=value),
+            plan_cache=plan_cache,
+        )
+        assert dg_query.plan is not None
+        assert dg_query.total() == expected
+    assert plan_cache.hits == 1
+
+
+@mark.usefixtures("operator_registry")
+def test_case_insensitive_columns_are_layered() -> None:
+    table = Table("layered", MetaData(), Column("a", String), Column("b", String))
+
+    def compile_operator(operator: str, column: Any, value: Any) -> str:
+        clause = get_operator_applicator(operator)(column, value)
+        return str(clause.compile(dialect=postgresql.dialect()))
+
+    register_index_friendly_operators()
+    register_case_insensitive_column(table.c.b)
+    # the index-friendly applicators still apply the columns which aren't declared
+    assert compile_operator("startsWith", table.c.a, "ab") == (
+        "layered.a >= %(a_1)s AND layered.a < %(a_2)s"
+    )
+    assert compile_operator("contains", table.c.a, "50%") == (
+        "layered.a LIKE '%%' || %(a_1)s || '%%' ESCAPE '/'"
+    )
+    contains = get_operator_applicator("contains")(table.c.a, "50%")
+    assert contains.compile().params == {"a_1": "50/%"}
+    assert compile_operator("startsWith", table.c.b, "ab") == (
+        "layered.b ILIKE %(case_insensitive_like_1)s ESCAPE '/'"
+    )
+    assert compile_operator("equals", table.c.a, "ab") == "layered.a = %(a_1)s"
+
+
+@mark.usefixtures("operator_registry")
+def test_case_insensitive_form_per_dialect() -> None:
+    register_case_insensitive_column(ParentModel.name)
+    equal = apply_equal_case_insensitive_operator(ParentModel.name, "a")
+    contains = apply_contains_case_insensitive_operator(ParentModel.name, "a")
+    assert str(equal.compile(dialect=postgresql.dialect())) == (
+        "lower(test_model.name) = lower(%(param_1)s)"
+    )
+    assert str(contains.compile(dialect=postgresql.dialect())) == (
+        "test_model.name ILIKE %(case_insensitive_like_1)s ESCAPE '/'"
+    )
+    assert str(contains.compile(dialect=mysql.dialect())) == (
+        "lower(test_model.name) LIKE lower(%s) ESCAPE '/'"
+    )
+
+
+def test_get_case_insensitive_ddl() -> None:
+    assert get_case_insensitive_ddl(ParentModel.name, dialect=mysql.dialect()) == [
+        "CREATE INDEX IF NOT EXISTS ix_test_model_name_ci ON test_model ((lower(name)))"
+    ]
+    assert get_case_insensitive_ddl(
+        ParentModel.name, dialect=postgresql.dialect(), name="ix_name"
+    ) == [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX IF NOT EXISTS ix_name ON test_model (lower(name))",
+        "CREATE INDEX IF NOT EXISTS ix_name_trgm ON test_model "
+        "USING gin (name gin_trgm_ops)",
+    ]
+    # the indexes are only described, rather than added to the table
+    assert not any(
+        index.name.startswith("ix_name") for index in ParentModel.__table__.indexes
+    )
+
+
+def test_register_case_insensitive_column_requires_column() -> None:
+    with raises(ValueError, match="Expected a table's column"):
+        register_case_insensitive_column(func.lower(ParentModel.name))
+
+
+@mark.usefixtures("operator_registry")
+def test_unregister_case_insensitive_column() -> None:
+    table = Table("unregistered", MetaData(), Column("a", String))
+    register_case_insensitive_column(table.c.a)
+    register_case_insensitive_column(ParentModel.name)
+    unregister_case_insensitive_column(table.c.a)
+    assert not is_case_insensitive_column(table.c.a)
+    # the layers still apply the remaining case-insensitive columns
+    assert get_operator_applicator("equals") is not apply_equal_operator
+    unregister_case_insensitive_column(ParentModel.name)
+    assert not is_case_insensitive_column(ParentModel.name)
+    assert get_operator_applicator("equals") is apply_equal_operator
+    assert get_operator_applicator("contains") is apply_contains_operator
+    register_case_insensitive_column(table.c.a)
+    reset_case_insensitive_columns()
+    assert not is_case_insensitive_column(table.c.a)
+    assert get_operator_applicator("isAnyOf") is apply_is_any_of_operator
@@ -0,0 +1,237 @@
+from typing import Any, Generator, List
+
+from pytest import fixture, mark, raises
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import mssql, mysql, postgresql
+from sqlalchemy.exc import CompileError
+from sqlalchemy.orm import Session
+
+from mui.v6.grid import GridFilterModel
+from mui.v6.integrations.sqlalchemy import DataGridQuery, PlanCache, register_operator
+from mui.v6.integrations.sqlalchemy.filter import (
+    IsAnyOfStrategy,
+    IsAnyOfThresholds,
+    OperatorLayer,
+    apply_filter_to_query_from_model,
+    apply_is_any_of_scalable_operator,
+    get_is_any_of_strategy,
+    get_loaded_temporary_tables,
+    get_operator_applicator,
+    register_scalable_is_any_of_operator,
+)
+from mui.v6.integrations.sqlalchemy.filter.applicators import apply_is_any_of_operator
+from mui.v6.integrations.sqlalchemy.filter.is_any_of import get_temporary_values_table
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import Base, ParentModel
+from tests.mui.v6.integrations.sqlalchemy.filter.conftest import filter_model
+
+THRESHOLDS = IsAnyOfThresholds(json=5, temporary_table=20)
+ROW_COUNT = 50
+
+
+@fixture(scope="module")
+def is_any_of_database() -> Generator[Session, None, None]:
+    """A session whose database is separate from the shared fixture database.
+
+    Yields:
+        Session: The SQLAlchemy session
+    """
+    engine = create_engine(url="sqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    session = Session(bind=engine, future=True)
+    session.add_all(
+        ParentModel(name=f"Name {i}", grouping_id=i) for i in range(1, ROW_COUNT + 1)
+    )
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@fixture()
+def is_any_of_session(
+    is_any_of_database: Session,
+    operator_registry: None,  # noqa: ARG001
+) -> Session:
+    """The isAnyOf database's session, with the scalable isAnyOf operator registered
+    using small thresholds for the duration of a test, loading temporary tables for
+    this session only.
+
+    Returns:
+        Session: The SQLAlchemy session
+    """
+    register_scalable_is_any_of_operator(THRESHOLDS, sessions=is_any_of_database)
+    return is_any_of_database
+
+
+def apply_is_none_of_operator(column: Any, value: Any) -> Any:
+    return column.not_in(value)
+
+
+def _is_any_of(value: Any) -> GridFilterModel:
+    return filter_model(operator="isAnyOf", value=value, field="grouping_id")
+
+
+def _grouping_ids(session: Session, value: Any, resolver: Resolver) -> List[int]:
+    query = apply_filter_to_query_from_model(
+        query=session.query(ParentModel),
+        model=_is_any_of(value=value),
+        resolver=resolver,
+    )
+    return sorted(item.grouping_id for item in query)
+
+
+@mark.parametrize(
+    ("count", "expected"),
+    (
+        (1, IsAnyOfStrategy.EXPANDING),
+        (4, IsAnyOfStrategy.EXPANDING),
+        (5, IsAnyOfStrategy.JSON),
+        (19, IsAnyOfStrategy.JSON),
+        (20, IsAnyOfStrategy.TEMPORARY_TABLE),
+    ),
+)
+def test_get_is_any_of_strategy(count: int, expected: IsAnyOfStrategy) -> None:
+    assert get_is_any_of_strategy(count=count, thresholds=THRESHOLDS) == expected
+    assert (
+        get_is_any_of_strategy(
+            count=count, thresholds=IsAnyOfThresholds(json=None, temporary_table=None)
+        )
+        == IsAnyOfStrategy.EXPANDING
+    )
+
+
+@mark.parametrize(
+    "value",
+    (
+        [1, 2, 3],
+        list(range(1, 10)),
+        [str(i) for i in range(1, 10)],
+        list(range(1, 40)) + [1, 2, 1000],
+    ),
+)
+def test_scalable_is_any_of(
+    value: List[Any], is_any_of_session: Session, resolver: Resolver
+) -> None:
+    expected = sorted({int(v) for v in value if int(v) <= ROW_COUNT})
+    assert (
+        _grouping_ids(session=is_any_of_session, value=value, resolver=resolver)
+        == expected
+    )
+
+
+@mark.parametrize("value", ([], None))
+def test_scalable_is_any_of_without_values(
+    value: Any, is_any_of_session: Session, resolver: Resolver
+) -> None:
+    assert (
+        _grouping_ids(session=is_any_of_session, value=value, resolver=resolver) == []
+    )
+
+
+def test_expanding_lists_are_applied_by_previous_applicator(
+    is_any_of_session: Session, resolver: Resolver
+) -> None:
+    layer = get_operator_applicator("isAnyOf")
+    assert isinstance(layer, OperatorLayer)
+    assert layer.previous is apply_is_any_of_operator
+    register_operator("isAnyOf", apply_is_none_of_operator)
+    register_scalable_is_any_of_operator(THRESHOLDS, sessions=is_any_of_session)
+    assert _grouping_ids(
+        session=is_any_of_session, value=[1, 2, 3], resolver=resolver
+    ) == list(range(4, ROW_COUNT + 1))
+    assert _grouping_ids(
+        session=is_any_of_session, value=list(range(1, 10)), resolver=resolver
+    ) == list(range(1, 10))
+
+
+def test_json_values_are_bound(is_any_of_session: Session, resolver: Resolver) -> None:
+    query = apply_filter_to_query_from_model(
+        query=is_any_of_session.query(ParentModel),
+        model=_is_any_of(value=list(range(10))),
+        resolver=resolver,
+    )
+    statement = query.statement.compile(dialect=is_any_of_session.get_bind().dialect)
+    assert "json_each(?)" in str(statement)
+    assert len(statement.params) == 1
+
+
+def test_json_values_are_planned(
+    is_any_of_session: Session, resolver: Resolver
+) -> None:
+    plan_cache = PlanCache()
+    for value in (list(range(1, 6)), list(range(1, 11)), [1, 2], [1, 2, 3]):
+        dg_query = DataGridQuery(
+            query=is_any_of_session.query(ParentModel),
+            column_resolver=resolver,
+            filter_model=_is_any_of(value=value),
+            plan_cache=plan_cache,
+        )
+        assert dg_query.plan is not None
+        assert dg_query.total() == len(value)
+    # the JSON and expanding strategies have a plan each
+    assert plan_cache.hits == 2  # noqa: PLR2004
+    assert len(plan_cache) == 2  # noqa: PLR2004
+
+
+def test_temporary_tables_are_loaded_once(
+    is_any_of_session: Session, resolver: Resolver
+) -> None:
+    executed: List[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        executed.append(args[2])
+
+    engine = is_any_of_session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    value = list(range(1, 31))
+    dg_query = DataGridQuery(
+        query=is_any_of_session.query(ParentModel),
+        column_resolver=resolver,
+        filter_model=_is_any_of(value=value),
+        plan_cache=PlanCache(),
+    )
+    assert dg_query.plan is None
+    assert dg_query.total() == len(value)
+    assert len(dg_query.items()) == len(value)
+    created = [s for s in executed if s.startswith("\nCREATE TEMPORARY TABLE")]
+    assert len(created) == 1
+    loaded = get_loaded_temporary_tables(is_any_of_session.connection())
+    assert created[0].startswith(f"\nCREATE TEMPORARY TABLE {loaded[-1]} ")
+    # the loaded tables are tracked, rather than looked up in the catalog
+    assert not any("sqlite_temp_master" in s or "PRAGMA" in s for s in executed)
+    # a table created by a transaction which was rolled back is loaded again
+    is_any_of_session.rollback()
+    assert get_loaded_temporary_tables(is_any_of_session.connection()) == []
+    assert (
+        _grouping_ids(session=is_any_of_session, value=value, resolver=resolver)
+        == value
+    )
+    created = [s for s in executed if s.startswith("\nCREATE TEMPORARY TABLE")]
+    assert len(created) == 2  # noqa: PLR2004
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_temporary_tables_are_named_after_values_and_type() -> None:
+    values = ["1", "2"]
+    table = get_temporary_values_table(ParentModel.grouping_id, values)
+    assert (
+        table.name == get_temporary_values_table(ParentModel.grouping_id, values).name
+    )
+    assert table.name != get_temporary_values_table(ParentModel.name, values).name
+
+
+def test_json_values_per_dialect() -> None:
+    clause = apply_is_any_of_scalable_operator(
+        ParentModel.grouping_id, [1, 2, 3, 4, 5], thresholds=THRESHOLDS
+    )
+    assert str(clause.compile(dialect=postgresql.dialect())) == (
+        "test_model.grouping_id IN (SELECT CAST(value AS INTEGER) FROM "
+        "json_array_elements_text(CAST(%(json_values_in_1)s AS JSON)))"
+    )
+    assert str(clause.compile(dialect=mysql.dialect())) == (
+        "test_model.grouping_id IN (SELECT value FROM JSON_TABLE(%s, '$[*]' "
+        "COLUMNS (value INTEGER PATH '$')) AS mui_values)"
+    )
+    with raises(CompileError, match="set the JSON threshold to None"):
+        clause.compile(dialect=mssql.dialect())
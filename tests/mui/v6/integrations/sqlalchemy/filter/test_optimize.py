@@ -0,0 +1,172 @@
+from typing import Any, List, Tuple
+
+from pytest import mark
+from sqlalchemy.orm import Query
+
+from mui.v6.grid import (
+    GridFilterItem,
+    GridFilterModel,
+    GridLogicOperator,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+)
+from mui.v6.integrations.sqlalchemy import DataGridQuery, PaginationStrategy, PlanCache
+from mui.v6.integrations.sqlalchemy.filter import optimize_filter_model
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+
+And = GridLogicOperator.And
+Or = GridLogicOperator.Or
+
+
+def _model(
+    logic_operator: GridLogicOperator, *items: Tuple[Any, ...]
+) -> GridFilterModel:
+    return GridFilterModel(
+        items=[
+            GridFilterItem(field=field, operator=operator, value=value)
+            for field, operator, value in items
+        ],
+        logic_operator=logic_operator,
+    )
+
+
+def _items(model: GridFilterModel) -> List[Tuple[Any, ...]]:
+    return [(item.field, item.operator, item.value) for item in model.items]
+
+
+@mark.parametrize(
+    ("model", "expected"),
+    (
+        (
+            _model(Or, ("a", "=", 1), ("a", "equals", 2), ("a", "isAnyOf", [2, 3])),
+            [("a", "isAnyOf", [1, 2, 3])],
+        ),
+        (
+            _model(Or, ("a", "=", 1), ("b", "contains", "x"), ("a", "=", 2)),
+            [("a", "isAnyOf", [1, 2]), ("b", "contains", "x")],
+        ),
+        (
+            _model(Or, ("a", "isAnyOf", []), ("b", "=", 1)),
+            [("b", "=", 1)],
+        ),
+        (
+            _model(And, ("a", ">=", 1), ("a", "<=", 5), ("a", ">", 0)),
+            [("a", "between", [1, 5])],
+        ),
+        (
+            _model(And, ("a", ">", 1), ("a", "<", 3), ("a", ">", 2)),
+            [("a", ">", 2), ("a", "<", 3)],
+        ),
+        (
+            _model(And, ("a", ">=", 3), ("a", "<=", 3)),
+            [("a", "=", 3)],
+        ),
+        (
+            _model(And, ("a", "isAnyOf", [1, 2, 3]), ("a", ">", 1), ("b", "=", "x")),
+            [("a", "isAnyOf", [2, 3]), ("b", "=", "x")],
+        ),
+        (
+            _model(And, ("a", "=", 1), ("a", "=", 1), ("a", "==", 1.0)),
+            [("a", "=", 1)],
+        ),
+        # mixed types may be converted by the database, so they're kept as-is
+        (
+            _model(And, ("a", "=", 1), ("a", "=", "1")),
+            [("a", "=", 1), ("a", "=", "1")],
+        ),
+        # strings are compared by the database, which may find distinct strings equal
+        (
+            _model(And, ("a", "=", "x"), ("a", "isAnyOf", ["X", "y"])),
+            [("a", "=", "x"), ("a", "isAnyOf", ["X", "y"])],
+        ),
+        (
+            _model(And, ("a", "equals", 1), ("b", "contains", "x")),
+            [("a", "equals", 1), ("b", "contains", "x")],
+        ),
+    ),
+)
+def test_optimize_filter_model(
+    model: GridFilterModel, expected: List[Tuple[Any, ...]]
+) -> None:
+    optimized = optimize_filter_model(model=model)
+    assert not optimized.unsatisfiable
+    assert _items(optimized.model) == expected
+
+
+@mark.parametrize(
+    "model",
+    (
+        _model(And, ("a", "=", 1), ("b", "=", 1), ("a", "=", 2)),
+        _model(And, ("a", ">", 5), ("a", "<", 3)),
+        _model(And, ("a", ">", 3), ("a", "<=", 3)),
+        _model(And, ("a", "isAnyOf", [1, 2]), ("a", ">=", 3)),
+        _model(And, ("a", "isAnyOf", [])),
+        _model(Or, ("a", "isAnyOf", []), ("b", "isAnyOf", None)),
+    ),
+)
+def test_optimize_unsatisfiable_filter_model(model: GridFilterModel) -> None:
+    optimized = optimize_filter_model(model=model)
+    assert optimized.unsatisfiable
+    # the contradicting items are kept, so the model still matches no rows
+    assert optimized.model.items
+
+
+QUERY_MODELS = (
+    _model(Or, ("grouping_id", "=", 1), ("grouping_id", "=", 3), ("name", "=", "x")),
+    _model(And, ("grouping_id", ">=", 2), ("grouping_id", "<=", 6), ("id", ">", 3)),
+    _model(And, ("grouping_id", "isAnyOf", [1, 2, 3]), ("grouping_id", "<", 3)),
+    _model(And, ("grouping_id", ">", 5), ("grouping_id", "<", 3)),
+    # the database converts both strings to the column's integer type
+    _model(And, ("grouping_id", "=", "1"), ("grouping_id", "=", "01")),
+)
+
+
+@mark.parametrize("filter_model", QUERY_MODELS)
+@mark.parametrize(
+    "pagination_strategy", (PaginationStrategy.OFFSET, PaginationStrategy.KEYSET)
+)
+def test_optimized_query_matches_query(
+    filter_model: GridFilterModel,
+    pagination_strategy: PaginationStrategy,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    def build(optimize_filter: bool) -> "DataGridQuery[ParentModel]":
+        return DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            filter_model=filter_model,
+            sort_model=[GridSortItem(field="name", sort=GridSortDirection.ASC)],
+            pagination_model=GridPaginationModel(page=0, page_size=10),
+            pagination_strategy=pagination_strategy,
+            plan_cache=PlanCache(),
+            optimize_filter=optimize_filter,
+        )
+
+    optimized, expected = build(optimize_filter=True), build(optimize_filter=False)
+    assert [item.id for item in optimized.items()] == [
+        item.id for item in expected.items()
+    ]
+    assert optimized.total() == expected.total()
+
+
+def test_unsatisfiable_query_is_not_executed(
+    query: "Query[ParentModel]", resolver: Resolver, executed_statements: List[str]
+) -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=_model(And, ("grouping_id", "=", 1), ("grouping_id", "=", 2)),
+        pagination_model=GridPaginationModel(page=0, page_size=10),
+        optimize_filter=True,
+    )
+    assert dg_query.unsatisfiable
+    assert dg_query.items() == []
+    assert dg_query.rows() == []
+    assert dg_query.items_and_total() == ([], 0)
+    assert dg_query.items_and_has_next_page() == ([], False)
+    assert dg_query.capped_total(cap=10).total == 0
+    assert list(dg_query.iter_items()) == []
+    assert executed_statements == []
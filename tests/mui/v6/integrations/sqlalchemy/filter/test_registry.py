@@ -0,0 +1,215 @@
+from typing import Any
+
+from pytest import fixture, raises
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Query
+
+from mui.v6.integrations.sqlalchemy import (
+    DataGridQuery,
+    OperatorPlan,
+    PlanCache,
+    register_operator,
+    register_operator_layer,
+    reset_operators,
+    unregister_operator_layer,
+)
+from mui.v6.integrations.sqlalchemy.filter import (
+    apply_filter_to_query_from_model,
+    get_operator_applicator,
+    get_operator_plan,
+    is_operator_registered,
+)
+from mui.v6.integrations.sqlalchemy.filter.applicators import (
+    apply_contains_operator,
+    apply_equal_operator,
+    apply_greater_than_operator,
+    apply_less_than_operator,
+)
+from mui.v6.integrations.sqlalchemy.filter.registry import OperatorLayer, bind_value
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+from tests.mui.v6.integrations.sqlalchemy.filter.conftest import filter_model
+
+
+def apply_in_range_operator(column: Any, value: Any) -> Any:
+    low, high = value
+    return column.between(low, high)
+
+
+def apply_at_least_operator(column: Any, value: Any) -> Any:
+    return column >= int(value)
+
+
+@fixture(autouse=True)
+def custom_operators(operator_registry: None) -> None:  # noqa: ARG001
+    """Registers the custom operators for the duration of a test."""
+    register_operator("inRange", apply_in_range_operator, aliases=("withinRange",))
+    register_operator(
+        "atLeast",
+        apply_at_least_operator,
+        plan=OperatorPlan(bind=lambda column, value: [int(value)]),
+    )
+
+
+def test_aliases_share_applicator() -> None:
+    assert get_operator_applicator("==") is apply_equal_operator
+    assert get_operator_applicator("equals") is apply_equal_operator
+    assert get_operator_applicator("withinRange") is apply_in_range_operator
+
+
+def test_custom_operator_is_applied_in_sql(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    filtered = apply_filter_to_query_from_model(
+        query=query,
+        model=filter_model("inRange", [2, 4], field="grouping_id"),
+        resolver=resolver,
+    )
+    compiled = str(filtered.statement.compile(dialect=sqlite.dialect()))
+    assert "test_model.grouping_id BETWEEN ? AND ?" in compiled
+    items = filtered.all()
+    assert items
+    assert all(2 <= item.grouping_id <= 4 for item in items)  # noqa: PLR2004
+
+
+def test_custom_operator_is_not_planned(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    plan_cache = PlanCache()
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=filter_model("withinRange", [2, 4], field="grouping_id"),
+        plan_cache=plan_cache,
+    )
+    assert dg_query.plan is None
+    assert plan_cache.unplanned == 1
+    expected = apply_filter_to_query_from_model(
+        query=query,
+        model=filter_model("inRange", [2, 4], field="grouping_id"),
+        resolver=resolver,
+    )
+    assert [item.id for item in dg_query.items()] == [item.id for item in expected]
+
+
+def test_custom_operator_with_plan_is_planned(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    plan_cache = PlanCache()
+    for value in ("2", "5"):
+        dg_query = DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            filter_model=filter_model("atLeast", value, field="grouping_id"),
+            plan_cache=plan_cache,
+        )
+        assert dg_query.plan is not None
+        expected = apply_filter_to_query_from_model(
+            query=query,
+            model=filter_model("atLeast", value, field="grouping_id"),
+            resolver=resolver,
+        )
+        assert [item.id for item in dg_query.items()] == [item.id for item in expected]
+    assert plan_cache.hits == 1
+
+
+def test_unregistered_operator(query: "Query[ParentModel]", resolver: Resolver) -> None:
+    assert not is_operator_registered("inLastNDays")
+    with raises(ValueError, match="Unsupported operator inLastNDays"):
+        apply_filter_to_query_from_model(
+            query=query,
+            model=filter_model("inLastNDays", 7, field="grouping_id"),
+            resolver=resolver,
+        )
+
+
+def _handles_field(field: str) -> Any:
+    return lambda column, value: column.key == field  # noqa: ARG005
+
+
+def test_layers_delegate_to_previous_applicator(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    register_operator("isNear", apply_equal_operator)
+    register_operator_layer(
+        "isNear",
+        apply_greater_than_operator,
+        handles=_handles_field("id"),
+        plan=OperatorPlan(bind=bind_value),
+    )
+    register_operator_layer(
+        "isNear",
+        apply_less_than_operator,
+        handles=_handles_field("grouping_id"),
+        plan=OperatorPlan(bind=bind_value),
+    )
+    # registering a layer again replaces it, rather than adding another layer
+    register_operator_layer(
+        "isNear",
+        apply_greater_than_operator,
+        handles=_handles_field("id"),
+        plan=OperatorPlan(bind=bind_value),
+    )
+    layer = get_operator_applicator("isNear")
+    assert isinstance(layer, OperatorLayer)
+    assert isinstance(layer.previous, OperatorLayer)
+    assert layer.previous.previous is apply_equal_operator
+    plan_cache = PlanCache()
+    for field, expected in (
+        ("id", "test_model.id > ?"),
+        ("grouping_id", "test_model.grouping_id < ?"),
+        ("name", "test_model.name = ?"),
+    ):
+        model = filter_model("isNear", 3, field=field)
+        filtered = apply_filter_to_query_from_model(
+            query=query, model=model, resolver=resolver
+        )
+        assert expected in str(filtered.statement.compile(dialect=sqlite.dialect()))
+        dg_query = DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            filter_model=model,
+            plan_cache=plan_cache,
+        )
+        assert dg_query.plan is not None
+        assert [item.id for item in dg_query.items()] == [item.id for item in filtered]
+
+
+def test_unregister_operator_layer() -> None:
+    register_operator("isNear", apply_equal_operator)
+    register_operator_layer(
+        "isNear",
+        apply_greater_than_operator,
+        handles=_handles_field("id"),
+        plan=OperatorPlan(bind=bind_value),
+    )
+    register_operator_layer(
+        "isNear",
+        apply_less_than_operator,
+        handles=_handles_field("grouping_id"),
+    )
+    assert get_operator_plan("isNear") is None
+    # the layers above are layered over the layer beneath the removed layer
+    unregister_operator_layer("isNear", apply_less_than_operator)
+    layer = get_operator_applicator("isNear")
+    assert isinstance(layer, OperatorLayer)
+    assert layer.applicator is apply_greater_than_operator
+    assert layer.previous is apply_equal_operator
+    assert get_operator_plan("isNear") is not None
+    # applicators which aren't layered over the operator are ignored
+    unregister_operator_layer("isNear", apply_less_than_operator)
+    unregister_operator_layer("isUnknown", apply_less_than_operator)
+    unregister_operator_layer("isNear", apply_greater_than_operator)
+    assert get_operator_applicator("isNear") is apply_equal_operator
+
+
+def test_reset_operators() -> None:
+    register_operator("contains", apply_in_range_operator)
+    register_operator_layer(
+        "equals", apply_greater_than_operator, handles=_handles_field("id")
+    )
+    reset_operators()
+    assert get_operator_applicator("contains") is apply_contains_operator
+    assert get_operator_applicator("equals") is apply_equal_operator
+    assert get_operator_plan("equals") is not None
+    assert not is_operator_registered("inRange")
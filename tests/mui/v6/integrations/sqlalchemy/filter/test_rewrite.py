@@ -0,0 +1,219 @@
+from typing import Any, Generator, List, Optional
+
+from pytest import fixture, mark, raises
+from sqlalchemy import create_engine, event, func, text
+from sqlalchemy.orm import Query, Session
+
+from mui.v6.integrations.sqlalchemy import DataGridQuery, PlanCache
+from mui.v6.integrations.sqlalchemy.filter import (
+    apply_filter_to_query_from_model,
+    get_prefix_upper_bound,
+    get_reversed_expression,
+    register_index_friendly_operators,
+    register_reversed_expression,
+    reset_reversed_expressions,
+    unregister_reversed_expression,
+)
+from mui.v6.integrations.sqlalchemy.filter.applicators import escape_like
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import Base, ParentModel
+from tests.mui.v6.integrations.sqlalchemy.filter.conftest import (
+    filter_model,
+    filtered_names,
+    query_plan,
+)
+
+NAMES = ("alpha", "alphabet", "alpine", "beta", "gamma_ray", "100%", "a/b", "zeta")
+
+
+@fixture()
+def index_friendly_operators(operator_registry: None) -> None:  # noqa: ARG001
+    """Registers the index-friendly operators, and the name's reversed-value
+    expression, for the duration of a test.
+    """
+    register_reversed_expression(ParentModel.name, func.reverse(ParentModel.name))
+    register_index_friendly_operators()
+
+
+@fixture(scope="module")
+def rewrite_session() -> Generator[Session, None, None]:
+    """A session whose database is separate from the shared fixture database, with
+    indexes on the name and on the reversed name, using a `reverse` function, which
+    SQLite doesn't provide.
+
+    Yields:
+        Session: The SQLAlchemy session
+    """
+    engine = create_engine(url="sqlite:///:memory:", future=True)
+
+    @event.listens_for(engine, "connect")
+    def connect(dbapi_connection: Any, connection_record: Any) -> None:  # noqa: ARG001
+        dbapi_connection.create_function(
+            "reverse",
+            1,
+            lambda value: value[::-1] if value is not None else None,
+            deterministic=True,
+        )
+
+    Base.metadata.create_all(bind=engine)
+    session = Session(bind=engine, future=True)
+    session.add_all(
+        ParentModel(name=name, grouping_id=i) for i, name in enumerate(NAMES, 1)
+    )
+    session.execute(text("CREATE INDEX ix_name ON test_model (name)"))
+    session.execute(text("CREATE INDEX ix_reversed_name ON test_model (reverse(name))"))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@mark.parametrize(
+    ("prefix", "expected"),
+    (
+        ("abc", "abd"),
+        ("a\U0010ffff", "b"),
+        ("\ud7ff", "\ue000"),
+        ("\U0010ffff", None),
+        ("", None),
+        (5, None),
+        (None, None),
+    ),
+)
+def test_get_prefix_upper_bound(prefix: Any, expected: Optional[str]) -> None:
+    assert get_prefix_upper_bound(prefix=prefix) == expected
+
+
+def test_escape_like() -> None:
+    assert escape_like("100%_a/b") == "100/%/_a//b"
+    assert escape_like(5) == 5  # noqa: PLR2004
+
+
+@mark.usefixtures("index_friendly_operators")
+@mark.parametrize(
+    ("operator", "value", "expected"),
+    (
+        ("contains", "%", ["100%"]),
+        ("contains", "_", ["gamma_ray"]),
+        ("contains", "/", ["a/b"]),
+        ("contains", None, list(NAMES)),
+        ("startsWith", "a_", []),
+        ("endsWith", "%", ["100%"]),
+    ),
+)
+def test_like_wildcards_are_escaped(
+    operator: str,
+    value: str,
+    expected: List[str],
+    rewrite_session: Session,
+    resolver: Resolver,
+) -> None:
+    model = filter_model(operator=operator, value=value)
+    query = rewrite_session.query(ParentModel)
+    assert filtered_names(query=query, model=model, resolver=resolver) == sorted(
+        expected
+    )
+    # the plan binds the escaped values
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=model,
+        plan_cache=PlanCache(),
+    )
+    assert dg_query.plan is not None
+    assert sorted(item.name for item in dg_query.items()) == sorted(expected)
+
+
+@mark.usefixtures("index_friendly_operators")
+@mark.parametrize(
+    ("operator", "value", "expected"),
+    (
+        ("startsWith", "alp", ["alpha", "alphabet", "alpine"]),
+        ("startsWith", "alpha", ["alpha", "alphabet"]),
+        ("startsWith", "100%", ["100%"]),
+        ("startsWith", "", list(NAMES)),
+        ("startsWith", "omega", []),
+        ("endsWith", "ta", ["beta", "zeta"]),
+        ("endsWith", "a", ["alpha", "beta", "zeta"]),
+        ("endsWith", "", list(NAMES)),
+    ),
+)
+def test_index_friendly_operators(
+    operator: str,
+    value: str,
+    expected: List[str],
+    rewrite_session: Session,
+    resolver: Resolver,
+) -> None:
+    query = rewrite_session.query(ParentModel)
+    model = filter_model(operator=operator, value=value)
+    assert filtered_names(query=query, model=model, resolver=resolver) == sorted(
+        expected
+    )
+
+
+@mark.usefixtures("index_friendly_operators")
+@mark.parametrize(
+    ("operator", "value", "index"),
+    (("startsWith", "alp", "ix_name"), ("endsWith", "ta", "ix_reversed_name")),
+)
+def test_index_friendly_operators_use_index(
+    operator: str, value: str, index: str, rewrite_session: Session, resolver: Resolver
+) -> None:
+    query = apply_filter_to_query_from_model(
+        query=rewrite_session.query(ParentModel),
+        model=filter_model(operator=operator, value=value),
+        resolver=resolver,
+    )
+    details = query_plan(session=rewrite_session, query=query)
+    assert any(f"USING INDEX {index} (" in detail for detail in details)
+
+
+@mark.usefixtures("index_friendly_operators")
+def test_index_friendly_operators_are_planned(
+    rewrite_session: Session, resolver: Resolver
+) -> None:
+    plan_cache = PlanCache()
+    for operator, value, expected in (
+        ("startsWith", "alp", ["alpha", "alphabet", "alpine"]),
+        ("startsWith", "be", ["beta"]),
+        ("endsWith", "ta", ["beta", "zeta"]),
+        ("endsWith", "ine", ["alpine"]),
+    ):
+        dg_query = DataGridQuery(
+            query=rewrite_session.query(ParentModel),
+            column_resolver=resolver,
+            filter_model=filter_model(operator=operator, value=value),
+            plan_cache=plan_cache,
+        )
+        assert dg_query.plan is not None
+        assert sorted(item.name for item in dg_query.items()) == expected
+    assert plan_cache.hits == 2  # noqa: PLR2004
+
+
+@mark.usefixtures("index_friendly_operators")
+def test_endswith_without_reversed_expression(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    model = filter_model(operator="endsWith", value="1", field="grouping_id")
+    filtered = apply_filter_to_query_from_model(
+        query=query, model=model, resolver=resolver
+    )
+    assert " LIKE " in str(filtered.statement)
+    assert all(str(item.grouping_id).endswith("1") for item in filtered)
+
+
+def test_register_reversed_expression_requires_column() -> None:
+    with raises(ValueError, match="Expected a table's column"):
+        register_reversed_expression(func.lower(ParentModel.name))
+
+
+@mark.usefixtures("operator_registry")
+def test_unregister_reversed_expression() -> None:
+    register_reversed_expression(ParentModel.name)
+    register_reversed_expression(ParentModel.created_at)
+    unregister_reversed_expression(ParentModel.name)
+    assert get_reversed_expression(ParentModel.name) is None
+    assert get_reversed_expression(ParentModel.created_at) is not None
+    reset_reversed_expressions()
+    assert get_reversed_expression(ParentModel.created_at) is None
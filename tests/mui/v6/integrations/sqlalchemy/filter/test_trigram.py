@@ -0,0 +1,225 @@
+from typing import Any, Generator, List
+
+from pytest import fixture, mark, raises
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+from mui.v6.grid import GridFilterItem, GridFilterModel, GridLogicOperator
+from mui.v6.integrations.sqlalchemy import DataGridQuery, FullTextIndex, PlanCache
+from mui.v6.integrations.sqlalchemy.filter import (
+    apply_filter_to_query_from_model,
+    get_operator_applicator,
+    get_searchable_index,
+    register_index_friendly_operators,
+    register_searchable_column,
+    reset_searchable_columns,
+    unregister_searchable_column,
+)
+from mui.v6.integrations.sqlalchemy.filter.applicators import apply_contains_operator
+from mui.v6.integrations.sqlalchemy.quick_filter import maintain_fts5_index
+from tests.mui.v6.integrations.sqlalchemy.filter.conftest import (
+    filter_model,
+    query_plan,
+)
+
+# the events maintaining the index are registered on a model of this module, so they
+# don't affect the shared fixture models
+Base = declarative_base()
+
+
+class AuditLog(Base):  # type: ignore[valid-type,misc]
+    __tablename__ = "audit_log"
+
+    id = Column(Integer, primary_key=True)
+    message = Column(String, nullable=False)
+    actor = Column(String, nullable=False)
+
+
+MESSAGES = (
+    ("Hello World", "alice"),
+    ("foo_bar%baz", "bob"),
+    ("wordle played", "alice"),
+    ("nothing here", "carol"),
+)
+INDEX = FullTextIndex(
+    name="audit_log_trigram",
+    rowid=AuditLog.id,
+    columns=("message",),
+    tokenize="trigram",
+)
+
+
+def audit_log_resolver(field: str) -> Any:
+    return getattr(AuditLog, field)
+
+
+@fixture(scope="module")
+def trigram_database() -> Generator[Session, None, None]:
+    """A session whose database contains audit logs, with a trigram index on their
+    messages which is maintained by events.
+
+    Yields:
+        Session: The SQLAlchemy session
+    """
+    maintain_fts5_index(index=INDEX)
+    engine = create_engine(url="sqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    session = Session(bind=engine, future=True)
+    session.add_all(
+        AuditLog(message=message, actor=actor) for message, actor in MESSAGES
+    )
+    session.commit()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@fixture()
+def trigram_session(
+    trigram_database: Session,
+    operator_registry: None,  # noqa: ARG001
+) -> Session:
+    """The trigram database's session, with the messages declared as searchable for
+    the duration of a test.
+
+    Returns:
+        Session: The SQLAlchemy session
+    """
+    register_searchable_column(AuditLog.message, INDEX)
+    return trigram_database
+
+
+def _contains(field: str, value: Any) -> GridFilterModel:
+    return filter_model(operator="contains", value=value, field=field)
+
+
+def _messages(session: Session, model: GridFilterModel) -> List[str]:
+    query = apply_filter_to_query_from_model(
+        query=session.query(AuditLog), model=model, resolver=audit_log_resolver
+    )
+    return sorted(log.message for log in query)
+
+
+@mark.parametrize(
+    ("value", "expected"),
+    (
+        ("wor", ["Hello World", "wordle played"]),
+        ("WOR", ["Hello World", "wordle played"]),
+        ("o", ["Hello World", "foo_bar%baz", "nothing here", "wordle played"]),
+        ("bar%b", ["foo_bar%baz"]),
+        ("zzz", []),
+        (None, [message for message, _ in MESSAGES]),
+    ),
+)
+def test_trigram_contains(
+    value: Any, expected: List[str], trigram_session: Session
+) -> None:
+    model = _contains(field="message", value=value)
+    assert _messages(session=trigram_session, model=model) == sorted(expected)
+
+
+def test_trigram_contains_uses_index(trigram_session: Session) -> None:
+    query = apply_filter_to_query_from_model(
+        query=trigram_session.query(AuditLog),
+        model=_contains(field="message", value="wor"),
+        resolver=audit_log_resolver,
+    )
+    details = query_plan(session=trigram_session, query=query)
+    assert f"SCAN {INDEX.name} VIRTUAL TABLE INDEX 0:L0" in details
+    assert f"SCAN {AuditLog.__tablename__}" not in details
+
+
+def test_columns_which_are_not_searchable(trigram_session: Session) -> None:
+    assert get_searchable_index(AuditLog.actor) is None
+    model = GridFilterModel(
+        items=[
+            GridFilterItem(field="actor", operator="contains", value="ali"),
+            GridFilterItem(field="message", operator="contains", value="world"),
+        ],
+        logic_operator=GridLogicOperator.And,
+    )
+    assert _messages(session=trigram_session, model=model) == ["Hello World"]
+
+
+@mark.usefixtures("operator_registry")
+def test_searchable_columns_are_layered(trigram_database: Session) -> None:
+    register_index_friendly_operators()
+    register_searchable_column(AuditLog.message, INDEX)
+    # the actor's wildcards are escaped by the previously registered applicator
+    assert _messages(session=trigram_database, model=_contains("actor", "_")) == []
+    assert _messages(session=trigram_database, model=_contains("actor", "ali")) == [
+        "Hello World",
+        "wordle played",
+    ]
+    query = apply_filter_to_query_from_model(
+        query=trigram_database.query(AuditLog),
+        model=_contains(field="message", value="wor"),
+        resolver=audit_log_resolver,
+    )
+    details = query_plan(session=trigram_database, query=query)
+    assert f"SCAN {INDEX.name} VIRTUAL TABLE INDEX 0:L0" in details
+
+
+def test_trigram_index_is_maintained(trigram_session: Session) -> None:
+    model = _contains(field="message", value="quokka")
+    log = AuditLog(message="a quokka appeared", actor="dave")
+    trigram_session.add(log)
+    trigram_session.flush()
+    assert _messages(session=trigram_session, model=model) == ["a quokka appeared"]
+    # changes to columns which aren't indexed keep the index as-is
+    log.actor = "erin"
+    trigram_session.flush()
+    assert _messages(session=trigram_session, model=model) == ["a quokka appeared"]
+    log.message = "a wombat appeared"
+    trigram_session.flush()
+    assert _messages(session=trigram_session, model=model) == []
+    assert _messages(
+        session=trigram_session, model=_contains(field="message", value="wombat")
+    ) == ["a wombat appeared"]
+    trigram_session.delete(log)
+    trigram_session.flush()
+    assert (
+        _messages(
+            session=trigram_session, model=_contains(field="message", value="wombat")
+        )
+        == []
+    )
+    trigram_session.rollback()
+
+
+def test_trigram_contains_is_planned(trigram_session: Session) -> None:
+    plan_cache = PlanCache()
+    for value, expected in (("wor", 2), ("here", 1)):
+        dg_query = DataGridQuery(
+            query=trigram_session.query(AuditLog),
+            column_resolver=audit_log_resolver,
+            filter_model=_contains(field="message", value=value),
+            plan_cache=plan_cache,
+        )
+        assert dg_query.plan is not None
+        assert dg_query.total() == expected
+    assert plan_cache.hits == 1
+
+
+def test_register_searchable_column_requires_trigram_index() -> None:
+    with raises(ValueError, match="to be an FTS5 trigram index"):
+        register_searchable_column(
+            AuditLog.message, INDEX._replace(tokenize="unicode61")
+        )
+    with raises(ValueError, match="to index the actor column"):
+        register_searchable_column(AuditLog.actor, INDEX)
+
+
+def test_unregister_searchable_column(trigram_session: Session) -> None:
+    unregister_searchable_column(AuditLog.message)
+    assert get_searchable_index(AuditLog.message) is None
+    assert get_operator_applicator("contains") is apply_contains_operator
+    assert _messages(session=trigram_session, model=_contains("message", "wor")) == [
+        "Hello World",
+        "wordle played",
+    ]
+    register_searchable_column(AuditLog.message, INDEX)
+    reset_searchable_columns()
+    assert get_searchable_index(AuditLog.message) is None
+    assert get_operator_applicator("contains") is apply_contains_operator
@@ -0,0 +1,82 @@
+from typing import List
+
+from pytest import mark, raises
+from sqlalchemy.orm import Query
+
+from mui.v6.grid import (
+    GridFilterItem,
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+)
+from mui.v6.integrations.sqlalchemy import DataGridQuery, PaginationStrategy
+from mui.v6.integrations.sqlalchemy.pagination import load_deferred_join_rows
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ChildModel, ParentModel
+
+FILTER_MODEL = GridFilterModel(
+    items=[GridFilterItem(field="grouping_id", operator=">", value=4)]
+)
+SORT_MODEL = [
+    GridSortItem(field="grouping_id", sort=GridSortDirection.DESC),
+    GridSortItem(field="name", sort=GridSortDirection.ASC),
+]
+
+
+def _get_query(
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    page: int,
+    strategy: PaginationStrategy,
+) -> "DataGridQuery[ParentModel]":
+    return DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=FILTER_MODEL,
+        sort_model=SORT_MODEL,
+        pagination_model=GridPaginationModel(page=page, page_size=15),
+        pagination_strategy=strategy,
+    )
+
+
+@mark.parametrize("page", (0, 5, 100))
+def test_deferred_join_matches_offset_pages(
+    page: int,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    executed_statements: List[str],
+) -> None:
+    expected = _get_query(
+        query=query, resolver=resolver, page=page, strategy=PaginationStrategy.OFFSET
+    ).items()
+    executed_statements.clear()
+    dg_query = _get_query(
+        query=query,
+        resolver=resolver,
+        page=page,
+        strategy=PaginationStrategy.DEFERRED_JOIN,
+    )
+    assert [item.id for item in dg_query.items()] == [item.id for item in expected]
+    # the page is located by primary key only
+    table = ParentModel.__tablename__
+    assert executed_statements[0].startswith(f"SELECT {table}.id AS {table}_id \nFROM")
+    if expected:
+        assert f"WHERE {table}.id IN" in executed_statements[1]
+
+    items, total = dg_query.items_and_total()
+    assert [item.id for item in items] == [item.id for item in expected]
+    assert total == dg_query.total()
+
+    items, has_next_page = dg_query.items_and_has_next_page()
+    assert [item.id for item in items] == [item.id for item in expected]
+    assert has_next_page == (page < dg_query.pages() - 1)
+
+
+def test_deferred_join_requires_single_entity(
+    joined_query: "Query[ChildModel]",
+) -> None:
+    with raises(ValueError):
+        load_deferred_join_rows(
+            query=joined_query.add_columns(ParentModel.id), keys=[(1,)]
+        )
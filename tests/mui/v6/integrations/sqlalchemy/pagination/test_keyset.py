@@ -0,0 +1,320 @@
+from typing import List, Optional, Tuple
+
+from pytest import mark, raises
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Query
+
+from mui.v6.grid import (
+    GridCursorCodec,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+    InvalidCursorError,
+)
+from mui.v6.integrations.sqlalchemy import DataGridQuery, Keyset, PaginationStrategy
+from mui.v6.integrations.sqlalchemy.pagination import (
+    apply_keyset_to_query_from_model,
+    get_keyset_columns,
+    get_keyset_page,
+    get_primary_key_columns,
+)
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.conftest import GENERATED_PARENT_MODEL_COUNT, NULLABLE_PARENT_MODEL_COUNT
+from tests.fixtures.sqlalchemy import ParentModel
+
+
+def test_keyset_columns_append_primary_key_tiebreaker(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    columns = get_keyset_columns(
+        model=[GridSortItem(field="grouping_id", sort=GridSortDirection.DESC)],
+        resolver=resolver,
+        tiebreakers=get_primary_key_columns(query=query),
+    )
+    assert len(columns) == 2
+    assert columns[1][1] == GridSortDirection.DESC
+
+
+def test_keyset_columns_skip_sorted_primary_key(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    columns = get_keyset_columns(
+        model=[GridSortItem(field="id", sort=GridSortDirection.ASC)],
+        resolver=resolver,
+        tiebreakers=get_primary_key_columns(query=query),
+    )
+    assert len(columns) == 1
+
+
+@mark.parametrize(
+    ("rows", "keyset", "expected"),
+    (
+        ([1, 2, 3], None, ([1, 2], None, Keyset(values=(2,)))),
+        ([1, 2], None, ([1, 2], None, None)),
+        (
+            [3, 4],
+            Keyset(values=(2,)),
+            ([3, 4], Keyset(values=(3,), backward=True), None),
+        ),
+        (
+            [4, 3, 2],
+            Keyset(values=(5,), backward=True),
+            ([3, 4], Keyset(values=(3,), backward=True), Keyset(values=(4,))),
+        ),
+        (
+            [2, 1],
+            Keyset(values=(3,), backward=True),
+            ([1, 2], None, Keyset(values=(2,))),
+        ),
+        ([], Keyset(values=(3,)), ([], None, None)),
+    ),
+)
+def test_get_keyset_page(
+    rows: List[int],
+    keyset: Optional[Keyset],
+    expected: Tuple[List[int], Optional[Keyset], Optional[Keyset]],
+) -> None:
+    assert (
+        get_keyset_page(
+            rows=rows, page_size=2, keyset=keyset, get_values=lambda row: (row,)
+        )
+        == expected
+    )
+
+
+def test_apply_keyset_uses_row_value_comparison(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    columns = get_keyset_columns(
+        model=[GridSortItem(field="grouping_id", sort=GridSortDirection.ASC)],
+        resolver=resolver,
+        tiebreakers=get_primary_key_columns(query=query),
+    )
+    paginated = apply_keyset_to_query_from_model(
+        query=query,
+        model=GridPaginationModel(page=0, page_size=10),
+        columns=columns,
+        keyset=Keyset(values=(3, 42)),
+    )
+    compiled = paginated.statement.compile(dialect=sqlite.dialect())
+    compiled_str = str(compiled)
+    assert (
+        f"WHERE ({ParentModel.__tablename__}.grouping_id, "
+        f"{ParentModel.__tablename__}.id) > (?, ?)"
+    ) in compiled_str
+    assert all(row.grouping_id >= 3 for row in paginated.all())  # noqa: PLR2004
+
+
+def test_apply_keyset_expands_mixed_directions(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    columns = get_keyset_columns(
+        model=[
+            GridSortItem(field="grouping_id", sort=GridSortDirection.ASC),
+            GridSortItem(field="name", sort=GridSortDirection.DESC),
+        ],
+        resolver=resolver,
+        tiebreakers=get_primary_key_columns(query=query),
+    )
+    paginated = apply_keyset_to_query_from_model(
+        query=query,
+        model=GridPaginationModel(page=0, page_size=10),
+        columns=columns,
+        keyset=Keyset(values=(3, "ParentModel 3", 3)),
+    )
+    compiled_str = str(paginated.statement.compile(dialect=sqlite.dialect()))
+    assert f"{ParentModel.__tablename__}.grouping_id > ?" in compiled_str
+    assert f"{ParentModel.__tablename__}.name < ?" in compiled_str
+
+
+@mark.parametrize(
+    "sort_model",
+    (
+        [],
+        [GridSortItem(field="grouping_id", sort=GridSortDirection.DESC)],
+        [
+            GridSortItem(field="grouping_id", sort=GridSortDirection.ASC),
+            GridSortItem(field="name", sort=GridSortDirection.DESC),
+        ],
+    ),
+)
+def test_keyset_pages_match_offset_pages(
+    sort_model: List[GridSortItem],
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    page_size = 37
+    # the keyset tiebreaker follows the direction of the last sorted column
+    tiebreaker_sort = sort_model[-1].sort if sort_model else GridSortDirection.ASC
+    expected = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        sort_model=[*sort_model, GridSortItem(field="id", sort=tiebreaker_sort)],
+    ).items()
+
+    pages: List[List[ParentModel]] = []
+    keyset: Optional[Keyset] = None
+    while True:
+        dg_query = DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            sort_model=sort_model,
+            pagination_model=GridPaginationModel(page=0, page_size=page_size),
+            pagination_strategy=PaginationStrategy.KEYSET,
+            keyset=keyset,
+        )
+        pages.append(dg_query.items())
+        assert (dg_query.previous_keyset is None) == (keyset is None)
+        if dg_query.next_keyset is None:
+            break
+        keyset = dg_query.next_keyset
+    assert [item.id for page in pages for item in page] == [
+        item.id for item in expected
+    ]
+    assert len(pages) == -(-GENERATED_PARENT_MODEL_COUNT // page_size)
+
+    # walk back from the last page to the first page
+    previous = dg_query.previous_keyset
+    for page in reversed(pages[:-1]):
+        assert previous is not None
+        dg_query = DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            sort_model=sort_model,
+            pagination_model=GridPaginationModel(page=0, page_size=page_size),
+            pagination_strategy=PaginationStrategy.KEYSET,
+            keyset=previous,
+        )
+        assert [item.id for item in dg_query.items()] == [item.id for item in page]
+        assert dg_query.next_keyset is not None
+        previous = dg_query.previous_keyset
+    assert previous is None
+
+
+def _sorted_ids(models: List[ParentModel], sort_model: List[GridSortItem]) -> List[int]:
+    """Sorts the models in Python, with NULL values before every other value and the
+    primary key following the direction of the last sorted column."""
+    models = sorted(
+        models,
+        key=lambda model: model.id,
+        reverse=sort_model[-1].sort == GridSortDirection.DESC,
+    )
+    for item in reversed(sort_model):
+        models.sort(
+            key=lambda model, field=item.field: (
+                getattr(model, field) is not None,
+                getattr(model, field) or 0,
+            ),
+            reverse=item.sort == GridSortDirection.DESC,
+        )
+    return [model.id for model in models]
+
+
+@mark.parametrize(
+    "sort_model",
+    (
+        [GridSortItem(field="null_field", sort=GridSortDirection.ASC)],
+        [GridSortItem(field="null_field", sort=GridSortDirection.DESC)],
+        [
+            GridSortItem(field="null_field", sort=GridSortDirection.DESC),
+            GridSortItem(field="grouping_id", sort=GridSortDirection.ASC),
+        ],
+    ),
+)
+def test_keyset_pages_of_nullable_sort_column(
+    sort_model: List[GridSortItem],
+    nullable_query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    page_size = 3
+    pages: List[List[int]] = []
+    keyset: Optional[Keyset] = None
+    while True:
+        dg_query = DataGridQuery(
+            query=nullable_query,
+            column_resolver=resolver,
+            sort_model=sort_model,
+            pagination_model=GridPaginationModel(page=0, page_size=page_size),
+            pagination_strategy=PaginationStrategy.KEYSET,
+            keyset=keyset,
+        )
+        pages.append([item.id for item in dg_query.items()])
+        assert dg_query.has_next_page == (dg_query.next_keyset is not None)
+        if dg_query.next_keyset is None:
+            break
+        keyset = dg_query.next_keyset
+    assert [id_ for page in pages for id_ in page] == _sorted_ids(
+        models=nullable_query.all(), sort_model=sort_model
+    )
+    assert len(pages) == -(-NULLABLE_PARENT_MODEL_COUNT // page_size)
+
+    # walk back from the last page to the first page
+    previous = dg_query.previous_keyset
+    for page in reversed(pages[:-1]):
+        assert previous is not None
+        dg_query = DataGridQuery(
+            query=nullable_query,
+            column_resolver=resolver,
+            sort_model=sort_model,
+            pagination_model=GridPaginationModel(page=0, page_size=page_size),
+            pagination_strategy=PaginationStrategy.KEYSET,
+            keyset=previous,
+        )
+        assert [item.id for item in dg_query.items()] == page
+        previous = dg_query.previous_keyset
+    assert previous is None
+
+
+def test_keyset_pages_from_cursors(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    codec = GridCursorCodec(secret="test-secret")
+    sort_model = [GridSortItem(field="created_at", sort=GridSortDirection.DESC)]
+    first = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        sort_model=sort_model,
+        pagination_model=GridPaginationModel(page_size=10),
+        pagination_strategy=PaginationStrategy.KEYSET,
+        cursor_codec=codec,
+    )
+    first_ids = [item.id for item in first.items()]
+    assert first.previous_cursor is None
+    assert first.next_cursor is not None
+
+    second = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        sort_model=sort_model,
+        pagination_model=GridPaginationModel(page_size=10, cursor=first.next_cursor),
+        pagination_strategy=PaginationStrategy.KEYSET,
+        cursor_codec=codec,
+    )
+    second_ids = [item.id for item in second.items()]
+    assert second_ids == list(range(first_ids[-1] - 1, first_ids[-1] - 11, -1))
+
+    back = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        sort_model=sort_model,
+        pagination_model=GridPaginationModel(
+            page_size=10, cursor=second.previous_cursor
+        ),
+        pagination_strategy=PaginationStrategy.KEYSET,
+        cursor_codec=codec,
+    )
+    assert [item.id for item in back.items()] == first_ids
+
+
+def test_keyset_rejects_tampered_cursor(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    cursor = GridCursorCodec(secret="another-secret").encode(values=[1])
+    with raises(InvalidCursorError):
+        DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            pagination_model=GridPaginationModel(page_size=10, cursor=cursor),
+            pagination_strategy=PaginationStrategy.KEYSET,
+            cursor_codec=GridCursorCodec(secret="test-secret"),
+        )
@@ -0,0 +1,156 @@
+from typing import Any, List
+
+from pytest import mark
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import Query
+
+from mui.v6.grid import (
+    GridFilterItem,
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+    RequestGridModels,
+)
+from mui.v6.integrations.sqlalchemy import (
+    DataGridQuery,
+    PaginationStrategy,
+    apply_request_grid_models_to_query,
+)
+from mui.v6.integrations.sqlalchemy.projection import (
+    apply_projection_to_query_from_model,
+    get_projected_columns,
+)
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+
+FILTER_MODEL = GridFilterModel(
+    items=[GridFilterItem(field="grouping_id", operator=">", value=4)]
+)
+SORT_MODEL = [GridSortItem(field="created_at", sort=GridSortDirection.DESC)]
+
+
+def _keys(columns: List[Any]) -> List[str]:
+    return [column.key for column in columns]
+
+
+def test_no_projection_without_models(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    assert get_projected_columns(query=query, resolver=resolver) is None
+    assert (
+        get_projected_columns(
+            query=query, resolver=resolver, column_visibility_model={"name": True}
+        )
+        is None
+    )
+
+
+def test_projects_fields_with_primary_key_and_required_fields(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    columns = get_projected_columns(
+        query=query,
+        resolver=resolver,
+        fields=["name"],
+        required_fields=["grouping_id"],
+    )
+    assert columns is not None
+    assert _keys(columns) == ["id", "grouping_id", "name"]
+
+
+def test_column_visibility_model_hides_columns(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    columns = get_projected_columns(
+        query=query,
+        resolver=resolver,
+        column_visibility_model={"id": False, "created_at": False, "name": True},
+    )
+    assert columns is not None
+    # the primary key is always loaded
+    assert "id" in _keys(columns)
+    assert "created_at" not in _keys(columns)
+    assert "name" in _keys(columns)
+
+
+def test_virtual_columns_are_skipped(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    virtual = {"__check__": False, "actions": False}
+    assert (
+        get_projected_columns(
+            query=query, resolver=resolver, column_visibility_model=virtual
+        )
+        is None
+    )
+    columns = get_projected_columns(
+        query=query,
+        resolver=resolver,
+        fields=["__check__", "name", "actions"],
+        column_visibility_model=virtual,
+    )
+    assert columns is not None
+    assert _keys(columns) == ["id", "name"]
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        column_visibility_model={**virtual, "created_at": False},
+    )
+    assert dg_query.projected_columns is not None
+    assert "created_at" not in _keys(dg_query.projected_columns)
+
+
+def test_projects_core_select(resolver: Resolver) -> None:
+    table = inspect(ParentModel).local_table
+    statement = apply_projection_to_query_from_model(
+        query=select(table), resolver=resolver, fields=["name"]
+    )
+    assert [column.key for column in statement.selected_columns] == ["id", "name"]
+
+
+@mark.parametrize(
+    "pagination_strategy",
+    (
+        PaginationStrategy.OFFSET,
+        PaginationStrategy.KEYSET,
+        PaginationStrategy.DEFERRED_JOIN,
+    ),
+)
+def test_data_grid_query_loads_only_displayed_columns(
+    pagination_strategy: PaginationStrategy,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    executed_statements: List[str],
+) -> None:
+    dg_query = apply_request_grid_models_to_query(
+        query=query,
+        request_model=RequestGridModels.model_validate({
+            "filterModel": FILTER_MODEL.model_dump(),
+            "sortModel": [item.model_dump() for item in SORT_MODEL],
+            "paginationModel": {"page": 1, "pageSize": 10},
+            "columnVisibilityModel": {"null_field": False, "name": False},
+        }),
+        column_resolver=resolver,
+        pagination_strategy=pagination_strategy,
+    )
+    expected = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=FILTER_MODEL,
+        sort_model=SORT_MODEL,
+        pagination_model=GridPaginationModel(page=1, page_size=10),
+        pagination_strategy=pagination_strategy,
+    )
+    expected_ids = [item.id for item in expected.items()]
+    query.session.expunge_all()
+    executed_statements.clear()
+
+    assert [item.id for item in dg_query.items()] == expected_ids
+    selected = executed_statements[-1].split("FROM")[0]
+    assert "test_model.name" not in selected
+    assert "test_model.null_field" not in selected
+    assert "test_model.created_at" in selected
+    assert "test_model.grouping_id" in selected
+    assert [row.id for row in dg_query.rows()] == expected_ids
+    assert "name" not in dg_query.mappings()[0]
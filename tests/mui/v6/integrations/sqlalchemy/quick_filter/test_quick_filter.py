@@ -0,0 +1,237 @@
+from typing import Any, Generator, List, Optional, Sequence
+
+from pytest import fixture, mark, raises
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from mui.v6.grid import (
+    GridFilterItem,
+    GridFilterModel,
+    GridLogicOperator,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+)
+from mui.v6.integrations.sqlalchemy import (
+    DataGridQuery,
+    FullTextIndex,
+    PaginationStrategy,
+    PlanCache,
+    register_quick_filter_backend,
+)
+from mui.v6.integrations.sqlalchemy.filter import apply_filter_to_query_from_model
+from mui.v6.integrations.sqlalchemy.quick_filter import (
+    get_fts5_ddl,
+    get_fts5_match_query,
+)
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import Base, ParentModel
+
+NAMES = (
+    "Alice Smith",
+    "Alicia Jones",
+    "Bob Smith",
+    "Carol Smithers",
+    'Dave "The Rave" O-Brien',
+)
+INDEX = FullTextIndex(name="test_model_fts", rowid=ParentModel.id, columns=("name",))
+
+
+@fixture(scope="module")
+def fts_session() -> Generator[Session, None, None]:
+    """A session whose database is separate from the shared fixture database, so that
+    its full-text index can be created and modified without affecting other tests.
+
+    Yields:
+        Session: The SQLAlchemy session
+    """
+    engine = create_engine(url="sqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    session = Session(bind=engine, future=True)
+    session.add_all(
+        ParentModel(name=name, grouping_id=i) for i, name in enumerate(NAMES, 1)
+    )
+    session.flush()
+    # the rows inserted before the index is created are indexed by the rebuild
+    for statement in get_fts5_ddl(index=INDEX):
+        session.execute(text(statement))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _quick_filter(
+    values: Sequence[Any], logic_operator: Optional[GridLogicOperator] = None
+) -> GridFilterModel:
+    return GridFilterModel(
+        items=[],
+        quick_filter_values=list(values),
+        quick_filter_logic_operator=logic_operator,
+    )
+
+
+def _names(session: Session, model: GridFilterModel, resolver: Resolver) -> List[str]:
+    query = apply_filter_to_query_from_model(
+        query=session.query(ParentModel),
+        model=model,
+        resolver=resolver,
+        quick_filter_index=INDEX,
+    )
+    return sorted(item.name for item in query)
+
+
+@mark.parametrize(
+    ("values", "logic_operator", "expected"),
+    (
+        (["smith"], None, ["Alice Smith", "Bob Smith", "Carol Smithers"]),
+        (["ali", "smi"], None, ["Alice Smith"]),
+        (["ali", "smi"], GridLogicOperator.And, ["Alice Smith"]),
+        (
+            ["alice", "bob"],
+            GridLogicOperator.Or,
+            ["Alice Smith", "Bob Smith"],
+        ),
+        (['"the', "o-brien"], None, ['Dave "The Rave" O-Brien']),
+        (["", "  "], None, list(NAMES)),
+        (["zzz"], None, []),
+    ),
+)
+def test_quick_filter(
+    values: List[str],
+    logic_operator: Optional[GridLogicOperator],
+    expected: List[str],
+    fts_session: Session,
+    resolver: Resolver,
+) -> None:
+    model = _quick_filter(values=values, logic_operator=logic_operator)
+    assert _names(session=fts_session, model=model, resolver=resolver) == sorted(
+        expected
+    )
+
+
+def test_fts5_match_query() -> None:
+    assert get_fts5_match_query(["a", 'b"c'], GridLogicOperator.Or) == (
+        '"a"* OR "b""c"*'
+    )
+
+
+def test_quick_filter_is_combined_with_items(
+    fts_session: Session, resolver: Resolver
+) -> None:
+    model = _quick_filter(values=["smith"])
+    model.items = [GridFilterItem(field="grouping_id", operator=">", value=1)]
+    assert _names(session=fts_session, model=model, resolver=resolver) == [
+        "Bob Smith",
+        "Carol Smithers",
+    ]
+
+
+def test_quick_filter_seeks_by_rowid(fts_session: Session, resolver: Resolver) -> None:
+    query = apply_filter_to_query_from_model(
+        query=fts_session.query(ParentModel),
+        model=_quick_filter(values=["smith"]),
+        resolver=resolver,
+        quick_filter_index=INDEX,
+    )
+    statement = query.statement.compile(
+        dialect=fts_session.get_bind().dialect, compile_kwargs={"literal_binds": True}
+    )
+    details = [
+        row[-1] for row in fts_session.execute(text(f"EXPLAIN QUERY PLAN {statement}"))
+    ]
+    assert any("INTEGER PRIMARY KEY" in detail for detail in details)
+    assert f"SCAN {ParentModel.__tablename__}" not in details
+
+
+def test_quick_filter_index_is_maintained(
+    fts_session: Session, resolver: Resolver
+) -> None:
+    model = _quick_filter(values=["zelda"])
+    item = ParentModel(name="Zelda Smith", grouping_id=10)
+    fts_session.add(item)
+    fts_session.flush()
+    assert _names(session=fts_session, model=model, resolver=resolver) == [
+        "Zelda Smith"
+    ]
+    item.name = "Zelda Jones"
+    fts_session.flush()
+    assert _names(
+        session=fts_session, model=_quick_filter(values=["smith"]), resolver=resolver
+    ) == ["Alice Smith", "Bob Smith", "Carol Smithers"]
+    fts_session.delete(item)
+    fts_session.flush()
+    assert _names(session=fts_session, model=model, resolver=resolver) == []
+    fts_session.rollback()
+
+
+@mark.parametrize(
+    "pagination_strategy", (PaginationStrategy.OFFSET, PaginationStrategy.KEYSET)
+)
+def test_data_grid_query_quick_filter(
+    pagination_strategy: PaginationStrategy, fts_session: Session, resolver: Resolver
+) -> None:
+    model = _quick_filter(values=["smith"])
+    model.items = [GridFilterItem(field="grouping_id", operator=">", value=1)]
+    dg_query = DataGridQuery(
+        query=fts_session.query(ParentModel),
+        column_resolver=resolver,
+        filter_model=model,
+        sort_model=[GridSortItem(field="name", sort=GridSortDirection.DESC)],
+        pagination_model=GridPaginationModel(page=0, page_size=1),
+        pagination_strategy=pagination_strategy,
+        plan_cache=PlanCache(),
+        quick_filter_index=INDEX,
+    )
+    assert dg_query.plan is not None
+    assert [item.name for item in dg_query.items()] == ["Carol Smithers"]
+    assert dg_query.total() == 2  # noqa: PLR2004
+
+
+def test_quick_filter_is_ignored_without_index(
+    fts_session: Session, resolver: Resolver
+) -> None:
+    dg_query = DataGridQuery(
+        query=fts_session.query(ParentModel),
+        column_resolver=resolver,
+        filter_model=_quick_filter(values=["smith"]),
+    )
+    assert dg_query.total() == len(NAMES)
+
+
+def test_custom_quick_filter_backend(fts_session: Session, resolver: Resolver) -> None:
+    calls: List[Any] = []
+
+    def apply_name_quick_filter(
+        index: FullTextIndex, values: Sequence[str], logic_operator: GridLogicOperator
+    ) -> Any:
+        calls.append((index.name, list(values), logic_operator))
+        return ParentModel.name.in_(values)
+
+    register_quick_filter_backend("name", apply_name_quick_filter)
+    index = FullTextIndex(
+        name="names", rowid=ParentModel.id, columns=("name",), backend="name"
+    )
+    query = apply_filter_to_query_from_model(
+        query=fts_session.query(ParentModel),
+        model=_quick_filter(values=["Bob Smith"]),
+        resolver=resolver,
+        quick_filter_index=index,
+    )
+    assert [item.name for item in query] == ["Bob Smith"]
+    assert calls == [("names", ["Bob Smith"], GridLogicOperator.And)]
+
+
+def test_unregistered_quick_filter_backend(
+    fts_session: Session, resolver: Resolver
+) -> None:
+    index = FullTextIndex(
+        name="names", rowid=ParentModel.id, columns=("name",), backend="unknown"
+    )
+    with raises(ValueError, match="Unsupported quick filter backend unknown"):
+        apply_filter_to_query_from_model(
+            query=fts_session.query(ParentModel),
+            model=_quick_filter(values=["smith"]),
+            resolver=resolver,
+            quick_filter_index=index,
+        )
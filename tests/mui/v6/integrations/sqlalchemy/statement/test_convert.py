@@ -0,0 +1,94 @@
+from typing import Any
+
+from pytest import mark
+from sqlalchemy import Table, select
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql import Select
+
+from mui.v6.grid import (
+    GridFilterItem,
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+)
+from mui.v6.integrations.sqlalchemy import (
+    Keyset,
+    apply_filter_to_query_from_model,
+    apply_keyset_to_query_from_model,
+    apply_limit_offset_to_query_from_model,
+    apply_sort_to_query_from_model,
+)
+from mui.v6.integrations.sqlalchemy.pagination import (
+    get_keyset_columns,
+    get_primary_key_columns,
+)
+from tests.fixtures.sqlalchemy import ParentModel
+
+TABLE: Table = ParentModel.__table__
+FILTER_MODEL = GridFilterModel(
+    items=[GridFilterItem(field="grouping_id", operator=">", value=4)]
+)
+SORT_MODEL = [GridSortItem(field="name", sort=GridSortDirection.DESC)]
+PAGINATION_MODEL = GridPaginationModel(page=2, page_size=10)
+
+
+def core_resolver(field: str) -> Any:
+    return TABLE.c[field]
+
+
+def _apply(statement: Any) -> Any:
+    statement = apply_filter_to_query_from_model(
+        query=statement, model=FILTER_MODEL, resolver=core_resolver
+    )
+    statement = apply_sort_to_query_from_model(
+        query=statement, model=SORT_MODEL, resolver=core_resolver
+    )
+    return apply_limit_offset_to_query_from_model(
+        query=statement, model=PAGINATION_MODEL
+    )
+
+
+@mark.parametrize(
+    "statement",
+    (TABLE, select(TABLE), select(ParentModel.id, ParentModel.name)),
+    ids=("table", "core select", "orm select"),
+)
+def test_appliers_accept_select_and_table(
+    statement: Any, query: "Query[ParentModel]", session: Session
+) -> None:
+    applied = _apply(statement)
+    assert isinstance(applied, Select)
+    expected = [row.id for row in _apply(query.with_entities(ParentModel.id))]
+    assert [row.id for row in session.execute(applied)] == expected
+
+
+def test_appliers_keep_query() -> None:
+    query = Query(ParentModel)
+    assert isinstance(_apply(query), Query)
+
+
+def test_keyset_on_core_table(session: Session) -> None:
+    assert get_primary_key_columns(query=TABLE) == [TABLE.c.id]
+    assert get_primary_key_columns(query=select(TABLE.c.name)) == [TABLE.c.id]
+    columns = get_keyset_columns(
+        model=SORT_MODEL,
+        resolver=core_resolver,
+        tiebreakers=get_primary_key_columns(query=TABLE),
+    )
+    first = session.execute(
+        apply_keyset_to_query_from_model(
+            query=TABLE, model=PAGINATION_MODEL, columns=columns
+        )
+    ).all()
+    last = first[-1]
+    second = session.execute(
+        apply_keyset_to_query_from_model(
+            query=TABLE,
+            model=PAGINATION_MODEL,
+            columns=columns,
+            keyset=Keyset(values=(last.name, last.id)),
+        )
+    ).all()
+    assert len(first) == len(second) == PAGINATION_MODEL.page_size
+    assert second[0].name < last.name
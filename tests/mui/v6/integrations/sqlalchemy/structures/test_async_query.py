@@ -0,0 +1,136 @@
+from asyncio import run
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from mui.v6.grid import (
+    GridCursorCodec,
+    GridFilterItem,
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+    RequestGridModels,
+)
+from mui.v6.integrations.sqlalchemy import (
+    AsyncDataGridQuery,
+    PaginationStrategy,
+    apply_request_grid_models_to_async_query,
+)
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.conftest import FILE_DATABASE_PARENT_MODEL_COUNT
+from tests.fixtures.sqlalchemy import ParentModel
+
+T = TypeVar("T")
+
+FILTER_MODEL = GridFilterModel(
+    items=[GridFilterItem(field="grouping_id", operator=">", value=4)]
+)
+SORT_MODEL = [GridSortItem(field="name", sort=GridSortDirection.DESC)]
+# grouping IDs 5 through 9 of each group of 10
+FILTERED_COUNT = FILE_DATABASE_PARENT_MODEL_COUNT // 2
+
+
+def run_with_session(
+    database_file: Path, test: Callable[[AsyncSession], Awaitable[T]]
+) -> T:
+    async def main() -> T:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{database_file}")
+        try:
+            async with AsyncSession(bind=engine) as session:
+                return await test(session)
+        finally:
+            await engine.dispose()
+
+    return run(main())
+
+
+def test_async_items_and_total(database_file: Path, resolver: Resolver) -> None:
+    async def test(session: AsyncSession) -> None:
+        dg_query = AsyncDataGridQuery[ParentModel](
+            statement=select(ParentModel),
+            session=session,
+            column_resolver=resolver,
+            filter_model=FILTER_MODEL,
+            sort_model=SORT_MODEL,
+            pagination_model=GridPaginationModel(page=1, page_size=10),
+        )
+        items = await dg_query.items()
+        assert len(items) == 10  # noqa: PLR2004
+        assert all(isinstance(item, ParentModel) for item in items)
+        assert all(item.grouping_id > 4 for item in items)  # noqa: PLR2004
+        assert [item.name for item in items] == sorted(
+            (item.name for item in items), reverse=True
+        )
+        assert await dg_query.total() == FILTERED_COUNT
+        assert await dg_query.pages() == 3  # noqa: PLR2004
+
+        page, total = await dg_query.items_and_total(factory=lambda item: item.id)
+        assert page == [item.id for item in items]
+        assert total == FILTERED_COUNT
+
+        page, total = await dg_query.items_and_total_concurrently(
+            factory=lambda item: item.id
+        )
+        assert page == [item.id for item in items]
+        assert total == FILTERED_COUNT
+
+        streamed = [item async for item in dg_query.stream(factory=lambda m: m.id)]
+        assert streamed == [item.id for item in items]
+
+    run_with_session(database_file=database_file, test=test)
+
+
+def test_async_columns_are_returned_as_rows(
+    database_file: Path, resolver: Resolver
+) -> None:
+    async def test(session: AsyncSession) -> List[Any]:
+        return await AsyncDataGridQuery[Any](
+            statement=select(ParentModel.id, ParentModel.name),
+            session=session,
+            column_resolver=resolver,
+            sort_model=[GridSortItem(field="id", sort=GridSortDirection.ASC)],
+            pagination_model=GridPaginationModel(page=0, page_size=2),
+        ).items()
+
+    assert run_with_session(database_file=database_file, test=test) == [
+        (1, "ParentModel 01"),
+        (2, "ParentModel 02"),
+    ]
+
+
+def test_async_keyset_pages_from_cursors(
+    database_file: Path, resolver: Resolver
+) -> None:
+    codec = GridCursorCodec(secret="test-secret")
+
+    async def test(session: AsyncSession) -> List[int]:
+        ids: List[int] = []
+        cursor: Optional[str] = None
+        while True:
+            dg_query = apply_request_grid_models_to_async_query(
+                statement=select(ParentModel),
+                session=session,
+                request_model=RequestGridModels(
+                    filter_model=FILTER_MODEL,
+                    sort_model=SORT_MODEL,
+                    pagination_model=GridPaginationModel(page_size=7, cursor=cursor),
+                ),
+                column_resolver=resolver,
+                pagination_strategy=PaginationStrategy.KEYSET,
+                cursor_codec=codec,
+            )
+            ids.extend(item.id for item in await dg_query.items())
+            cursor = dg_query.next_cursor
+            if cursor is None:
+                return ids
+
+    ids = run_with_session(database_file=database_file, test=test)
+    expected = sorted(
+        (i for i in range(1, FILE_DATABASE_PARENT_MODEL_COUNT + 1) if i % 10 > 4),  # noqa: PLR2004
+        key=lambda i: f"ParentModel {i:02}",
+        reverse=True,
+    )
+    assert ids == expected
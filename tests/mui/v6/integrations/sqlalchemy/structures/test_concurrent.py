@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import get_ident
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from mui.v6.grid import (
+    GridFilterItem,
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+)
+from mui.v6.integrations.sqlalchemy import CountCache, DataGridQuery
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+
+FILTER_MODEL = GridFilterModel(
+    items=[GridFilterItem(field="grouping_id", operator=">", value=4)]
+)
+SORT_MODEL = [GridSortItem(field="name", sort=GridSortDirection.DESC)]
+
+
+def test_items_and_total_concurrently(file_engine: Engine, resolver: Resolver) -> None:
+    executed: List[Tuple[int, str]] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        executed.append((get_ident(), args[2]))
+
+    event.listen(file_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        with Session(bind=file_engine, future=True) as session:
+            dg_query = DataGridQuery(
+                query=session.query(ParentModel),
+                column_resolver=resolver,
+                filter_model=FILTER_MODEL,
+                sort_model=SORT_MODEL,
+                pagination_model=GridPaginationModel(page=1, page_size=10),
+            )
+            expected_items = dg_query.items()
+            expected_total = dg_query.total()
+            executed.clear()
+            items, total = dg_query.items_and_total_concurrently()
+    finally:
+        event.remove(file_engine, "before_cursor_execute", before_cursor_execute)
+
+    assert [item.id for item in items] == [item.id for item in expected_items]
+    assert total == expected_total
+    count_threads = {ident for ident, sql in executed if "count(" in sql}
+    page_threads = {ident for ident, sql in executed if "LIMIT" in sql}
+    assert page_threads == {get_ident()}
+    assert len(count_threads) == 1
+    assert count_threads.isdisjoint(page_threads)
+
+
+def test_items_and_total_concurrently_uses_count_cache(
+    file_engine: Engine, resolver: Resolver
+) -> None:
+    cache = CountCache()
+    totals: List[int] = []
+    pages: List[List[Dict[str, int]]] = []
+    with ThreadPoolExecutor(max_workers=2) as executor, Session(
+        bind=file_engine, future=True
+    ) as session:
+        for page in range(2):
+            items, total = DataGridQuery(
+                query=session.query(ParentModel),
+                column_resolver=resolver,
+                filter_model=FILTER_MODEL,
+                pagination_model=GridPaginationModel(page=page, page_size=10),
+                count_cache=cache,
+            ).items_and_total_concurrently(
+                factory=lambda item: {"id": item.id}, executor=executor
+            )
+            totals.append(total)
+            pages.append(items)
+    assert totals[0] == totals[1]
+    assert pages[0] != pages[1]
+    assert (cache.hits, cache.misses) == (1, 1)
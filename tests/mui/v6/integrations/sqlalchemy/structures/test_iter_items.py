@@ -0,0 +1,106 @@
+from typing import List, Optional
+
+from pytest import mark
+from sqlalchemy.orm import Query
+
+from mui.v6.grid import (
+    GridFilterItem,
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+)
+from mui.v6.integrations.sqlalchemy import DataGridQuery, Keyset, PaginationStrategy
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+
+FILTER_MODEL = GridFilterModel(
+    items=[GridFilterItem(field="grouping_id", operator=">", value=4)]
+)
+SORT_MODEL = [GridSortItem(field="name", sort=GridSortDirection.DESC)]
+
+
+@mark.parametrize(
+    "pagination_model",
+    (None, GridPaginationModel(page=0, page_size=100), GridPaginationModel(page=2)),
+)
+@mark.parametrize(
+    "pagination_strategy",
+    (
+        PaginationStrategy.OFFSET,
+        PaginationStrategy.KEYSET,
+        PaginationStrategy.DEFERRED_JOIN,
+    ),
+)
+def test_iter_items_match_items(
+    pagination_model: Optional[GridPaginationModel],
+    pagination_strategy: PaginationStrategy,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=FILTER_MODEL,
+        sort_model=SORT_MODEL,
+        pagination_model=pagination_model,
+        pagination_strategy=pagination_strategy,
+    )
+    expected = dg_query.items(factory=lambda item: item.id)
+    assert list(dg_query.iter_items(factory=lambda item: item.id, chunk_size=7)) == (
+        expected
+    )
+
+
+def test_iter_items_streams_in_chunks(
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    executed_statements: List[str],
+) -> None:
+    dg_query = DataGridQuery(query=query, column_resolver=resolver)
+    executed_statements.clear()
+    items = dg_query.iter_items(chunk_size=10)
+    first = next(items)
+    assert isinstance(first, ParentModel)
+    assert len(executed_statements) == 1
+    assert sum(1 for _ in items) + 1 == dg_query.total()
+
+
+def test_iter_items_populates_keysets_once_exhausted(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    pages: List[List[int]] = []
+    keyset: Optional[Keyset] = None
+    while True:
+        dg_query = DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            filter_model=FILTER_MODEL,
+            sort_model=SORT_MODEL,
+            pagination_model=GridPaginationModel(page=0, page_size=40),
+            pagination_strategy=PaginationStrategy.KEYSET,
+            keyset=keyset,
+        )
+        pages.append([item.id for item in dg_query.iter_items(chunk_size=15)])
+        assert (dg_query.previous_keyset is None) == (keyset is None)
+        if dg_query.next_keyset is None:
+            break
+        keyset = dg_query.next_keyset
+    expected = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=FILTER_MODEL,
+        sort_model=[*SORT_MODEL, GridSortItem(field="id", sort=GridSortDirection.DESC)],
+    ).items()
+    assert [id_ for page in pages for id_ in page] == [item.id for item in expected]
+
+    backward = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=FILTER_MODEL,
+        sort_model=SORT_MODEL,
+        pagination_model=GridPaginationModel(page=0, page_size=40),
+        pagination_strategy=PaginationStrategy.KEYSET,
+        keyset=dg_query.previous_keyset,
+    )
+    assert [item.id for item in backward.iter_items()] == pages[-2]
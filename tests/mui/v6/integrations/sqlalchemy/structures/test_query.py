@@ -0,0 +1,122 @@
+from math import ceil
+from typing import List, Optional
+
+from pytest import mark
+from sqlalchemy.orm import Query
+
+from mui.v6.grid import (
+    GridFilterItem,
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+)
+from mui.v6.integrations.sqlalchemy import (
+    DataGridQuery,
+    TotalCount,
+    get_unknown_row_count_response,
+)
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.conftest import GENERATED_PARENT_MODEL_COUNT
+from tests.fixtures.sqlalchemy import ParentModel
+
+FILTER_MODEL = GridFilterModel(
+    items=[GridFilterItem(field="grouping_id", operator=">", value=4)]
+)
+SORT_MODEL = [GridSortItem(field="name", sort=GridSortDirection.DESC)]
+
+
+@mark.parametrize("page", (0, 3, 7))
+def test_items_and_total_uses_single_statement(
+    page: int,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    executed_statements: List[str],
+) -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=FILTER_MODEL,
+        sort_model=SORT_MODEL,
+        pagination_model=GridPaginationModel(page=page, page_size=25),
+    )
+    expected_items = dg_query.items()
+    expected_total = dg_query.total()
+    executed_statements.clear()
+
+    items, total = dg_query.items_and_total(factory=lambda item: item.id)
+    assert len(executed_statements) == 1
+    assert "count(*) OVER ()" in executed_statements[0]
+    assert items == [item.id for item in expected_items]
+    assert total == expected_total
+
+
+def test_items_and_total_falls_back_on_empty_page(
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    executed_statements: List[str],
+) -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        pagination_model=GridPaginationModel(
+            page=GENERATED_PARENT_MODEL_COUNT, page_size=25
+        ),
+    )
+    items, total = dg_query.items_and_total()
+    assert items == []
+    assert total == GENERATED_PARENT_MODEL_COUNT
+    assert len(executed_statements) == 2  # noqa: PLR2004
+
+
+@mark.parametrize(("cap", "expected"), ((10, TotalCount(10, False)), (1000, None)))
+def test_capped_total(
+    cap: int,
+    expected: Optional[TotalCount],
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    executed_statements: List[str],
+) -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=FILTER_MODEL,
+        pagination_model=GridPaginationModel(page=0, page_size=25),
+    )
+    total = dg_query.capped_total(cap=cap)
+    assert len(executed_statements) == 1
+    assert "LIMIT" in executed_statements[0]
+    if expected is None:
+        expected = TotalCount(dg_query.total(), True)
+    assert total == expected
+    assert str(total) == (f"{cap}+" if not expected.exact else str(expected.total))
+    assert dg_query.pages(total=total) == ceil((total.total + (not total.exact)) / 25)
+
+
+@mark.parametrize(("page", "has_next_page"), ((0, True), (6, True), (7, False)))
+def test_unknown_row_count_response(
+    page: int,
+    has_next_page: bool,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    executed_statements: List[str],
+) -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        pagination_model=GridPaginationModel(page=page, page_size=50),
+    )
+    response = get_unknown_row_count_response(query=dg_query, factory=lambda i: i.id)
+    assert len(executed_statements) == 1
+    assert "count" not in executed_statements[0].lower()
+    assert response["hasNextPage"] is has_next_page
+    assert dg_query.has_next_page is has_next_page
+    assert response["rowCount"] == -1
+    assert response["page"] == page
+    assert response["pageSize"] == 50  # noqa: PLR2004
+    assert (
+        response["items"]
+        == list(range(page * 50 + 1, (page + 1) * 50 + 1))[
+            : max(0, GENERATED_PARENT_MODEL_COUNT - page * 50)
+        ]
+    )
@@ -0,0 +1,117 @@
+from typing import List, Optional
+
+from pytest import mark
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Query
+
+from mui.v6.grid import (
+    GridFilterItem,
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+)
+from mui.v6.integrations.sqlalchemy import DataGridQuery, Keyset, PaginationStrategy
+from mui.v6.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+
+FILTER_MODEL = GridFilterModel(
+    items=[GridFilterItem(field="grouping_id", operator=">", value=4)]
+)
+SORT_MODEL = [GridSortItem(field="name", sort=GridSortDirection.DESC)]
+
+
+@mark.parametrize(
+    "pagination_strategy",
+    (
+        PaginationStrategy.OFFSET,
+        PaginationStrategy.DEFERRED_JOIN,
+        PaginationStrategy.KEYSET,
+    ),
+)
+def test_rows_match_items(
+    pagination_strategy: PaginationStrategy,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=FILTER_MODEL,
+        sort_model=SORT_MODEL,
+        pagination_model=GridPaginationModel(page=0, page_size=25),
+        pagination_strategy=pagination_strategy,
+    )
+    expected = [(item.id, item.name) for item in dg_query.items()]
+    assert [(row.id, row.name) for row in dg_query.rows()] == expected
+    assert dg_query.rows(factory=lambda row: row.id) == [id_ for id_, _ in expected]
+
+
+def test_rows_skip_identity_map(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    session = query.session
+    session.expunge_all()
+    rows = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        pagination_model=GridPaginationModel(page=0, page_size=10),
+    ).rows()
+    assert len(rows) == 10  # noqa: PLR2004
+    assert all(isinstance(row, Row) for row in rows)
+    assert not any(isinstance(value, ParentModel) for row in rows for value in row)
+    assert len(session.identity_map) == 0
+
+
+def test_mappings(query: "Query[ParentModel]", resolver: Resolver) -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        sort_model=SORT_MODEL,
+        pagination_model=GridPaginationModel(page=1, page_size=5),
+    )
+    expected = dg_query.items()
+    mappings = dg_query.mappings(factory=dict)
+    assert [mapping["id"] for mapping in mappings] == [item.id for item in expected]
+    assert set(mappings[0]) >= {"id", "name", "grouping_id"}
+
+
+def test_rows_keyset_pages_match_items(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    pages: List[List[int]] = []
+    keyset: Optional[Keyset] = None
+    while True:
+        dg_query = DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            filter_model=FILTER_MODEL,
+            sort_model=SORT_MODEL,
+            pagination_model=GridPaginationModel(page=0, page_size=30),
+            pagination_strategy=PaginationStrategy.KEYSET,
+            keyset=keyset,
+        )
+        pages.append([row.id for row in dg_query.rows()])
+        if dg_query.next_keyset is None:
+            break
+        keyset = dg_query.next_keyset
+
+    expected = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=FILTER_MODEL,
+        sort_model=[*SORT_MODEL, GridSortItem(field="id", sort=GridSortDirection.DESC)],
+    ).items()
+    assert [id_ for page in pages for id_ in page] == [item.id for item in expected]
+
+    assert dg_query.previous_keyset is not None
+    previous = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=FILTER_MODEL,
+        sort_model=SORT_MODEL,
+        pagination_model=GridPaginationModel(page=0, page_size=30),
+        pagination_strategy=PaginationStrategy.KEYSET,
+        keyset=dg_query.previous_keyset,
+    )
+    assert [row.id for row in previous.rows()] == pages[-2]